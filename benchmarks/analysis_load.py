@@ -0,0 +1,132 @@
+"""Load test of the analysis service over loopback.
+
+Starts an AnalysisServer (see analysis_server.py) in this process and
+sends it the positions of a corpus of random games from concurrent
+keep-alive clients. Each position is requested --repeat times, so the
+coalescing and the cache are measured as well as the analysis.
+
+    python benchmarks/analysis_load.py [--clients 64] [--games 20]
+        [--repeat 4] [--workers N] [--queue-size N] [--batch-size N]
+        [--json OUT]
+
+503 answers are retried after a short wait and counted as rejected.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+CHESS_DIR = os.path.join(BENCHMARKS_DIR, os.pardir, "chess")
+sys.path.insert(0, CHESS_DIR)
+
+# Wait before retrying a rejected request, in seconds
+RETRY_WAIT = 0.01
+
+
+def corpusFens(games, seed):
+    """FENs of the positions played in a corpus of random games"""
+    from corpus import generateCorpus
+    from game_record import GameRecordReader
+    from position import Position
+    from snapshot import snapshotToFen
+
+    path = os.path.join(tempfile.mkdtemp(), "corpus.cgr")
+    generateCorpus(path, games, seed)
+    fens = []
+    with GameRecordReader(path) as reader:
+        for game in reader:
+            position = Position()
+            for move in game.moves:
+                position.playMove(move)
+                fens.append(snapshotToFen(position.snapshot()))
+    return fens
+
+
+async def runClient(client, fens, latencies, rejected):
+    for fen in fens:
+        start = time.perf_counter()
+        while True:
+            status, data = await client.analyze(fen)
+            if status != 503:
+                break
+            rejected.append(fen)
+            await asyncio.sleep(RETRY_WAIT)
+        if status != 200:
+            raise RuntimeError(f"{status} for {fen}: {data}")
+        latencies.append(time.perf_counter() - start)
+    await client.close()
+
+
+async def load(args, fens):
+    from analysis_server import AnalysisClient, AnalysisServer, AnalysisService
+
+    server = AnalysisServer(
+        AnalysisService(args.workers, args.queue_size, args.batch_size),
+        port=0)
+    await server.start()
+    requests = fens * args.repeat
+    random.Random(args.seed).shuffle(requests)
+    shares = [requests[i::args.clients] for i in range(args.clients)]
+    latencies, rejected = [], []
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            runClient(AnalysisClient(port=server.port), share, latencies, rejected)
+            for share in shares))
+        elapsed = time.perf_counter() - start
+        stats = server.service.getStats()
+    finally:
+        await server.close()
+
+    latencies.sort()
+    return {
+        "requests": len(requests),
+        "positions": len(set(fens)),
+        "clients": args.clients,
+        "seconds": elapsed,
+        "requests_per_s": len(requests) / elapsed,
+        "median_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "rejected": len(rejected),
+        "service": stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=4,
+                        help="times every position is requested")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--queue-size", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--json", help="write the results to a JSON file")
+    args = parser.parse_args()
+
+    fens = corpusFens(args.games, args.seed)
+    results = asyncio.run(load(args, fens))
+    print(f"{results['requests']} requests for {results['positions']} positions "
+          f"from {args.clients} clients in {results['seconds']:.2f} s: "
+          f"{results['requests_per_s']:.0f} requests/s")
+    print(f"latency median {results['median_ms']:.1f} ms, "
+          f"p99 {results['p99_ms']:.1f} ms, {results['rejected']} rejected")
+    service = results["service"]
+    print(f"service: {service.get('batches', 0)} batches, "
+          f"{service.get('coalesced', 0)} coalesced, "
+          f"{service.get('cached', 0)} from the cache")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Replays clicks on the board of a headless MainWindow and times them.
+
+Clicks go through BoardToGameInterface.squareClicked() and
+BoardScene.applyClickResult(), like a mouse press on a square, and
+promotions pick their piece like the promotion dialog. Paint events are
+processed after every move, so the times include drawing the board.
+
+    python benchmarks/gui_replay.py --pgn FILE [--game N]
+    python benchmarks/gui_replay.py --clicks FILE
+        [--repeat N] [--tracemalloc] [--json OUT]
+
+A clicks file has the clicked squares separated by whitespace. A
+promoting move is followed by =Q, =R, =B or =N for the piece picked.
+A PGN game is turned into the clicks of its moves.
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+CHESS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         os.pardir, "chess")
+sys.path.insert(0, CHESS_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Actions after which a move has been played
+MOVE_ACTIONS = ("movePiece", "castle", "enPassant")
+
+
+def clicksFromPgn(path, gameIndex=0):
+    """Returns the clicks that play a game of a PGN file"""
+    from game_record import pgnGameToMoves, readPgnGames
+
+    with open(path) as file:
+        for i, (tags, sanMoves, _) in enumerate(readPgnGames(file)):
+            if i == gameIndex:
+                break
+        else:
+            raise ValueError(f"{path} has no game {gameIndex}")
+    # A new game of the window always starts from the starting position
+    if "FEN" in tags:
+        raise ValueError(f"Game {gameIndex} of {path} starts from a set-up position")
+
+    return clicksFromMoves(pgnGameToMoves(sanMoves))
+
+
+def clicksFromMoves(moves):
+    """Returns the clicks that play encoded moves"""
+    from moves import decodeMove
+    from san import PIECE_LETTERS
+
+    clicks = []
+    for move in moves:
+        fromName, toName, promotion = decodeMove(move)
+        clicks += [fromName, toName]
+        if promotion is not None:
+            clicks.append("=" + PIECE_LETTERS[promotion])
+    return clicks
+
+
+def readClicks(path):
+    with open(path) as file:
+        return file.read().split()
+
+
+def replay(window, clicks, app, onMove=None):
+    """Plays clicks on a new game of window. Returns the time of every
+    move in seconds. onMove(game, ply) is called after every move,
+    outside of the timing."""
+    from PySide6.QtCore import QEvent
+    from san import LETTER_PIECES
+
+    window.startNewGame()
+    game = window.currentGame
+    scene = game.board.scene()
+    app.processEvents()
+
+    moveTimes = []
+    promotionState = None
+    start = time.perf_counter()
+    for click in clicks:
+        if click.startswith("="):
+            scene.promotePawn(promotionState, LETTER_PIECES[click[1:]])
+            moved = True
+        else:
+            result = game.squareClicked(click)
+            scene.applyClickResult(result)
+            if result["action"] == "showPromotionDialog":
+                promotionState = result["state"]
+            moved = result["action"] in MOVE_ACTIONS
+
+        if moved:
+            app.processEvents()
+            # The event loop deletes the objects passed to deleteLater(),
+            # processEvents() doesn't
+            app.sendPostedEvents(None, QEvent.DeferredDelete)
+            end = time.perf_counter()
+            moveTimes.append(end - start)
+            if onMove is not None:
+                onMove(game, len(moveTimes))
+                end = time.perf_counter()
+            start = end
+    return moveTimes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pgn")
+    source.add_argument("--clicks")
+    parser.add_argument("--game", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="also measure the peak of Python allocations "
+                             "(slows the replay down)")
+    parser.add_argument("--json", help="write the results to a JSON file")
+    args = parser.parse_args()
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    from main import MainWindow
+    import analysis_worker
+
+    if args.pgn:
+        clicks = clicksFromPgn(args.pgn, args.game)
+    else:
+        clicks = readClicks(args.clicks)
+
+    window = MainWindow()
+    window.show()
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    runs = []
+    try:
+        for _ in range(args.repeat):
+            runs.append(replay(window, clicks, app))
+    finally:
+        analysis_worker.shutdown()
+
+    tracedPeak = None
+    if args.tracemalloc:
+        tracedPeak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    # ru_maxrss is in kilobytes on Linux
+    peakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    moveTimes = [t for run in runs for t in run]
+    results = {
+        "clicks": len(clicks),
+        "moves": len(runs[0]),
+        "runs": args.repeat,
+        "total_s": sum(moveTimes),
+        "mean_move_ms": statistics.fmean(moveTimes) * 1000 if moveTimes else 0,
+        "median_move_ms": statistics.median(moveTimes) * 1000 if moveTimes else 0,
+        "max_move_ms": max(moveTimes, default=0) * 1000,
+        "move_ms": [round(t * 1000, 3) for t in runs[-1]],
+        "peak_rss_bytes": peakRss,
+        "peak_traced_bytes": tracedPeak,
+    }
+
+    print(f"{results['moves']} moves x {args.repeat} runs in "
+          f"{results['total_s']:.3f} s")
+    print(f"per move: mean {results['mean_move_ms']:.2f} ms, median "
+          f"{results['median_move_ms']:.2f} ms, max {results['max_move_ms']:.2f} ms")
+    print(f"peak RSS {peakRss / 2**20:.1f} MB")
+    if tracedPeak is not None:
+        print(f"peak Python allocations {tracedPeak / 2**20:.1f} MB")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Import-time benchmark for the headless rules modules.
+
+Imports the modules in a fresh interpreter several times and reports the
+best time. Fails if importing them loads PySide6 or takes longer than
+the budget.
+
+    python benchmarks/import_time.py [--budget-ms 100] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+CHESS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         os.pardir, "chess")
+
+RULES_MODULES = ("pieces", "special_moves", "position", "moves", "san",
+                 "snapshot", "game_record", "timeline", "analysis")
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {modules}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(",".join(sorted(m for m in sys.modules if m.startswith("PySide6"))))
+"""
+
+
+def measureImport(modules, runs):
+    """Returns the best import time in milliseconds and the PySide6
+    modules the import loaded"""
+    env = dict(os.environ, PYTHONPATH=CHESS_DIR)
+    script = SCRIPT.format(modules=", ".join(modules))
+    times = []
+    qtModules = ""
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script], env=env, check=True,
+            capture_output=True, text=True).stdout.splitlines()
+        times.append(float(output[0]))
+        qtModules = output[1] if len(output) > 1 else ""
+    return min(times), [m for m in qtModules.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    best, qtModules = measureImport(RULES_MODULES, args.runs)
+    print(f"rules modules imported in {best:.1f} ms (budget {args.budget_ms} ms)")
+
+    failed = False
+    if qtModules:
+        print(f"FAIL: importing the rules modules loaded {', '.join(qtModules)}")
+        failed = True
+    if best > args.budget_ms:
+        print("FAIL: import time is over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
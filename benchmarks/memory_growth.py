@@ -0,0 +1,180 @@
+"""Memory growth per ply of long games.
+
+Plays random games of corpus.py and samples, every --every plies, the
+memory tracemalloc traced from the code in chess/ and the footprint of
+the game (see footprint.py). The growth per ply is the slope of a least squares line
+through the samples. The run fails if a slope is over --max-growth
+bytes per ply.
+
+    python benchmarks/memory_growth.py [--games N] [--plies N] [--seed N]
+        [--every N] [--max-growth BYTES] [--gui] [--json OUT]
+
+Without --gui the games are played on a Position and a GameTimeline,
+what a headless server keeps per game. With --gui they are clicked on a
+headless MainWindow (see gui_replay.py), and the process RSS is
+sampled too, as tracemalloc doesn't see what Qt allocates.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+CHESS_DIR = os.path.join(BENCHMARKS_DIR, os.pardir, "chess")
+sys.path.insert(0, CHESS_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+# Only the allocations of the game's code, not the samples of this
+# script. Module paths start with the sys.path entry they came from.
+TRACE_FILTERS = (tracemalloc.Filter(True, os.path.join(CHESS_DIR, "*")),)
+
+DEFAULT_MAX_GROWTH = 64
+# The window also keeps the SAN of every move and its move list row
+DEFAULT_MAX_GROWTH_GUI = 256
+
+
+def currentRss():
+    """Resident set size of the process in bytes, None where /proc
+    isn't available"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def slope(samples):
+    """Least squares slope of [(ply, bytes)]"""
+    if len(samples) < 2:
+        return 0.0
+    plies = [ply for ply, _ in samples]
+    values = [value for _, value in samples]
+    meanPly = statistics.fmean(plies)
+    meanValue = statistics.fmean(values)
+    variance = sum((ply - meanPly) ** 2 for ply in plies)
+    return sum((ply - meanPly) * (value - meanValue)
+               for ply, value in samples) / variance
+
+
+def tracedBytes():
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def randomGames(games, plies, seed):
+    from corpus import gameSeed, playRandomGame
+    for index in range(games):
+        moves, _, _ = playRandomGame(random.Random(gameSeed(seed, index)), plies)
+        yield list(moves)
+
+
+def sampleHeadless(moves, every):
+    """Plays moves on a Position and a GameTimeline. Returns the samples
+    {"traced": [(ply, bytes)], "footprint": [(ply, bytes)]}."""
+    from footprint import Footprint, addPosition
+    from position import Position
+    from timeline import GameTimeline
+
+    samples = {"traced": [], "footprint": []}
+    position = Position()
+    timeline = GameTimeline()
+    for ply, move in enumerate(moves, 1):
+        position.playMove(move)
+        timeline.record(position)
+        if ply % every == 0:
+            samples["traced"].append((ply, tracedBytes()))
+            footprint = Footprint()
+            addPosition(footprint, position)
+            footprint.addObject("timeline", timeline)
+            samples["footprint"].append((ply, footprint.result()["total"]))
+            del footprint
+    return samples
+
+
+def sampleGui(window, app, moves, every):
+    """Clicks moves on a new game of window. Returns the samples
+    {"traced", "footprint", "rss"}."""
+    import gui_replay
+    from footprint import gameFootprint
+
+    samples = {"traced": [], "footprint": [], "rss": []}
+
+    def onMove(game, ply):
+        if ply % every:
+            return
+        samples["traced"].append((ply, tracedBytes()))
+        samples["footprint"].append((ply, gameFootprint(game)["total"]))
+        rss = currentRss()
+        if rss is not None:
+            samples["rss"].append((ply, rss))
+
+    gui_replay.replay(window, gui_replay.clicksFromMoves(moves), app, onMove)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--plies", type=int, default=1000,
+                        help="longest game, random games can end sooner")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--every", type=int, default=10)
+    parser.add_argument("--max-growth", type=float,
+                        help="allowed growth in bytes per ply, "
+                             f"{DEFAULT_MAX_GROWTH} or {DEFAULT_MAX_GROWTH_GUI} "
+                             "with --gui")
+    parser.add_argument("--gui", action="store_true")
+    parser.add_argument("--json", help="write the results to a JSON file")
+    args = parser.parse_args()
+    if args.max_growth is None:
+        args.max_growth = DEFAULT_MAX_GROWTH_GUI if args.gui else DEFAULT_MAX_GROWTH
+
+    window = app = None
+    if args.gui:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+        app = QApplication([])
+        from main import MainWindow
+        window = MainWindow()
+        window.show()
+
+    tracemalloc.start()
+    results = []
+    try:
+        for index, moves in enumerate(randomGames(args.games, args.plies,
+                                                  args.seed)):
+            if args.gui:
+                samples = sampleGui(window, app, moves, args.every)
+            else:
+                samples = sampleHeadless(moves, args.every)
+            growth = {kind: slope(values) for kind, values in samples.items()}
+            results.append({"game": index, "plies": len(moves),
+                            "growth": growth, "samples": samples})
+            print(f"game {index}: {len(moves)} plies, growth per ply " + ", ".join(
+                f"{kind} {value:.1f} B" for kind, value in growth.items()))
+    finally:
+        tracemalloc.stop()
+        if args.gui:
+            import analysis_worker
+            analysis_worker.shutdown()
+
+    failed = False
+    # RSS moves in pages and with Qt's caches, it is reported only
+    for kind in ("traced", "footprint"):
+        worst = max(result["growth"][kind] for result in results)
+        if worst > args.max_growth:
+            print(f"FAIL: {kind} grows by {worst:.1f} bytes per ply, "
+                  f"over {args.max_growth:g}")
+            failed = True
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Fan-out of a game's delta stream to local spectators.
+
+Replays a random game of corpus.py through a SpectatorHub (see
+spectator.py) to --spectators connections over a unix socket, or TCP
+loopback with --tcp. A quarter of them join halfway through the game
+and start from the hub's keyframe. Reports the time to encode a delta
+and the bytes sent, next to what sending the whole board (a keyframe)
+every ply would cost. Fails if a spectator's board doesn't end like the
+game's.
+
+    python benchmarks/spectator_fanout.py [--spectators 200] [--seed N]
+        [--tcp] [--json OUT]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+CHESS_DIR = os.path.join(BENCHMARKS_DIR, os.pardir, "chess")
+sys.path.insert(0, CHESS_DIR)
+
+
+async def spectate(connect, board, ready):
+    from spectator import readFrames
+    reader, writer = await connect()
+    ready.set_result(None)
+    async for frameType, body in readFrames(reader):
+        board.apply(frameType, body)
+    writer.close()
+
+
+async def run(args):
+    from corpus import gameSeed, playRandomGame
+    from position import Position
+    from spectator import DeltaEncoder, SpectatorBoard, SpectatorHub, SpectatorPublisher
+
+    moves, _, _ = playRandomGame(random.Random(gameSeed(args.seed, 0)))
+    hub = SpectatorHub()
+    if args.tcp:
+        server = await hub.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        connect = lambda: asyncio.open_connection("127.0.0.1", port)
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "spectators.sock")
+        server = await hub.serve(unixPath=path)
+        connect = lambda: asyncio.open_unix_connection(path)
+
+    boards, tasks = [], []
+
+    async def join(count):
+        for _ in range(count):
+            board = SpectatorBoard()
+            ready = asyncio.get_running_loop().create_future()
+            boards.append(board)
+            tasks.append(asyncio.create_task(spectate(connect, board, ready)))
+            await ready
+        # Let the hub accept them
+        while len(hub.subscribers) < len(boards):
+            await asyncio.sleep(0.001)
+
+    late = args.spectators // 4
+    encodeTimes = []
+    sentBytes = keyframeBytes = 0
+    position = Position()
+    publisher = SpectatorPublisher(position, hub)
+    await join(args.spectators - late)
+    keyframeEncoder = DeltaEncoder(position)
+    for ply, move in enumerate(moves, 1):
+        position.playMove(move)
+        start = time.perf_counter()
+        delta = publisher.encoder.delta(move)
+        encodeTimes.append(time.perf_counter() - start)
+        hub.publish(delta)
+        if ply % publisher.keyframeInterval == 0:
+            hub.setKeyframe(publisher.encoder.keyframe())
+        sentBytes += len(delta) * len(hub.subscribers)
+        keyframeBytes += len(keyframeEncoder.keyframe()) * len(hub.subscribers)
+        if ply == len(moves) // 2:
+            await join(late)
+        # Let the connections write
+        await asyncio.sleep(0)
+
+    for writer in list(hub.subscribers):
+        await writer.drain()
+        writer.close()
+    await asyncio.gather(*tasks)
+    server.close()
+    await server.wait_closed()
+
+    finalBoard = SpectatorBoard()
+    keyframe = DeltaEncoder(position).keyframe()
+    finalBoard.apply(keyframe[2], keyframe[3:])
+    mismatches = sum(
+        1 for board in boards
+        if (board.ply, board.placement(), board.control, board.pins)
+        != (len(moves), finalBoard.placement(), finalBoard.control, finalBoard.pins))
+    return {
+        "plies": len(moves),
+        "spectators": len(boards),
+        "late_joiners": late,
+        "encode_median_us": statistics.median(encodeTimes) * 1e6,
+        "delta_mean_bytes": sentBytes / len(moves) / len(boards),
+        "keyframe_mean_bytes": keyframeBytes / len(moves) / len(boards),
+        "sent_bytes": sentBytes,
+        "keyframe_every_ply_bytes": keyframeBytes,
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spectators", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tcp", action="store_true")
+    parser.add_argument("--json", help="write the results to a JSON file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{results['plies']} plies to {results['spectators']} spectators "
+          f"({results['late_joiners']} joined late)")
+    print(f"delta encoded in {results['encode_median_us']:.0f} us, "
+          f"{results['delta_mean_bytes']:.0f} bytes against "
+          f"{results['keyframe_mean_bytes']:.0f} for the whole board")
+    print(f"sent {results['sent_bytes'] / 2**10:.0f} KB instead of "
+          f"{results['keyframe_every_ply_bytes'] / 2**10:.0f} KB")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    if results["mismatches"]:
+        print(f"FAIL: {results['mismatches']} spectators don't have the "
+              "game's board")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
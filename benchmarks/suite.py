@@ -0,0 +1,297 @@
+"""Benchmark suite for the hot paths, compared against a JSON baseline.
+
+    python benchmarks/suite.py [--baseline FILE] [--threshold 0.25]
+        [--update-baseline] [--only NAME,...] [--skip-gui] [--json OUT]
+
+Every benchmark reports the median time of one operation in
+milliseconds. The run fails when a benchmark is slower than its
+baseline by more than the threshold, or when importing the rules
+modules loads PySide6. Baselines are absolute timings of the machine
+they were measured on, so they aren't committed (baseline.json is
+ignored by git). Write one with --update-baseline before the first
+comparison on a machine, and again after a deliberate change.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+CHESS_DIR = os.path.join(BENCHMARKS_DIR, os.pardir, "chess")
+sys.path.insert(0, CHESS_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+BASELINE_PATH = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+# Morphy vs Duke Karl / Count Isouard, Paris 1858
+OPERA_GAME = (
+    "e4 e5 Nf3 d6 d4 Bg4 dxe5 Bxf3 Qxf3 dxe5 Bc4 Nf6 Qb3 Qe7 Nc3 c6 Bg5 b5 "
+    "Nxb5 cxb5 Bxb5+ Nbd7 O-O-O Rd8 Rxd7 Rxd7 Rd1 Qe6 Bxd7+ Nxd7 Qb8+ Nxb8 "
+    "Rd8#").split()
+# A busy middlegame with both sides able to castle
+BUSY_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+MATE_FENS = (
+    # Fool's mate
+    "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3",
+    # Back rank mate
+    "R5k1/5ppp/8/8/8/8/8/6K1 b - - 1 1",
+)
+# Random games of corpus.py, the same on every machine
+CORPUS_SEED = 0
+CORPUS_GAMES = 20
+
+# {name: function returning the milliseconds of one operation}
+BENCHMARKS = {}
+GUI_BENCHMARKS = ("gui_click_move",)
+
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def timeOp(op, setup=None, number=20, repeat=7):
+    """Returns the median over repeat runs of the mean time of op in
+    milliseconds. setup() is called before every op without being
+    timed, and its result is passed to op."""
+    runs = []
+    for _ in range(repeat):
+        total = 0
+        for _ in range(number):
+            arg = setup() if setup is not None else None
+            start = time.perf_counter_ns()
+            op(arg)
+            total += time.perf_counter_ns() - start
+        runs.append(total / number / 1e6)
+    return statistics.median(runs)
+
+
+def positionFromFen(fen):
+    from position import Position
+    from snapshot import snapshotFromFen
+    return Position(snapshotFromFen(fen))
+
+
+def findMove(position, uci):
+    from moves import moveToUci
+    for move in position.getLegalMoves():
+        if moveToUci(move) == uci:
+            return move
+    raise ValueError(f"{uci} isn't legal")
+
+
+def corpusPath():
+    """Generates the benchmark corpus once per run"""
+    global CORPUS_PATH
+    if CORPUS_PATH is None:
+        from corpus import generateCorpus
+        CORPUS_PATH = os.path.join(tempfile.mkdtemp(), "corpus.cgr")
+        generateCorpus(CORPUS_PATH, CORPUS_GAMES, CORPUS_SEED)
+    return CORPUS_PATH
+
+
+CORPUS_PATH = None
+
+
+def operaMoves():
+    from game_record import pgnGameToMoves
+    return pgnGameToMoves(OPERA_GAME)
+
+
+@benchmark("initialize_start")
+def initializeStart():
+    from position import Position
+    return timeOp(lambda _: Position())
+
+
+@benchmark("initialize_busy")
+def initializeBusy():
+    from position import Position
+    from snapshot import snapshotFromFen
+    snapshot = snapshotFromFen(BUSY_FEN)
+    return timeOp(lambda _: Position(snapshot))
+
+
+@benchmark("set_square_cascade")
+def setSquareCascade():
+    """One queen move on the busy board, the cascade included"""
+    move = findMove(positionFromFen(BUSY_FEN), "f3f5")
+    return timeOp(lambda position: position.playMove(move),
+                  setup=lambda: positionFromFen(BUSY_FEN))
+
+
+@benchmark("check_mate")
+def checkMate():
+    positions = [positionFromFen(fen) for fen in MATE_FENS]
+
+    def op(_):
+        for position in positions:
+            position.activate()
+            position.check()
+    return timeOp(op, number=50)
+
+
+@benchmark("get_moves_busy")
+def getMovesBusy():
+    position = positionFromFen(BUSY_FEN)
+
+    def op(_):
+        for piece in position.pieces:
+            if not piece.captured:
+                piece.getMoves()
+    return timeOp(op, number=200)
+
+
+@benchmark("legal_moves_busy")
+def legalMovesBusy():
+    position = positionFromFen(BUSY_FEN)
+    return timeOp(lambda _: position.getLegalMoves(), number=200)
+
+
+@benchmark("legal_moves_corpus")
+def legalMovesCorpus():
+    """Move generation over the positions of every phase of the corpus"""
+    from corpus import PHASES, corpusPositions
+    from position import Position
+    positions = [Position(snapshot) for phase in PHASES
+                 for snapshot, _ in corpusPositions(corpusPath(), phase)]
+
+    def op(_):
+        for position in positions:
+            position.getLegalMoves()
+    return timeOp(op, number=5) / len(positions)
+
+
+@benchmark("replay_opera_game")
+def replayOperaGame():
+    from position import Position
+    moves = operaMoves()
+
+    def op(_):
+        position = Position()
+        for move in moves:
+            position.playMove(move)
+    return timeOp(op, number=5)
+
+
+@benchmark("gui_click_move")
+def guiClickMove():
+    """Median time of a move played with clicks on a headless window"""
+    from PySide6.QtWidgets import QApplication
+    import gui_replay
+    app = QApplication.instance() or QApplication([])
+    from main import MainWindow
+    import analysis_worker
+
+    clicks = gui_replay.clicksFromMoves(operaMoves())
+    window = MainWindow()
+    window.show()
+    moveTimes = []
+    try:
+        for _ in range(5):
+            moveTimes += gui_replay.replay(window, clicks, app)
+    finally:
+        analysis_worker.shutdown()
+        window.close()
+    return statistics.median(moveTimes) * 1000
+
+
+@benchmark("import_rules")
+def importRules():
+    import import_time
+    best, qtModules = import_time.measureImport(import_time.RULES_MODULES, 5)
+    if qtModules:
+        raise RuntimeError(
+            f"importing the rules modules loaded {', '.join(qtModules)}")
+    return best
+
+
+def compare(results, baseline, threshold):
+    """Prints results next to the baseline. Returns the names of the
+    benchmarks that regressed."""
+    regressed = []
+    print(f"{'benchmark':<22}{'ms':>10}{'baseline':>10}{'change':>9}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<22}{value:>10.3f}{'-':>10}{'':>9}")
+            continue
+        change = value / base - 1
+        flag = ""
+        if change > threshold:
+            regressed.append(name)
+            flag = "  REGRESSED"
+        print(f"{name:<22}{value:>10.3f}{base:>10.3f}{change:>+9.1%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown, eg. 0.25 for 25%%")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--only", help="comma separated benchmark names")
+    parser.add_argument("--skip-gui", action="store_true")
+    parser.add_argument("--json", help="write the results to a JSON file")
+    args = parser.parse_args()
+
+    names = list(BENCHMARKS)
+    if args.only:
+        names = args.only.split(",")
+        unknown = set(names) - set(BENCHMARKS)
+        if unknown:
+            parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    if args.skip_gui:
+        names = [name for name in names if name not in GUI_BENCHMARKS]
+
+    failed = False
+    results = {}
+    for name in names:
+        try:
+            results[name] = BENCHMARKS[name]()
+        except RuntimeError as error:
+            print(f"FAIL: {name}: {error}")
+            failed = True
+
+    output = {
+        "machine": platform.platform(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            saved = json.load(file)
+        baseline = saved["results"]
+        if (saved["machine"], saved["python"]) != (output["machine"],
+                                                   output["python"]):
+            print(f"Warning: the baseline was measured on {saved['machine']} "
+                  f"with Python {saved['python']}")
+    elif not args.update_baseline:
+        print(f"No baseline at {args.baseline}, write one with --update-baseline")
+    if compare(results, baseline, args.threshold):
+        print(f"FAIL: slower than the baseline by more than {args.threshold:.0%}")
+        failed = True
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(output, file, indent=2)
+    if args.update_baseline:
+        output["results"] = dict(baseline, **results)
+        with open(args.baseline, "w") as file:
+            json.dump(output, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Analysis of a position that doesn't need the GUI: legal moves, pins,
+hanging pieces, square control and a simple evaluation.
+
+Positions are passed in as snapshots (see snapshot.py) so the analysis
+can run in another process, on a Position of its own."""
+from moves import indexToSquareName, moveFrom, moveTo
+from position import Position
+
+PIECE_VALUES = {
+    "Pawn": 100,
+    "Knight": 300,
+    "Bishop": 300,
+    "Rook": 500,
+    "Queen": 900,
+    "King": 0,
+}
+MOBILITY_VALUE = 5
+
+
+def analyzePosition(position):
+    """Returns a dict with the analysis of a Position:
+
+    moves       {square name: [square names the piece can move to]}
+                for the side to move
+    pins        [(pinned piece's square, pinning piece's square)]
+    hanging     squares of pieces attacked by the other color and not
+                defended by their own
+    control     64 (white, black) counts of the pieces controlling each
+                square, indexed like move codes (a1 = 0)
+    evaluation  material and mobility balance in centipawns, positive
+                when white is better
+    """
+    position.activate()
+    moves = {}
+    for move in position.getLegalMoves():
+        fromName = indexToSquareName(moveFrom(move))
+        toName = indexToSquareName(moveTo(move))
+        targets = moves.setdefault(fromName, [])
+        if toName not in targets:  # promotions give one move per piece
+            targets.append(toName)
+
+    pins = []
+    hanging = []
+    evaluation = 0
+    for piece in position.pieces:
+        if piece.captured:
+            continue
+        sign = 1 if piece.isWhite else -1
+        evaluation += sign * (PIECE_VALUES[piece.pieceName]
+                              + MOBILITY_VALUE * len(piece.moves))
+        if piece.pinning is not None:
+            pins.append((piece.pinning.square.name, piece.square.name))
+
+        attacked = defended = False
+        for other in piece.square.getControllingPieces():
+            if other.isOppositeColorAs(piece):
+                attacked = True
+            else:
+                defended = True
+        if attacked and not defended and piece.pieceName != "King":
+            hanging.append(piece.square.name)
+
+    control = [None] * 64
+    for file in position.squares:
+        for sq in file:
+            white = sum(1 for p in sq.getControllingPieces() if p.isWhite)
+            coord = sq.getCoord()
+            control[coord[0] + 8*coord[1]] = (
+                white, len(sq.getControllingPieces()) - white)
+
+    return {
+        "moves": moves,
+        "pins": pins,
+        "hanging": hanging,
+        "control": control,
+        "evaluation": evaluation,
+    }
+
+
+def analyzeSnapshot(snapshot):
+    """Analyzes the position of a snapshot"""
+    return analyzePosition(Position(snapshot))
@@ -0,0 +1,422 @@
+"""HTTP/JSON service for the position analysis of analysis.py.
+
+    python analysis_server.py [--host 127.0.0.1] [--port 8765] [--workers N]
+        [--queue-size N] [--batch-size N]
+
+    POST /analyze   {"fen": FEN} -> {"fen", "moves", "pins", "hanging",
+                    "control", "evaluation"} (see analyzePosition())
+    GET /stats      queue, in flight, cache and request counts
+
+Requests for a position that is already being analyzed wait for the
+same job instead of starting one. A batcher task takes the queued
+positions, as many as BATCH_SIZE, and sends them to a process pool as
+one job, so a job's overhead is shared by the positions in it. Workers
+send back the encoded JSON, and the latest results are kept in a cache.
+When QUEUE_SIZE positions are waiting, new ones get a 503 with a
+Retry-After header instead of waiting for a queue that is only growing.
+
+The service only uses the headless rules modules. AnalysisClient is a
+small keep-alive client for tests and benchmarks (see
+benchmarks/analysis_load.py)."""
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from analysis import analyzeSnapshot
+from moves import indexToSquareName
+from snapshot import FenError, decodeSnapshot, snapshotFromFen, snapshotToFen
+import logger
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+QUEUE_SIZE = 1024
+BATCH_SIZE = 32
+# Jobs sent to the pool at once, per worker
+JOBS_PER_WORKER = 2
+CACHE_SIZE = 4096
+MAX_BODY = 64 * 1024
+RETRY_AFTER = 1
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class ServiceBusy(Exception):
+    """Raised when the queue of positions is full"""
+
+
+def initWorker():
+    """The log files belong to the server process, don't write to them"""
+    logger.setLevel(logger.OFF)
+
+
+def analyzeBatch(snapshots):
+    """Runs in a worker. Returns (status, JSON body) for every snapshot,
+    so a position the engine fails on doesn't fail the others."""
+    results = []
+    for snapshot in snapshots:
+        try:
+            result = analyzeSnapshot(snapshot)
+        except Exception as error:
+            results.append((500, encodeJson(
+                {"error": f"analysis failed: {error!r}"})))
+            continue
+        result["fen"] = snapshotToFen(snapshot)
+        results.append((200, encodeJson(result)))
+    return results
+
+
+def encodeJson(data):
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def validateSnapshot(snapshot):
+    """The engine needs one king of each color, no pawn on the first or
+    last rank, where its moves would wrap around the board, and an en
+    passant square behind a pawn that just moved two squares"""
+    placement, whiteTurn, _, epSquare = decodeSnapshot(snapshot)
+    pieces = list(placement.values())
+    if pieces.count("wKing") != 1 or pieces.count("bKing") != 1:
+        raise FenError("The position needs one king of each color")
+    for index, piece in placement.items():
+        if piece[1:] == "Pawn" and not 8 <= index < 56:
+            raise FenError(
+                f"The position has a pawn on {indexToSquareName(index)}")
+    if epSquare is not None:
+        rank, pawnIndex, pawn = ((5, epSquare - 8, "bPawn") if whiteTurn
+                                 else (2, epSquare + 8, "wPawn"))
+        if epSquare // 8 != rank or placement.get(pawnIndex) != pawn:
+            raise FenError(f"The position has no en passant on "
+                           f"{indexToSquareName(epSquare)}")
+
+
+class AnalysisService:
+    """Coalesces, queues and batches analysis jobs to a process pool.
+    start() and analyze() are called on the event loop."""
+
+    def __init__(self, workers=None, queueSize=QUEUE_SIZE,
+                 batchSize=BATCH_SIZE, cacheSize=CACHE_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.batchSize = batchSize
+        self.cacheSize = cacheSize
+        self.queue = asyncio.Queue(queueSize)
+        # {snapshot: future of (status, body)} of queued and running jobs
+        self.pending = {}
+        # {snapshot: body}, least recently used first
+        self.cache = collections.OrderedDict()
+        self.jobSlots = asyncio.Semaphore(self.workers * JOBS_PER_WORKER)
+        self.executor = None
+        self.batcher = None
+        # Running runBatch() tasks, the event loop only keeps weak
+        # references to them
+        self.jobs = set()
+        self.stats = collections.Counter()
+
+    def start(self):
+        self.executor = ProcessPoolExecutor(self.workers, initializer=initWorker)
+        self.batcher = asyncio.create_task(self.batchLoop())
+        logger.info("Analysis service started with %d workers", self.workers)
+
+    async def close(self):
+        if self.batcher is not None:
+            self.batcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.batcher
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        for future in self.pending.values():
+            if not future.done():
+                future.cancel()
+        logger.info("Analysis service stopped: %s", dict(self.stats))
+
+    async def analyze(self, snapshot):
+        """Returns (status, JSON body) of the analysis of a snapshot.
+        Raises ServiceBusy when the queue is full."""
+        self.stats["requests"] += 1
+        body = self.cache.get(snapshot)
+        if body is not None:
+            self.cache.move_to_end(snapshot)
+            self.stats["cached"] += 1
+            return 200, body
+
+        future = self.pending.get(snapshot)
+        if future is None:
+            try:
+                self.queue.put_nowait(snapshot)
+            except asyncio.QueueFull:
+                self.stats["rejected"] += 1
+                raise ServiceBusy
+            future = self.pending[snapshot] = (
+                asyncio.get_running_loop().create_future())
+        else:
+            self.stats["coalesced"] += 1
+        # A request that goes away doesn't cancel the job of the others
+        return await asyncio.shield(future)
+
+    async def batchLoop(self):
+        while True:
+            await self.jobSlots.acquire()
+            batch = [await self.queue.get()]
+            # Positions queued while the pool was busy go in one job
+            while len(batch) < self.batchSize and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            job = asyncio.create_task(self.runBatch(batch))
+            self.jobs.add(job)
+            job.add_done_callback(self.jobs.discard)
+
+    async def runBatch(self, batch):
+        loop = asyncio.get_running_loop()
+        self.stats["batches"] += 1
+        executor = self.executor
+        try:
+            results = await loop.run_in_executor(executor, analyzeBatch, batch)
+        except Exception as error:
+            logger.error("Analysis batch of %d positions failed: %r",
+                         len(batch), error)
+            # Other batches on the same pool fail too, only the first
+            # one replaces it
+            if isinstance(error, BrokenProcessPool) and executor is self.executor:
+                # A worker died, start a new pool for the next jobs
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = ProcessPoolExecutor(
+                    self.workers, initializer=initWorker)
+            # The requests waiting for the batch get the error. Futures
+            # whose requests all went away are skipped or marked as
+            # retrieved, the error is logged above.
+            for snapshot in batch:
+                future = self.pending.pop(snapshot)
+                if not future.done():
+                    future.set_exception(error)
+                    future.exception()
+            return
+        finally:
+            self.jobSlots.release()
+
+        for snapshot, (status, body) in zip(batch, results):
+            if status == 200:
+                self.cache[snapshot] = body
+                if len(self.cache) > self.cacheSize:
+                    self.cache.popitem(last=False)
+            else:
+                logger.error("Analysis of %s failed: %s",
+                             snapshotToFen(snapshot), body.decode())
+            future = self.pending.pop(snapshot)
+            if not future.done():
+                future.set_result((status, body))
+
+    def getStats(self):
+        return dict(self.stats, queued=self.queue.qsize(),
+                    pending=len(self.pending), cacheSize=len(self.cache))
+
+
+class AnalysisServer:
+    """HTTP/1.1 front of an AnalysisService, with keep-alive"""
+
+    def __init__(self, service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.service = service
+        self.host = host
+        self.port = port
+        self.server = None
+        # {writer: handler task} of the open connections
+        self.connections = {}
+
+    async def start(self):
+        """Starts serving. With port 0, self.port is the port picked."""
+        self.service.start()
+        self.server = await asyncio.start_server(
+            self.handleConnection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self.server.close()
+        # Handlers see the end of their stream and return, a cancelled
+        # one would be reported as an error by asyncio
+        for writer in list(self.connections):
+            writer.close()
+        await asyncio.gather(*self.connections.values(), return_exceptions=True)
+        await self.server.wait_closed()
+        await self.service.close()
+
+    async def handleConnection(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    break
+                keepAlive = await self.handleRequest(head, reader, writer)
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self.connections[writer]
+            writer.close()
+
+    async def handleRequest(self, head, reader, writer):
+        """Answers one request. Returns whether the connection stays
+        open."""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, version = lines[0].split(" ")
+        except ValueError:
+            self.respond(writer, 400, {"error": "bad request line"}, False)
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keepAlive = (connection != "close" if version == "HTTP/1.1"
+                     else connection == "keep-alive")
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.respond(writer, 400, {"error": "bad Content-Length"}, False)
+            return False
+        if length > MAX_BODY:
+            self.respond(writer, 413, {"error": "body too large"}, False)
+            return False
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError:
+            self.respond(writer, 400, {"error": "body shorter than Content-Length"},
+                         False)
+            return False
+
+        if path == "/analyze":
+            if method != "POST":
+                self.respond(writer, 405, {"error": "use POST"}, keepAlive)
+            else:
+                status, data, headers = await self.analyze(body)
+                self.respond(writer, status, data, keepAlive, headers)
+        elif path == "/stats":
+            self.respond(writer, 200, self.service.getStats(), keepAlive)
+        else:
+            self.respond(writer, 404, {"error": f"no {path}"}, keepAlive)
+        return keepAlive
+
+    async def analyze(self, body):
+        """Returns (status, body, extra headers)"""
+        try:
+            fen = json.loads(body)["fen"]
+            snapshot = snapshotFromFen(fen)
+            validateSnapshot(snapshot)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            return 400, {"error": f"expected {{\"fen\": FEN}}: {error}"}, None
+        try:
+            status, data = await self.service.analyze(snapshot)
+        except ServiceBusy:
+            return 503, {"error": "too many positions queued"}, {
+                "Retry-After": str(RETRY_AFTER)}
+        except BrokenProcessPool:
+            return 500, {"error": "analysis worker died"}, None
+        except Exception as error:
+            return 500, {"error": f"analysis failed: {error!r}"}, None
+        return status, data, None
+
+    @staticmethod
+    def respond(writer, status, data, keepAlive, headers=None):
+        """data is a dict or an encoded JSON body"""
+        body = data if isinstance(data, bytes) else encodeJson(data)
+        head = [f"HTTP/1.1 {status} {REASONS[status]}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(body)}",
+                "Connection: " + ("keep-alive" if keepAlive else "close")]
+        for name, value in (headers or {}).items():
+            head.append(f"{name}: {value}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+
+class AnalysisClient:
+    """Sends requests to an AnalysisServer over one keep-alive
+    connection, one at a time"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, data=None):
+        """Returns (status, decoded JSON body)"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port)
+        body = b"" if data is None else encodeJson(data)
+        self.writer.write(
+            (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+             f"Content-Type: application/json\r\n"
+             f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        lines = head.split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        data = json.loads(await self.reader.readexactly(
+            int(headers["content-length"])))
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, data
+
+    async def analyze(self, fen):
+        return await self.request("POST", "/analyze", {"fen": fen})
+
+    async def stats(self):
+        return await self.request("GET", "/stats")
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self.writer.wait_closed()
+            self.reader = self.writer = None
+
+
+async def serve(host, port, workers, queueSize, batchSize):
+    server = AnalysisServer(
+        AnalysisService(workers, queueSize, batchSize), host, port)
+    await server.start()
+    print(f"Serving analysis on http://{server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve position analysis over HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int,
+                        help="analysis processes, one per CPU by default")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size,
+                          args.batch_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Runs position analysis in a background process so the GUI thread never
+waits for it.
+
+The rules classes keep the state of the live game in class attributes,
+so the analysis can't safely run on a thread of the GUI process. Jobs
+go to a process pool instead, and their results come back to the GUI
+thread through a Qt signal. Only the result of the latest job is
+delivered; older jobs are cancelled or their results dropped."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from PySide6.QtCore import QObject, Signal
+from analysis import analyzeSnapshot
+from snapshot import snapshotToFen
+import logger
+
+EXECUTOR = None
+
+
+def getExecutor():
+    """Returns the process pool shared by every AnalysisWorker, starting
+    it on first use"""
+    global EXECUTOR
+    if EXECUTOR is None:
+        # Forking a process that runs Qt isn't safe, start fresh ones
+        EXECUTOR = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+            initializer=initWorker)
+    return EXECUTOR
+
+
+def initWorker():
+    """The log files belong to the GUI process, don't write to them"""
+    logger.setLevel(logger.OFF)
+
+
+def shutdown():
+    """Stops the process pool. Called when the application quits."""
+    global EXECUTOR
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        EXECUTOR = None
+
+
+def discardExecutor(executor):
+    """Drops a pool whose worker died, the next job starts a new one.
+    A pool started since then is kept."""
+    if EXECUTOR is executor:
+        shutdown()
+
+
+class AnalysisWorker(QObject):
+    """Analyzes snapshots in the background. analysisReady is emitted on
+    the GUI thread with the result of analysis.analyzeSnapshot() for the
+    latest submitted snapshot."""
+
+    analysisReady = Signal(dict)
+    # Emitted from the pool's thread, delivered on the GUI thread
+    _jobDone = Signal(int, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.future = None
+        # Latest snapshot submitted, and whether it was already sent
+        # again after its worker died
+        self.snapshot = None
+        self.retried = False
+        self._jobDone.connect(self._deliver)
+
+    def submit(self, snapshot, retried=False):
+        """Starts analyzing a snapshot and cancels the previous job"""
+        self.cancel()
+        self.generation += 1
+        generation = self.generation
+        self.snapshot = snapshot
+        self.retried = retried
+
+        executor = getExecutor()
+        try:
+            self.future = executor.submit(analyzeSnapshot, snapshot)
+        except BrokenProcessPool:
+            # The worker died since the last job, start a new pool
+            logger.warning("Analysis pool broken, starting a new one")
+            discardExecutor(executor)
+            executor = getExecutor()
+            self.future = executor.submit(analyzeSnapshot, snapshot)
+        self.future.add_done_callback(
+            lambda future: self._jobFinished(generation, executor, future))
+
+    def cancel(self):
+        """Cancels the running job, if any. A job that has already
+        started still runs, but its result is dropped."""
+        self.generation += 1
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+
+    def _jobFinished(self, generation, executor, future):
+        """Called on the pool's thread"""
+        try:
+            self._jobDone.emit(generation, executor, future)
+        except RuntimeError:
+            pass  # The worker was deleted with its game
+
+    def _deliver(self, generation, executor, future):
+        # A dead worker fails the stale jobs too, and the pool must be
+        # dropped whichever job tells first
+        broken = (not future.cancelled()
+                  and isinstance(future.exception(), BrokenProcessPool))
+        if broken:
+            discardExecutor(executor)
+        if generation != self.generation:
+            return  # The position changed since the job started
+        self.future = None
+        if future.cancelled():
+            return
+        if broken:
+            logger.warning("Analysis worker died on %s",
+                           snapshotToFen(self.snapshot))
+            if not self.retried:
+                self.submit(self.snapshot, retried=True)
+            return
+        if (error := future.exception()) is not None:
+            logger.error("Analysis of %s failed: %r",
+                         snapshotToFen(self.snapshot), error)
+            return
+        self.analysisReady.emit(future.result())
@@ -1,19 +1,29 @@
 """This module handles the drawing of the board and its pieces."""
 from __future__ import annotations
-import resources
-from PySide6.QtCore import Qt, QSize, QRectF, QPointF
-from PySide6.QtGui import QBrush, QPixmap
+from PySide6.QtCore import Qt, QSize, QRectF, QPointF, QTimer
+from PySide6.QtGui import QBrush
 from PySide6.QtWidgets import (QGraphicsScene, QGraphicsView,
     QGraphicsRectItem, QGraphicsPixmapItem)
 from PySide6.QtWidgets import QGraphicsSceneMouseEvent
 from interface import BoardToGameInterface
-from special_moves import Promotion
+from promotion import Promotion
+from overlay import BoardOverlay
+import piece_images
+from moves import squareNameToIndex
+from snapshot import decodeSnapshot
+from events import PieceMoved, PiecePromoted, PieceRemoved
+import latency
 
 
 # Create a list with the names of each square starting from
 # [a8, b8, ..., h8, a7, b7, ..., h7, etc..]
 SQUARE_NAMES = [(l+n) for n in "87654321" for l in "abcdefgh"]
 
+# Stacking order of the items on the board
+OVERLAY_Z = 1
+PIECE_Z = 2
+DIALOG_Z = 3
+
 
 class BoardView(QGraphicsView):
 
@@ -28,6 +38,13 @@ class BoardView(QGraphicsView):
         scene = BoardScene()
         self.setScene(scene)
 
+    def resizeEvent(self, event):
+        """Scales the board to fit the view, keeping the same margins"""
+        super().resizeEvent(event)
+        margin = self.VIEW_SIZE.width() - BoardScene.SCENE_SIZE.width()
+        side = min(event.size().width(), event.size().height()) - margin
+        self.scene().resizeBoard(QSize(side, side))
+
 
 class BoardScene(QGraphicsScene):
 
@@ -55,27 +72,44 @@ class BoardScene(QGraphicsScene):
         super().__init__()
         self.setSceneRect(
             5, 5, self.SCENE_SIZE.width(), self.SCENE_SIZE.height())
+        # Current sizes, changed by resizeBoard()
+        self.squareSize = self.SQUARE_SIZE
+        self.pieceSize = self.PIECE_SIZE
+        piece_images.prewarm(self.pieceSize)
+        # The board has few items that move all the time, so keeping
+        # them in an index costs more than it saves
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        # Hidden piece items, reused for the next pieces shown
+        self.itemPool = []
 
         # Create the squares.
-        self.squares = self.createSquares()
+        self.squares = self.createSquares(self.squareSize)
         # Draw the board
         self.drawBoard()
+        # Highlights and the background analysis are drawn over the
+        # squares by a single item
+        self.overlay = BoardOverlay(self.squares)
+        self.overlay.setZValue(OVERLAY_Z)
+        self.addItem(self.overlay)
         # Draw pieces on their initial position
         self.drawPiecesInInitialPos()
 
-        # Util variables
-        self.highlightedSquares = []
-
         self.promotionDialogShown = False
-
-    def createSquares(self):
+        # True while showing an earlier position of the game
+        self.reviewing = False
+        # Piece events of the game waiting to be drawn, see queueEvent()
+        self.pendingEvents = []
+        self.eventsFlushPending = False
+
+    @staticmethod
+    def createSquares(squareSize, lightColor=Qt.white, darkColor=Qt.black):
         """Create Square objects for every square on the board and put
         them in a dictionary."""
         squares = {}
         squareNames = iter(SQUARE_NAMES)
         whiteOnEven = True
         # row height and col width are the same
-        rowHeight = self.SQUARE_SIZE.height()
+        rowHeight = squareSize.height()
         rowCoord = [(x * rowHeight) for x in range(0, 8)]
         colCoord = [(y, y * rowHeight) for y in range(0, 8)]
 
@@ -85,15 +119,15 @@ class BoardScene(QGraphicsScene):
             # parity of a column
             whiteOnEven = False if whiteOnEven is True else True
             for c, col in colCoord:
-                rect = QRectF(QPointF(col, row), self.SQUARE_SIZE)
+                rect = QRectF(QPointF(col, row), squareSize)
                 name = next(squareNames)
 
                 if (c%2==0 and whiteOnEven) or (c%2==1 and not whiteOnEven):
                     squares[name] = Square(
-                        rect=rect, color=Qt.white, name=name)
+                        rect=rect, color=lightColor, name=name)
                 else:
                     squares[name] = Square(
-                        rect=rect, color=Qt.black, name=name)
+                        rect=rect, color=darkColor, name=name)
 
         return squares
 
@@ -106,29 +140,156 @@ class BoardScene(QGraphicsScene):
         """Draw the pieces in their initial positions"""
         # These ids are appened to the piece's name so that they're unique
         for piece in self.INITIAL_POS:
-            img = QPixmap(f":pieces\\{piece}").scaled(self.PIECE_SIZE,
-                                                      Qt.KeepAspectRatio)
             for id_, pos in enumerate(self.INITIAL_POS[piece]):
-                imgItem = self.addPixmap(img)
+                imgItem = self.acquirePieceItem(piece)
                 sq = self.squares[pos]
                 sq.setPiece(piece + str(id_), imgItem)
 
-    def highlightSquares(self, squares):
-        """Change color of selected squares to highlight them"""
-        # First unhighlight previously selected squares, if any
+    def getPieceImage(self, piece):
+        """Returns the image of a piece (eg. wRook) scaled to fit a square"""
+        return piece_images.getPixmap(piece, self.pieceSize)
+
+    def resizeBoard(self, size):
+        """Scales the board and its pieces to size. The piece images are
+        rescaled from the already decoded ones."""
+        squareSize = size / 8
+        if squareSize == self.squareSize:
+            return
+        self.squareSize = squareSize
+        self.pieceSize = squareSize - QSize(10, 10)
+        self.setSceneRect(5, 5, size.width(), size.height())
+
+        for i, name in enumerate(SQUARE_NAMES):
+            sq = self.squares[name]
+            row, col = divmod(i, 8)
+            sq.setRect(QRectF(
+                QPointF(col * squareSize.width(), row * squareSize.height()),
+                squareSize))
+            if sq.hasPiece():
+                # Piece names on the board have an id appended (eg. wRook0)
+                pixmap = sq.getPiecePixmap()
+                pixmap.setPixmap(self.getPieceImage(
+                    sq.getPiece().rstrip("0123456789")))
+                pixmap.setOffset(sq.getCoord())
+
+        self.overlay.boardResized()
+
+    def acquirePieceItem(self, piece):
+        """Returns an item showing a piece (eg. wRook), reusing a hidden
+        one if there is any"""
+        if self.itemPool:
+            item = self.itemPool.pop()
+            item.setPixmap(self.getPieceImage(piece))
+            item.show()
+            return item
+        item = self.addPixmap(self.getPieceImage(piece))
+        item.setZValue(PIECE_Z)
+        return item
+
+    def releasePieceItem(self, item):
+        """Hides the item of a piece that left the board so it can be
+        reused"""
+        item.hide()
+        self.itemPool.append(item)
+
+    def showSnapshot(self, snapshot):
+        """Redraws the pieces from a position snapshot (see snapshot.py)"""
+        placement = decodeSnapshot(snapshot).placement
+        self.applyDiff({name: placement.get(squareNameToIndex(name))
+                        for name in self.squares})
+
+    def applyDiff(self, placement):
+        """Makes the board show placement, {square name: piece (eg. wRook)
+        or None}. Squares missing from placement are left as they are.
+
+        Squares that already show the right type of piece don't change.
+        Items of pieces that left a square are moved to the squares that
+        need the same type of piece, then reused for the other pieces or
+        hidden. No item is added or removed from the scene, and all the
+        changes are drawn together in the next frame."""
         self.unhighlightSquares()
 
-        # Highlight selected squares
-        for sqName in squares:
-            sq = self.squares[sqName]
-            self.highlightedSquares.append((sq, sq.brush()))
-            sq.setBrush(Qt.yellow)
+        left = {}  # piece type: [(piece name, item)] taken off the board
+        arriving = []
+        for name, piece in placement.items():
+            sq = self.squares[name]
+            current = sq.getPiece()
+            # Piece names on the board have an id appended (eg. wRook0)
+            if current is not None and current.rstrip("0123456789") == piece:
+                continue
+            if current is not None:
+                left.setdefault(current.rstrip("0123456789"), []).append(
+                    sq.takePiece())
+            if piece is not None:
+                arriving.append((sq, piece))
+
+        for sq, piece in arriving:
+            sameType = left.get(piece)
+            if sameType:
+                sq.setPiece(*sameType.pop())
+            else:
+                sq.setPiece(piece, self.acquirePieceItem(piece))
+
+        for items in left.values():
+            for _, item in items:
+                self.releasePieceItem(item)
+
+    def highlightSquares(self, squares):
+        """Highlights the selected squares, replacing the ones
+        highlighted before"""
+        self.overlay.setHighlights(squares)
 
     def unhighlightSquares(self):
         """Unhighlight currently highlighted squares"""
-        for sq, brush in self.highlightedSquares:
-            sq.setBrush(brush)
-        self.highlightedSquares.clear()
+        self.overlay.setHighlights(())
+
+    def showAnalysis(self, result):
+        """Outlines pinned pieces in red and hanging pieces in orange,
+        with a line to the pinning piece. result is returned by
+        analysis.analyzePosition()."""
+        self.overlay.setAnalysis(
+            result["pins"], result["hanging"], result["control"])
+
+    def showControl(self, shown):
+        """Shows or hides the tint of the squares controlled more by one
+        color"""
+        self.overlay.setControlShown(shown)
+
+    def applyClickResult(self, result):
+        """Updates the board with the result of ChessGame.squareClicked().
+        The pieces of a move are drawn from the game's events."""
+        self.applyEvents()
+        if (action := result["action"]) == "highlightSquares":
+            self.highlightSquares(result["squares"])
+        elif action == "unhighlightSquares":
+            self.unhighlightSquares()
+        elif action == "showPromotionDialog":
+            self.showPromotionDialog(result["state"])
+
+    def queueEvent(self, event):
+        """Subscribed to the piece events of the game's Position (see
+        events.py). They are drawn with the result of the click that
+        played the move, or when control returns to the event loop for
+        moves played some other way."""
+        self.pendingEvents.append(event)
+        if not self.eventsFlushPending:
+            self.eventsFlushPending = True
+            QTimer.singleShot(0, self, self.applyEvents)
+
+    def applyEvents(self):
+        """Draws the piece events waiting"""
+        self.eventsFlushPending = False
+        events, self.pendingEvents = self.pendingEvents, []
+        for event in events:
+            if isinstance(event, PieceMoved):
+                self.movePiece((event.fromSquare, event.toSquare))
+            elif isinstance(event, PieceRemoved):
+                self.removePiece(event.square)
+            elif isinstance(event, PiecePromoted):
+                # The new piece's item replaces the pawn's
+                pieceType = event.piece.rstrip("0123456789")
+                self.squares[event.square].setPiece(
+                    event.piece, self.acquirePieceItem(pieceType))
 
     def movePiece(self, squares):
         """Move piece from squares[0] to squares[1]"""
@@ -139,7 +300,7 @@ class BoardScene(QGraphicsScene):
 
     def removePiece(self, square):
         sq = self.squares[square]
-        self.removeItem(sq.getPiecePixmap())
+        self.releasePieceItem(sq.getPiecePixmap())
         sq.setPiece(None, None)
 
     def showPromotionDialog(self, state):
@@ -158,6 +319,7 @@ class BoardScene(QGraphicsScene):
             )
         )
 
+        self.promotionDialog.setZValue(DIALOG_Z)
         # Centers the dialog in the middle of the board
         x, y = self.promotionDialog.boundingRect().size().toTuple()
         center = self.sceneRect().center() - QPointF((1/2)*x, (1/2)*y)
@@ -165,20 +327,30 @@ class BoardScene(QGraphicsScene):
 
     def promotePawn(self, state, promoteTo):
         """Promotes a pawn to promoteTo"""
+        if latency.ENABLED:
+            start = latency.now()
         self.promotionDialogShown = False
+        # The dialog is out of the scene but still alive. Deleting it
+        # later lets the button that was clicked return first, and
+        # replacing it with the next dialog won't delete it again.
         self.removeItem(self.promotionDialog)
+        self.promotionDialog.deleteLater()
 
-        old_sq, new_sq, whiteTurn = state
-        from_sq, to_sq = self.squares[old_sq], self.squares[new_sq]
+        whiteTurn = state[2]
         if whiteTurn:
             promoteTo = "w" + promoteTo
         else:
             promoteTo = "b" + promoteTo
 
-        from_sq.movePieceTo(to_sq, promotingTo=promoteTo)
-        self.unhighlightSquares()
-
         BoardToGameInterface.pawnPromoted(promoteTo)
+        if latency.ENABLED:
+            promoted = latency.now()
+        self.applyEvents()
+        if latency.ENABLED:
+            end = latency.now()
+            latency.record("promotion", "game", promoted - start)
+            latency.record("promotion", "scene", end - promoted)
+            latency.record("promotion", "total", end - start)
 
     def printSquares(self):
         """Prints all the squares and the pieces on each square.
@@ -211,28 +383,21 @@ class Square(QGraphicsRectItem):
         """When a square is clicked and there is a piece on that square,
         this function will highlight the squares that the piece can move
         to."""
-        # Don't let squares be clicked if there is a pawn promoting.
-        if self.scene().promotionDialogShown:
+        # Don't let squares be clicked if there is a pawn promoting or
+        # an earlier position is shown.
+        if self.scene().promotionDialogShown or self.scene().reviewing:
             return super().mousePressEvent(event)
+        if latency.ENABLED:
+            start = latency.now()
         # Let the game know this square has been clicked
         result = BoardToGameInterface.squareClicked(
             self.name)
+        if latency.ENABLED:
+            clicked = latency.now()
 
-        # Check result to know what to do
-        if (action := result["action"]) == "highlightSquares":
-            self.scene().highlightSquares(result["squares"])
-        elif action == "movePiece":
-            self.scene().movePiece(result["squares"])
-        elif action == "unhighlightSquares":
-            self.scene().unhighlightSquares()
-        elif action == "castle":
-            self.scene().movePiece(result["kingMove"])
-            self.scene().movePiece(result["rookMove"])
-        elif action == "enPassant":
-            self.scene().movePiece(result["squares"])
-            self.scene().removePiece(result["take"])
-        elif action == "showPromotionDialog":
-            self.scene().showPromotionDialog(result["state"])
+        self.scene().applyClickResult(result)
+        if latency.ENABLED:
+            latency.recordClick(result["action"], start, clicked, latency.now())
 
         return super().mousePressEvent(event)
 
@@ -249,18 +414,24 @@ class Square(QGraphicsRectItem):
 
     def movePieceTo(self, square_to, promotingTo=None):
         """Moves the piece on this square to another square"""
-        piece, pixmap = self.piece, self.piecePixmap
-        self.piece = self.piecePixmap = None
+        piece, pixmap = self.takePiece()
 
         if promotingTo is not None:
-            self.scene().removeItem(pixmap)  # remove pawn
+            self.scene().releasePieceItem(pixmap)  # remove pawn
 
-            newPixmap = self.scene().addPixmap(QPixmap(f":pieces\\{promotingTo}"))
+            newPixmap = self.scene().acquirePieceItem(promotingTo)
             square_to.setPiece(promotingTo, newPixmap)
             return
 
         square_to.setPiece(piece, pixmap)
 
+    def takePiece(self):
+        """Takes the piece off this square without removing its item.
+        Returns the piece and its item."""
+        piece, pixmap = self.piece, self.piecePixmap
+        self.piece = self.piecePixmap = None
+        return piece, pixmap
+
     def setPiecePixmap(self, pixmap: QGraphicsPixmapItem):
         """Gives a reference to the square of the pixmap item of the piece
         on this square."""
@@ -270,8 +441,8 @@ class Square(QGraphicsRectItem):
         
         if self.hasPiece():
             # If there was a piece on this square, it was captured
-            # and its pixmap can be deleted off the scene
-            self.scene().removeItem(self.piecePixmap)
+            # and its item can be reused
+            self.scene().releasePieceItem(self.piecePixmap)
         
         pixmap.setOffset(self.getCoord())  # moves img of piece to sq
         self.piecePixmap = pixmap
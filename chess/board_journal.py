@@ -0,0 +1,157 @@
+"""Append-only binary journal of the pieces controlling and tracking
+every square, one entry per ply.
+
+Each entry only holds the squares whose controlledBy or trackedBy lists
+changed since the previous ply, so recording a ply costs a few bytes
+instead of rewriting the whole board. The reader replays the entries to
+rebuild the board at any ply.
+
+Records (all integers little endian):
+
+    GAME   type:u8=1                        starts a new game at ply 0
+    NAME   type:u8=2 id:u16 length:u8 name  names a piece id
+    PLY    type:u8=3 count:u8 squares...    one ply
+
+Each changed square of a PLY record is
+
+    square:u8 controlCount:u8 ids:u16... trackCount:u8 ids:u16...
+
+where square is indexed like move codes (a1 = 0)."""
+import struct
+
+GAME = 1
+NAME = 2
+PLY = 3
+
+MAGIC = b"CBJ1"
+NAME_HEADER = struct.Struct("<BHB")
+
+
+def pieceIds(pieces, ids):
+    return tuple(ids[piece.name] for piece in pieces)
+
+
+class BoardJournal:
+    """Encodes boards into journal records. write is called with the
+    bytes of every record."""
+
+    def __init__(self, write):
+        self.write = write
+        self.ids = {}
+        self.previous = None
+        write(MAGIC)
+
+    def startGame(self):
+        self.previous = [((), ())] * 64
+        self.write(bytes((GAME,)))
+
+    def record(self, squares):
+        """Records the board of the current ply"""
+        if self.previous is None:
+            self.startGame()
+
+        ids = self.ids
+        data = bytearray()
+        changed = 0
+        for file in squares:
+            for sq in file:
+                controlledBy = sq.getControllingPieces()
+                trackedBy = sq.getTrackingPieces()
+                for piece in controlledBy + trackedBy:
+                    if piece.name not in ids:
+                        self.addName(piece.name)
+
+                state = (pieceIds(controlledBy, ids), pieceIds(trackedBy, ids))
+                coord = sq.getCoord()
+                index = coord[0] + 8*coord[1]
+                if state == self.previous[index]:
+                    continue
+                self.previous[index] = state
+                changed += 1
+                data.append(index)
+                for pieceList in state:
+                    data.append(len(pieceList))
+                    data += struct.pack(f"<{len(pieceList)}H", *pieceList)
+
+        self.write(bytes((PLY, changed)) + data)
+
+    def addName(self, name):
+        pieceId = len(self.ids)
+        self.ids[name] = pieceId
+        encoded = name.encode()
+        self.write(NAME_HEADER.pack(NAME, pieceId, len(encoded)) + encoded)
+
+
+class JournalReader:
+    """Reads a journal. games[i][ply] is the board of a ply, as 64
+    (controlledBy names, trackedBy names) tuples indexed like move codes."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = file.read()
+        if not self.data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a board journal")
+        # Offsets of the PLY records of every game
+        self.games = []
+        self.names = {}
+        self.scan()
+
+    def scan(self):
+        data = self.data
+        offset = len(MAGIC)
+        while offset < len(data):
+            recordType = data[offset]
+            if recordType == GAME:
+                self.games.append([])
+                offset += 1
+            elif recordType == NAME:
+                _, pieceId, length = NAME_HEADER.unpack_from(data, offset)
+                offset += NAME_HEADER.size
+                self.names[pieceId] = data[offset:offset + length].decode()
+                offset += length
+            elif recordType == PLY:
+                self.games[-1].append(offset)
+                count = data[offset + 1]
+                offset += 2
+                for _ in range(count):
+                    offset += 1
+                    for _ in range(2):
+                        offset += 1 + 2*data[offset]
+            else:
+                raise ValueError(f"Corrupt journal at byte {offset}")
+
+    def plyCount(self, game=-1):
+        return len(self.games[game])
+
+    def boardAt(self, ply, game=-1):
+        """Rebuilds the board of a ply"""
+        board = [((), ())] * 64
+        data = self.data
+        for offset in self.games[game][:ply + 1]:
+            count = data[offset + 1]
+            offset += 2
+            for _ in range(count):
+                index = data[offset]
+                offset += 1
+                state = []
+                for _ in range(2):
+                    length = data[offset]
+                    ids = struct.unpack_from(f"<{length}H", data, offset + 1)
+                    state.append(tuple(self.names[i] for i in ids))
+                    offset += 1 + 2*length
+                board[index] = tuple(state)
+        return board
+
+
+def formatBoard(board):
+    """Formats a board from JournalReader.boardAt() like the old board
+    log, one line per square"""
+    lines = []
+    for file in range(8):
+        for rank in range(8):
+            controlledBy, trackedBy = board[file + 8*rank]
+            name = "abcdefgh"[file] + str(rank + 1)
+            lines.append("{} | controlledBy: {:<50} | trackedBy: {:<50}".format(
+                name, "[" + ", ".join(controlledBy) + "]",
+                "[" + ", ".join(trackedBy) + "]"))
+    return "\n".join(lines)
@@ -0,0 +1,163 @@
+"""Profiling of the update cascades of Piece.setSquare().
+
+When a piece moves, every piece tracking its old or new square updates
+its squares. While profiling is enabled, each cascade records:
+
+    size        number of pieces updated
+    updates     time of every updateSquares() call, by piece type
+    walked      squares walked by the updates (each walked square is
+                tracked, so this counts the trackedBy additions)
+    list ops    additions to and removals from the trackedBy and
+                controlledBy lists of the squares
+
+The results can be read as aggregated stats (stats(), writeStats()) or
+written as a Chrome trace (writeTrace()), which chrome://tracing and
+Perfetto can open.
+
+Piece.setSquare() checks ENABLED before calling in. The list counters
+are only installed on Square while profiling is enabled, so profiling
+costs nothing when it is off."""
+import json
+import time
+from squares import Square
+
+ENABLED = False
+# Cascades kept for the trace and the worst cascades list
+MAX_CASCADES = 100000
+WORST_CASCADES = 20
+
+COUNTED_METHODS = {
+    "addTrackingPiece": "trackAdds",
+    "removeTrackingPiece": "trackRemoves",
+    "addControllingPiece": "controlAdds",
+    "removeControllingPiece": "controlRemoves",
+}
+
+now = time.perf_counter_ns
+counts = dict.fromkeys(COUNTED_METHODS.values(), 0)
+originalMethods = {}
+# Recorded cascades, see runCascade()
+cascades = []
+# {piece type: [calls, total ns, max ns]}
+updateTimes = {}
+
+
+def countingMethod(method, counter):
+    def counted(self, piece):
+        counts[counter] += 1
+        return method(self, piece)
+    return counted
+
+
+def enable():
+    """Starts recording cascades"""
+    global ENABLED
+    if ENABLED:
+        return
+    for name, counter in COUNTED_METHODS.items():
+        originalMethods[name] = getattr(Square, name)
+        setattr(Square, name, countingMethod(originalMethods[name], counter))
+    ENABLED = True
+
+
+def disable():
+    """Stops recording. What was recorded is kept until reset()."""
+    global ENABLED
+    if not ENABLED:
+        return
+    for name, method in originalMethods.items():
+        setattr(Square, name, method)
+    originalMethods.clear()
+    ENABLED = False
+
+
+def reset():
+    cascades.clear()
+    updateTimes.clear()
+
+
+def runCascade(movedPiece, oldSquare, piecesToUpdate):
+    """Updates piecesToUpdate like Piece.setSquare() does, recording the
+    cascade"""
+    before = dict(counts)
+    updates = []
+    start = now()
+    for piece in piecesToUpdate:
+        updateStart = now()
+        piece.updateSquares()
+        updates.append((piece.pieceName, piece.name, updateStart, now() - updateStart))
+    end = now()
+
+    for pieceName, _, _, duration in updates:
+        times = updateTimes.get(pieceName)
+        if times is None:
+            times = updateTimes[pieceName] = [0, 0, 0]
+        times[0] += 1
+        times[1] += duration
+        if duration > times[2]:
+            times[2] = duration
+
+    if len(cascades) < MAX_CASCADES:
+        cascades.append({
+            "piece": movedPiece.name,
+            "from": oldSquare.name,
+            "to": movedPiece.square.name,
+            "start": start,
+            "duration": end - start,
+            "updates": updates,
+            "counts": {key: counts[key] - before[key] for key in counts},
+        })
+
+
+def stats():
+    """Returns the aggregated stats of the recorded cascades"""
+    sizes = [len(cascade["updates"]) for cascade in cascades]
+    totals = dict.fromkeys(counts, 0)
+    for cascade in cascades:
+        for key, value in cascade["counts"].items():
+            totals[key] += value
+
+    worst = sorted(cascades, key=lambda c: c["duration"], reverse=True)
+    return {
+        "cascades": len(cascades),
+        "mean_size": sum(sizes) / len(sizes) if sizes else 0,
+        "max_size": max(sizes, default=0),
+        "total_us": sum(c["duration"] for c in cascades) / 1000,
+        "squares_walked": totals["trackAdds"],
+        "list_ops": totals,
+        "updates": {
+            pieceName: {"calls": calls, "total_us": total / 1000,
+                        "mean_us": total / calls / 1000, "max_us": maximum / 1000}
+            for pieceName, (calls, total, maximum) in sorted(updateTimes.items())
+        },
+        "worst": [
+            {"move": f"{c['piece']} {c['from']}-{c['to']}",
+             "size": len(c["updates"]), "us": c["duration"] / 1000}
+            for c in worst[:WORST_CASCADES]
+        ],
+    }
+
+
+def writeStats(path):
+    with open(path, "w") as file:
+        json.dump(stats(), file, indent=2)
+
+
+def writeTrace(path):
+    """Writes the recorded cascades as a Chrome trace, one event per
+    cascade with its updateSquares() calls nested in it"""
+    events = []
+    for cascade in cascades:
+        events.append({
+            "name": f"{cascade['piece']} {cascade['from']}-{cascade['to']}",
+            "cat": "cascade", "ph": "X", "pid": 0, "tid": 0,
+            "ts": cascade["start"] / 1000, "dur": cascade["duration"] / 1000,
+            "args": dict(cascade["counts"], size=len(cascade["updates"])),
+        })
+        for pieceName, name, start, duration in cascade["updates"]:
+            events.append({
+                "name": name, "cat": pieceName, "ph": "X", "pid": 0, "tid": 0,
+                "ts": start / 1000, "dur": duration / 1000,
+            })
+    with open(path, "w") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, file)
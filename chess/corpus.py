@@ -0,0 +1,168 @@
+"""Seeded corpus of random games and positions for benchmarks.
+
+Games are played by picking random legal moves through the rules
+engine. A game ends on mate or stalemate, when only the kings are left
+or after MAX_PLIES. One position of each phase the game reaches is
+picked at random:
+
+    opening     before ply OPENING_PLIES
+    middlegame  later, while the pieces (not counting pawns and kings)
+                are worth more than ENDGAME_MATERIAL
+    endgame     once they are worth ENDGAME_MATERIAL or less
+
+A corpus is a game record archive (see game_record.py). Each game keeps
+all its moves, and a tag per phase reached holds the ply and the FEN of
+the picked position, eg. [Middlegame "37 r1b1k2r/..."]. The moves up to
+that ply lead to the position, so it can be read as a snapshot or as a
+move sequence.
+
+Game i of a corpus generated with a seed only depends on the seed and
+i, so the same corpus can be generated again anywhere and games can be
+added to it without changing the others.
+
+Usage: python corpus.py OUT_FILE [--games N] [--seed N] [--max-plies N]
+       python corpus.py OUT_FILE --stats"""
+import argparse
+import random
+import sys
+from game_record import GameRecordReader, GameRecordWriter
+from position import Position
+from snapshot import snapshotFromFen, snapshotToFen
+
+PHASES = ("Opening", "Middlegame", "Endgame")
+OPENING_PLIES = 20
+ENDGAME_MATERIAL = 26
+MAX_PLIES = 300
+DEFAULT_SEED = 0
+DEFAULT_GAMES = 100
+PIECE_VALUES = {"Knight": 3, "Bishop": 3, "Rook": 5, "Queen": 9}
+
+
+def gameSeed(seed, index):
+    """Seed of the random moves of game index"""
+    return f"{seed}:{index}"
+
+
+def material(position):
+    """Value of the pieces on the board, not counting pawns and kings"""
+    return sum(PIECE_VALUES.get(piece.pieceName, 0)
+               for piece in position.pieces if not piece.captured)
+
+
+def phaseOf(position, ply):
+    if material(position) <= ENDGAME_MATERIAL:
+        return "Endgame"
+    if ply < OPENING_PLIES:
+        return "Opening"
+    return "Middlegame"
+
+
+def playRandomGame(rng, maxPlies=MAX_PLIES):
+    """Plays random legal moves from the starting position. Returns
+    (moves, result, {phase: (ply, fen)})."""
+    # Reservoir sampling: the n-th position of a phase replaces the
+    # picked one with probability 1/n
+    seen = dict.fromkeys(PHASES, 0)
+    positions = {}
+    result = "*"
+    position = Position()
+    for ply in range(maxPlies + 1):
+        if material(position) == 0 and len(
+                [p for p in position.pieces if not p.captured]) == 2:
+            result = "1/2-1/2"
+            break
+        # The order of the moves of a piece depends on the order its
+        # squares were updated in, which isn't the same every run
+        legalMoves = sorted(position.getLegalMoves())
+        if not legalMoves:
+            # Mate, or else stalemate
+            result = position.result or "1/2-1/2"
+            break
+        phase = phaseOf(position, ply)
+        seen[phase] += 1
+        if rng.randrange(seen[phase]) == 0:
+            positions[phase] = (ply, snapshotToFen(
+                position.snapshot(), 0, ply // 2 + 1))
+        if ply == maxPlies:
+            break
+        position.playMove(legalMoves[rng.randrange(len(legalMoves))])
+    moves = position.history
+    return moves, result, positions
+
+
+def generateCorpus(path, games=DEFAULT_GAMES, seed=DEFAULT_SEED,
+                   maxPlies=MAX_PLIES, append=False):
+    """Writes games random games to a corpus. With append, the games are
+    added after the ones already in the corpus and numbered after them.
+    Returns the number of games in the corpus."""
+    first = 0
+    if append:
+        try:
+            with GameRecordReader(path) as reader:
+                first = len(reader)
+        except FileNotFoundError:
+            pass
+    with GameRecordWriter(path, append) as writer:
+        for index in range(first, first + games):
+            moves, result, positions = playRandomGame(
+                random.Random(gameSeed(seed, index)), maxPlies)
+            tags = {"Seed": gameSeed(seed, index)}
+            for phase, (ply, fen) in positions.items():
+                tags[phase] = f"{ply} {fen}"
+            writer.addGame(moves, result, tags)
+    return first + games
+
+
+def corpusPositions(path, phase):
+    """Yields (snapshot, moves leading to it) for the position of phase
+    of every game that reached it"""
+    with GameRecordReader(path) as reader:
+        for game in reader:
+            tag = game.tags.get(phase)
+            if tag is None:
+                continue
+            ply, fen = tag.split(" ", 1)
+            yield snapshotFromFen(fen), game.moves[:int(ply)]
+
+
+def corpusStats(path):
+    """Returns {"games", "plies", "results": {result: count},
+    "positions": {phase: count}}"""
+    stats = {"games": 0, "plies": 0, "results": {},
+             "positions": dict.fromkeys(PHASES, 0)}
+    with GameRecordReader(path) as reader:
+        for game in reader:
+            stats["games"] += 1
+            stats["plies"] += len(game)
+            stats["results"][game.result] = stats["results"].get(game.result, 0) + 1
+            for phase in PHASES:
+                if phase in game.tags:
+                    stats["positions"][phase] += 1
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a corpus of random games")
+    parser.add_argument("outFile")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES)
+    parser.add_argument("--append", action="store_true",
+                        help="add games after the ones already in the corpus")
+    parser.add_argument("--stats", action="store_true",
+                        help="only print the stats of an existing corpus")
+    args = parser.parse_args(argv)
+
+    if not args.stats:
+        generateCorpus(args.outFile, args.games, args.seed, args.max_plies,
+                       args.append)
+    stats = corpusStats(args.outFile)
+    print(f"{stats['games']} games, {stats['plies']} plies")
+    print("results: " + ", ".join(
+        f"{result} {count}" for result, count in sorted(stats["results"].items())))
+    print("positions: " + ", ".join(
+        f"{phase} {count}" for phase, count in stats["positions"].items()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""Renders positions to PNG diagrams without showing a window.
+
+The squares come from BoardScene.createSquares() and the pieces from
+the shared cache in piece_images.py, so diagrams look like the board.
+Pins and square control can be drawn with the board's overlay.
+
+Renderers given a DiagramCache (see diagram_cache.py) only render the
+diagrams that aren't in it yet.
+
+Usage: python diagram.py FEN_FILE OUT_DIR [--size N] [--theme NAME]
+                         [--pins] [--control] [--cache DIR] [--cache-mb N]
+
+FEN_FILE has one FEN per line. Diagrams are written to
+OUT_DIR/diagram0000.png, OUT_DIR/diagram0001.png, ..."""
+import argparse
+import os
+import shutil
+import sys
+from PySide6.QtCore import QBuffer, QIODevice, QSize, Qt
+from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter
+from PySide6.QtWidgets import QStyleOptionGraphicsItem
+from analysis import analyzePosition, analyzeSnapshot
+from board import BoardScene
+from diagram_cache import DEFAULT_MAX_BYTES, DiagramCache, diagramKey
+from moves import indexToSquareName
+from overlay import BoardOverlay
+from position import Position
+from snapshot import decodeSnapshot, snapshotFromFen
+import piece_images
+
+DEFAULT_SIZE = 400
+# Trades a little compression for much faster encoding, which takes
+# most of the time of a diagram
+PNG_QUALITY = 50
+# (light squares, dark squares)
+THEMES = {
+    "classic": (QColor(Qt.white), QColor(Qt.black)),
+    "wood": (QColor(240, 217, 181), QColor(181, 136, 99)),
+}
+
+
+def ensureApplication():
+    """Pixmaps need a QGuiApplication. Starts one on the offscreen
+    platform if there is none."""
+    app = QGuiApplication.instance()
+    if app is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QGuiApplication([])
+    return app
+
+
+def toSnapshot(position):
+    """Returns the snapshot of a FEN string, a Position or a snapshot"""
+    if isinstance(position, str):
+        return snapshotFromFen(position)
+    if isinstance(position, Position):
+        return position.snapshot()
+    return bytes(position)
+
+
+class DiagramRenderer:
+    """Draws positions on images of size x size pixels"""
+
+    def __init__(self, size=DEFAULT_SIZE, theme="classic", pins=False,
+                 control=False, cache=None):
+        ensureApplication()
+        self.size = size
+        self.theme = theme
+        self.pins = pins
+        self.control = control
+        self.cache = cache
+
+        self.squareSize = QSize(size, size) / 8
+        # Same margin around the pieces as on the board
+        self.pieceSize = self.squareSize - (
+            BoardScene.SQUARE_SIZE - BoardScene.PIECE_SIZE)
+        self.squares = BoardScene.createSquares(self.squareSize, *THEMES[theme])
+        self.overlay = None
+        if pins or control:
+            self.overlay = BoardOverlay(self.squares)
+            self.overlay.setControlShown(control)
+        piece_images.prewarm(self.pieceSize)
+
+    def render(self, position):
+        """Returns a QImage of a position (FEN string, Position or
+        snapshot)"""
+        snapshot = toSnapshot(position)
+        # The board covers the whole image, so it needs no alpha channel
+        image = QImage(self.squareSize * 8, QImage.Format_RGB32)
+        painter = QPainter(image)
+        for sq in self.squares.values():
+            painter.fillRect(sq.rect(), sq.brush())
+
+        if self.overlay is not None:
+            if isinstance(position, Position):
+                result = analyzePosition(position)
+            else:
+                result = analyzeSnapshot(snapshot)
+            self.overlay.setAnalysis(
+                result["pins"] if self.pins else (), (), result["control"])
+            option = QStyleOptionGraphicsItem()
+            option.exposedRect = self.overlay.boundingRect()
+            self.overlay.paint(painter, option)
+
+        for index, piece in decodeSnapshot(snapshot).placement.items():
+            sq = self.squares[indexToSquareName(index)]
+            painter.drawPixmap(
+                sq.getCoord(), piece_images.getPixmap(piece, self.pieceSize))
+        painter.end()
+        return image
+
+    def encode(self, position):
+        """Returns the PNG bytes of the diagram of a position"""
+        buffer = QBuffer()
+        buffer.open(QIODevice.WriteOnly)
+        self.render(position).save(buffer, "PNG", PNG_QUALITY)
+        return bytes(buffer.data())
+
+    def cachedPath(self, position):
+        """Returns the path of the diagram of a position in the cache,
+        rendering it first if it isn't cached"""
+        key = diagramKey(toSnapshot(position), self.size, self.pins,
+                         self.control, self.theme)
+        path = self.cache.get(key)
+        if path is None:
+            path = self.cache.put(key, self.encode(position))
+        return path
+
+    def save(self, position, path):
+        """Writes the diagram of a position to a PNG file"""
+        if self.cache is not None:
+            try:
+                shutil.copyfile(self.cachedPath(position), path)
+                return
+            except FileNotFoundError:
+                pass  # evicted by another process before it was copied
+        with open(path, "wb") as file:
+            file.write(self.encode(position))
+
+    def renderBatch(self, positions, outDir, prefix="diagram"):
+        """Writes a diagram for every position to outDir and returns the
+        paths written"""
+        os.makedirs(outDir, exist_ok=True)
+        paths = []
+        for i, position in enumerate(positions):
+            path = os.path.join(outDir, f"{prefix}{i:04d}.png")
+            self.save(position, path)
+            paths.append(path)
+        return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render FENs to PNG diagrams")
+    parser.add_argument("fenFile")
+    parser.add_argument("outDir")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--theme", choices=sorted(THEMES), default="classic")
+    parser.add_argument("--pins", action="store_true")
+    parser.add_argument("--control", action="store_true")
+    parser.add_argument("--cache", help="directory of a diagram cache")
+    parser.add_argument("--cache-mb", type=int,
+                        default=DEFAULT_MAX_BYTES // (1024 * 1024))
+    args = parser.parse_args(argv)
+
+    with open(args.fenFile) as file:
+        fens = [line.strip() for line in file if line.strip()]
+    cache = None
+    if args.cache:
+        cache = DiagramCache(args.cache, args.cache_mb * 1024 * 1024)
+    renderer = DiagramRenderer(args.size, args.theme, args.pins, args.control,
+                               cache)
+    paths = renderer.renderBatch(fens, args.outDir)
+    print(f"Wrote {len(paths)} diagrams to {args.outDir}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""On-disk cache of rendered diagrams, shared by any number of processes.
+
+A diagram is stored under a hash of everything it depends on: the
+position's snapshot, the size, the overlays and the theme. A diagram
+that was rendered once is never rendered again while it is cached.
+
+Files are written to a temporary name and renamed into place, so other
+processes never see a partial file. The modification time of a file is
+updated on every hit. When the cache grows over its size limit, the
+least recently used files are deleted until it is back under
+EVICT_TO of the limit."""
+import hashlib
+import os
+import struct
+import tempfile
+import time
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+EVICT_TO = 0.9
+# Temporary files older than this were left by a process that died
+# while writing
+STALE_TEMP_SECONDS = 3600
+# Changed whenever diagrams start looking different, so old files are
+# no longer used
+RENDER_VERSION = 1
+
+KEY_OPTIONS = struct.Struct("<HHBB")
+
+
+def diagramKey(snapshot, size, pins, control, theme):
+    """Returns the hex key of a diagram"""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(snapshot)
+    digest.update(KEY_OPTIONS.pack(RENDER_VERSION, size, pins, control))
+    digest.update(theme.encode())
+    return digest.hexdigest()
+
+
+class DiagramCache:
+
+    def __init__(self, directory, maxBytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        os.makedirs(directory, exist_ok=True)
+        # Size of the cache as far as this process knows. Other
+        # processes add files too, so it is measured again before
+        # evicting.
+        self.totalBytes = sum(size for _, _, size in self.entries())
+
+    def path(self, key):
+        # Files are spread over subdirectories to keep directories small
+        return os.path.join(self.directory, key[:2], key + ".png")
+
+    def get(self, key):
+        """Returns the path of a cached diagram, or None"""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key, data):
+        """Stores the PNG bytes of a diagram and returns its path"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tempPath = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            # mkstemp makes files only the owner can read
+            os.chmod(tempPath, 0o644)
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            try:
+                replacedBytes = os.stat(path).st_size
+            except FileNotFoundError:
+                replacedBytes = 0
+            os.replace(tempPath, path)
+        except BaseException:
+            try:
+                os.unlink(tempPath)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self.totalBytes += len(data) - replacedBytes
+        if self.totalBytes > self.maxBytes:
+            self.evict()
+        return path
+
+    def entries(self, suffix=".png"):
+        """Yields (mtime, path, size) of every cached diagram"""
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if not entry.name.endswith(suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # evicted by another process
+                yield stat.st_mtime, entry.path, stat.st_size
+
+    def evict(self):
+        """Deletes the least recently used diagrams until the cache is
+        under EVICT_TO of its limit"""
+        entries = sorted(self.entries())
+        total = sum(size for _, _, size in entries)
+        target = self.maxBytes * EVICT_TO
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.totalBytes = total
+
+        staleTime = time.time() - STALE_TEMP_SECONDS
+        for mtime, path, _ in list(self.entries(".tmp")):
+            if mtime < staleTime:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,65 @@
+"""Events of the rules model, sent to subscribers after every move.
+
+Once a move is complete (after promote() for a promotion), a Position
+emits its events in this order:
+
+    PieceRemoved    a piece was captured, en passant included
+    PieceMoved      a piece changed squares, twice for castling
+    PiecePromoted   a pawn was replaced by a new piece
+    ControlChanged  the pieces controlling a square changed
+    PinRemoved      a piece is no longer pinned by pinner
+    PinAdded        a piece is now pinned by pinner
+    Check           the king of the side to move is in check
+    MovePlayed      the encoded move, always last
+
+Pieces are given by their name (eg. wKnight1) and squares by their name
+(eg. e4). The events are found by comparing the board before and after
+the move. A Position only reads the board before a move while it has
+subscribers, and the control of the squares while one of them takes
+ControlChanged, so events cost nothing to a Position nobody listens to."""
+from collections import namedtuple
+
+PieceMoved = namedtuple("PieceMoved", "piece fromSquare toSquare")
+PieceRemoved = namedtuple("PieceRemoved", "piece square")
+PiecePromoted = namedtuple("PiecePromoted", "piece pawn square")
+# controlledBy is a sorted tuple of piece names
+ControlChanged = namedtuple("ControlChanged", "square controlledBy")
+PinAdded = namedtuple("PinAdded", "pinned pinner")
+PinRemoved = namedtuple("PinRemoved", "pinned pinner")
+Check = namedtuple("Check", "king square mate")
+MovePlayed = namedtuple("MovePlayed", "move ply")
+
+EVENT_TYPES = (PieceRemoved, PieceMoved, PiecePromoted, ControlChanged,
+               PinRemoved, PinAdded, Check, MovePlayed)
+# What a view of the pieces needs
+PIECE_EVENTS = (PieceRemoved, PieceMoved, PiecePromoted)
+
+
+class EventSource:
+    """Calls the subscribed callbacks with the events they take"""
+
+    def __init__(self):
+        # [(callback, event types or None for all)]
+        self.subscribers = []
+
+    def subscribe(self, callback, eventTypes=None):
+        """callback(event) is called with every event of eventTypes, or
+        of every type if eventTypes is None"""
+        types = frozenset(eventTypes) if eventTypes is not None else None
+        self.subscribers.append((callback, types))
+
+    def unsubscribe(self, callback):
+        self.subscribers = [(subscribed, types)
+                            for subscribed, types in self.subscribers
+                            if subscribed != callback]
+
+    def wants(self, eventType):
+        """Whether a subscriber takes events of eventType"""
+        return any(types is None or eventType in types
+                   for _, types in self.subscribers)
+
+    def emit(self, event):
+        eventType = type(event)
+        for callback, types in list(self.subscribers):
+            if types is None or eventType in types:
+                callback(event)
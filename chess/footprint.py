@@ -0,0 +1,142 @@
+"""Memory held by one game, in bytes, by category.
+
+    pieces      the Piece objects and their own attributes
+    squares     the Square objects and their own attributes
+    tracking    the lists of squares and pieces that pieces and squares
+                keep of each other (trackedBy, controlledBy, moves, ...)
+    board       the Position itself and its lists of squares and pieces
+    history     the moves played
+    timeline    moves and snapshots kept to review earlier plies, and
+                the Position the timeline replays on
+    move list   the SAN moves of the move list
+    scene       the Python side of the scene items
+
+positionFootprint() only counts a Position, which is what a headless
+server holds per game. gameFootprint() counts a ChessGame.
+
+Sizes come from sys.getsizeof() and every object is counted once, in
+the first category it is found in. Objects shared by every game (classes,
+small ints, None, ...) aren't counted. Qt allocates the widgets and the
+scene items in C++, which Python can't see: "scene" only counts their
+Python wrappers, and "scene items" gives their number. Measure the
+process RSS for the C++ side (see benchmarks/memory_growth.py)."""
+import sys
+from moves import MoveBuffer
+from pieces import Piece
+from squares import Square
+
+# Lists pieces and squares keep of each other
+TRACKING_ATTRIBUTES = frozenset((
+    "trackedBy", "controlledBy", "trackedSquares", "moves",
+    "nonMovesControlledSquares", "pinnedTo", "controlledSquares",
+    "castleMoves",
+))
+CONTAINERS = (list, tuple, dict, set, frozenset)
+
+
+class Footprint:
+    """Adds up the sizes of objects by category, counting each object
+    once"""
+
+    def __init__(self):
+        self.seen = set()
+        self.sizes = {}
+
+    def count(self, category, obj):
+        """Adds the size of obj alone. Returns False if it was already
+        counted."""
+        if id(obj) in self.seen:
+            return False
+        self.seen.add(id(obj))
+        self.sizes[category] = self.sizes.get(category, 0) + sys.getsizeof(obj)
+        return True
+
+    def add(self, category, value):
+        """Adds a plain data value and what it holds. Pieces, squares
+        and other objects are only referenced, they are added with
+        addObject()."""
+        if value is None or isinstance(value, bool):
+            return
+        # Small ints are shared by the whole interpreter
+        if isinstance(value, int) and -5 <= value <= 256:
+            return
+        if isinstance(value, (str, bytes, int, float)):
+            self.count(category, value)
+        elif isinstance(value, dict):
+            if self.count(category, value):
+                for key, item in value.items():
+                    self.add(category, key)
+                    self.add(category, item)
+        elif isinstance(value, CONTAINERS):
+            if self.count(category, value):
+                for item in value:
+                    self.add(category, item)
+        elif isinstance(value, MoveBuffer):
+            if self.count(category, value):
+                self.count(category, value.codes)
+
+    def addObject(self, category, obj, skip=(), trackingCategory="tracking"):
+        """Adds an object, its __dict__ and its plain data attributes,
+        except the ones in skip"""
+        if obj is None or not self.count(category, obj):
+            return
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is None:
+            return
+        self.count(category, attributes)
+        for name, value in attributes.items():
+            if name in skip:
+                continue
+            if name in TRACKING_ATTRIBUTES and isinstance(value, list):
+                self.add(trackingCategory, value)
+            else:
+                self.add(category, value)
+
+    def result(self):
+        sizes = dict(self.sizes)
+        sizes["total"] = sum(self.sizes.values())
+        return sizes
+
+
+def addPosition(footprint, position, category=None):
+    """Adds a Position. With category, everything goes in it."""
+    footprint.addObject(category or "board", position,
+                        skip=("squares", "pieces", "history"))
+    for piece in position.pieces:
+        footprint.addObject(category or "pieces", piece,
+                            trackingCategory=category or "tracking")
+    for file in position.squares:
+        for square in file:
+            footprint.addObject(category or "squares", square,
+                                trackingCategory=category or "tracking")
+    footprint.add(category or "board", position.squares)
+    footprint.add(category or "board", position.pieces)
+    footprint.add(category or "history", position.history)
+
+
+def positionFootprint(position):
+    """Returns {category: bytes, "total": bytes} for a Position"""
+    footprint = Footprint()
+    addPosition(footprint, position)
+    return footprint.result()
+
+
+def gameFootprint(game):
+    """Returns {category: bytes, "total": bytes, "scene items": count}
+    for a ChessGame"""
+    footprint = Footprint()
+    addPosition(footprint, game.position)
+
+    timeline = game.timeline
+    footprint.addObject("timeline", timeline, skip=("replayPosition",))
+    if timeline.replayPosition is not None:
+        addPosition(footprint, timeline.replayPosition, "timeline")
+
+    footprint.add("move list", game.gameInfo.moveList.model.moves)
+
+    items = game.board.scene().items()
+    for item in items:
+        footprint.addObject("scene", item)
+    sizes = footprint.result()
+    sizes["scene items"] = len(items)
+    return sizes
@@ -1,12 +1,21 @@
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QFrame, QLabel,
-                               QGridLayout, QVBoxLayout)
-from PySide6.QtCore import Qt
-from board import BoardView, Square
+                               QListView, QVBoxLayout, QCheckBox)
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, Signal
+from PySide6.QtGui import QFontDatabase, QKeySequence, QShortcut
+from board import BoardView
 from interface import BoardToGameInterface
-from pieces import *
-from squares import Squares
-from special_moves import Castle
-import logger
+from position import Position
+from timeline import GameTimeline
+from events import PIECE_EVENTS
+from analysis_worker import AnalysisWorker
+from special_moves import EnPassant
+from san import PIECE_LETTERS, checkSuffix, sanFromSquares
+import latency
+
+RESULT_TEXT = {"1-0": "White wins", "0-1": "Black wins"}
+# White's column of the move list when black moves first
+NO_MOVE = "..."
+
 
 class ChessGame(QWidget):
     
@@ -20,18 +29,27 @@ class ChessGame(QWidget):
         self.gameInfo = GameInfo()
         
         # Game variables
-        self.turn = 0
-        self.whiteTurn = True
         self.selectedPiece = None
         self.selectedSquare = None  # square of the selected piece
-        self.wKing = None
-        self.bKing = None
+        # Name of a pawn's move waiting for the promotion dialog
+        self.promotionMoveName = None
 
         # Make a board state
-        self.squares = [[], [], [], [], [], [], [], []]
-        Squares.setSquares(self.squares)
-        self.pieces = []
-        self.initializeBoardState()
+        self.position = Position()
+        self.position.startJournal()
+        # The board draws the moves from the position's events
+        self.position.events.subscribe(
+            self.board.scene().queueEvent, PIECE_EVENTS)
+        # Moves and snapshots used to review earlier plies, and the ply
+        # shown on the board
+        self.timeline = GameTimeline()
+        self.shownPly = 0
+
+        # Pins, hanging pieces and evaluation are computed in the
+        # background after every move
+        self.analysisWorker = AnalysisWorker(self)
+        self.analysisWorker.analysisReady.connect(self.showAnalysis)
+        self.analysisWorker.submit(self.position.snapshot())
 
         self.layout = QHBoxLayout()
         self.layout.setContentsMargins(0,0,0,0)
@@ -40,121 +58,45 @@ class ChessGame(QWidget):
         self.layout.addWidget(self.gameInfo, stretch=1)
         self.setLayout(self.layout)
 
-    def initializeBoardState(self):
-        """Initializes the board state by creating all the squares
-        and adding the appropriate Pieces to their initial squares."""
-        for i in range(8):
-            for j in range(8):
-                sqName = self.coordToSquareName((i, j))
-                self.squares[i].append(Square((i, j), sqName))
-
-        for i in range(8):
-            # Piece instances save themselves as an attribute to
-            # the passed in 'square' using square.setPiece(self).
-
-            # Add pawns
-            p1 = Pawn(isWhite=True, square=self.squares[i][1])
-            p2 = Pawn(isWhite=False, square=self.squares[i][6])
-            self.pieces.extend((p1, p2))
-
-            # Add rooks
-            if i == 0 or i == 7:  # i=0 is the a file and i=7 is the h file
-                p1 = Rook(isWhite=True, square=self.squares[i][0])
-                p2 = Rook(isWhite=False, square=self.squares[i][7])
-                self.pieces.extend((p1, p2))
-
-            # Add knights
-            if i == 1 or i == 6:
-                p1 = Knight(isWhite=True, square=self.squares[i][0])
-                p2 = Knight(isWhite=False, square=self.squares[i][7])
-                self.pieces.extend((p1, p2))
-
-            # Add bishops
-            if i == 2 or i == 5:
-                p1 = Bishop(isWhite=True, square=self.squares[i][0])
-                p2 = Bishop(isWhite=False, square=self.squares[i][7])
-                self.pieces.extend((p1, p2))
-
-            # Add queens
-            if i == 3:
-                p1 = Queen(isWhite=True, square=self.squares[i][0])
-                p2 = Queen(isWhite=False, square=self.squares[i][7])
-                self.pieces.extend((p1, p2))
-
-            # Add kings
-            if i == 4:
-                self.wKing = King(isWhite=True, square=self.squares[i][0])
-                self.bKing = King(isWhite=False, square=self.squares[i][7])
-                self.pieces.extend((self.wKing, self.bKing))
-
-        for piece in self.pieces:
-            piece.updateSquares(init=True)
-        logger.showBoard(self.squares)
-
-    def squareNameToCoord(self, squareName):
-        """Convert a square's name (eg. a1) to indexes for the square
-        on self.squares"""
-        letters = "abcdefgh"
-
-        letterCoord = letters.index(squareName[0])
-        numCoord = int(squareName[1]) - 1
-
-        return letterCoord, numCoord
-
-    def coordToSquareName(self, coord):
-        """Convert a square's index in self.squares (nicknamed coords),
-        to the traditional square names in chess (eg. a1, b2)"""
-        letters = "abcdefgh"
-
-        sqName = letters[coord[0]] + str(coord[1] + 1)
-        return sqName
+        # Earlier plies are shown with the arrow keys or by clicking a
+        # move in the move list
+        self.gameInfo.moveList.plyClicked.connect(self.showPly)
+        self.gameInfo.showControl.toggled.connect(self.board.scene().showControl)
+        for key, ply in ((Qt.Key_Left, lambda: self.shownPly - 1),
+                         (Qt.Key_Right, lambda: self.shownPly + 1),
+                         (Qt.Key_Home, lambda: 0),
+                         (Qt.Key_End, lambda: len(self.timeline))):
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(
+                lambda ply=ply: self.showPly(min(max(ply(), 0), len(self.timeline))))
+
+    @property
+    def whiteTurn(self):
+        return self.position.whiteTurn
 
     def pawnPromoted(self, promotedTo):
         """When user selects a piece for the promoting pawn to promote
         to."""
-        if promotedTo[0] == "w":
-            isWhite = True
-        else:
-            isWhite = False
-        
-        if promotedTo[1:] == "Queen":
-            newPiece = Queen(
-                isWhite=isWhite, square=self.promotionSquares[1], promotion=True
-            )
-        elif promotedTo[1:] == "Rook":
-            newPiece = Rook(
-                isWhite=isWhite, square=self.promotionSquares[1], promotion=True
-            )
-        elif promotedTo[1:] == "Knight":
-            newPiece = Knight(
-                isWhite=isWhite, square=self.promotionSquares[1], promotion=True
-            )
-        elif promotedTo[1:] == "Bishop":
-            newPiece = Bishop(
-                isWhite=isWhite, square=self.promotionSquares[1], promotion=True
-            )
-
-        turn = self.whiteTurn
-        self.nextTurn()
-        # Checks if a king is checked and whether it is checkmate
-        # or not.
-        checked = self.check()
+        turn = self.position.whiteTurn
+        self.position.promote(promotedTo)
+        self.timeline.record(self.position)
+        self.shownPly = len(self.timeline)
+        self.analysisWorker.submit(self.position.snapshot())
         self.gameInfo.moveList.addMove(
-            self.createMoveName(
-                self.promotionSquares[0], self.promotionSquares[1], 
-                promotingTo=promotedTo, capture=self.promotionOnCapture,
-                **checked
-            ),
+            self.promotionMoveName + "=" + PIECE_LETTERS[promotedTo[1:]]
+            + checkSuffix(self.position.lastCheck),
             turn
         )
-
-        self.promotionSquares = None
-
+        self.promotionMoveName = None
+        self.showResult()
 
     def squareClicked(self, squareName):
-        """""" 
-        coord = self.squareNameToCoord(squareName)
-        sq = self.squares[coord[0]][coord[1]]
+        """Selects the piece on the clicked square or moves the selected
+        piece there. Returns what the board should do.""" 
+        # Reviewing earlier plies replays them on another Position
+        self.position.activate()
+        sq = self.position.getSquare(squareName)
         piece = sq.getPiece()
 
         if sq.hasPiece():
@@ -163,32 +105,7 @@ class ChessGame(QWidget):
             if (self.selectedPiece is not None
                     and self.selectedPiece.isOppositeColorAs(piece)
                     and self.selectedPiece.canMoveTo(sq)):
-
-                moveType = self.selectedPiece.setSquare(sq)
-                old_sq = self.selectedSquare
-                turn = self.whiteTurn
-
-                if moveType == "promotion":
-                    self.promotionSquares = (old_sq, sq)
-                    self.promotionOnCapture = True
-                    return {
-                        "action": "showPromotionDialog",
-                        "state": (str(old_sq), str(sq), turn)
-                    }
-                
-                self.nextTurn()
-                # Checks if a king is checked and whether it is checkmate
-                # or not.
-                checked = self.check()
-                self.gameInfo.moveList.addMove(
-                    self.createMoveName(old_sq, sq, capture=True, **checked),
-                    turn
-                )
-
-                return {
-                    "action": "movePiece",
-                    "squares": [str(old_sq), str(sq)]
-                }
+                return self.moveSelectedPiece(sq)
 
             # If there is a piece on the clicked square, check if it is
             # its color's turn. If so, select the piece and visually
@@ -208,143 +125,85 @@ class ChessGame(QWidget):
             # that can move to the square.
             if (self.selectedPiece is not None 
                     and self.selectedPiece.canMoveTo(sq)):
-                moveType = self.selectedPiece.setSquare(sq) # Moves the piece to sq
-                old_sq = self.selectedSquare
-                turn = self.whiteTurn
-                EnPassant.reset(turn)  # if enPassant was available, remove it
-                
-                if moveType == "promotion":
-                    self.promotionSquares = (old_sq, sq)
-                    self.promotionOnCapture = False
-                    return {
-                        "action": "showPromotionDialog",
-                        "state": (str(old_sq), str(sq), turn)
-                    }
-                
-                self.nextTurn()
-                
-                checked = self.check()
-
-                if moveType[0] == "normal":
-                    self.gameInfo.moveList.addMove(
-                        self.createMoveName(old_sq, sq, capture=False, **checked),
-                        turn
-                    )
-                    return {
-                        "action": "movePiece",
-                        "squares": [str(old_sq), str(sq)]
-                    }
-
-                elif moveType[0] == "castle":
-                    self.gameInfo.moveList.addMove(
-                        self.createMoveName(old_sq, sq, capture=False, castle=moveType[1]),
-                        turn
-                    )
-                    return {
-                        "action": "castle",
-                        "kingMove": [str(old_sq), str(sq)],
-                        "rookMove": moveType[1]
-                    }
-
-                elif moveType[0] == "enPassant":
-                    self.gameInfo.moveList.addMove(
-                        self.createMoveName(old_sq, sq, capture=True),
-                        turn
-                    )
-                    return {
-                        "action": "enPassant",
-                        "squares": [str(old_sq), str(sq)],
-                        "take": str(EnPassant.take)
-                    }
+                return self.moveSelectedPiece(sq)
             else:
                 # This can run if there is no selected piece or the
                 # selected piece cannot move to the selected square.
                 # Just unhighlight any highlighted squares, if any.
                 return {"action": "unhighlightSquares"}
 
-    def nextTurn(self):
-            # After every turn, one of the kings will have their squares
-            # updated, as they could be restricted at any time and their
-            # trackedSquares list is not enough to keep up.
-            if self.whiteTurn:
-                self.bKing.updateSquares()
-            else:
-                self.wKing.updateSquares()
-
-            self.selectedPiece = None
-            self.selectedSquare = None
-
-            self.whiteTurn = True if self.whiteTurn is False else False  # switch turns
-
-            logger.showBoard(self.squares)
-
-    def check(self):
-        """Checks whether a king is checked and whether it is checkmate or not"""
-        noCheck = {"check": False, "mate": False}
-        checkNoMate = {"check": True, "mate": False}
-        checkmate = {"check": True, "mate": True}
-
-        if self.wKing.isChecked():
-            # If king has no moves, check if a piece can block or capture the check
-            if not self.wKing.getMoves():
-                for piece in self.pieces:
-                    if piece.isSameColorAs(self.wKing) and piece.getMoves():
-                        return checkNoMate
-                # Game over
-                print("Black wins")
-                return checkmate
-            return checkNoMate
-
-        elif self.bKing.isChecked():
-            if not self.bKing.getMoves():
-                for piece in self.pieces:
-                    if piece.isSameColorAs(self.bKing) and piece.getMoves():
-                        return checkNoMate
-                
-                # Game over
-                print("White wins")
-                return checkmate
-            return checkNoMate
-        
-        return noCheck
-
-    def createMoveName(self, oldSquare, newSquare, capture = False, check = False,
-                       mate = False, castle = None, promotingTo = None):
-        """Creates a move name (eg. Nf3) from looking at a pieces'
-        current square (oldSquare) and the square it's going to move
-        to (newSquare)"""
-
-        def getAbbr(name):
-            # Abbreviation for knight in moves is N, as the King takes K
-            if (name) == "Knight":
-                return "N"
-            elif name == "Pawn" and capture:
-                return str(oldSquare)[0]
-            elif name == "Pawn":
-                return ""
-            else:
-                return name[0]
+    def moveSelectedPiece(self, sq):
+        """Moves the selected piece to sq and adds the move to the move
+        list"""
+        old_sq = self.selectedSquare
+        turn = self.whiteTurn
+        # The move is named before it is played, as disambiguating it
+        # needs the pieces that could also move to sq
+        moveName = sanFromSquares(old_sq, sq)
+        moveType = self.position.makeMove(old_sq, sq)
+        self.selectedPiece = None
+        self.selectedSquare = None
 
-        if castle:
-            return Castle.getMoveName(castle)
+        if moveType == "promotion":
+            self.promotionMoveName = moveName
+            self.analysisWorker.cancel()
+            return {
+                "action": "showPromotionDialog",
+                "state": (str(old_sq), str(sq), turn)
+            }
 
-        pieceName = newSquare.getPiece().pieceName
-        if promotingTo is None:
-            prefix = getAbbr(pieceName)
-        else:
-            prefix = getAbbr("Pawn")
+        self.timeline.record(self.position)
+        self.shownPly = len(self.timeline)
+        self.analysisWorker.submit(self.position.snapshot())
+        self.gameInfo.moveList.addMove(
+            moveName + checkSuffix(self.position.lastCheck), turn)
+        self.showResult()
 
-        suffix = ""
-        if capture:
-            prefix += 'x'
-        if promotingTo is not None:
-            suffix += '=' + getAbbr(promotingTo[1:])
-        if mate:
-            suffix += '#'
-        elif check:
-            suffix += '+'
+        if moveType[0] == "castle":
+            return {
+                "action": "castle",
+                "kingMove": [str(old_sq), str(sq)],
+                "rookMove": moveType[1]
+            }
 
-        return prefix + str(newSquare) + suffix
+        elif moveType[0] == "enPassant":
+            return {
+                "action": "enPassant",
+                "squares": [str(old_sq), str(sq)],
+                "take": str(EnPassant.take)
+            }
+
+        return {
+            "action": "movePiece",
+            "squares": [str(old_sq), str(sq)]
+        }
+
+    def showResult(self):
+        """Shows who won once a king is mated"""
+        if self.position.result is not None:
+            self.gameInfo.setResult(RESULT_TEXT[self.position.result])
+
+    def showPly(self, ply):
+        """Shows the board as it was after ply moves. Squares can't be
+        clicked until the last ply is shown again."""
+        scene = self.board.scene()
+        if scene.promotionDialogShown or ply == self.shownPly:
+            return
+        self.selectedPiece = None
+        self.selectedSquare = None
+        if ply == len(self.timeline):
+            snapshot = self.position.snapshot()
+        else:
+            snapshot = self.timeline.snapshotAt(ply)
+        scene.showSnapshot(snapshot)
+        scene.reviewing = ply != len(self.timeline)
+        self.shownPly = ply
+        self.analysisWorker.submit(snapshot)
+
+    def showAnalysis(self, result):
+        """Shows the result of the background analysis of the board"""
+        self.board.scene().showAnalysis(result)
+        self.gameInfo.setEvaluation(result["evaluation"])
 
 
 class GameInfo(QFrame):
@@ -352,25 +211,92 @@ class GameInfo(QFrame):
     def __init__(self):
         super().__init__()
         self.moveList = MoveList()
+        self.evaluation = QLabel()
+        # Tints the squares controlled more by one color
+        self.showControl = QCheckBox("Show control")
+        self.result = QLabel()
+        self.result.hide()
 
         layout = QVBoxLayout()
+        layout.addWidget(self.evaluation)
+        layout.addWidget(self.showControl)
+        layout.addWidget(self.result)
         layout.addWidget(self.moveList, stretch=1)
+        if latency.ENABLED:
+            from latency_panel import LatencyPanel
+            layout.addWidget(LatencyPanel())
         self.setLayout(layout)
 
+    def setEvaluation(self, centipawns):
+        """Shows an evaluation, positive when white is better"""
+        self.evaluation.setText(f"Evaluation: {centipawns / 100:+.2f}")
+
+    def setResult(self, text):
+        self.result.setText(text)
+        self.result.show()
+
+
+class MoveListModel(QAbstractListModel):
+    """The moves of a game, one row per move number with white's and
+    black's move"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.moves = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return (len(self.moves) + 1) // 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        white = self.moves[2*row]
+        black = self.moves[2*row + 1] if 2*row + 1 < len(self.moves) else ""
+        return f"{row + 1:>3}. {white:<9}{black}"
+
+    def addMove(self, move, isWhite=True):
+        """Appends a move to white's or black's column. Only the row of
+        the move is updated."""
+        row = len(self.moves) // 2
+        if len(self.moves) % 2 == 0:
+            self.beginInsertRows(QModelIndex(), row, row)
+            if not isWhite:
+                # The game started with black to move
+                self.moves.append(NO_MOVE)
+            self.moves.append(move)
+            self.endInsertRows()
+        else:
+            self.moves.append(move)
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def plyAfterRow(self, row):
+        """Number of plies played up to the last move of a row"""
+        skipped = 1 if self.moves[:1] == [NO_MOVE] else 0
+        return min(2*row + 2, len(self.moves)) - skipped
+
 
 class MoveList(QFrame):
-    """Widget that shows move history of a game"""
+    """Widget that shows move history of a game. Only the visible rows
+    are drawn, so long games don't slow it down."""
+
+    # Ply after the last move of a clicked row
+    plyClicked = Signal(int)
 
     def __init__(self):
         super().__init__()
         self.setFrameStyle(QFrame.Panel | QFrame.Raised)
         self.setLineWidth(3)
 
-        # Row number for the move list (increments after black's turn)
-        self.row = 0
-
         label = QLabel("Moves")
-        self.moveList, self.moveListLayout = self.createMoveList()
+        self.model = MoveListModel(self)
+        self.moveList = self.createMoveList()
+        # Scrolling lays the view out, so it's done once after a batch
+        # of moves is added rather than for every move
+        self.scrollPending = False
 
         self.layout = QVBoxLayout()
         self.layout.addWidget(label, stretch=1, alignment=Qt.AlignCenter)
@@ -378,92 +304,30 @@ class MoveList(QFrame):
         self.setLayout(self.layout)
 
     def createMoveList(self):
-        """Creates frame that will hold move history"""
-        moveList = QFrame()
-        layout = QGridLayout()
-        for i in range(20):
-            layout.setRowStretch(i, 1)
-        layout.setColumnStretch(0, 1)  # Column showing turn number should be smaller.
-        layout.setColumnStretch(1, 2)
-        layout.setColumnStretch(2, 2)
-        moveList.setLayout(layout)
-        return moveList, layout
+        """Creates the view that will show move history"""
+        moveList = QListView()
+        moveList.setModel(self.model)
+        # Rows all have the same height, so the view doesn't have to
+        # measure them to lay them out
+        moveList.setUniformItemSizes(True)
+        moveList.setEditTriggers(QListView.NoEditTriggers)
+        moveList.setSelectionMode(QListView.NoSelection)
+        moveList.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        moveList.clicked.connect(lambda index: self.plyClicked.emit(
+            self.model.plyAfterRow(index.row())))
+        return moveList
 
     def addMove(self, move: str, isWhite=True):
         """Adds move to the move history"""
-        turnLabel = QLabel(str(self.row + 1))
-        label = QLabel(move)
-        if isWhite:
-            self.moveListLayout.addWidget(turnLabel, self.row, 0)
-            self.moveListLayout.addWidget(label, self.row, 1)
-        else:
-            self.moveListLayout.addWidget(label, self.row, 2)
-            self.row += 1
-
-class Square:
-    """A detailed representation of a square that will hold
-    info about the square's state"""
-
-    def __init__(self, coord, name):
-        self.name = name
-        self.piece = None
-        self.trackedBy = []
-        self.controlledBy = []
-        self.pinned = False
-        self.coord = coord
-
-    def setPiece(self, piece, init=False):
-        """Sets a piece to this square. If there was already a piece,
-        and the piece param is not None, the piece on this square is 
-        captured and their getCaptured() method is called."""
-        if (self.piece is not None) and (piece is not None):
-            self.piece.getCaptured()
-
-        self.piece = piece
-        # Don't update squares when initializing the pieces on their
-        # initial positions
-        if (not init) and (piece is not None):
-            self.piece.updateSquares()
-
-    def addTrackingPiece(self, piece):
-        self.trackedBy.append(piece)
-
-    def removeTrackingPiece(self, piece):
-        indexToRemove = self.trackedBy.index(piece)
-        del self.trackedBy[indexToRemove]
-
-    def getTrackingPieces(self):
-        return self.trackedBy
-
-    def addControllingPiece(self, piece):
-        self.controlledBy.append(piece)
-    
-    def getControllingPieces(self):
-        return self.controlledBy
-    
-    def removeControllingPiece(self, piece):
-        indexToRemove = self.controlledBy.index(piece)
-        del self.controlledBy[indexToRemove]
-
-    def isControlledByOppositeColor(self, piece):
-        for controllingPiece in self.controlledBy:
-            if controllingPiece.isOppositeColorAs(piece):
-                return True
-        return False
-
-    def getCoord(self):
-        return self.coord
-
-    def hasPiece(self):
-        if self.piece is not None:
-            return True
-        return False
-
-    def getPiece(self):
-        return self.piece
-
-    def __str__(self):
-        return self.name
-    
-    def __repr__(self):
-        return self.name
\ No newline at end of file
+        self.model.addMove(move, isWhite)
+        self.scrollToEnd()
+
+    def scrollToEnd(self):
+        """Scrolls to the last move when control returns to the event loop"""
+        if not self.scrollPending:
+            self.scrollPending = True
+            QTimer.singleShot(0, self, self.scrollNow)
+
+    def scrollNow(self):
+        self.scrollPending = False
+        self.moveList.scrollToBottom()
@@ -0,0 +1,367 @@
+"""Compact binary archive of games.
+
+Each game is stored as a small header followed by its tags and its
+moves, packed as 16-bit move codes (see moves.py). An index of game
+offsets is written at the end of the file so any game, or any ply of a
+game, can be read in O(1) from an mmap of the file.
+
+File layout (all integers little endian):
+
+    "CGRF" version:u8 reserved:3 bytes
+    games...
+    index: offset:u64 for every game
+    footer: indexOffset:u64 gameCount:u64 "CGRI"
+
+Game layout:
+
+    plyCount:u32 result:u8 reserved:u8 tagsLength:u16
+    tags: "key\\tvalue\\n"... encoded in UTF-8
+    moves: plyCount move codes, u16 each
+
+A game with a FEN tag starts from that position, like in PGN.
+"""
+import mmap
+import os
+import re
+import struct
+from moves import MoveBuffer
+from san import checkSuffix, moveToSan, sanToMove
+from snapshot import STARTING_SNAPSHOT, snapshotFromFen
+import logger
+
+MAGIC = b"CGRF"
+INDEX_MAGIC = b"CGRI"
+VERSION = 1
+
+FILE_HEADER = struct.Struct("<4sB3x")
+GAME_HEADER = struct.Struct("<IBxH")
+FOOTER = struct.Struct("<QQ4s")
+OFFSET = struct.Struct("<Q")
+MOVE = struct.Struct("<H")
+
+RESULTS = ("*", "1-0", "0-1", "1/2-1/2")
+MAX_TAGS_LENGTH = 0xFFFF
+
+
+class GameRecordError(Exception):
+    """Raised when a file is not a valid game record archive"""
+
+
+class GameRecord:
+    """A game read from an archive"""
+
+    __slots__ = ("moves", "result", "tags")
+
+    def __init__(self, moves, result="*", tags=None):
+        self.moves = moves
+        self.result = result
+        self.tags = tags if tags is not None else {}
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __repr__(self):
+        return f"GameRecord({len(self.moves)} plies, {self.result})"
+
+
+def encodeTags(tags):
+    for key, value in tags.items():
+        if "\t" in key or "\n" in key or "\n" in value:
+            raise ValueError(f"Tag {key!r} can't hold a tab or a newline")
+    data = "".join(f"{key}\t{value}\n" for key, value in tags.items()).encode()
+    if len(data) > MAX_TAGS_LENGTH:
+        raise ValueError(f"Tags take {len(data)} bytes, the most is {MAX_TAGS_LENGTH}")
+    return data
+
+
+def decodeTags(data):
+    tags = {}
+    # Not splitlines(), which also breaks on \r, \x0b, \u2028... that a
+    # value can hold
+    for line in data.decode().split("\n")[:-1]:
+        key, _, value = line.partition("\t")
+        tags[key] = value
+    return tags
+
+
+class GameRecordWriter:
+    """Writes games to an archive. Opening an existing archive in append
+    mode adds games after the ones already in it."""
+
+    def __init__(self, path, append=False):
+        self.offsets = []
+        if append and os.path.exists(path):
+            with GameRecordReader(path) as reader:
+                self.offsets = [reader.getOffset(i) for i in range(len(reader))]
+                end = reader.indexOffset
+            self.file = open(path, "r+b")
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            self.file = open(path, "wb")
+            self.file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+    def addGame(self, moves, result="*", tags=None):
+        """Adds a game. moves is a MoveBuffer or any iterable of move
+        codes. Raises ValueError, before writing anything, for tags that
+        don't fit the format."""
+        if not isinstance(moves, MoveBuffer):
+            moves = MoveBuffer(moves)
+        tagData = encodeTags(tags) if tags else b""
+
+        self.offsets.append(self.file.tell())
+        self.file.write(GAME_HEADER.pack(
+            len(moves), RESULTS.index(result), len(tagData)))
+        self.file.write(tagData)
+        self.file.write(moves.tobytes())
+
+    def close(self):
+        if self.file.closed:
+            return
+        indexOffset = self.file.tell()
+        self.file.write(b"".join(OFFSET.pack(o) for o in self.offsets))
+        self.file.write(FOOTER.pack(indexOffset, len(self.offsets), INDEX_MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GameRecordReader:
+    """Reads games from an archive through an mmap of the file"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self.file.close()
+            raise GameRecordError(f"{path} is empty")
+
+        magic, version = FILE_HEADER.unpack_from(self.data, 0)
+        indexOffset, count, indexMagic = FOOTER.unpack_from(
+            self.data, len(self.data) - FOOTER.size)
+        if magic != MAGIC or indexMagic != INDEX_MAGIC:
+            self.close()
+            raise GameRecordError(f"{path} is not a game record archive")
+        if version != VERSION:
+            self.close()
+            raise GameRecordError(f"Unsupported archive version {version}")
+        self.indexOffset = indexOffset
+        self.count = count
+
+    def getOffset(self, game):
+        if not 0 <= game < self.count:
+            raise IndexError("game index out of range")
+        return OFFSET.unpack_from(self.data, self.indexOffset + 8*game)[0]
+
+    def getHeader(self, game):
+        """Returns (plyCount, result, offset of the first move)"""
+        offset = self.getOffset(game)
+        plyCount, result, tagsLength = GAME_HEADER.unpack_from(self.data, offset)
+        return plyCount, RESULTS[result], offset + GAME_HEADER.size + tagsLength
+
+    def getPlyCount(self, game):
+        return self.getHeader(game)[0]
+
+    def getMove(self, game, ply):
+        """Returns the move code played at ply (starting at 0) of a game"""
+        plyCount, _, movesOffset = self.getHeader(game)
+        if not 0 <= ply < plyCount:
+            raise IndexError("ply out of range")
+        return MOVE.unpack_from(self.data, movesOffset + 2*ply)[0]
+
+    def getMoves(self, game, start=0, stop=None):
+        """Returns the moves of a game from ply start to ply stop"""
+        plyCount, _, movesOffset = self.getHeader(game)
+        stop = plyCount if stop is None else min(stop, plyCount)
+        start = min(start, stop)
+        return MoveBuffer.frombytes(
+            self.data[movesOffset + 2*start:movesOffset + 2*stop])
+
+    def getGame(self, game):
+        offset = self.getOffset(game)
+        plyCount, result, tagsLength = GAME_HEADER.unpack_from(self.data, offset)
+        tagsOffset = offset + GAME_HEADER.size
+        movesOffset = tagsOffset + tagsLength
+        return GameRecord(
+            MoveBuffer.frombytes(self.data[movesOffset:movesOffset + 2*plyCount]),
+            RESULTS[result],
+            decodeTags(self.data[tagsOffset:movesOffset]))
+
+    def __getitem__(self, game):
+        return self.getGame(game)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.getGame(i)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Converters
+
+def writePosition(writer, position, result="*", tags=None):
+    """Adds the moves played on a Position (or the history of a
+    ChessGame, game.position) to an archive"""
+    writer.addGame(position.history, result, tags)
+
+
+TAG_RE = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]')
+COMMENT_RE = re.compile(r"\{[^}]*\}|;[^\n]*")
+MOVE_NUMBER_RE = re.compile(r"^\d+\.+")
+RESULT_TOKENS = frozenset(RESULTS)
+
+
+def readPgnGames(file):
+    """Yields (tags, SAN moves, result) for every game of a PGN file
+    object"""
+    tags = {}
+    movetext = []
+    for line in file:
+        line = line.strip()
+        if line.startswith("["):
+            if movetext:
+                yield parsePgnGame(tags, movetext)
+                tags, movetext = {}, []
+            match = TAG_RE.match(line)
+            if match:
+                tags[match.group(1)] = match.group(2).replace('\\"', '"')
+        elif line and not line.startswith("%"):
+            movetext.append(line)
+    if movetext or tags:
+        yield parsePgnGame(tags, movetext)
+
+
+def parsePgnGame(tags, movetext):
+    text = COMMENT_RE.sub(" ", "\n".join(movetext))
+    sanMoves = []
+    result = tags.get("Result", "*")
+    depth = 0  # depth of variations, which are skipped
+    for token in text.replace("(", " ( ").replace(")", " ) ").split():
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth or token.startswith("$"):
+            continue
+        elif token in RESULT_TOKENS:
+            result = token
+        else:
+            token = MOVE_NUMBER_RE.sub("", token)
+            if token:
+                sanMoves.append(token)
+    if result not in RESULT_TOKENS:
+        result = "*"
+    return tags, sanMoves, result
+
+
+def startSnapshot(fen=None):
+    """Snapshot a game starts from, given its FEN tag"""
+    return STARTING_SNAPSHOT if fen is None else snapshotFromFen(fen)
+
+
+def pgnGameToMoves(sanMoves, fen=None):
+    """Replays the SAN moves of a game and returns them as a MoveBuffer.
+    fen is the FEN tag of a game that doesn't start from the starting
+    position."""
+    # The rules engine is only needed when converting to or from PGN
+    from position import Position
+    position = Position(startSnapshot(fen))
+    for san in sanMoves:
+        position.playMove(sanToMove(position, san))
+    return position.history
+
+
+def movesToSan(moves, fen=None):
+    """Replays encoded moves and returns their SAN, with check
+    suffixes. fen is the FEN tag of the game, if any."""
+    from position import Position
+    position = Position(startSnapshot(fen))
+    sanMoves = []
+    for move in moves:
+        san = moveToSan(position, move)
+        position.playMove(move)
+        sanMoves.append(san + checkSuffix(position.lastCheck))
+    return sanMoves
+
+
+def writePgnGame(file, game):
+    """Writes a GameRecord to a PGN file object"""
+    tags = dict(game.tags)
+    tags["Result"] = game.result
+    for key, value in tags.items():
+        value = value.replace('"', '\\"')
+        file.write(f'[{key} "{value}"]\n')
+    file.write("\n")
+
+    # A game set up with a FEN starts at its move number, and with
+    # "N..." when black moves first
+    fen = game.tags.get("FEN")
+    fields = fen.split() if fen is not None else []
+    firstMove = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+    blackFirst = len(fields) > 1 and fields[1] == "b"
+
+    line = ""
+    for ply, san in enumerate(movesToSan(game.moves, fen),
+                              start=1 if blackFirst else 0):
+        number = firstMove + ply // 2
+        if ply % 2 == 0:
+            token = f"{number}. {san}"
+        elif blackFirst and ply == 1:
+            token = f"{number}... {san}"
+        else:
+            token = san
+        if len(line) + len(token) >= 80:
+            file.write(line.rstrip() + "\n")
+            line = ""
+        line += token + " "
+    file.write(line + game.result + "\n\n")
+
+
+def convertPgn(pgnPath, recordPath, append=False, skipped=None):
+    """Converts every game of a PGN file to an archive. Games that
+    can't be replayed or stored are left out, and (index of the game in
+    the PGN file, error) is appended to the skipped list for each of
+    them. Returns the number of games converted."""
+    count = 0
+    with open(pgnPath, encoding="utf-8", errors="replace") as pgn, \
+            GameRecordWriter(recordPath, append) as writer:
+        for index, (tags, sanMoves, result) in enumerate(readPgnGames(pgn)):
+            try:
+                moves = pgnGameToMoves(sanMoves, tags.get("FEN"))
+                writer.addGame(moves, result, tags)
+            except Exception as error:
+                # A bad game mustn't stop the conversion of a big file
+                logger.warning("Skipped game %d of %s: %r",
+                               index, pgnPath, error)
+                if skipped is not None:
+                    skipped.append((index, error))
+                continue
+            count += 1
+    return count
+
+
+def exportPgn(recordPath, pgnPath):
+    """Writes every game of an archive to a PGN file. Returns the number
+    of games written."""
+    with GameRecordReader(recordPath) as reader, \
+            open(pgnPath, "w", encoding="utf-8") as pgn:
+        for game in reader:
+            writePgnGame(pgn, game)
+    return len(reader)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import latency
 if TYPE_CHECKING:
     from game import ChessGame
 
@@ -29,7 +30,12 @@ class BoardToGameInterface:
     @classmethod
     def squareClicked(cls, squareName):
         """Called when a Square is clicked"""
-        return cls.CURRENT_GAME.squareClicked(squareName)
+        if not latency.ENABLED:
+            return cls.CURRENT_GAME.squareClicked(squareName)
+        start = latency.now()
+        result = cls.CURRENT_GAME.squareClicked(squareName)
+        latency.record(result["action"], "game", latency.now() - start)
+        return result
 
     @classmethod
     def pawnPromoted(cls, promotedTo):
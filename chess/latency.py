@@ -0,0 +1,160 @@
+"""Latency of the clicks on the board, from the mouse press to the end of
+the scene update.
+
+Each click is timed in stages:
+
+    game      ChessGame.squareClicked(), called through
+              BoardToGameInterface
+    interface the call to BoardToGameInterface.squareClicked(),
+              including the game
+    scene     updating the scene with the result
+    total     the whole mousePressEvent
+
+Times go into a histogram per (action, stage), where the action is what
+the click did (eg. "highlight" or "move"). Histograms have one bucket
+per power of two microseconds, so they use the same memory however
+many clicks they count.
+
+Timing is off unless the CHESS_LATENCY environment variable is set (eg.
+CHESS_LATENCY=1) or setEnabled(True) is called. Call sites check
+ENABLED first, so it costs nothing when disabled."""
+import json
+import os
+import time
+
+ENABLED = False
+LATENCY_PATH = os.path.join("logs", "latency.json")
+BUCKETS = 32
+
+# Names of the actions returned by ChessGame.squareClicked()
+ACTION_NAMES = {
+    "highlightSquares": "highlight",
+    "unhighlightSquares": "unhighlight",
+    "movePiece": "move",
+    "castle": "castle",
+    "enPassant": "en passant",
+    "showPromotionDialog": "promotion dialog",
+}
+STAGES = ("game", "interface", "scene", "total")
+
+now = time.perf_counter_ns
+
+
+def setEnabled(enabled):
+    global ENABLED
+    ENABLED = enabled
+
+
+def actionName(action):
+    return ACTION_NAMES.get(action, action)
+
+
+class Histogram:
+    """Counts durations in buckets of powers of two microseconds.
+    Bucket i counts the durations in [2**i, 2**(i+1)) microseconds,
+    bucket 0 also counts the ones under a microsecond."""
+
+    __slots__ = ("counts", "count", "totalNs", "maxNs")
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.totalNs = 0
+        self.maxNs = 0
+
+    def add(self, ns):
+        bucket = min(max(ns // 1000, 1).bit_length() - 1, BUCKETS - 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.totalNs += ns
+        if ns > self.maxNs:
+            self.maxNs = ns
+
+    def percentile(self, fraction):
+        """Returns the upper bound in microseconds of the bucket holding
+        the given fraction of the durations"""
+        if not self.count:
+            return 0
+        wanted = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= wanted:
+                return min(2 ** (bucket + 1), self.maxNs / 1000)
+        return self.maxNs / 1000
+
+    def meanUs(self):
+        return self.totalNs / self.count / 1000 if self.count else 0
+
+    def toDict(self):
+        return {
+            "count": self.count,
+            "mean_us": round(self.meanUs(), 1),
+            "p50_us": round(self.percentile(0.5), 1),
+            "p90_us": round(self.percentile(0.9), 1),
+            "p99_us": round(self.percentile(0.99), 1),
+            "max_us": round(self.maxNs / 1000, 1),
+            # Last non-empty bucket first, so the list stays short
+            "buckets": self.counts[:max(
+                (i + 1 for i, c in enumerate(self.counts) if c), default=0)],
+        }
+
+
+class LatencyStats:
+
+    def __init__(self):
+        # {action: {stage: Histogram}}
+        self.histograms = {}
+
+    def record(self, action, stage, ns):
+        stages = self.histograms.get(action)
+        if stages is None:
+            stages = self.histograms[action] = {}
+        histogram = stages.get(stage)
+        if histogram is None:
+            histogram = stages[stage] = Histogram()
+        histogram.add(ns)
+
+    def recordClick(self, action, start, clicked, end):
+        """Records the stages of a click from the times it started, it
+        came back from the game and the scene was updated"""
+        action = actionName(action)
+        self.record(action, "interface", clicked - start)
+        self.record(action, "scene", end - clicked)
+        self.record(action, "total", end - start)
+
+    def reset(self):
+        self.histograms.clear()
+
+    def summary(self):
+        """Returns {action: {stage: histogram dict}}"""
+        return {action: {stage: stages[stage].toDict()
+                         for stage in STAGES if stage in stages}
+                for action, stages in self.histograms.items()}
+
+    def dump(self, path=LATENCY_PATH):
+        """Writes the summary to a JSON file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+
+STATS = LatencyStats()
+
+
+def record(action, stage, ns):
+    STATS.record(actionName(action), stage, ns)
+
+
+def recordClick(action, start, clicked, end):
+    STATS.recordClick(action, start, clicked, end)
+
+
+def dumpOnExit():
+    """Writes the latency summary when the application quits, if there
+    is anything to write"""
+    if ENABLED and STATS.histograms:
+        STATS.dump()
+
+
+setEnabled(bool(os.environ.get("CHESS_LATENCY")))
@@ -0,0 +1,42 @@
+"""On-screen view of the click latency recorded by latency.py"""
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QFrame, QLabel, QPushButton, QVBoxLayout
+import latency
+
+REFRESH_MS = 1000
+
+
+class LatencyPanel(QFrame):
+    """Shows the median and 90th percentile of the total time of each
+    action, refreshed every REFRESH_MS"""
+
+    def __init__(self):
+        super().__init__()
+        self.setFrameStyle(QFrame.Panel | QFrame.Raised)
+
+        self.label = QLabel()
+        self.label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        saveButton = QPushButton("Save latency JSON")
+        saveButton.clicked.connect(lambda: latency.STATS.dump())
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.label)
+        layout.addWidget(saveButton)
+        self.setLayout(layout)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_MS)
+        self.refresh()
+
+    def refresh(self):
+        lines = [f"{'action':<17}{'n':>5}{'p50 ms':>8}{'p90 ms':>8}"]
+        for action, stages in sorted(latency.STATS.histograms.items()):
+            total = stages.get("total")
+            if total is None:
+                continue
+            lines.append(f"{action:<17}{total.count:>5}"
+                         f"{total.percentile(0.5) / 1000:>8.2f}"
+                         f"{total.percentile(0.9) / 1000:>8.2f}")
+        self.label.setText("\n".join(lines))
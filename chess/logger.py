@@ -1,42 +1,151 @@
-"""Module that will log certain activities in another file"""
+"""Module that will log certain activities in another file.
+
+Messages have a level and are only formatted if that level is enabled.
+Enabled messages are written by a background thread, which opens the
+log files on first use and flushes them whenever it runs out of
+messages to write.
+
+The piece updates happen on every move, so their call sites check
+DEBUG_ENABLED before calling in. With debug logging disabled (the
+default) they cost a single attribute lookup. The level can be set
+with setLevel() or the CHESS_LOG_LEVEL environment variable (eg.
+CHESS_LOG_LEVEL=debug)."""
+import os
+import queue
+import threading
+from board_journal import BoardJournal
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING,
+               "error": ERROR, "off": OFF}
+
+LOG_DIR = "logs"
+LOG_PATH = os.path.join(LOG_DIR, "logs.txt")
+BOARD_JOURNAL_PATH = os.path.join(LOG_DIR, "board_journal.bin")
+
+LEVEL = WARNING
+DEBUG_ENABLED = False
+
+# Messages waiting to be written: (path, data). data is either text or
+# bytes, which are written to a binary file.
+QUEUE = queue.SimpleQueue()
+WRITER = None
+STOP = object()
+JOURNAL = None
+
+
+def setLevel(level):
+    """Sets the lowest level that is logged. level is one of the level
+    constants or its name (eg. "debug")."""
+    global LEVEL, DEBUG_ENABLED
+    if isinstance(level, str):
+        level = LEVEL_NAMES[level.lower()]
+    LEVEL = level
+    DEBUG_ENABLED = level <= DEBUG
+
+
+def writeLoop():
+    """Writes queued messages until closeLog() is called"""
+    files = {}
+    while True:
+        item = QUEUE.get()
+        while item is not STOP:
+            path, data = item
+            file = files.get(path)
+            if file is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                mode = "wb" if isinstance(data, bytes) else "w"
+                file = files[path] = open(path, mode)
+            file.write(data)
+            try:
+                item = QUEUE.get_nowait()
+            except queue.Empty:
+                break
+
+        for file in files.values():
+            file.flush()
+        if item is STOP:
+            for file in files.values():
+                file.close()
+            return
+
+
+def write(path, data):
+    global WRITER
+    if WRITER is None:
+        WRITER = threading.Thread(target=writeLoop, name="logger", daemon=True)
+        WRITER.start()
+    QUEUE.put((path, data))
+
+
+def log(level, message, *args):
+    """Logs message % args if level is enabled. The message is only
+    formatted when it is logged."""
+    if level < LEVEL:
+        return
+    if args:
+        message = message % args
+    write(LOG_PATH, message + "\n")
+
+
+def debug(message, *args):
+    log(DEBUG, message, *args)
+
+
+def info(message, *args):
+    log(INFO, message, *args)
+
+
+def warning(message, *args):
+    log(WARNING, message, *args)
+
+
+def error(message, *args):
+    log(ERROR, message, *args)
 
-print("Opening log file...")
-LOG_FILE = open("logs/logs.txt", "w", )
-BOARD_LOG_FILE = open("logs/board_logs.txt", "w")
 
 def pieceUpdatedSquares(piece):
     """Shows that piece was updated and its current state"""
-    toLog = f"UPDATED {piece.name}\n" + str(piece) + '\n'
-    LOG_FILE.write(toLog)
-    LOG_FILE.flush()
+    debug("UPDATED %s\n%s", piece.name, piece)
+
 
 def pieceMoved(piece, piecesToUpdate=None):
     """Shows that a piece has moved. If piecesToUpdate is not None, this
     marks the start of updates. If None, it marks the end of updates."""
     if piecesToUpdate is not None:
-        toLog = (f"START\t{piece.name} HAS MOVED\t" + "-"*20 + "\n"
-               + f"PIECES AFFECTED: {piecesToUpdate}\n")
+        debug("START\t%s HAS MOVED\t%s\nPIECES AFFECTED: %s",
+              piece.name, "-"*20, piecesToUpdate)
     else:
-        toLog = f"END  \t{piece.name} HAS MOVED\t" + "-"*20 + "\n"
-    LOG_FILE.write(toLog)
-    LOG_FILE.flush()
-
-def showBoard(squares):
-    """Shows every square and the pieces that control them"""
-    # Clear file first so it only shows latest board
-    BOARD_LOG_FILE.truncate(0)
-    BOARD_LOG_FILE.seek(0)
-
-    toLog = ""
-    for l in range(8):
-        for n in range(8):
-            sq = squares[l][n]
-            toLog += "{} | controlledBy: {:<50} | trackedBy: {:<50}\n".format(
-                str(sq), str(sq.getControllingPieces()), str(sq.getTrackingPieces()))
-    BOARD_LOG_FILE.write(toLog)
-    BOARD_LOG_FILE.flush()
+        debug("END  \t%s HAS MOVED\t%s", piece.name, "-"*20)
+
+
+def showBoard(squares, newGame=False):
+    """Appends the pieces that control and track every square to the
+    board journal (see board_journal.py). newGame marks the first board
+    of a game."""
+    global JOURNAL
+    if not DEBUG_ENABLED:
+        return
+    if JOURNAL is None:
+        JOURNAL = BoardJournal(lambda data: write(BOARD_JOURNAL_PATH, data))
+    if newGame:
+        JOURNAL.startGame()
+    JOURNAL.record(squares)
+
 
 def closeLog():
-    print("Closing log file...")
-    LOG_FILE.close()
-    BOARD_LOG_FILE.close()
\ No newline at end of file
+    """Writes the queued messages and closes the log files"""
+    global WRITER, JOURNAL
+    JOURNAL = None
+    if WRITER is None:
+        return
+    QUEUE.put(STOP)
+    WRITER.join()
+    WRITER = None
+
+
+setLevel(os.environ.get("CHESS_LOG_LEVEL", "warning"))
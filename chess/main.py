@@ -3,6 +3,8 @@ from game import ChessGame
 from PySide6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QApplication
 from PySide6.QtCore import Qt
 import logger
+import analysis_worker
+import latency
 
 
 class MainWindow(QWidget):
@@ -41,6 +43,8 @@ class MainWindow(QWidget):
 if __name__ == "__main__":
     app = QApplication([])
     app.aboutToQuit.connect(logger.closeLog)
+    app.aboutToQuit.connect(analysis_worker.shutdown)
+    app.aboutToQuit.connect(latency.dumpOnExit)
 
     main = MainWindow()
     main.show()
@@ -0,0 +1,224 @@
+"""Compact integer encoding for moves.
+
+A move is packed into 16 bits so it fits an unsigned short:
+
+    bits 0-5    square the piece moves from (0 = a1, 63 = h8)
+    bits 6-11   square the piece moves to
+    bits 12-15  flag (normal, castle, en passant or a promotion piece)
+
+Move lists are stored in array('H') buffers, which take two bytes per
+move and pickle as a single bytes object."""
+from array import array
+
+FILES = "abcdefgh"
+
+NULL_MOVE = 0
+
+# Flags
+NORMAL = 0
+CASTLE = 1
+EN_PASSANT = 2
+PROMOTION = 4  # PROMOTION + index in PROMOTION_PIECES
+
+PROMOTION_PIECES = ("Knight", "Bishop", "Rook", "Queen")
+
+SQUARE_MASK = 0x3F
+TO_SHIFT = 6
+FLAG_SHIFT = 12
+
+
+def squareIndex(coord):
+    """Converts a square's coord (file, rank) to its index from 0 to 63"""
+    return coord[0] + 8*coord[1]
+
+
+def indexToCoord(index):
+    return index & 7, index >> 3
+
+
+def squareNameToIndex(name):
+    return FILES.index(name[0]) + 8*(int(name[1]) - 1)
+
+
+def indexToSquareName(index):
+    return FILES[index & 7] + str((index >> 3) + 1)
+
+
+def encodeMove(fromIndex, toIndex, flag=NORMAL):
+    return fromIndex | (toIndex << TO_SHIFT) | (flag << FLAG_SHIFT)
+
+
+def encodeSquares(fromSq, toSq, promotingTo=None, castle=False,
+                  enPassant=False):
+    """Encodes a move between two Square objects. promotingTo is the
+    name of the piece promoted to, with or without its color prefix
+    (eg. "Queen" or "wQueen")."""
+    if promotingTo is not None:
+        flag = PROMOTION + PROMOTION_PIECES.index(promotingTo.lstrip("wb"))
+    elif castle:
+        flag = CASTLE
+    elif enPassant:
+        flag = EN_PASSANT
+    else:
+        flag = NORMAL
+    return encodeMove(
+        squareIndex(fromSq.getCoord()), squareIndex(toSq.getCoord()), flag)
+
+
+def encodeResult(result, promotingTo=None):
+    """Encodes a result dict returned by ChessGame.squareClicked. Returns
+    None if the result is not a move."""
+    action = result["action"]
+    if action == "movePiece":
+        squares, flag = result["squares"], NORMAL
+    elif action == "castle":
+        squares, flag = result["kingMove"], CASTLE
+    elif action == "enPassant":
+        squares, flag = result["squares"], EN_PASSANT
+    elif action == "showPromotionDialog" and promotingTo is not None:
+        squares = result["state"][:2]
+        flag = PROMOTION + PROMOTION_PIECES.index(promotingTo.lstrip("wb"))
+    else:
+        return None
+
+    return encodeMove(
+        squareNameToIndex(squares[0]), squareNameToIndex(squares[1]), flag)
+
+
+def moveFrom(move):
+    return move & SQUARE_MASK
+
+
+def moveTo(move):
+    return (move >> TO_SHIFT) & SQUARE_MASK
+
+
+def moveFlag(move):
+    return move >> FLAG_SHIFT
+
+
+def isCastle(move):
+    return move >> FLAG_SHIFT == CASTLE
+
+
+def isEnPassant(move):
+    return move >> FLAG_SHIFT == EN_PASSANT
+
+
+def promotionPiece(move):
+    """Returns the name of the piece a move promotes to, or None"""
+    flag = move >> FLAG_SHIFT
+    if flag < PROMOTION:
+        return None
+    return PROMOTION_PIECES[flag - PROMOTION]
+
+
+def decodeMove(move):
+    """Returns (from square name, to square name, promotion piece name)"""
+    return (indexToSquareName(move & SQUARE_MASK),
+            indexToSquareName((move >> TO_SHIFT) & SQUARE_MASK),
+            promotionPiece(move))
+
+
+def moveToUci(move):
+    """Returns the move in long algebraic notation (eg. e7e8q)"""
+    fromName, toName, promotion = decodeMove(move)
+    if promotion is None:
+        return fromName + toName
+    return fromName + toName + ("n" if promotion == "Knight"
+                                else promotion[0].lower())
+
+
+class MoveBuffer:
+    """List of encoded moves backed by an array('H')"""
+
+    __slots__ = ("codes",)
+
+    def __init__(self, codes=()):
+        self.codes = array('H', codes)
+
+    def append(self, move):
+        self.codes.append(move)
+
+    def extend(self, moves):
+        self.codes.extend(moves)
+
+    def clear(self):
+        del self.codes[:]
+
+    def pop(self):
+        return self.codes.pop()
+
+    def tobytes(self):
+        """Little endian bytes of the moves, two bytes per move"""
+        if array('H', [1]).tobytes()[0] == 1:
+            return self.codes.tobytes()
+        codes = array('H', self.codes)
+        codes.byteswap()
+        return codes.tobytes()
+
+    @classmethod
+    def frombytes(cls, data):
+        buffer = cls()
+        buffer.codes.frombytes(data)
+        if array('H', [1]).tobytes()[0] != 1:
+            buffer.codes.byteswap()
+        return buffer
+
+    def __reduce__(self):
+        return type(self).frombytes, (self.tobytes(),)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return MoveBuffer(self.codes[i])
+        return self.codes[i]
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, move):
+        return move in self.codes
+
+    def __eq__(self, other):
+        if isinstance(other, MoveBuffer):
+            return self.codes == other.codes
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MoveBuffer([{', '.join(moveToUci(m) for m in self.codes)}])"
+
+
+def generateMoves(pieces, isWhite, buffer=None):
+    """Encodes the moves of every piece of a color into a MoveBuffer.
+    A pawn move to the last rank is added once for every promotion
+    piece."""
+    if buffer is None:
+        buffer = MoveBuffer()
+    append = buffer.append
+
+    for piece in pieces:
+        if piece.captured or piece.isWhite is not isWhite:
+            continue
+
+        fromIndex = squareIndex(piece.square.getCoord())
+        pieceName = piece.pieceName
+        for sq in piece.getMoves():
+            toIndex = squareIndex(sq.getCoord())
+            if pieceName == "Pawn":
+                if toIndex < 8 or toIndex > 55:
+                    for flag in range(PROMOTION, PROMOTION + 4):
+                        append(encodeMove(fromIndex, toIndex, flag))
+                    continue
+                # A diagonal move onto an empty square is en passant
+                if (toIndex - fromIndex) % 8 and not sq.hasPiece():
+                    append(encodeMove(fromIndex, toIndex, EN_PASSANT))
+                    continue
+            elif pieceName == "King" and abs(toIndex - fromIndex) == 2:
+                append(encodeMove(fromIndex, toIndex, CASTLE))
+                continue
+            append(encodeMove(fromIndex, toIndex))
+
+    return buffer
@@ -0,0 +1,141 @@
+"""One item that draws everything shown over the squares of the board:
+highlighted squares, the square control map, and outlines and lines
+for pins and hanging pieces.
+
+The item is cached, and when its contents change only the squares and
+lines that look different are repainted, so the cost of a move doesn't
+grow with the number of things shown."""
+from PySide6.QtCore import Qt, QLineF, QRectF
+from PySide6.QtGui import QColor, QPen
+from PySide6.QtWidgets import QGraphicsItem
+from moves import squareNameToIndex
+
+HIGHLIGHT_COLOR = QColor(Qt.yellow)
+PIN_COLOR = QColor(Qt.red)
+HANGING_COLOR = QColor(255, 140, 0)
+# Tints of squares controlled more by white or by black
+WHITE_CONTROL = (0, 120, 255)
+BLACK_CONTROL = (220, 0, 0)
+CONTROL_ALPHA = 40  # per piece of difference
+MAX_CONTROL_ALPHA = 120
+OUTLINE_WIDTH = 4
+
+
+class BoardOverlay(QGraphicsItem):
+    """Drawn over the squares and under the pieces. squares is the
+    {name: Square} dict of the BoardScene."""
+
+    def __init__(self, squares):
+        super().__init__()
+        self.squares = squares
+        self.highlighted = set()
+        self.hanging = set()
+        self.pins = set()  # (pinned square, pinning square)
+        self.control = None
+        self.controlShown = False
+
+        # {square name: (highlighted, outline color, control tint)} for
+        # the squares that show anything
+        self.states = {}
+        self.lines = set()
+
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.boundsRect = self.boardRect()
+
+    def boardRect(self):
+        rect = QRectF()
+        for sq in self.squares.values():
+            rect = rect.united(sq.rect())
+        return rect
+
+    def boundingRect(self):
+        return self.boundsRect
+
+    def boardResized(self):
+        """Called after the squares changed size"""
+        self.prepareGeometryChange()
+        self.boundsRect = self.boardRect()
+        self.update()
+
+    def setHighlights(self, squares):
+        self.highlighted = set(squares)
+        self.refresh()
+
+    def setAnalysis(self, pins, hanging, control):
+        """Shows the pins, hanging pieces and square control of
+        analysis.analyzePosition()"""
+        self.pins = set(pins)
+        self.hanging = set(hanging)
+        self.control = control
+        self.refresh()
+
+    def setControlShown(self, shown):
+        self.controlShown = shown
+        self.refresh()
+
+    def controlTint(self, name):
+        if not self.controlShown or self.control is None:
+            return None
+        white, black = self.control[squareNameToIndex(name)]
+        if white == black:
+            return None
+        color = WHITE_CONTROL if white > black else BLACK_CONTROL
+        return color + (min(CONTROL_ALPHA * abs(white - black), MAX_CONTROL_ALPHA),)
+
+    def refresh(self):
+        """Works out what every square shows and repaints the ones that
+        changed"""
+        pinned = {pinnedSq for pinnedSq, _ in self.pins}
+        states = {}
+        for name in self.squares:
+            if name in pinned:
+                outline = PIN_COLOR
+            elif name in self.hanging:
+                outline = HANGING_COLOR
+            else:
+                outline = None
+            state = (name in self.highlighted, outline, self.controlTint(name))
+            if state != (False, None, None):
+                states[name] = state
+
+        for name in states.keys() | self.states.keys():
+            if states.get(name) != self.states.get(name):
+                self.update(self.squares[name].rect())
+        for line in self.lines ^ self.pins:
+            self.update(self.lineRect(line))
+
+        self.states = states
+        self.lines = set(self.pins)
+
+    def lineOf(self, squares):
+        pinnedSq, pinningSq = squares
+        return QLineF(self.squares[pinningSq].getCenter(),
+                      self.squares[pinnedSq].getCenter())
+
+    def lineRect(self, squares):
+        line = self.lineOf(squares)
+        margin = OUTLINE_WIDTH
+        return QRectF(line.p1(), line.p2()).normalized().adjusted(
+            -margin, -margin, margin, margin)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        for name, (highlighted, outline, tint) in self.states.items():
+            rect = self.squares[name].rect()
+            if not rect.intersects(exposed):
+                continue
+            if tint is not None:
+                painter.fillRect(rect, QColor(*tint))
+            if highlighted:
+                painter.fillRect(rect, HIGHLIGHT_COLOR)
+            if outline is not None:
+                painter.setPen(QPen(outline, OUTLINE_WIDTH))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(rect.adjusted(2, 2, -2, -2))
+
+        painter.setPen(QPen(PIN_COLOR, OUTLINE_WIDTH / 2))
+        for line in self.lines:
+            if self.lineRect(line).intersects(exposed):
+                painter.drawLine(self.lineOf(line))
@@ -0,0 +1,64 @@
+"""Piece images sliced from the sprite sheet
+Resources/piecesWithBg/chessPieces.png.
+
+The sheet is decoded once, instead of one PNG per piece. It has a row
+of black pieces over a row of white ones, in ATLAS_COLUMNS order, on a
+faint checkerboard. The checkerboard is cleared when the sheet is
+loaded, and each piece's sub-rectangle is the bounding box of the
+opaque pixels in its cell."""
+import os
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QBitmap, QColor, QImage, QPainter, QPixmap, QRegion
+
+ATLAS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir,
+    "Resources", "piecesWithBg", "chessPieces.png")
+
+ATLAS_ROWS = ("b", "w")
+ATLAS_COLUMNS = ("King", "Queen", "Rook", "Bishop", "Knight", "Pawn")
+BACKGROUND = QColor(230, 230, 230, 102)
+
+
+class PieceAtlas:
+
+    def __init__(self, path=ATLAS_PATH):
+        image = self.loadSheet(path)
+        # {piece: QRect of the piece on the sheet}
+        self.rects = self.findPieceRects(image)
+        self.sheet = QPixmap.fromImage(image)
+
+    @staticmethod
+    def loadSheet(path):
+        """Decodes the sheet and clears its background"""
+        image = QImage(path)
+        if image.isNull():
+            raise FileNotFoundError(f"Can't load the piece sheet {path}")
+        image = image.convertToFormat(QImage.Format_ARGB32)
+
+        # Keep the pixels that aren't the background's color
+        keep = image.createMaskFromColor(BACKGROUND.rgba(), Qt.MaskOutColor)
+        keep.setColorTable([0x00000000, 0xff000000])
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, keep)
+        painter.end()
+        return image
+
+    @staticmethod
+    def findPieceRects(image):
+        opaque = QRegion(QBitmap.fromImage(
+            image.createAlphaMask(Qt.ThresholdAlphaDither)))
+        cellWidth = image.width() / len(ATLAS_COLUMNS)
+        cellHeight = image.height() / len(ATLAS_ROWS)
+
+        rects = {}
+        for row, color in enumerate(ATLAS_ROWS):
+            for col, name in enumerate(ATLAS_COLUMNS):
+                cell = QRect(round(col * cellWidth), round(row * cellHeight),
+                             round(cellWidth), round(cellHeight))
+                rects[color + name] = opaque.intersected(cell).boundingRect()
+        return rects
+
+    def pixmap(self, piece):
+        """Returns the image of a piece (eg. wRook) at the sheet's size"""
+        return self.sheet.copy(self.rects[piece])
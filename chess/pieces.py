@@ -1,5 +1,6 @@
 """This module defines classes for every type of chess piece"""
 import logger
+import cascade_profile
 from squares import Squares
 from special_moves import Castle, EnPassant
 
@@ -22,6 +23,7 @@ class Piece():
         self.nonMovesControlledSquares = []
         self.pinning = None
         self.pinnedTo = []
+        self.pinnedBy = None
         self.captured = False
 
         # Adds itself to a square, which starts things off
@@ -65,10 +67,15 @@ class Piece():
         self.uncheckKing()
         
         # Update the pieces affected by the move
-        logger.pieceMoved(self, piecesToUpdate)  # Marks the start
-        for piece in piecesToUpdate:
-            piece.updateSquares()
-        logger.pieceMoved(self)  # Marks the end of the updates
+        if logger.DEBUG_ENABLED:
+            logger.pieceMoved(self, piecesToUpdate)  # Marks the start
+        if cascade_profile.ENABLED:
+            cascade_profile.runCascade(self, old_square, piecesToUpdate)
+        else:
+            for piece in piecesToUpdate:
+                piece.updateSquares()
+        if logger.DEBUG_ENABLED:
+            logger.pieceMoved(self)  # Marks the end of the updates
 
         return "normal",
 
@@ -76,7 +83,7 @@ class Piece():
     def updateSquares(self, init=False):
         """This function should be reimplemented to update the squares of
         this piece. This only serves to log the changes."""
-        if not init:
+        if logger.DEBUG_ENABLED and not init:
             logger.pieceUpdatedSquares(self)
 
     def linearUpdateSquares(self, init=False):
@@ -95,6 +102,7 @@ class Piece():
 
         for d in self.directions:
             canAddToMoves = True
+            checking = False
             piecesOnRankOrFile = []
             for i in range(1, 8):
                 sqCoords = coord[0] + d[0]*i, coord[1] + d[1]*i
@@ -108,6 +116,12 @@ class Piece():
                 # Update Piece and Square's control vars
                 self.addTrackedSquare(sq)
 
+                # The checked king can't step back along the line of
+                # the check, so the square behind it is controlled too
+                if checking:
+                    self.addNonMoveControlledSquare(sq)
+                    checking = False
+
                 # Everything that needs to happen if there is a piece
                 if sq.hasPiece():
 
@@ -120,6 +134,7 @@ class Piece():
                             self.pinPiece(piecesOnRankOrFile[0], d, sq)
                         elif len(piecesOnRankOrFile) == 0:
                             self.checkKing(piece, d)
+                            checking = True
                         
                     # Track pieces on the rank or file. Used to
                     # determine if a piece should be pinned if a
@@ -139,7 +154,7 @@ class Piece():
                     if canAddToMoves:
                         self.addMove(sq)
 
-        if not init:
+        if logger.DEBUG_ENABLED and not init:
             logger.pieceUpdatedSquares(self)
 
     def checkKing(self, kingPiece, dirOfCheck = None):
@@ -162,11 +177,14 @@ class Piece():
         """If the piece's king was in check pending the piece's move,
         remove the king from check since the move would remove them
         from check."""
-        # checkingSquares would be an empty list if the king was
-        # not in check
-        if (self.isWhite and King.whiteCheckingSquares
-                or (not self.isWhite) and King.blackCheckingSquares):
-            King.checkedKing.uncheck()
+        # checkingSquares is None if the king isn't in check, and an
+        # empty list in double check
+        if (self.isWhite and King.whiteCheckingSquares is not None
+                or (not self.isWhite) and King.blackCheckingSquares is not None):
+            if self.isWhite:
+                King.whiteCheckedKing.uncheck()
+            else:
+                King.blackCheckedKing.uncheck()
 
     def clearTrackedAndControlledSquares(self):
         """Goes through a squares' trackedSquares list and removes the piece
@@ -209,18 +227,24 @@ class Piece():
                 
             allowedSquares.append(squares[sq_coord[0]][sq_coord[1]])
 
-        piece.setPin(allowedSquares)
+        piece.setPin(allowedSquares, self)
         self.pinning = piece
 
     def unpinPiece(self):
-        self.pinning.removePin()
+        self.pinning.removePin(self)
         self.pinning = None
 
-    def setPin(self, allowedSquares):
+    def setPin(self, allowedSquares, pinner):
         self.pinnedTo = allowedSquares
+        self.pinnedBy = pinner
 
-    def removePin(self):
-        self.pinnedTo.clear()
+    def removePin(self, pinner):
+        # When the king moves, the piece can be pinned again before the
+        # pinner of the king's old square updates, which must then
+        # leave the new pin alone
+        if self.pinnedBy is pinner:
+            self.pinnedTo.clear()
+            self.pinnedBy = None
 
     def isOppositeColorAs(self, piece):
         if self.isWhite is piece.isWhite:
@@ -244,14 +268,7 @@ class Piece():
 
     def getMoves(self, nameOnly=False):
         if type(self) != King:
-            if self.pinnedTo:
-                moves = set(self.pinnedTo).intersection(set(self.moves))
-            elif (King.whiteCheckingSquares is not None) and self.isWhite:
-                moves = set(King.whiteCheckingSquares).intersection(set(self.moves))
-            elif (King.blackCheckingSquares is not None) and (not self.isWhite):
-                moves = set(King.blackCheckingSquares).intersection(set(self.moves))
-            else:
-                moves = self.moves
+            moves = self.legalSquares(self.moves)
         else:
             moves = self.moves.copy()
             moves.extend(self.castleMoves)
@@ -261,13 +278,23 @@ class Piece():
             return [str(sq) for sq in moves]
         return moves
 
-    def canMoveTo(self, square):
-        """Checks if square is in this Piece's move list"""
+    def legalSquares(self, squares):
+        """The squares a pinned piece can stay on its pin line with
+        and, when its king is checked, the ones that block or take the
+        checking piece. A double check leaves none."""
+        if self.isWhite:
+            checkingSquares = King.whiteCheckingSquares
+        else:
+            checkingSquares = King.blackCheckingSquares
         if self.pinnedTo:
-            moves = set(self.pinnedTo).intersection(set(self.moves))
-            return square in moves
-        
-        return square in self.moves
+            squares = [sq for sq in squares if sq in self.pinnedTo]
+        if checkingSquares is not None:
+            squares = [sq for sq in squares if sq in checkingSquares]
+        return squares
+
+    def canMoveTo(self, square):
+        """Checks if square is one of this Piece's legal moves"""
+        return square in self.getMoves()
 
 
 class King(Piece):
@@ -279,7 +306,10 @@ class King(Piece):
     # direction in which a king is being checked.
     whiteCheckingSquares = None
     blackCheckingSquares = None
-    checkedKing = None
+    # Kept per color, as a move that blocks a check can check the
+    # other king
+    whiteCheckedKing = None
+    blackCheckedKing = None
     
     def __init__(self, isWhite, square):
         super().__init__(isWhite, square)
@@ -309,18 +339,20 @@ class King(Piece):
             return
             
         self.checked = True
-        King.checkedKing = self
         if self.isWhite:
+            King.whiteCheckedKing = self
             King.whiteCheckingSquares = checkingSquares
         else:
+            King.blackCheckedKing = self
             King.blackCheckingSquares = checkingSquares
 
     def uncheck(self):
         self.checked = False
-        King.checkedKing = None
         if self.isWhite:
+            King.whiteCheckedKing = None
             King.whiteCheckingSquares = None
         else:
+            King.blackCheckedKing = None
             King.blackCheckingSquares = None
 
     def setSquare(self, square):
@@ -333,14 +365,14 @@ class King(Piece):
                     Castle.wRook1.setSquare(Squares.getSquares()[5][0])
                     return "castle", Castle.wRook1Move
                 elif str(square) == self.queensideCastleSquare:
-                    Castle.wRook0.setSquare(Squares.getSquares()[2][0])
+                    Castle.wRook0.setSquare(Squares.getSquares()[3][0])
                     return "castle", Castle.wRook0Move
             else:
                 if str(square) == self.kingsideCastleSquare:
                     Castle.bRook1.setSquare(Squares.getSquares()[5][7])
                     return "castle", Castle.bRook1Move
                 elif str(square) == self.queensideCastleSquare:
-                    Castle.bRook0.setSquare(Squares.getSquares()[2][7])
+                    Castle.bRook0.setSquare(Squares.getSquares()[3][7])
                     return "castle", Castle.bRook0Move
 
         return "normal",
@@ -350,6 +382,8 @@ class King(Piece):
         self.clearTrackedAndControlledSquares()
         if not self.moved:
             self.addMove(Castle.canCastle(self), castle=True)
+        else:
+            self.castleMoves.clear()
 
         coord = self.square.getCoord()
         squares = Squares.getSquares()
@@ -506,26 +540,47 @@ class Pawn(Piece):
             self.clearTrackedAndControlledSquares()
             # Get pieces that tracked the square the pawn was on
             # and update them because the pawn is no longer there.
-            trackingPieces = self.square.getTrackingPieces()
+            trackingPieces = list(self.square.getTrackingPieces())
             self.square.setPiece(None)
             for piece in trackingPieces:
                 piece.updateSquares()
+            # The promotion can take the checking piece, which is only
+            # removed by Position.promote(), so the king is unchecked
+            # after the updates
+            self.uncheckKing()
             return "promotion"
-        elif (self.square.getCoord()[1] == 1 or self.square.getCoord()[1] == 6
-                and (square.getCoord()[1] == 3 or square.getCoord()[1] == 4)):
+        elif abs(square.getCoord()[1] - self.square.getCoord()[1]) == 2:
             EnPassant.potentialEnPassant(square, self.isWhite)
         elif square == EnPassant.move:
+            # The taken pawn isn't on the square this pawn moves to, so
+            # capture it and update the pieces looking through its square
+            EnPassant.take.getPiece().getCaptured()
             EnPassant.take.setPiece(None)
+            trackingPieces = list(EnPassant.take.getTrackingPieces())
             super().setSquare(square)
+            for piece in trackingPieces:
+                piece.updateSquares()
             return "enPassant", EnPassant.take
 
         return super().setSquare(square)
 
     
     def getMoves(self, nameOnly = False):
-        if self.square in EnPassant.canTakeEnPassant:
-            self.addMove(EnPassant.move)
-        return super().getMoves(nameOnly)
+        moves = list(self.legalSquares(self.moves))
+        enPassant = EnPassant.moveFor(self)
+        if enPassant is not None:
+            # Taking the checking pawn answers its check as well
+            checkingSquares = (King.whiteCheckingSquares if self.isWhite
+                               else King.blackCheckingSquares)
+            if (checkingSquares is not None and EnPassant.take in checkingSquares
+                    and (not self.pinnedTo or enPassant in self.pinnedTo)):
+                moves.append(enPassant)
+            else:
+                moves.extend(self.legalSquares([enPassant]))
+
+        if nameOnly:
+            return [str(sq) for sq in moves]
+        return moves
     
 
 class Rook(Piece):
@@ -536,11 +591,12 @@ class Rook(Piece):
     def __init__(self, isWhite, square, promotion = False):
         super().__init__(isWhite, square)
         # Add rook to Castle class to allow king to determine when it
-        # can castle.
-        if self.name[0:-1] == "wRook":
-            Castle.setWhiteRook(self)
-        elif self.name[0:-1] == "bRook":
-            Castle.setBlackRook(self)
+        # can castle. Promoted rooks can never castle.
+        if not promotion:
+            if self.name[0:-1] == "wRook":
+                Castle.setWhiteRook(self)
+            elif self.name[0:-1] == "bRook":
+                Castle.setBlackRook(self)
         
         self.directions = (
             (1, 0), (0, -1), (-1, 0), (0, 1)
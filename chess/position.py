@@ -0,0 +1,395 @@
+"""Headless rules model of a game. Holds the squares, the pieces and
+whose turn it is, and plays moves on them without any GUI."""
+from pieces import King, Queen, Rook, Bishop, Knight, Pawn
+from squares import Squares, Square
+from special_moves import Castle, EnPassant
+from moves import (MoveBuffer, encodeSquares, generateMoves, indexToCoord,
+                   moveFrom, moveTo, promotionPiece, squareIndex)
+from snapshot import STARTING_SNAPSHOT, decodeSnapshot, encodeSnapshot
+from events import (Check, ControlChanged, EventSource, MovePlayed, PieceMoved,
+                    PiecePromoted, PieceRemoved, PinAdded, PinRemoved)
+import logger
+
+PIECE_TYPES = {
+    "King": King,
+    "Queen": Queen,
+    "Rook": Rook,
+    "Bishop": Bishop,
+    "Knight": Knight,
+    "Pawn": Pawn,
+}
+
+
+# Class attributes the rules classes use to hold the state of the
+# current game
+RULES_STATE = (
+    (Squares, "squares"),
+    (King, "whiteCheckingSquares"),
+    (King, "blackCheckingSquares"),
+    (King, "whiteCheckedKing"),
+    (King, "blackCheckedKing"),
+    (Castle, "wRook0"),
+    (Castle, "wRook1"),
+    (Castle, "bRook0"),
+    (Castle, "bRook1"),
+    (EnPassant, "canTakeEnPassant"),
+    (EnPassant, "take"),
+    (EnPassant, "move"),
+    (EnPassant, "resetOnWhiteTurn"),
+) + tuple(
+    # Ids of the next pieces, so promotions get new names
+    (pieceType, counter) for pieceType in PIECE_TYPES.values()
+    for counter in ("w_id", "b_id"))
+
+
+def resetRulesState():
+    """The rules classes keep the state of the current game as class
+    attributes. Reset them so a new game starts from a clean slate."""
+    for pieceType in PIECE_TYPES.values():
+        pieceType.w_id = 0
+        pieceType.b_id = 0
+    King.whiteCheckingSquares = None
+    King.blackCheckingSquares = None
+    King.whiteCheckedKing = King.blackCheckedKing = None
+    Castle.wRook0 = Castle.wRook1 = Castle.bRook0 = Castle.bRook1 = None
+    EnPassant.canTakeEnPassant = []
+    EnPassant.take = None
+    EnPassant.move = None
+    EnPassant.resetOnWhiteTurn = False
+
+
+class Position:
+    """Board state of a game and the moves played on it.
+
+    The pieces find the squares through Squares and the special moves
+    keep class level state, so only one Position is live at a time.
+    Creating a Position makes it the live one, and activate() swaps the
+    state of another Position back in."""
+
+    current = None
+
+    def __init__(self, snapshot=STARTING_SNAPSHOT):
+        Position.deactivateCurrent()
+        resetRulesState()
+        Position.current = self
+
+        self.whiteTurn = True
+        self.wKing = None
+        self.bKing = None
+        # Encoded moves played so far
+        self.history = MoveBuffer()
+        # (pawn, square moved from, square moved to, capture) of a pawn
+        # waiting for promote() to be called
+        self.pendingPromotion = None
+        # Result of check() after the last move
+        self.lastCheck = {"check": False, "mate": False}
+        # "1-0" or "0-1" once a king is mated, None before
+        self.result = None
+        # Values of RULES_STATE while this position isn't live
+        self.rulesState = None
+        # Subscribers to the moves played (see events.py), and the
+        # board before the move being played while there are any
+        self.events = EventSource()
+        self.eventState = None
+        # Whether the boards are recorded in the board journal, only
+        # for the live game (see startJournal())
+        self.journaled = False
+
+        self.squares = [[], [], [], [], [], [], [], []]
+        Squares.setSquares(self.squares)
+        self.pieces = []
+        self.initializeBoardState(snapshot)
+
+    @classmethod
+    def deactivateCurrent(cls):
+        """Saves the rules state of the live position"""
+        if cls.current is not None:
+            cls.current.rulesState = [
+                getattr(owner, attr) for owner, attr in RULES_STATE]
+            cls.current = None
+
+    def activate(self):
+        """Makes this position the live one"""
+        if Position.current is self:
+            return
+        Position.deactivateCurrent()
+        for (owner, attr), value in zip(RULES_STATE, self.rulesState):
+            setattr(owner, attr, value)
+        self.rulesState = None
+        Position.current = self
+
+    def initializeBoardState(self, snapshot=STARTING_SNAPSHOT):
+        """Initializes the board state by creating all the squares
+        and adding the appropriate Pieces to the squares given by a
+        snapshot (see snapshot.py)."""
+        for i in range(8):
+            for j in range(8):
+                sqName = self.coordToSquareName((i, j))
+                self.squares[i].append(Square((i, j), sqName))
+
+        placement, whiteTurn, castling, epSquare = decodeSnapshot(snapshot)
+        # Piece instances save themselves as an attribute to
+        # the passed in 'square' using square.setPiece(self).
+        for index, piece in sorted(placement.items()):
+            coord = indexToCoord(index)
+            newPiece = PIECE_TYPES[piece[1:]](
+                isWhite=piece[0] == "w", square=self.squares[coord[0]][coord[1]])
+            self.pieces.append(newPiece)
+            if piece == "wKing":
+                self.wKing = newPiece
+            elif piece == "bKing":
+                self.bKing = newPiece
+
+        # Rooks register themselves for castling by name, which only
+        # works for the starting position. Set them from the castling
+        # rights instead.
+        for right, attr, coord, king in (
+                ("Q", "wRook0", (0, 0), self.wKing),
+                ("K", "wRook1", (7, 0), self.wKing),
+                ("q", "bRook0", (0, 7), self.bKing),
+                ("k", "bRook1", (7, 7), self.bKing)):
+            rook = self.squares[coord[0]][coord[1]].getPiece()
+            if (right in castling and rook is not None
+                    and rook.pieceName == "Rook" and rook.isWhite is king.isWhite):
+                setattr(Castle, attr, rook)
+            else:
+                setattr(Castle, attr, None)
+        self.wKing.moved = not ("K" in castling or "Q" in castling)
+        self.bKing.moved = not ("k" in castling or "q" in castling)
+
+        self.whiteTurn = whiteTurn
+        if epSquare is not None:
+            # The pawn that can be taken is in front of the en passant
+            # square from the point of view of the side that moved it
+            coord = indexToCoord(epSquare + (-8 if whiteTurn else 8))
+            EnPassant.potentialEnPassant(
+                self.squares[coord[0]][coord[1]], not whiteTurn)
+
+        # Kings are updated last, as their moves depend on the squares
+        # the other pieces control.
+        for piece in self.pieces:
+            if piece.pieceName != "King":
+                piece.updateSquares(init=True)
+        self.wKing.updateSquares(init=True)
+        self.bKing.updateSquares(init=True)
+        self.lastCheck = self.check()
+
+    def snapshot(self):
+        """Returns a compact snapshot of this position (see snapshot.py)"""
+        self.activate()
+        placement = {}
+        for piece in self.pieces:
+            if not piece.captured:
+                color = "w" if piece.isWhite else "b"
+                placement[squareIndex(piece.square.getCoord())] = (
+                    color + piece.pieceName)
+
+        castling = ""
+        for right, rook, king in (("K", Castle.wRook1, self.wKing),
+                                  ("Q", Castle.wRook0, self.wKing),
+                                  ("k", Castle.bRook1, self.bKing),
+                                  ("q", Castle.bRook0, self.bKing)):
+            if not king.moved and Castle.rookCanCastle(rook):
+                castling += right
+
+        epSquare = None
+        if EnPassant.move is not None:
+            epSquare = squareIndex(EnPassant.move.getCoord())
+        return encodeSnapshot(placement, self.whiteTurn, castling, epSquare)
+
+    @staticmethod
+    def squareNameToCoord(squareName):
+        """Convert a square's name (eg. a1) to indexes for the square
+        on self.squares"""
+        letters = "abcdefgh"
+
+        letterCoord = letters.index(squareName[0])
+        numCoord = int(squareName[1]) - 1
+
+        return letterCoord, numCoord
+
+    @staticmethod
+    def coordToSquareName(coord):
+        """Convert a square's index in self.squares (nicknamed coords),
+        to the traditional square names in chess (eg. a1, b2)"""
+        letters = "abcdefgh"
+
+        sqName = letters[coord[0]] + str(coord[1] + 1)
+        return sqName
+
+    def getSquare(self, squareName):
+        coord = self.squareNameToCoord(squareName)
+        return self.squares[coord[0]][coord[1]]
+
+    def getLegalMoves(self):
+        """Returns the encoded moves of the side to move"""
+        self.activate()
+        return generateMoves(self.pieces, self.whiteTurn)
+
+    def makeMove(self, fromSq, toSq, promotingTo=None):
+        """Moves the piece on fromSq to toSq and passes the turn. Returns
+        the move type given by Piece.setSquare. If a pawn reaches the
+        last rank and promotingTo is None, the move waits for promote()
+        to be called."""
+        self.activate()
+        if self.events.subscribers:
+            self.eventState = self.readEventState()
+        turn = self.whiteTurn
+        piece = fromSq.getPiece()
+        capture = toSq.hasPiece()
+        moveType = piece.setSquare(toSq)
+        EnPassant.reset(turn)  # if enPassant was available, remove it
+
+        if moveType == "promotion":
+            self.pendingPromotion = (piece, fromSq, toSq, capture)
+            if promotingTo is not None:
+                self.promote(promotingTo)
+            return moveType
+
+        self.history.append(encodeSquares(
+            fromSq, toSq, castle=moveType[0] == "castle",
+            enPassant=moveType[0] == "enPassant"))
+        self.nextTurn()
+        # Checks if a king is checked and whether it is checkmate or not.
+        self.lastCheck = self.check()
+        if self.eventState is not None:
+            self.emitMoveEvents()
+        return moveType
+
+    def promote(self, promotingTo):
+        """Replaces the pawn waiting for promotion with a new piece.
+        promotingTo is the piece's name, with or without its color
+        prefix (eg. "Queen" or "wQueen")."""
+        self.activate()
+        pawn, fromSq, toSq, capture = self.pendingPromotion
+        self.pendingPromotion = None
+
+        pieceName = promotingTo.lstrip("wb")
+        newPiece = PIECE_TYPES[pieceName](
+            isWhite=self.whiteTurn, square=toSq, promotion=True)
+        pawn.getCaptured()
+        self.pieces.append(newPiece)
+        # Pieces looking through the promotion square see the new piece
+        for piece in list(toSq.getTrackingPieces()):
+            if piece is not newPiece:
+                piece.updateSquares()
+
+        self.history.append(encodeSquares(fromSq, toSq, promotingTo=pieceName))
+        self.nextTurn()
+        self.lastCheck = self.check()
+        if self.eventState is not None:
+            self.emitMoveEvents((pawn, fromSq, toSq))
+
+    def playMove(self, move):
+        """Plays an encoded move"""
+        fromCoord, toCoord = indexToCoord(moveFrom(move)), indexToCoord(moveTo(move))
+        return self.makeMove(
+            self.squares[fromCoord[0]][fromCoord[1]],
+            self.squares[toCoord[0]][toCoord[1]],
+            promotionPiece(move))
+
+    def readEventState(self):
+        """Returns the (square of every piece, control of every square
+        or None, {pinned piece: pinner}) the events are compared on"""
+        squares = [None if piece.captured else piece.square
+                   for piece in self.pieces]
+        control = None
+        if self.events.wants(ControlChanged):
+            control = [tuple(sorted(piece.name for piece in sq.getControllingPieces()))
+                       for file in self.squares for sq in file]
+        pins = {piece.pinning: piece for piece in self.pieces
+                if not piece.captured and piece.pinning is not None}
+        return squares, control, pins
+
+    def emitMoveEvents(self, promotion=None):
+        """Emits the events of the move just completed. promotion is
+        (pawn, square moved from, square moved to) of a promotion."""
+        before, controlBefore, pinsBefore = self.eventState
+        self.eventState = None
+        squares, control, pins = self.readEventState()
+        emit = self.events.emit
+        pawn = promotion[0] if promotion is not None else None
+
+        for piece, square in zip(self.pieces, before):
+            if square is not None and piece.captured and piece is not pawn:
+                emit(PieceRemoved(piece.name, square.name))
+        for piece, old, new in zip(self.pieces, before, squares):
+            if old is not None and new is not None and old is not new:
+                emit(PieceMoved(piece.name, old.name, new.name))
+        if promotion is not None:
+            _, fromSq, toSq = promotion
+            emit(PieceMoved(pawn.name, fromSq.name, toSq.name))
+            for piece in self.pieces[len(before):]:
+                emit(PiecePromoted(piece.name, pawn.name, toSq.name))
+
+        if controlBefore is not None:
+            allSquares = (sq for file in self.squares for sq in file)
+            for sq, old, new in zip(allSquares, controlBefore, control):
+                if new != old:
+                    emit(ControlChanged(sq.name, new))
+
+        for pinned, pinner in pinsBefore.items():
+            if pins.get(pinned) is not pinner:
+                emit(PinRemoved(pinned.name, pinner.name))
+        for pinned, pinner in pins.items():
+            if pinsBefore.get(pinned) is not pinner:
+                emit(PinAdded(pinned.name, pinner.name))
+
+        if self.lastCheck["check"]:
+            king = self.wKing if self.whiteTurn else self.bKing
+            emit(Check(king.name, king.square.name, self.lastCheck["mate"]))
+        emit(MovePlayed(self.history[-1], len(self.history)))
+
+    def nextTurn(self):
+        # After every turn, one of the kings will have their squares
+        # updated, as they could be restricted at any time and their
+        # trackedSquares list is not enough to keep up.
+        if self.whiteTurn:
+            self.bKing.updateSquares()
+        else:
+            self.wKing.updateSquares()
+
+        self.whiteTurn = True if self.whiteTurn is False else False  # switch turns
+
+        if logger.DEBUG_ENABLED and self.journaled:
+            logger.showBoard(self.squares)
+
+    def startJournal(self):
+        """Starts a game in the board journal and records the boards of
+        this position from now on. Positions built for seeking, analysis
+        or search don't call it, so they stay out of the journal."""
+        self.journaled = True
+        if logger.DEBUG_ENABLED:
+            self.activate()
+            logger.showBoard(self.squares, newGame=True)
+
+    def check(self):
+        """Checks whether a king is checked and whether it is checkmate
+        or not. A mate sets self.result."""
+        noCheck = {"check": False, "mate": False}
+        checkNoMate = {"check": True, "mate": False}
+        checkmate = {"check": True, "mate": True}
+
+        if self.wKing.isChecked():
+            # If king has no moves, check if a piece can block or capture the check
+            if not self.wKing.getMoves():
+                for piece in self.pieces:
+                    if piece.isSameColorAs(self.wKing) and piece.getMoves():
+                        return checkNoMate
+                # Game over
+                self.result = "0-1"
+                return checkmate
+            return checkNoMate
+
+        elif self.bKing.isChecked():
+            if not self.bKing.getMoves():
+                for piece in self.pieces:
+                    if piece.isSameColorAs(self.bKing) and piece.getMoves():
+                        return checkNoMate
+
+                # Game over
+                self.result = "1-0"
+                return checkmate
+            return checkNoMate
+
+        return noCheck
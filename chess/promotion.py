@@ -0,0 +1,49 @@
+"""Dialog that lets the user pick what a promoting pawn becomes"""
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QSizePolicy
+from PySide6.QtCore import QSize
+from piece_images import getIcon
+
+
+class Promotion():
+
+    @classmethod
+    def getPromotionDialog(cls, isWhite, promoteToFunc):
+        dialog = QWidget()
+        layout = QHBoxLayout()
+
+        queenButton = QPushButton()
+        rookButton = QPushButton()
+        knightButton = QPushButton()
+        bishopButton = QPushButton()
+
+        queenButton.clicked.connect(lambda: promoteToFunc("Queen"))
+        rookButton.clicked.connect(lambda: promoteToFunc("Rook"))
+        knightButton.clicked.connect(lambda: promoteToFunc("Knight"))
+        bishopButton.clicked.connect(lambda: promoteToFunc("Bishop"))
+
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        queenButton.setSizePolicy(sizePolicy)
+        rookButton.setSizePolicy(sizePolicy)
+        knightButton.setSizePolicy(sizePolicy)
+        bishopButton.setSizePolicy(sizePolicy)
+
+        layout.addWidget(queenButton)
+        layout.addWidget(rookButton)
+        layout.addWidget(knightButton)
+        layout.addWidget(bishopButton)
+
+        dialog.setLayout(layout)
+
+        iconSize = QSize(100, 100)
+        queenButton.setIconSize(iconSize)
+        rookButton.setIconSize(iconSize)
+        knightButton.setIconSize(iconSize)
+        bishopButton.setIconSize(iconSize)
+
+        color = "w" if isWhite else "b"
+        queenButton.setIcon(getIcon(color + "Queen"))
+        rookButton.setIcon(getIcon(color + "Rook"))
+        knightButton.setIcon(getIcon(color + "Knight"))
+        bishopButton.setIcon(getIcon(color + "Bishop"))
+
+        return dialog
@@ -1,1896 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.3.1
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x0aD\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00P\x00\x00\x00U\x08\x06\x00\x00\x00\xde\xdcc\x1e\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x08yIDATx^\xed\x9c\xcfk\
-TW\x14\xc7OK\xe9\xc2@'Y(\x9a@+H\
-\x0364\x1b\x13W\xcdt\xb6.$+k\xd2\xff\xc0\
-U\xc1\xb8\xe8\xce\xd7\xbap\x157\xa5\xb8Q\xc8\xce_\
-\xb4\xa0\xdd\xb8\x10:*t\x11\xe9F\x98H\x05iS\
-0\x91t\x93\xb4j\xa9\xb4\xa4\xe7\xfb\xf2\xeep\xe6\xce\
-\xfd\xf5~L\xe6Mf>p\x987\xef\xdd\x9f\xe7\x9d\
-{\xef\xb9?f\x88\x06\x0c\x180`@\xe9X\x5c\x5c\
-\xdc\xe6\x0f%\x91;\xf4\x80\x16\xd6\xd6\xd6N\xce\xce\xce\
-J\x05\x0e\x94\x98\x86\xeb\xd7\xaf\xeb\xca\x8b\xa5\xd1h|\
-\xec\x8c\xd8\x05\xde\xf6\x05\xe8\x06\xcf\x9f?7\xde\xbfz\
-\xf5\xea7\xc6\x07]\xe4-_\x80\xdd \xe9\xefhl\
-l,V\x1e[ =z\xf4\xc8\x18\x16\xcf$\xd5j\
-ujtt\xf4gc\xe0~\x80\x9b\xe5\xfbdh\xae\
-\xa1\x924\xf7\xaeQ\x86&\xfc\x89/\x80\x8b\x83\x07\x0f\
-\xfa\x82t\x94\x9eW \xf3\x95/\xc0\x9e\x86]\x96c\
-\xd3\xd3\xd3\xde\xa6j\x12\xee\xfb\x22S\x9a}\x07\xf7\x83\
-\x9f\x9f={\x16\x0a\xf1*-\x91:\x0f<5Kr\
-\xfd\x0d;\xd0\x119\x14\xc7\xcfk\xd6\xc8\x03v\xd0\xa6\
-qRJG\x19\x06\x916\xe0\x0f\xf6\x0a\xa5T\xa0\x8d\
-z\xbd^\xf3\x85\xd9mzJ\x81w\xee\xdc\x89|a\
-\xfa\x1e\xee\xff\x22r\x8c\xc0<ZG\xd6\xc8\xfd\x0cV\
-ZX9u\xf2\xbb0\xdb\xec7\xd6-\xc9\xf4'P\
-^\x0a\x1f0\x96$\xfc\x00\xc0\xbe]\x9d\x02\x94\xa6\xcb\
-\xc0\x12)^\x9e\xaaQ\x80\xb2l2\xe8\x13\xd9;\xa1\
-\x00E\xd9\xa4\xaf\x9b\xf2\xda\xda\xda\x08\x05()@\xba\
-FW\xfd\xc0k\xd7\xae}\xe1\x0bSv\xde\xf1\x05\xe8\
-$\xdc\xff\x9d\xf2\x85)\x02\x1e\xe5/\xde\xbd{\xf7K\
-\x5cc\xcb\xe0\xd9\xb3g\xf1\xfd#G\x8e\xe0c\x95\xa7\
-\x8euH\xb5Z\xfd\x8e\xbb\x84\xbf\x1cI\xe5\x87+=\
-\x91t\xdc\x0d\xf27\xad\x06VW\xd89\x9e0\xa5\x95\
-\xd6uq\x88\x11.+Vo\x82\x97\xc9\x10\x16\xbeh\
-\xc7\xa6\x8c\xec6D\x14P\x10\x93$qu\xbc\xf1\x02\
-\xa5\x05V\x5c\x94u\x91\x96v\xca\x1a+rkkk\
-\x9f\x9ev&\xd8\x82\xf6\xf3\xc7-\x0a\xc8\xdc#\x0d(\
-2\xd9H\xea\x88\x05&\xad\xc3\x17>H\xa0H\x1e\xe8\
-\x8e\x92\x03\xef\xb6&\x9b\xf5\xa9\xdb\xb7o\x7f\xcb\x97\xfb\
-\xf5g\x5cX:~\xfcx\xbc\xb13>>\x1e\xdf{\
-\xfa\xf4)\xbdx\xf1\x82\x96\x97\x97\xe9\xd2\xa5Kz\x94\
-&\x9c.q\xba\xd6\xe7i\xe1\xca\xc6\xfd\x1bW\xd8\xf8\
-\x5c/\xeb\xe6\xe6&=~\xfc8\x8e\x03\xb1\x95\x95\xd3\
-}s\xef\xde\xbd\xe1J\xa5\xf2\xb71\x80\x0b\xce\xb4F\
-\xda[\x81\xd5p\x1f\xb1\x1d\x0a\xc2\x16hi\xa9\x04\x16\
-\xb4\xb2\xb2\xb2\xfd\xea\xd5K_1\xe30X\xc85\x95\
-\x95\xd31\xbf\x95\x00\xea$\x12B'\x1bR\x18\x13\x8e\
-U\xe6\x8e\x08\xf2\xcb\x02\xeag\xea?\xb9\xee?QJ\
-\x22\x12\x09`\xd3\xc7\x04,\x0c\xcf\xd4h\x97\x8cdF\
-+\xb5\x15\xaeHI\xfa-k9\xf1\x1c\xe5\xc4'\xca\
-\x0aE\x9b\x8cB/'\xe2p\xba3\x14\x82\xbe&\x87\
-\xc8h\x0a\x12\x14F\x86\xb1\x09N\x0e\xe8\x84\xc6M+\
-\xa6\x16\x12j\xf9z\x5c\x5c\x9b\xc2P\x08z? \xad\
-\x0fo7\xad\x15\x99\xfa\xcd\xd0\x8a\x85\x8a\xdeB\xb2\xf4\
-\xbd\xba\xf5\xea/:\xb1\xc2\x93\xe4\x82\x03\x8c\xeb\x91\xa4\
-\xf5\xa5U\x9e\x14\xbd_*\xca\x12u\xe5\xe5y9\xba\
-\xb1\x18\x9e\xffG.\xb8\xc9-\xc9\x08P\x98\xc2vn\
-/\x8d\xe8\x955\x1c\xa4L%\x88/)\xe2\xa5\xc8\xd6\
-b\xc8\xef\x1fr\xc1\x05\xf8M\x8bPh\xe1 \xba%\
-fU\xa2|\xb9\x9d*\x9f\xde\x0dp\x9e/I\xd0\xb6\
-\x1a\xc3\x13\xed\x8a\xfc\x9eL\xb8\xd53=x&\x16\x16\
-\x16\xe8\xc6\x8d\x1b\xcd\xef\x97/_v\x84\xb6#\x1dq\
-\xa4\xe7r\xdc\xd3 \x0fx\xc2A\xd7\xf8W~iS\
- \xb7\xfb_\xf5{\x9d`nn\x8e\xd6\xd7\xd7\xe3\xeb\
-C\x87\x0e\xc53\x854 <\xe2\x81'O\x9e\xc4\xe9\
-\x15\x85\xcbPX\xb9n\x05\xb2\xc9\xfe\x22\xbf\xcb\xc4\xa4\
-5\x16\xc1\x993g\x9a\xd7\xe7\xce\x9ds\x84l\xe7\xc2\
-\x85\xaf\x9b\xd7W\xae\x5cq\x84L\x8f\xac\xa7~Rv\
-lllS~oS`\xb5Z\xad\xcb\xefrn\x89\
-\xb9d\x91\xa0\x09J+\xe4\xbe\xc7\x13c\x07\x84\xdb\xb7\
-o(\xbe\x86\xf5\x15\xd5t\x15\xb2\x9e\x86\xb9\xf5\xf7\xfa\
-\x8d\x16\x1a\x8d\x06\x8e|\xb6t\x9cjT\x82s\x99\xd6\
-\xb7\xf2\x89\x1c\x08\xe0.\xf9\xc2C$Y\x07 \x97(\
-_\xd0\xe4up\xd71I\x01\xe8\x91\x9a\x05\xce\xe3c\
-\xd9D\x112\xd5\xc3\x0b\x94\xe1}i\xa7\x15YWC\
-Y\xb0\x88\xecG?!\xa0;\xd3E[\xa1\x9c\xee\xf9\
-^\x90t1\xd02|i\xa7\x15UOS\xda\x5c\xef\
-\xf3\x14\x02\x9b\xf0(i\x91\xe5\x9b)\xc2\xa1\x96\x22}\
-M\x9fR\x5cS\xad\xbc\x22_\x8e\xa9%p\xbd?\xa2\
-Pt+\x84H\x0f\xdd\xd7\xd4\xd2\x88l\x96\xbe~P\
-RdK\x90/\xd1\xd4\x0a8\xaf\x9b\x94\x06\x93\x15\xea\
-+\x16EV@\xa5\x0b\x05\xba\xd2\x95\xf8\xd2\x0c\x15\xb9\
-\x88\x80O=\x7f\xfe\xbe\xc1\xc6\xd3\xb6\x22\xef\x05\xbbZ\
-\xa4e&\xcd\xdc\x94YVQ}\x8fk\xb5\xa7\x13\x03\
-\x88\xde\xbf\x9bFulkP\x16\xb0+eJP6\
-e_\x9f\x15*\xd2U\xb2)0\x8b\xcb\xe3\x13Y\x17\
-S\xdf\x9e\xba\xe9\xea$G\xcf\xea\xd4\x9ahKg^\
-\xc4\xa0\x22Gb\x9bo'\xfb\xa9\xa2\xf3\xb4\xf8\xb8\x1b\
-\x1c&}\xd3\xb5P'Ke\x80\xcf\xfd\xf0\x89\xac\x8c\
-mt-\xca\x85\x81%\xeb\x0b\xbc\x856]\x13\x9ci\
-\x8d\x1c\x15R\x95\xca\xd2'\x22\x8e\x1c\x9c`\xddj\xff\
-B\x89\xfe\xc2@\x96\xbcL{&&\xe5Mw\xe2\xec\
-\xa1\xde\x94\xc9\xa0DUyTN\x89\x1e\x87\x12\xa5M\
-\xef\x9c\x00h\xdbo\xd1\xd3\xb3\xed\x04\xe2\xbe\xdc\xd0\xb2\
-\xe5#\xf3\xd2\xd3\xb2Y{\xe8\xf1\x0e\xef\xc6\xba\x04?\
-\xafZXX\xf8\xd1p\xbfm9\x0a\x8b\x04\xd8\xbc\x06\
-\x1b\x1b\x1b\xf1'6\xdc\x016\xb7\x0f\x1c8@\xc3\xc3\
-\xc3\xcd%\xa9\xbc`QA\xe6\xa3~\xc5\x89|\x80)\
-/\xacK\x9a\x16\x22\xb8.\xf7\xf9~\xad\xedA\x11$\
-\xa6\xdd\xf6\xc6\xb2\xee\xc3\xda\x80\xe5\xa1K@\xdf\x88O\
-\xd3Ve\x1el\x96\x07kM\xf3\xd7\x02\xa9,\x10\xe0\
-H\xee\xdc\xdc\x5c\x9b\x15\x02\x1c\xd7\x98\x9f\x9f\xa7\xd3\xa7\
-O\x9b\x1e\xb7\xf1\xfa\xf5+Z]\xfd\xbdy\xc4\xe2\xc1\
-\x83\x07\xcd\xe5#\xfd\x98\x06W\xac\xf9\x0b\xa6\x99\x99\x99\
-\xf8\x1a299IG\x8f:\x8f\xaf\xb4\x80\x95k\xb4\
-\x18\xdb/\xe2\xf9\xd9-\xb6\xcc\xcf\x8c\x0f\x0d\xa4V \
-`+\x8c\xb8\x00\xe7m\xcfQY\x80\x0a\xa2\xb2\x00\x0b\
-\xb3R9\x0a\xdbY\x964\xa8\xfc\x80R2\xeeaa\
-T\xe5\xab\xf2t\xe5\xc7\xf5\xfacii\xe9\xc3\x89\x89\
-\x89-k\xa0\x02\x89\xc8\xd0\x04zY\xd8\xfaR\xbb-\
-\x99,P\xb0\xed\x0b\xd0C\xac\xb2\x1c\xf6\x05\xd2\xe9\xea\
-\x19\xe921\xbb\xf3[\x95\xd4\xe4U\xe0\xba/@\xaf\
-\xa0\xef\x05\x85\x92W\x81{\xe6\xffZp\xc8\xdc\x17\xa6\
-pFw\xfe\xf4\xc1\xdb9\x97]\x92\xd5\x9fL\xe4\xb2\
-@\xcexOX\xa0t\x83\xd2\x92K\x81\xec4\xef\x09\
-\x05\xe690\x90\xeb\x876<#\xc9\xe5\x05\x9b\x1c`\
-\xdbs`s\x82C\x9cd\x17y\xfe\xa3!\x97\x02C\
-Q\xd309\x05\x93\x93}L\xf4A\xa5\xf2^\xf3\xc4\
-A(\x98\x0enm\xfd\xd9\xfcu\x00P'\xef\x1f>\
-|h\x9d\xb2I\xf2(\xb0\x08\xac\x9d3\x96\x99\xb0\x18\
-\x10zR\xbeh\xd4\x82\x84k\xfbs49=k\xae\
-\xda\xee`\x1d\xd9\xca\x84k\xa3\xaa\xd1h\xfc`\xab\x9c\
-\x8f\x8e5a4!\xac\x09\xba\xd6\xfbT\xf3\xc3\xba!\
-\xd6\xf2\xd0\x04U\xf3\x03j!@-\x0c\x00\xd9\x05\xa8\
-\xe6\x1f\xd2\xf4m\x7f\xea\x08FFF\xba\xa7@T\xce\
-\xd4y\xe3\xde\xd4\xd4T|\x8dC\x8a\xa6\x95\x11\x196\
-+\xfa@\x03\xe5\x9aVbly \xfc\xd0\xd0\xd0}\
-\xe3\xc3\xdd \xcb\xbeD\x99$\x8f\x13\x0dr\xf9\x81\x80\
-]\x99\x9e\xfe\xff\xbe<Nt\x91D\x14\xf0\xb6\xcb(\
-\xc9\x19\xa0R\x10Q@\x81\xcb$p\xb3\x0a\xfbMp\
-\x11\xf4\xd2\xe2\x02\x94\xc7\x03\xcb1*\x1b\xac\xc4\x1a\xe5\
-\xfc+\x93NJ\xb2?\x5c\xa7\xb2\x83\x93\x0c\xb6-\xd0\
-\xdd\x96dc\xbd\xb1\xb8\xb8x\x9e\x9b\xec\xbbT y\
-\xf7D\xbc`\x1btyy9b\x9f\xec\xd3\xd0\xdd\xb1\
-\xac\xc8\xdd\xc0\xe4ze~~\xfe\xe6\x89\x13'.V\
-*\x957\xce\xc8\x19\xe9\xb8\x02]\xb0E\x1c\xe6\x8f\x1a\
-+\xb5\x86O\x96\x0f\xd43\xd3\x8f]L\xcbN\xc9\xcc\
-\x04\x8ep\xc4.U\xbd-\xc0\x80\x01{\x9a\xff\x010\
-\x15\xef\x85h \x8bw\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x07\xa5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00W\x00\x00\x00V\x08\x06\x00\x00\x00\xba\x94\x0a\xc9\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x05\xdaIDATx^\xed\x9c=o\
-\xecD\x14\x86\x0f\xdf\x12\xa2A\x82\xe2\xae(nGA\
-\x09)hr]P\x22\xa5\xa2\x00\x09)4\xb7\xa0\xcc\
-\x0f \xfe\x03))\xe8RPD\xdc*\xfc\x01\xacD\
-T\xab\x94\x8eD\x81\x94\x22\x89\xa2\xa4\xb2DrE\x15\
-\xce\x8b\xec\x953;3g\xd6\x9e\xb1\xc7\xbb\xf3H\xaf\
-\x92M\x8e\xed\x993\xc7g><^\xa2D\x22\x91H\
-$\x12\x89D\x221(\x07\x07\x07\x8f;;;\xaf\x8a\
-\xa2\xf8X\xb2\xdd(\x8e\x8e\x8e\xdec\xe7|\xc4??\
-\x91lu\xc0\xb1\xfc\xa3\xd1-\x7f\xfeF8ds\x98\
-\xcdf\x0b\xe7\xf0\xef\x17[[[\x87\x1c\x85\xbb{{\
-{\xcf\x85C\xd10m\xc7.\xc4\xc7\x17UU\xbdo\
-=x\x13h;W\x15\xff\xaf`Ge\xea1\xec\xb8\
-\xb7\xca\xb2\xfc\x95\x1b\xc2x,7\xce\xa3z\xdc\xc6a\
-sPKKN\xae\x9dg\x15\xa7\x88\xafi\x93a\xa7\
-\x89Nj\x0b\xf6.\x8e\x85\xb8\xe1\xf6i\x93Y\xd5\xb9\
-+\xeaw\x9a\x00oJ\x06]\xd9\xde\xde\x96L\xfa\xf0\
-\x85d\x10\x03\xc1\x9c\x1b\x98g\x9c\x1a2\xc9hl\xa6\
-\xea\x5c\x9a\xcf\xe7\xb9d36\xc1\x9c{uu%\x99\
-\xf4\xe5\x05Y\xf22&!<\xb4\xfb\xf4\xfa\xfa\xfa+\
-\x0c\xf1,\xe7\x99\x1e\x81;4ga\xbc\xcd\xd3\xe7[\
-Z'\x1c\xc7\xb9\x83\x09\x8d\x8d(\xa65A\xac\xf0\xd0\
-Z\x8b(\xaeg]be\xfb\x08\x91\x88\xbb\xc36\xcd\
-\xd6\x09\xf6\xf5\xa2\xd04\xe1J\x17\xe4P\xd1.\xaa\xa3\
-\xef\xb1\xe1\xfc\xfc\xfc\x11\x0b=p\x18fx\xae\xcef\
-\xdb\xe9E0W2#\x87\xcau\x15\xa2\xd5\x06\x9c\xed\
-:\x8d\xe6\xe8\xff\x8d\xa6\x04\x96\x05\xc9\xa1b}\x84\x94\
-\x80\xe8\xe5\x0e\xca\xead\x97\x11\x0b\xdb\xe44\x05\xf8\xf6\
-|N\x0e\xce\xf1%\xa4\x00D2\xd2\x82\x09e\xd1]\
-+\x8e\xf4\x9cb\x87\x0b\xb9KBE\xe0\x8c\x10\xc34\
-\x9c\xb3\x9d\x8b\xdb\x98\x16\xdf\xdb\xe2F\xc8)r\x0e\xc9\
-\x5c\xf8N\x95^UH\x05:\xe0xa\x01\x1f\xe5\xc9\
-)b.\xc8\xb1\xb2\x009\xd3\xb5w_E8\xa7.\
-\x1f#\x0fK\x0e.\xcb\xf2;\x8a\x0d.\xd8g\xa4\x14\
-V\xea\xd9\x11M\xea1>\xa5K\x13\xd25k\xe7G\
-GNJAm\xbd9\xfe\x17\x22\xf7\xaa\xd2uvR\
-:\xaaG\x19QQR\xab\x80\x18k\x9a\xb8\xbf\xff\xc7\
-i\x98\xe4K:\x07\xdbF\x11\xf5D\xe5o\x8a\x84\x8c\
-\x94\x02\x9azn\xe4\xbd!\x22V\x95\xce\xc1\xb6\xc9F\
-\x9d\xb7?\xa7\x08(\xc8\xa12R\xbe\x0b-]\x99l\
-w\x10;\xff5\x8dLF\x9a\x82!:\x11\xa5\x10\x9c\
-\xea:%\x0d-\x94\xa7\x8dm\xc4R\x8f\x1e~\xa2\x11\
-)\xc8P\x91\x10\xc3\xac\xbeB\xa3#\xe7\xb7\xb1up\
-cnB\xc1\xfe-\xb1B\xb1I\xd7\xd9\x9a\xd2C\xdd\
-\xb9\xed\xd2\x90pa\xb0\xf3\x10\xcbvbeb\x94\x9a\
-\x7f\x11\xcd&[n\x8cC\x1a\x98W\xe4P\x89X\xa5\
-K\x0f\xa6\xe1\x196\x12\xd2PpK\xfe@\x0e\x15\x88\
-]\xba\xf5\x0eS?Q\xafS\x0f\xc2\x039\x14~\x0a\
-Rg\x91\xa6\xce\xad~\xba\x12\x16n\xc1\xbf\xc8\xa1\xd0\
-S\xd1*\xd1\xcb\x8e\xcf($1\x0e\xaf\xfa\x08\xf5q\
-\xcd\xbd\x9c\x0e\x0b\x0aAUU\x1fH\x0b\x1eS\x95n\
-\xe6\xa6\xb3\xab\xa7\xc4\x1f\x92O\x9a\xed@\xeb\x16\xb5\x8d\
-tK\xa3\xa6q/7\xc4>\xf9\x84\x9d;[\xd7\xa8\
-m\xa4\xa6\x06\xd3:\x08\xa7\x0c\xac\xfe\xf9e]\xa3\xb6\
-\x91k\xc7\x86(\xe7`{\x97|!=\x7fZ\x07\xa1\
-~*\xa6\xc5\xa6\xb2,\xbf%_\x0c\xb9\xb0\xad\x0a\x95\
-\x1e\xea\xfa*\xa6\xd4\xc0)\xd2_j\x18#j\xeb\x17\
-P\xda\xef\x9d\x15\xd21}\xa5.\xf0c\x82\xa1\xb3C\
-D{\xd9\xf3\xcb\xad\xb4\xf4\xe0\xb1\xd9\x8c\xa1\xfe\xdd\x97\
-\xe0T\xae\xd8\x8c\x96\x11\x8f\xed#\xddj\x99\xae\x9e\xf8\
-\x1b\x97\xef\x19\xf5\xa5\xde\xee\xb381\x12?Z4\xc4\
-S\x05l\x85b22#\x9e\xa3\xafTL\x13\x0a.\
-\xe7\x8f\xd4\x17\x8e\xd2\xc5\x83\xc7\xf6mc[\xa2\xeb\x22\
-\x87-E\xf8\xbfx\x9e\xbeR1\x0dA\xd9\x17?\x93\
-\x07\xfe?\x99:\xd0\xf69\xee\x8d\xc5\xb1\x90\xfa\x18\x08\
-\x9fuv\xec\xdc?\xc8\x03\x8d\x03\x9e\x5c\xd4W'\xc7\
-\xb7\xdd/\xea\x05\xdbp\xa3.\xe5\xfc\x90R\xa7\xc2\xa6\
-]:\x5c\xee\xfe\xfb{\x9b\x137\x1b\xdd\x90\x83|9\
-\x96\x1b\xecO\xf5z\x1arr8\x97/\xa9A\x84\xf4\
-\xa7\xeb\xd4\xbc<[\xabW\x82\xc4B\xad*\xee\xbc\xae\
-\xc9\x8d'\x9bMB\xcbu\x9d\xa1vx?0\xce\xf4\
-=\xec\xe2\xf3\xfd\xcbw\xc1\x97$\x93\x93\xc3\xf9|J\
-7S\xd39\xd7\xdb\x9e2vD\xee+\x15@|7\
-\xbcT\xaf\xa1!'\x87s\x85\x90\x8ae\xcf\x85\x1f\xb0\
-\x0a\xcf\x0e.\xc8\xa1p6q\xd4\x8a\xef!\xf0ur\
-r8W(\x0d\xee\xdc\x06vN\xe7(\xe6\xe3n\xa5\
-/\x03\xc2\xf9u\xc7\x0e)\x15\xcb\xa6=\xff`\x16\x85\
-\xd9\x94\xe6=\xb0\xf67\x7f,\x15\x86#\xc0\xfa%@\
-\xf5xW\xac|h\xa9X\xc6\xf4\xe1\xc1\xfb\x04\x9a=\
-\xad\x05\xb5\x0a\x22==\xad\xdfI\x10+>\x84\xa2r\
-\xae\x0e\x8e\xe8\x8cZ\x05\xb1=9\xc5\x9d\xd05\xd5\x84\
-\x90\xfa\xb8\xdd\xb2\x8e2\x1e\xb8\xcd\x91>\xa4\x0d\x15!\
-\xdf\xb8\xec\x22u\x0a\x1c\xa5s]\x08\xfd\xc6e\x17\xa9\
-\xeb\xba]\x9d\x1b\xec\xcb,\x5c\x89\xf1\xfd\xaf\x9b\x9b\x1b\
-\xc9\xc4\x89Q\x9d\x8b\xb4\xc1\xf9\xed\x85d7U\xde\x96\
-\x0cB\x81Y_\x96e\xfb\x92\xdd\x18\xf8\xfa\x0a\x99Q\
-\x22\xb7\xaa\xaaw\xce\xce\xce\xa2t,\x98\xb4s//\
-/\xb79\xd7Jf\xa3qzz\xfa\xe43\x07\x82\xc1\
-\xd2\xce(\xce\xbd\xbb\xbb\xfb\x9es\xadd6\x1a\xf3\xf9\
-\x9c\x1e\x1e\xee\x17\x9fONN,\xd6\x91\xc1Q{A\
-\x0eC\xa21\x85I\x0dff\xc2\x9e\x89\xf8\xf0\xbd>\
-<\xa2\xac\xbc!\x19\x04B,\xd8D\xb0\xfao\x94\x9c\
-\xbb)$\xe7\x06d\x94I\x04\xe7\x5c\xac\x9aIf\xd1\
-s||,\x99$\x12\x89D\x22\x91H$\xc6\xe1?\
-\xe2\x0d\xb6\xfd\xeeT\xa2+\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x06*\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00G\x00\x00\x00W\x08\x06\x00\x00\x00VfX\x84\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x04_IDATx^\xed\x9b\xbfO\
-\xdc0\x14\xc7M\x85\xd4\x0eUa\xa4\xc0\xd2\x91\xb5\x15\
-l\xa5,\xdd\x8an\xe8\x00\xea\x1f\xc0\x1fp\xfc\x01\x84\
-\xbd0t\xab\xc4R\xa9\xc3\xad\xa8S\xb7\x13K\x87\xd3\
-\x8d\xb0T\x1dZ\xc1qe\x22\xa8\xfcP\x87\xa6\xef\x9d\
-\xce'\xc7\xd8~N\xe2\xcb\xaf\xf3Gz\xbaK\xe2\xbc\
-\xd8_\xdb/\x8e\xe30\xe6\xf1x<\x1e\x8f\xc7\xe3\xf1\
-\xe8h6\x9b\x01\xfcD66??\x1f5\x1a\x8d\x17\
-*?\xadVk\x0d\x8fS>\x14\xf6F\xe5/\x0c\xc3\
-\xe9\xbd\xbd\xbd(\x89\xcf\xe5\xe5\xe5@\xe5+\x15P\xd0\
-\x80Y\x5cT\xb2\x8f*_@\xdb\xe2\x5c\x95\xfd\x00{\
-$;\x83J[O\x22\x0c78'\x90}%&\xa5\
-0hW\x90\x81\xc7\xa2/l5\x16\xe7\x99l\x87I\
-\x0c[\x01u\x9e\xd2\x5c\x08D^Dg\x90\xf1-\xd1\
-\x114\xff6u\x0ea\xb7\xe0\xe3\x99\xe8\x13\xae\xf1\xc5\
-\xe2<\x93i\x996\x1dT\x01j\xb3\xcd\xcdM\xb6\xb2\
-\xb2\xc2\xce\xce\xceb\xc7\x16\x16\x16\x06\xc78p|\x0b\
-b\xc2\xa7\xd3\xd3\xd3\xb7\x8b\x8b\x8b\xdf\x0e\x0e\x0e^\x89\
-\xe9\xa1`\x03\x7f&z\xbd\x1e\xebt:|\x13\xbb\xd5\
-\x07\xb0u!I,\xb6A7\xbb\x977\xcc\x17n\x83\
-\xb0\x03\x7f.\x89)\x0d]#2!\xa77\x19\xe5\x0b\
-999!\xfd\x88\x06\x857\xfaR\xc4'-\x0fL\
-\x07e\xb0\xa6766\xa8d\xd6\xc8-O\xc5\xc5\xc5\
-\x05\x95$\xc6\xe5\xe5\xa5\xf6\xd8\xd2\xd2\xd2\xa0\x0c\xb6$\
-\x12\xa7\x0a\xcc\xce\xceRI\x9c2j\x82\xa0\xba\xb6\xc9\
-r\xb0\xab\xd8\xdcZ\xe1.\x18]_\xff\xa1\xdc\x0d\x80\
-8B\xfaC\xc3\xf1\x0e\x05^W:OK\xe2\x80L\
-\x81\xddnnn\x8eu\xbb]c:\x0c\x9c\xb6` \
-U\xdd\x00D0\xe8\xba\xec\xf2\xb6$j9e'I\
-\xcb\xa9]\xccq\x89\x17'#\x01\x13\x9a!\x06\xc7\xaa\
-\x82\x01\x9b\xc5\xbb\x94\xb1[\xd9\x120)\xf6\x98\x06[\
-eD\x11k\xfe5\x93\xdc\x15\x08\x02&8\xc7\xdbu\
-\xbb\xdd\xa6\xf2T8X\x89X\x99,.\xcc_hE\
-\xef\xf4EMG\xc0\xa4fi\xf3\x08P\x14Xy\x8a\
-1\xd7\x15\xe4\xf9\xb5\xb6\x84Y\x18>\xe6\xc7.X\xc6\
-8\x84\x95&\xe7\x13\xec7\x08\xf6\x5cW6'\xa8\xe6\
-x\x92\x8cx\xc7\x8djD\x0d\x95\xfa\xfd\xf8\xf8\xf8\xa9\
-\xb6P\x0a\xa6\xa8\x04:P\xa0\xc3\xc3\xc3\x1dq\x1f>\
-\xd4\xf1)\x0b\x1c\xcd\xe2\xa85\xef\xffGGG\x0c\xf2\
-\xc5D _]\xd8\xf7\x12\x04\xbaey\x91d^\xb9\
-(\x83J\xfc\x1a\x86a1\xe39\x88\xfa\x01\xb3\xc8d\
-\x11\x06\x95\xf7\x19\x84I\xdd;\x9c\x00\xc1/\xb0y\x12\
-\xcf\xd3\xa0\xd2\xde\xb3\x8c8S\x15\x9a\xef\x1d\xf4\xeb\x87\
-\xc26[]]\x1d=I\xf3\xa9\xcaq\xfd\xee\xef\xef\
-\x8f\xf2\x82S\xaf0\xbeqV\xb6\xcc@\xd0\xeb3\xa1\
-\xe6\xf2\x1e \x8a\xd7\x1e\xb6\xe2\xcc\xb8\x0cT\xb1\xf9\xc9\
-~\xbf\xafK\xe7\x9c\xf3\xf3s*I*\xc6&N\x1d\
-\xf0\xe2\x18\xa8\x85833O\xa8$\xa9\xa8\x858a\
-xE%IE-\xc4\x19\x17^\x1c\x03\xb5\x10\xc7\xc7\
-\x1c\x03>\xe6\x14\x80\x17\xc7@-\xc4\xf11\xc7\x80\x8f\
-9\x05\xe0L\x9cN\xa7sG\xa5\xa9\x1a\xce\xc4)\x92\
-*\xc4\x9c\xc2\xa8B\xcc\xa9\x1d\xb5\x10\xa7\xf2\xdd\xea\xe6\
-\xe6\xda\xf9\x7f\xce\xcf\x9f\xbf\xee\xed+#\xe4+\x93<\
-\xact\x13\xec\x8dFc\x8dJ\x93\x17\xfc\xd5pV\x9c\
-\x89\xd3\xeb\xf5\x02*M^\xd8,\xfe\xb6\xc1\xc9\x8b/\
-\xdd\xa2\x02W\x99\xa4\xe0/\xf6\xc4\xef\x1a\xe0\xfa\xbb0\
-0\x0d\xf4g\xe5\x80j9J\xde/\xf4\x10\x5c\xc1%\
-\xbf\x92v\xfa\xd1YRda\x8a^\x0a\xa7Z\xe2V\
-\x88@e\x13\x86S\xb8@e\x15\x86S\x98@*a\
-\xf0;\xa6\xb2\x91\xbb@U\x11\x86\x83k\x14s\x11H\
-\x16\x06/Z\x96\x05\x92\x14\xf2\x02m[\x81\xac\xc69\
-\xaaq\x0c.\xfev5\x12\x1d78\x06j\xb5Z\xee\
-\xc7A\x19>\x9d.\xbd\xd9\xb6 %u\x16\x86[*\
-\x81&A\x18n:\x81\xb41\x07\xefDb\x1f\xa5\xbe\
-\xff\xae\x1a\x8a\xef\xcb\xefia\x0a\xc8Ql#\x8am\
-V\x9e\xa9)Z\x0b\xeb)\x8bq-J,3\xd6\xe2\
-L\x22\xbe[\x09\xbb\xe4\x1d\xd6\xdf\x95ooo\x8f&\
-\x95\x10jEy\x99\x7fm\xb1n9\x13@\xfa\x80<\
-\x89h\xc5\x81g\x91]\xdd\xb1\xba\x01\xcf\x89\xc9\xcb\x8a\
-\x9f\x0a1\x8b\x11f\x95m\xf8A\x9d\xc7\xe3\xf1x<\
-\x1e\xcfD\xf1\x1f\x8b\x0dM\xfb\xf5.\x1cs\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x05$\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00?\x00\x00\x00T\x08\x06\x00\x00\x005l\xefF\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x03YIDATx^\xed\x9a1\x8f\
-\xd30\x14\xc7\x1fH,|\x00T5\x12b\xe6\xd8P\
-\xd6\x92o\xd0\x05\xa4\x8a\xe9t+['6\xbc1e\
-\xe0\x03TbA\xad`\xba\xad\xa3\xe9\xd8\x99\x8c\x95n\
-I\x06n@\x19\x98\xc33J\x07\xda8\xcf\x8d\xed\xc4\
-\x0e\xfeI\x7f]uy\xe7\xf3?\xef\xd9\xb1S\x03\x04\
-\x02\x81@ 0j\x1eP\x01\xb6H\xd3\xf4I\x9e\xe7\
-/\xf0\xa3\xd0<\x8a\xa2\x09\xea\xdbl6\xfb4\x9dN\
-\x7fQ\x7f\xef\x1d\xcb\xe5\xf2\x0a\x8d1\xfc\x98\xa1\xaa&\
-\xe1\xf5\x0a\xe3xQ\x14SyK\x1e\x81YN\xf0\x07\
-\x07\x89\xe1&\xcd\xe7\xf3\x8as\xce\x1a\x9a\xf3\x07\xccb\
-\x02\x0af\x9b$\xaa\x00+\xe0eC\xb3\xde\xc0A\xc1\
-\xa8Lq\x1cW\xe7Mz\x00f\xee\x0a\x14\x0cR\xda\
-l6\x1f\xce\x1a\xf7\x00\x06\x0a\xe6(\xe1M\xccN\x1b\
-\xf6\x01\xe9\xac\xdeA\xc6\xb1\xfd\x9c7\xd9i\xe3}}\
-H\x05\x8c\x99`\xde\x03\xbeS\x01.BMbJ\xc2\
-\xd9>9m\xd8y\xc4\x0a\x0d\x14\xcc\x11b\xa7\xedz\
-\x01.m\x19\xd0\xe6\xc6g\xfc\x88f\xf6\xd9y\x8b\x9e\
-\x80\xcbR\x06\xb4\xc1V\xe1\xee\x8e\x9d\xb6\xeb<u\xa7\
-Is*\xaa\xf7\xf8\x0c<\x81\x81\x82\xa9K%\xf6\xf8\
-XM\x15\xb8H\xbdw\xe7\xa0`DG\x9c\xf3\x9f\xe0\
-\x12\xe2\x15\x15(t\xdc\x94\xb0\x02\xbe\x82C0P\xe8\
-\xb4)\x89!P\x96\xe5#p\x04\x93\xdbW%a\xf6\
-\xafA\x03Sk{\x86zN\x05\x99f\xbf\xdf'T\
-L\x1f\x90Y\xb2\xa4;\x18\x12\x1c{\x09\xd0\x9d\xb4&\
-,\xfdg\xd0\x11\xed\xb2\xbf\xbd\xbdeT\x8cM\xf2<\
-O\xa8\x18\x19\xda\xe6\x91WT\x80M\x866?4\x09\
-\x15 C\xdb|\x1c\xc7T\x88U\xa2(\xba\xa3bd\
-h\x9b\xc7M\x07\x15b\x1bF\x05X\x03g[\x0e\x0a\
-\xb3\xb2\x0d\xe1\x8d\xd7Z\xe2jg~2\x990*\xc6\
-\x12\xf7\x8b\xc5\xe2\x1d\x15d\x1d\x03\xaf\xab\xba\xe8\x0d8\
-\xc4\x0f\xa0;lJ\x1c\x5c\x22M\xd3\xd7@w\xda\x88\
-\xeaU\xa5\x930P0\xd0Q\x1c\x1f\xad\x09x\x00\x03\
-\xda\x8c\xb2\xea\xb3<F1\xfe\xcd\xe7\x09\x15\x15p\x01\
-\xc6\xfb\xaa\xfd\xa8k\xa2\x1e\x93\x9c\x08\xbb\x08\x1b\x99\xb7\
-\x01\x03\x852\xee*\x1c\xf3\x9f9\xe7\x8f\xc1%\xea\x89\
-\x88\x83\x82\x01\x03\xcapm\xd1\xfb\x9b\xa33\xba\x9c\xb1\
-3\xa4\xdfx\xc3\xafa(\x06Z\xd9\xfd#\xbc\x01\x0c\
-\xfa\xc6\xe4\xd7Q\xba\xeau2\xac\xef6\xd9\xa9\x9e\xc5\
-\xc06\xe2\xcb\x02\xa0;2\x88\xacV\x00\x8eq\xb2\x03\
-C\xcb\xca\x1c\x90e\xd9G\xcd\x83\x06\xbd\xc9\xf8\x0d\xa8\
-\x0f\x00{#c\xc7\xd5\x87|U\xd5U\xa2J\xcb\xb2\
-\xd4_\x09\xfa\x96\xf5\xa30\xfb\x1ct\xc0\xb1\xfe\x14\x14\
-\xfe\x91\x8b\xaa\xe7()\xe4\xaen\xb5Z\xddP1\xae\
-R\x14\xc5\xdf\x89Zv\x9d4\x7f8\x1c\x9czQx\
-)\x98\xbc\xf7TL#\xa2\xe4}y\xbc\xc9\xd4V\xfa\
-\xad\x99\xdfn\xb77\xa2t\xc6J\xab\xf9<\xcf\xbd.\
-y\x81H\x1e\xeam\xd3\xb5V\xf38\xde\x87\x7fa`\
-\x80\xf5z\xfd\xa5\xe9\xf7\xad\xe6\xc7R\xf2\xbb\xdd\xae\xf1\
-\xf7\xe4l?\x06dI\xa4\xc6|\xdbe\xef\xf9/2\
-\xdf\x15\xf29\xea\x83d\xcf\xfa\x90\xf9&\xd24\xed\xf5\
- q\x0f:C\x9a\xf91,p\x8e\xc8\xce\x0dI\xcd\
-GQ4\x1a\xf32\xda\xc6\xfc}\xcb\xb5Q\xd0f\x9e\
-\xb5\x5c\xf3\x8a\xb1\xacT\x03\x81@ \x10\xb8\x90? \
-\x0dfS\xd9\xfeq\x5c\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x08\xa7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00[\x00\x00\x00_\x08\x06\x00\x00\x00\x87\xa7\xbb\x8f\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x06\xdcIDATx^\xed\x9d\xbfo\
-#E\x14\xc7\x07\x84((H\x90 J\x1c!\x22\x5c\
-\x85\x884Q\xdc\x9d\xcf\xd7\x83]!\x99H\xa0\xab\xf8\
-\x03b\xd1\xd0xS]\x15\xa7\xa3C\xba.\xd1\xe5\x1a\
-\x87\x22%KRZQ*\xa7\xb3\x08\x85\xad(\x14$\
-\x88\x9c\xe8\xc2\xfb\xda\xbb9g=\xe3\xb7\xbb\xdeY\xef\
-\xae\xe7#=\xad\xbd~\xfb\xeb\xed\xec\x9b73o\xc7\
-B\x18\x0c\x06\x83\xc1`\xc8\x0e\xedv\xfb\xe7\xdb\xdb\xdb\
-\x8f9=CH*\x95J9\x97\xcb\xfdA\x1f\xef]\
-\xa1\xef\xf7\x9b\x9b\x9b\xf7\xdb\xdb\xdb\xf7\xbd^\xef\x07f\
-\x17\x06\x0e2f\x89\x16\xb6\x182\xb2J\x0e\x0e\x0e\xee\
-\xe5{1\x8c\x85\x0cW\xa2\x92k\x0b\x1fF\x1e\x16\xda\
-\xae.\xdd\xa1A\x0d\x5c\x83\xf0a\x5c\xaf\xd0\x93\xd0\x96\
-\xee\xd0 \x87J\xa7-\xc6\x18\x147\x02\xbez\x8c\x8e\
-\xc1/\xbb\xbb\xbbR#b\xbd\x17T\x92\x12\xdd\xc4\xf1\
-.\xa7\x90$\xa8$\xc3\xb5\x8c\xac\xaf\xd5j\x12\xed\xe4\
-\x91Xcw\xbb\xdd\x91u\xd5jU\xa2)\xc4\xc6\xc6\
-\x86t}\xd2H\xac\xb1\x97\x97\x97G\xd6\x9d\x9c\x9cH\
-4\x858;;\x93\xae7\xf8\xc4&d\xbe\x18>\xfb\
-\xee\xee\xdf\x07\x7f}qq!\xf3\xd9\xb6r\xc7\x86Q\
-\xa8)\xfe\x01\xb5\x18\xa5\x95\xa4\xdbbTE$d\xfc\
-\x92j\xbf\x06\x05\x14\xfeY\x8aHc\x9cX\xd2\x9d\x19\
-xB4l\x12Kb+H\x97B\xa1\xc0\xa9<\xc2\
-\x89\xcf\x0da\x08\xeaF\xa0\x0f_\xdfn\xb7\x7fU\xec\
-\xd20\x0c\x19kM\x0c|/\xfa8X\x03\xcb\xc45\
-\xba\xe9\xf3V@\xd1^I\xf8\xecJ\x0d\x22\xa8h\x85\
-\xe1-T\x11\x1e\x0a\x1f\x86\x0b+\xe8\xaaE8)f\
-\x99^\xaf\xf79\xc5\xca\xd7\xc2\x87\xc1&\x15\xb8\x16z\
-z,1\x8b8n\x835R\xd4B\x11\x8b%f\x10\
-[\xf80\x8e\x0e\xa1\xca\xd3\x12\xb3\x00\xf9\xe7\x92\x98\xa2\
-\xa1]!\xf7e\x89,C\x86\xb6\x84\x0fC\xc4%\x99\
-5x\x14\x86F\xf3\x9d|}\x7f\x14\x1dK\xd5\x88N\
-\x10q\xce+;\x90q\xd0Pa/\x9c\x13\x18y\x18\
-t\xb7r\xdb\xf8\x91LU\x9a\x14vY\xc2\xc7Es\
-\xe2\x1d\x83\xa4\xd0\x91\xdd\xc6\x8f\xc4\x11\x16\xc6\xd6\x11E\
-F\xf9\x86\xd3\x99&t~boo\xaf\xae\xb3y\x1f\
-\x97\xb1K$_pJa\xb8\xb9\xb9\xe1T|\xd3l\
-6\xc5\xf9\xf9\xf9_\x9c^X\xde\xe3\x14\x22\xc2\xe2\x14\
-T`4\xbd\x5c.\x8b\xab\xab\xab\xfe\xf7\xf5\xf5\xf5G\
-\xbf\xaf\xae\xae\xa2[\xb5?f\xb9\xb8\xb8\xd8\x1f\x8f\xc4\
-w\x94\xd40P\xe9\xe6T\x92\x8b\x13Z\xb1>S%\
-\x18c\x0c\x02|8\x93\xbc\xe3G\xd2\x87S\xc3s\x17\
-6V\x10\xde\x05\x01\xc6\x0e\xda\x07.\x11-h\xf5\xd9\
-\xddn\xb7\xce\xe9\xcc\x12Z\x8d=-d9'\x99G\
-\x95\x8a0\x89x\xe3l\xf8tn\x9b\x10\xa2\x85\xd4\x97\
-\xec\xf9\xf9yN%1\xa4\xde\xd8iB\xab\xb1\xf3\xf9\
-<\xa72Sh56UT\xbfs:A\xf1V~\
-KKK\x0a\xcd\xe4\xa1\xb5\x05I\x86\xb1h\xf1\x1b\xa7\
-\x17\x84\xfd\xfd\xfdG\xe9\xc4\xb2\xd4\xe2\x99\xc5y\xbf\x85\
-\xab\xfd\x93$\x7f\x0aMhu#\xe0\xc9\x93'\x87\x9c\
-N\x92\xa0p\xf5\x94\xd3\x09\x8bvc\x97\xcb\xe5T\x19\
-\xbbX,\xca3\xee\xd3B\x88L\xd4\xa9\x88\x93#\xb8\
-(\xd2\x0c\x92\x1c#\xe8\x89\xd3.\xba\xd3\xd4\xb4F#\
-.kkk_S\xe9\xb6[\xad\xd6SN\x17\xe0\xad\
-0\x90\xcb\xe5B\xc5\xea\x9dN\xa7\xdf\x9fM\xc7\xe3T\
-\x1f\xa0\xf3\xdb\xa9V\xab\x16\xa7\x97\x1a\xb8\xbe\xed\xa0}\
-\xd7~Q\xbcw3,\xd6\xe8\xd9f\x03KH.\x18\
-nF'cR\x1e,\xe9Yf\x08i\xec\xedMS\
-\x88\x0a\x0c@(J\xb6\xad8?-\xbc\xc3)\xe8\x00\
-yv\xcdf\xb3\xae\xfa\x1d\xbe\x1a\xb8Ms\xf7;P\
-\xf9p\xf8i\xe0\x8e=\xba-\xcbqc\x91t\x1e\xcf\
-\xe8<l\xa5B\x16 \x03|\x14\xc1\xd0U\x14\x12+\
-\xda\x1b52\xc8\xd0\x7fO{4e\xf8i\x89\x8b\xa9\
-\xb8\x11\x80\x92\xed'\xdd \x8cQ\xfc\xec\x17P\xb8\xf7\
-\xac\xd1h\xd8\x9c^T\xc4\x12g\xcb\x90\x19\x04\xf1\xb5\
-;\x19\x80\x9b\x07\xb2\xb0\xb00\xa2\xc7q}}\xdd\xcf\
-3q\xfd6\xdeyG\x02\x8e\x17\xf2\xf3\x96\x18$\x10\
-e\x9eG\xfe\x13%]'\xb2.\x03\x84\x9b:\xd3\xcd\
-\xbcL\xc5g\xc7\x9d\x13\xfd\xe6\xcd\x9d8=\x1d\xed\xcc\
-C\x0bSg\xba\x99\x97\xd8\xdd\x08J\xd2\xdc\xdc\x5c\xdd\
-\xbb\x1en\x05\xae\x03\xae\xa4X,\xf6?c97\xf7\
-\xa1l7}no\xffy\xc8\xf5s]\x07p\xdd\x07\
-\x96\x08\x09aT\x95\x1f?::\x92\xae\xd7A\xec\xc6\
->>>V\x96$\x18\x04\xbe\xd5\xf5\xaf~*G\xbf\
-\x95\xa1\x0a7>\xcf$I\xeb\xfds\xce'\x9b$\xa4\
-1\xe3\x95X\x88\xbd\x82\x9cvcF\xc2\x0e\xa7\x10\x15\
-\xb1\x1b;a\xc0\xd0\x16\xa7\x94Z09mB\xfc\xb6\
-%\xb2\x0e\x85~\xefcY\xa9T\xdaS0:\xbav\
-\xebt\x5c-\xaf\x9c\xa4\x11\xce`a\xc4\x12\x86\x01T\
-\xda\x17\xdb\xed\xf6/Q\xbc@\xaa\x90\xd9\x05\xf3~\x90\
-q_`d\x06}\x16q\x86\x83\xd3|\x9bWK\x17\
-+\x95P4\xfd6\x86\x85\x9a\xce\xfd\x0cH\xb7\xc56\
-\xae\x09\x1d\x03H\xf8\xb4HlL\x91\x94\xcf\xe7\xf1\x8e\
-&\xa4\xef\xcb\x11\x9e\xcar\x08q\xee\xeeHQ\xa1P\
-x],\x16\xbf\xa3\x82\xf2\xdf\x88b\x94P\xe9\x98x\
-\x0e\xa7,\x08&\xa5\xa1\xa7S\xcf\xcb\xb4\x98\xa9]$\
-`\xea\x8a\xa4\x09rbD\x948w\x90=\xf0\xac\x8a\
-\xd3_>9\xb6m\x7fB\xbe)\x96y\x9c\xd2,\x91\
-\xfc\xb9\x05U\x22Zg&\xcb\x92L\xf4\xf7-\x8e\x9f\
-f\x0fbd \xce\xeb\x88\xa1\xb1\x85\x8f\x83\xc4)\xee\
-l\x94\x9c\xde\xb4\x84\xda\x10\xdf\x8a0$-\xb7\x1a\x86\
-\xa68\xfeG\xfa\x8cT\xe4\x17q6\x88\xfc\x08\xce\xc7\
-\xed\xff\x09\x0cf\x97I\xca\x059\xb3\xdd\xfc$\x86@\
-v\x15\x15\x88\xbaHH\xcc?\xf1\x84\xbbN\x928{\
- ]BFn\xc3\xa0\x5c\x89!\xd7\xb2D\xba_\xd1\
-\xc7:\x09Fr{\x82\xd9w\x94\x12Y\xf8\xe7\x04\xee\
-\xec\x01\xa3\x92\xdc\xe0\x0f\xdalg\x0e\xc0I(\x89\x18\
-\xea\x1d'\xc3\xeb{\x11\x05\xf4x|\xa9\xab\xff\xd91\
-,\xe4\x92J\xe7K2\xf0s:^\xf0T\xa81\xd0\
-~W\xe88\xcf\xe9\xe3K\x92K\xe1\xe3\xbc\x82\x08\xb9\
-\xb7W\x82!PG\x14\xfeackk\xebi\xd0\x0e\
-$\xa4$\x0c\xa7\xff\xe6\xf3\xf9\x0b\xfa\xf8\x8a\xd6\x1d\xd6\
-j\xb5\x8b\xf1[\xc7\x03\xdd\xe8\x95n\xb7[\x12\x83'\
-\xa1D\xd7\xf8\xd9\xf8-\xdeB7r\xa7\xd9lZ\x9c\
-^ c\x03\xb4\x92T\x7f\xce\x83\x04\x1b2&^\xda\
-\xb4\xc9\xa06\x96\x8dF\xe3R\xaa\x9c\x12\xe8)[\xe9\
-t:\xa5V\xab\x85\x1bP\xa2U\x8fn\x02]\xf3\x0e\
-\xfdfI7\x8e\x02o'?\xbe\xe3&P\x05\xf6)\
-\xb3i\xea\xc9\x0d\xcdO\x18[\x1a\x9d;\x8b{$\xfd\
-\x01)\x03\x06\x9f\xe6 \x84\xc1`0\x18\x0c\x06C8\
-\xfe\x07Zm\x5cx\xd3\xfcT \x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x06\x8a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00B\x00\x00\x00V\x08\x06\x00\x00\x00{\x13@e\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x04\xbfIDATx^\xed\x9bMJ\
-\x1cA\x14\x80\xcb$\x84`\x185\x10\xc5QP\xd7\x11\
-\x5c$\xd1\x9d0'\xd0\x95 Y\xe5\x0a\xea\x01\xec\x0b\
-\xcc.\x07p\x13\x90x\x81@6\x9d\x03\xb8\x1c\xf7\x13\
-\x18\x11\xc9B1n\xd3yo\xa6\x1b\xa6\xab\xdf\xeb\xaa\
-\xee\xa9\x9a\xae2\xf5A1L\xf9\xa6\xab\xea\xf5\xfb\xab\
-\xeaV\x88@ \x10\x08\x04\x02\x81\xc0D<W\x09\xd8\
-\xe0\xf8\xf8\xf8e\xbf\xdf\x9fk\xb5Zo\x1f\x1e\x1e\xda\
-\xd0\xb5\x06\xed\x0d\xb4\xdf\x8a\x9f>\x0d\xba\xdd\xee\x22|\
-\x5c@Kt\xda\xf6\xf6vr\x7f\x7f\xdfb.\xe7'\
-\xb0\xa8\x03\xf8\xb8\x15\x1a\x0a\x90\xda\xed\xf5\xf5\xf5+\xea\
-\x9a\xde\xb1\xbf\xbf\x1f\x09b\x91+++\x09\xfc-\x01\
-W\x19\xde}J&\x95\xfbF_\xd9#\xc0\x1d\x22\x5c\
-\xb0\x90\x16w~~\x9eP\x80<\xe7&\x1dn\x0c/\
-\xa8\xa2\x84\x8c\xab\xab+\xca*bv\x10O\x90\xefl\
-\xa9\x122\xd0]\xe4\xdf\x96\x8c\xe1\x05\x95\xac!\x03\x02\
-\xe4T\x15\xf1L%`\x9a\xe5\xe5e\x95\xc8\x90\xf9\xf9\
-9\x95\x88Q\xa6\xae\x88\xcb\xcbK\x95\xc8\x90~\xff\x97\
-\xdc\xf5\x93\x92\xf3\x09S1\xa2\xc3\x0f\xe1\x07\x05_\x8f\
-\xe3X\xa5\x87D\xca61\x7fyO\x80\x05E\xa2\xa2\
-U<Ek\xc8\x88\x84\xa4\x0c\xac\x15(\x1e\x1f\xff\xc8\
-\xd6`5[4Anqx\xd7)\xd0md\xd9\x92\
-k\x1ac\xeaYC\x05\x95UR\xf7\xf2\x1b\xdc#\xa4\
-\xe5\xb1V\xc0d\xca\xeb\xc4weD\xa2h\xe6\xc3\x8d\
-U\x19X}R{\x14l\x18h{\xbd\xde'f<\
-'\x89\x04\xb1\x08\x0c\x86\xba\xe0\x16]\xbe\x86H-\x04\
-\x94\x151\xe3\xba\x01,\x96<\x85\xe2\x82\xa3\x0a\xb4\x1e\
-\xca:\xb0\x0f\xdc\xab\xc3\xcd\xa3Q\xe0\x0e\x92\xa7P\xba\
-\x1b-\x0e\x8c\x1b\x942@\xe917\x97\xc6\x80\xc5v\
-\x04a\xc6\x93*!\x83\x0a\xa2bdi\x1dzF\x0d\
-\x01\xd6\x10\x0bC\xee\xc0\x81J\x95\xc7p\xf1\xc0\xa60\
-I<S0\x0ds\xb6\xe9\x14V\xad!\x83\xb2\x8a\x92\
-9ic\xad\xb2\xdc\xd9\xd9Q\x89\xd4bkkK%\
-R\x0bk\x8a\xd0=\x89\xaa\xca\xc2\xc2\x82J\xa4\x16\xd6\
-\x14a\x13\x08\x90*\x91\xcaXS\xc4\xcd\xcd\x8dJ\xa4\
-6\x10\x84U\x22\x95\xb1\xa6\x88\xc1`\xa0\x12\xa9\xc5\xdd\
-\xdd\x9dJ\xa4q\xe4\xfc^i_\xa1\x0b\x915z%\
-s\x9a>\x90\xdf\x7f\x08I\x19\xa6\xaa\xca\x0c\xacK\x88\
-R\xfb\x94\x9fU\x03\xc0\xa2\xdf\xc3\xc7_!)C\xe7\
-\xa0V\x07\xb4.j7\x0a7\xe0\x1d;\xa9\xa6\x80\xbb\
-\xf5U\x14\x8b\x9d\x89\x95\x81\xfb\x0c\xa6\xa2\x8c\x98\xa94\
-\x0bX\xc5<||\x17\x842\xb0\xd2\xac\x133\x98J\
-\xd2]%dt\xbb]|\x1d\xe9\x8b &\x8f\xa6\xad\
-\xbb\xff@\xa51\x0f\x82c\xe1\xe1\xf1~,\x8a>\xad\
-\xd2\xc1\x10\xe6t*b\xc6q\x1bXLG\x10\x96\xa1\
-c\x15\xd4\xef\xd2\xebY\xc1ZA\x95\xd2\xa1:\xdb\xed\
-6\xd5\x9d\x83)\xa3#\xaa\xd3i\xa8G}\xd8tk\
-\x0b\xeeDJx\xa6\x8cHH\x0bH\x0f[U\xeb\xcf\
-Q\x926/\xe0z\x8b\xdc\xe0\x8d\x02\x11~S\x8c\x14\
-\x80%\xaf\xec\xdbZq\x81\xa2${\xe0!\xf1\x019\
-\x99\xa6\x80\xbb\x83\x13\x22MY\xf50G\x97\x92z\xe2\
-\x0c\xacf\x96\x9e\xd9tA\x13-\x1c\xe1\xa3+pO\
-\xbc\xeb\xc2\x95\xd9bd\x85\x8d\x97\xda\xc6\x1e\xe6\xe8\xc2\
-<1\x7f\x84\xf6\x99\x99\xa3u\x22a\xc9\x15Tp\x0f\
-}D\x03Y%\x12\xd2$tS\xa3)0\x00SY\
-\x05\xfa\x22n\xd2\xa6\x89D\xc3J\xc8\xe0\x94\x91\xbe\xff\
-m\x95B\x86hJ\x09\x19\x183\x98W\x9d\xed\x04P\
-\x08\x82\x85\x0c\x81Q\xdc\x05\xa8\x00\x0a\xca9\xe5W3\
-\x19\xb9\x0ca\xeb\x5c\xb2.D\xe1e\xfe<\x13\xee<\
-V\x8e\xb9\x81\xaa\x96\xcc\xb6\xa1\xde\xdf\x86\x9be\xd6=\
-\xe4M\x94\xee\xb9\xc2\xb4!\xac\xc2\xb8{\xe4\xf6\x10\xae\
-YC\x06\xba\xaa\xc8+\xc2\x9c{\xc8n\x81\xb1\xc1e\
-\xe42\x1c\xe6\xbbQ\xb2\xbc!Z\x073\xe0{\xb9]\
-\xde\xc9\xc9\x09'\xea\x04GGG\xb9\xef0\xff\x0e-\
-Y\x11\xd0h\xce-Lo\xa6l0>_hg\xfc\
-\xeaF\xcc\xa8\x04R\x92\xdc\x97$\xf7\xd5IVWW\
-\xc7\x1f\x16\xf7\xa1m\xf0\xd2\x9a\xae1\x0ed\x0b\x95\x88\
-\x13\x1c\x1e\x1e\x8e\x7f]\x07\xab.=(\xad\xac\x88\xdd\
-\xdd]\x95\x88\x13\xec\xed\xed\xc9]\x1f(\xb9\x8c\xca\x8a\
-\xb0\xf5J\x90i\x96\x96\x96\xe4\xae\xc9\x14\x01\xae\xb0\xa9\
-\x92q\x91\xf5\xf55\xb9k2E\x08\xe9\x80\xd4\xd6\xbb\
-Q\xa6\x99\x9d}-w}\xa4\xe42\x94\x8a\x18\x0c\x06\
-9E\x10&\xe7\x05\x90AJ\x83\xa52}b\x159\
-\xfe\xce\x92\x0f\xa93cf\xa6\xb0<v\xbd/\xb8?\
-p`U\x899\x1a\xdf\x91r\xf9\xd38\xdc?\x90x\
-\xdaX\x941\xe2\x7f!(\x22%(\x22\x10\x08\x04\x02\
-\x81@]\xfe\x01\xca9\x8c\xf3`\xe6\xd1\xcb\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x0d[\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x002\x00\x00\x002\x08\x06\x00\x00\x00\x1e?\x88\xb1\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x02atEXtRaw pr\
-ofile type exif\x00\
-\x0aexif\x0a     282\x0a4\
-5786966000049492\
-a000800000005000\
-b000200250000004\
-a000000120103000\
-1000000\x0a01000000\
-3101020025000000\
-7000000032010200\
-1300000096000000\
-6987040001000000\
-\x0aaa0000000000000\
-057696e646f77732\
-050686f746f20456\
-469746f722031302\
-e302e3130\x0a303131\
-2e31363338340057\
-696e646f77732050\
-686f746f20456469\
-746f722031302e30\
-2e\x0a31303031312e3\
-1363338340032303\
-2323a30363a32392\
-031373a35353a303\
-80005000390\x0a0200\
-13000000ec000000\
-0490020013000000\
-0001000091920200\
-0200000030300000\
-9292\x0a02000200000\
-03030000001a0030\
-0010000000100000\
-0000000003230323\
-23a30363a3239\x0a20\
-31373a33383a3036\
-00323032323a3036\
-3a32392031373a33\
-383a303600\x0arj\xd6\x10\x00\
-\x00\x00ZtEXtRaw profi\
-le type iptc\x00\x0aip\
-tc\x0a      26\x0a5068\
-6f746f73686f7020\
-332e30003842494d\
-0404000000000000\
-\x0a\xc7\xd1i\xdc\x00\x00\x00#tEXtRaw\
- profile type xm\
-p\x00\x0axmp\x0a       0\x0a\
-M\x18N[\x00\x00\x08\x8eIDAThC\xedZ\
-Yh\x16I\x10\x1e\x93\x18M\xd6\x03\xd4\x8dn\x10\x09\
->,\x9a\x88\xd7\xaa h\x1cA\x5c\x04\xf5A\x0d\x8a\
-7\xe2\x11u\x11YD\x1f\x14\x1c\xa3`\x82\xc7\x83\x10\
-\x84]]\x82\x22\x06\x15\x8f\x8d\x17\xa8\xeb\x8fG|\xf1\
-\x88hD\x09B\xf0\x08jH0\xc6\xa81\x89\xbd\xf5\
-\x95\x7fMz\xe6\x9f\x7ff\x92(\xba\xb0\x1f\x8c\xfd\xcf\
-\xf4t\xd7W\xd5\xd5U\xd5\x13\x0d\xe3\x7f\xfc\xc7QY\
-Y\xd9%???\xed\xec\xd9\xb3\xe9\xf1\xdeQJ\x99\
-g\xce\x9c\x89\xd0\xcf\x07\x83\x06\x0d\xca{\xf3\xe6\xcd\x0f\
-\xf1\xde\xfd\x96P\xb8\xbat\xe9\xa2\x96,Yb\xb9;\
-?|\xf8`\xee\xd8\xb1Cu\xee\xdc\x99\xdf\xeb\xd4\xa9\
-\x93Z\xbbvm\x91\xfb\xbd\xef\x01L\x0emRR\x92\
-\xda\xb0a\x83\xa9w\x1e=z4bD\x95]\xb1b\
-\x85JLLT\xd1\xfb\xef\x0bX\x89\xf4\xf4tu\xea\
-\xd4)Q&\xe2zE%''\xab]\xbbv)\xc0\
-hU\xfc\xfb\x82\xac\x06\xb9\x10\x93\x8d\xdeG\xc8\xfaf\
-\xf4\x15e\x9a\xa6\xfa\xf8\xf1#+\x02\xc5\xf1\x8c\xdc\xcb\
-\x8a7\xe77\xc1\x981cTBB\x82\xda\xb6m\x1b\
-\x13\xcd\xca\xca\x12\xd7\xb1\xf7Eyy\xb9\xfa\xf4\xe9\x13\
-\xf7\x0f\x180\xc0\xee'7\xab\x22\xc5K\xe8\xb7\x95\x9d\
-\x9d=m\xef\xde\xbdq\x03\xc6W\xc7\x9e={\xd8\xef\
-\x17-Z\xc4d_\xbdz\xa5\x8e\x1c9\xa2\x8e\x1f?\
-\xaeJJJ\xd4\xf5\xeb\xd7\x95\x8eg\xcf\x9eq_A\
-A\x81Z\xb8p\xa1\x1a<x\xb0\xeen\xb8*\xc7\x8d\
-\x1bWt\xe9\xd2\xa5\xc5\xef\xdf\xbf\xcf\xf0\x97\xfe\x05\xd1\
-\xabW/&P\x5c\x5cl\x93mii\xb1\x7f\x8bK\
-\x01\x8d\x8d\x8d1\xfd@MM\x8d:y\xf2\xa4\x9a7\
-o\x9e\xbdZ\xb8\x86\x0f\x1f\xae\x22\x91\xc8\x1f4.\xd9\
-\x9f\xc5\x17\x0062\x5c\x0b\xe4\x9a\x9b\x9bm\xa2\xf2\x1b\
-hjj\xe2V\xdc\x0b\x0a\xa1\x1f\x17\xde\xd5\x15\xc3\xb3\
-\xc2\xc2B\x9e\xd3\x88*\x94\x9b\x9b[J\xab\xf3S\x10\
-\x97v\xe1\xf6\xed\xdb\xa6\xb8\xc3\xe9\xd3\xa7\x99\xac\x10\xd2\
-\x95\x00\x10\x08D\x09/\xe8\x8a\x13an\xb1\x92[\xb7\
-ne\xb7\x85R}\xfb\xf6\xad\x22\xb7\x1c\x1b\xc4\xab\xcd\
- \x01\x11\x08Y\xb6l\x19[\xf8\xd0\xa1C\xb0\x9cz\
-\xfa\xf4)\x13\x011]9\x00\xca\xe8\xae\x86~\xdc\xbb\
-]\x0d\x90g\x8f\x1e=\xd2\x83C\xe3\x8b\x17/\x96\x07\
-q\x0b\x8d\xe9\xd3\xa7gQ\xa3F\x8d\x1a\xc5\xc2\xb6o\
-\xdfn\x0b\xa3\xec\xee +\xa4t\xab\xbb\x15\x02p\x8f\
-\xe7\xfa>\xc2=\xc6\xa0\x1d=z\xb4\x1d\x10\xaa\xaa\xaa\
-\x16\xfb\x12\x0c\x8bn\xdd\xbaY\xd4\xa8\xe7\xcf\x9f\xab\x8a\
-\x8a\x0aG\xd4\xb1,\xcb\xa1\x80\x0eY%\x01\x08\x8a+\
-\xb9\xa1+\x8a\xf70\x17B=dddd4\x102\
-}I\x86D\xf9\xe6\xcd\x9bY\x08\x5cK+;\xd4\xbd\
-{\xf7l\xe1\x80{\xe3\xeb\xe4\xa4_\x87( \xcf\xf5\
-\xf1Tlb\xaf\xb0\x9c\x05\x0b\x16\x94\xd3\xa3\xd4\x00\x9e\
-\xf1A\x96\xb7@\x1c\x96\x855Q_\x19Q%V\xaf\
-^\xad\xc2@\xdcE\xdaxJy\xe1\xfe\xfd\xfb\xb6\x07\
-\x9c;w\xae\xc8\x9fm\x1cP\xf4\xb0\xa8Q\x07\x0f\x1e\
-\xb4'^\xbe|9\xd7R3f\xcc\xf0\x11\x1f\x0b\x90\
-\xaf\xaf\xaf\xe7\x04\xa9?\x0b\x03$a#j<R\xde\
-\xf4%\xed\xc6\x96-[x\x83\x8f\x1c9\xd2\x9e\x10\xab\
-\x02\xab\xbe|\xf9\xd2\xd3}\xbc\x00\xab\x8b\xfbt\xed\xda\
-\x95\x8d\x00\x97qo\xfex\x80\xb2\x90;p\xe0@\x95\
-\x92\x92\xa2v\xee\xdc\x19\x09\xe2\xee\x06\xbb\xd4\x8d\x1b7\
-\x1cd\x80x\xf9#\x08\xb2\xb7`\x08\xa0-\xe3Q\xfe\
-`,\x8cA\xe3\xcc\x00\xee\xad\xa0\xbdP>{\xf6\xec\
-\x18a\x92\xa1\xe5wXP-\xc5$\xe0\xeb\x12r\xc3\
-\xba\x16\x00YX\x15\xa2\xa6\x0e\x1f>\x1c\x09\xe2/\xb0\
-\x90]\xef\xde\xbd\xeb\x88&nw\x08K\x04c'M\
-\x9a\xc4\x81b\xfd\xfa\xf5\x8e\xe7A@\x95\x00\xe0]:\
-\xb4\xa9\xd4\xd4T\xd5\xbbwo(\xe6_\xc2L\x9e<\
-\x99\x95X\xb3f\x0dO\xe0E\x16\xd6\x89\x97\x0f\xbc\xb0\
-\x7f\xff~=\xb9\xc5\xcd\xeeA\xa8\xab\xab\xe3=\x86y\
-\x1e>|85\xae\x12TO\x0d\x10?F\x85\xaa'\
-3\xbd@\x14\x84\xd9\xb0\xd7\xae]\xb3#\x0e\x94\xc1F\
-\x17\x84UF\xe7\xb1r\xe5J\xdek\x94\xd76\xc7U\
-d\xda\xb4is!p\xd3\xa6M1\x13\x00RF\x00\
-\xef\xde\xbd\xb3\x9fyet\xe0\xce\x9d;\xac\x80\xe4\x1e\
-\xac4\x0c$\xee\x12\x06:\x07\x18\xee\xca\x95+b\x98\
-\xbf=\x95\xa0\xd5H\xa1\xa6\x0c\xa7\xbc\xea\xeaj\xc7\x86\
-\xd4's\x97\x1c\x02\xb7b\x88v4_\x84.\x13\xf3\
-\x93\x12\xff`\xee\xda\xdaZ~\x0f\xf3\x87YQ\x81n\
-@(B.V\xe5\xa9\xc8\xcc\x993\xff\xc2\xd2\xaf[\
-\xb7\xce&\xab\x9f+\xbc\x22\x14\x9e\x09\x19]A\x94\xf9\
-Q%t\xfc\xde\xb3gO\xeeo\x8b\x02z\xa8\x17e\
-\xc6\x8e\x1d\xcb\xca\x9c8q\x22\xc3!\x81\xb2-'?\
-#\xba\x19\x01\x94\xd3\xfaD\x02X\xd2\x1d\x00\xf4\x0a\x16\
-\xdf\xb4\x8c\xcf\xfb\xc1\xd4e\x90\x05\x7f\xa6#\xadz\xfb\
-\xf6\xad=.L\xd4\xf3\x0a\xff\xfb\xf6\xedc\x19\xabV\
-\xadZ\xecP$??\xdfB\xc7\xdc\xb9s\x99\x14\x8e\
-\x9c\xb8\x87`\x00\xcf\xdc\xab\xe4\xce\x05(?f\xcd\x9a\
-\x85q\xaf\xe8\xca1b\xf1\x9b^\x9b\xb9\xcf.~\xd0\
-\x95A\xb4\xbcu\xeb\x96\x18\xab\xc8!a\xfc\xf8\xf1\xe5\
-\xe88\x7f\xfe\xbc*++\xb3\xa3\x0c.\xfd\x8b\x88;\
-\xbb\x8b\x80\xd2\xd2R\xd5\xbd{wD\x93#t\xfd\xe8\
-\xd6\x80\xce3\xbfR\xd3\x8c<\xd0VH\xb1\x0a\x08\x0f\
-\xdcG\xf9U:\x04\xc9g\x9c\xc7\x8f\x1f3AQ\xa2\
-\x7f\xff\xfe\x8e2[,\xa8\xbb\x07\xce#\x88F\xd1\x02\
-\xd3\x13\xd4W\x87\xf9\xa4`\xc4\x9cm\xa9\x0a\x04\xb2'\
-\xd1\xca\x91\xf8\xe6\xcd\x9b\xad\x89\x11\xdf\x9e\x10\x22)r\
-\xf1\x00\xb8\x09\xa2\x8eD\x22\xaf\xa8\x85\xe83d\xc8\x10\
-\x09\xadq\x95\x88B\xd1\xaa\xdb\x07&\x9dX\x18\xe8'\
-LY\x95\xa9S\xa7\xb2\xb1i\x9591&\xe0\x1f:\
-V\x1a4\xa9A\x1b\x9c\xa5RM\x84\x0fq\x06U\x9b\
-FNN\x0e>\x93\x1a\x85\x85\x85\xf8\xca\x8e\x1a\xcc\xa0\
-\x953\xa8L0\x1e<x\x80q[\x0c\x1fE\xc8r\
-\xfcig\xe3\xc6\x8d8\xdb\xf03\x22\xc5\xad\xe2/\xaa\
-\xc1\xc08\xc8\x05\xc8\x10|\x99\xa6\xc9\xf7O\x9e<\xf9\
-\xc5~q\xf7\xee\xdd\xbcL\xd8\xec\x80X\xea\xf2\xe5\xcb\
-\xac\xb5d{\x00\x99\x19a\x1a\xd7\xb0a\xc3\xac\x18\xa9\
-\x1arss\x13\xa996b\xc4\x88\x18+\x87\x85\xac\
-\x80;\xc2\x15\x15\x151g:\xb1\xb6&F\xd2\xca\x92\
-Z\x88*K~\x11.p\xe1\xc2\x05;+\xc3\x8d\x80\
-\xa1C\x87\xf2=E\xb6\x887\xfdV\x90\xa0?a\x04\
-\xaa\x8b\x1cQ\xca+\xf7\xc4C<E.^\xbc\xc8\xdc\
-233\x9d\x891//\xcf2\xb4h\x85\x92[\xbf\
-\xa7M\xa5\xc8=x%`\x09\xda#\xa6\xe1\x03z\xa7\
-\x00\xe3p\xba\xf3B[\x92\xa2\x1c\x8fu\xa5\xc8\xad\x99\
-\x0b\xb9\xff\xa7\x18\xe1\x07\x0e\x1c0)\x8cF@@\x22\
-\x99\xfc\xc6\xd9\x04\xbf\xa1\xc4\xd5\xabW\xad\x98\xc1\x1ah\
-\x15\xd0\xaf\x96.]\xca\x82\xbd>\x05\x01a\xf3\x88{\
-U0\x0e\xdf\x9c\xa3\xfc\x9a\xfc\xb8\xb8a+U\x5c\x5c\
-l\xf9\xbdHJ\xb3\x9bN\x992\xc5A\x06n\xa4'\
-V\xe4\x820\x99\x1d\xf0R\x18\x85g\x94S\xa3\x1f\x9f\
-\xf6\x82\x8f\xc7s\xe6\xccaa\xfa\xd7\x13\x9d\x8c\x9c\xfd\
-\xc3B\x7fW\x9f\xc7\xf8\x1c\x88\xde\x05\x91j+,\xb8\
-\xe0\xfc\xf9\xf3\x1dq_\x87\xbb\xf8\x0c\xbb\x22\xfa\x5c\xfa\
-x\xe3\xf3\x8a\xd4\x07\x11\x0b\x0d\xb8\x135v\xf8\x16\x84\
-%\xea\x07\xb7[\xc9=V\x15\x86\xa3\x15\xa9\x0b\xe2\x17\
-\x0aYYY\xfc\x95>;;\xbbM\xee\xd2Q\xc0H\
-\xfd\xfa\xf5\xc3\x8a\xd4\x06q\x0c\x05*\xcf#\xd4\xf0y\
-\x1a\x80\xc5`-\xfd,\xd3\x91K\xe6\xd0WF~S\
-B\x86\x22\xd5\xe0\x91\xe0G2\x08iii&\xf9\xef\
-\x84c\xc7\x8e\x19=z\xf40H \xf2\x07\xf7\xa1\xa4\
- Y\x5c^t\xe4\x02\xd0\xca\xbcr\x0f\xd0A\x0dM\
-l\x1ei\x07\x22\xf8S\x9c\xb8\x94\x9cQ\xf4\xdfA\x16\
-\x0f\xba\xbc\x8aL\xe9\x83;\x93\xc18\xb3'\x051\xf5\
-\x03m\xb6\x09TO\xd9\xc5\x1f\xb9\x19\x17\x84h\xc5\x82\
-b\xbd\xf6B\x1f\xaf\xaf\x10\x00\x19\xa4\x5c\x0b\xff\xf6\x18\
-\x1b\x1a\xb4\x0f\x8c\x89\x13'\xb2\x1bQ\xe9\xcf\xcf\xa0\x04\
- \x8a@\xc9\x8e\x5c\x00\xaa]\x81\xfe<*\x83]\xab\
-C+\x02`\xb2\x9a\x9a\x1a\xfe\xfd\xfa\xf5k\xfc_\x14\
-\xb6\x18\x8e\x00\x0d\x0d\x0dX\xb5\x80\x19\xfcA\xe1\x95\xe7\
-\xc4QB\x94\xc0^\x14\xe3\x91\xfc\x16\xdcw\x08R1\
-\x7f\xe3\xab\x82\xae\x8e\xb9\x16)\xf22\xe8\x9d\xaf\x8d>\
-}\xfa\xf0r\xfc\x0b\xfan\xd9\x0e\x16Js\xd6\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0cG\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00e\x00\x00\x00^\x08\x06\x00\x00\x00:\xc1\xda\xa1\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x0a|IDATx^\xed\x9dMl\
-\x1cI\x15\xc7\x0b\x16\x05\x11>\x1c!6r\xc6A\x04\
-\x82\xbc\xab\x0c>D\xbb\x06q\xb0=\x5c \x07HN\
-A\x16'\x1f,\x90\x96\x0b\xca&g\x0f\xdak\x92]\
-\x84V\xabE9X\x5c\x92\x90\xc3\xca\x04)\x5c\x80&\
-\x8e\x22\x14\xc7\x08E\xb2\x05\x07K\xdeC&\x96WZ\
-<\xb0\x8e\x94]-\xe6\xff\xda]\xb3\xd55U\xf5\xaa\
-?f\xa6{\xdc?\xe9i\xc6\xd3\xefUW\xd5\xebz\
-\xf5\xd1\xd5m!***********\
-**r\xa1\xddn\x7f\x05\xf2B\x10\x04{\xe7\xce\x9d\
-\x0b\xe5\xca\x95+{\xadV\xeb\xa7\x9cmE\x0f \x87\
-\x5c\xb8pa\x0f_\x8d299\xb9\xed\xb2\xaf\xc8\x99\
-\xb5\xb5\xb5\x09j\x15\xc2\xe2\x10\xf1\x89c~gO\xa5\
-\x22W\x10\xa2\x02\xa19\xa0V\xab\x85\xa2\xff\x0e\xdd\x86\
--\x9d\x0a\x11^\xe1#7n\xdc\xb8e\xaa<\x5c\xd5\
-\xe8\x1a\x82\x863\x01\xb1\xdfJ\x84\xe6\x0c\xeaS$\xeb\
-\xeb\xeb1\xe7\xe0{\xe0JO\x824\x9eG\xeb\xbb%\
-\xba[\xdc\x1a\x1c\xdbt\xd9\x96\x16\x14\xfa|\x14\xe7\x9d\
-!\x07N;oO%L'\xd0\xf4\xf7t\xe87\x11\
-O\xd7\x09\xfa&:\xa73oQ\xb8\x1c\x1e\xd0)\x7f\
-\x16\x0eq:C\x91mjQ\xb6\xb4P\xe1\x81\xaaO\
--Cgw\xf7\x03o\xa7D\xe1\x8d\xcbS(p\xde\
-\x9c9\x95\x12\x82\x8al\x0a\xa5p\x14^h\xe4D\xc3\
-W\x12\xdda8f\xed\xa0\xa3\x10\xd7\xd1UC\x97\xc5\
-)k\xb6\xb4\x88(\xbc\x19\xf3\xa6\x0f&pl\xd1\x9e\
-R\xc9@\xa5S\xc58+\xd2\xd0\x92\xac\xa0r\x9aR\
-\x8f*\x8e\x9c\xa0\xa2\x0e\x95\xa1\xbb\xe0JK\xc4\xcf\xd9\
-\xd5\xf2\xb4P\xb8\xe9H\xa7t\xc4\xaeD\x13te\xaa\
-z\xce\xd4\xf6\x89\xa5)[\x9d>w\x81\xd3N9S\
-Qt\xc9\xd6\x84r\xc1\xb4\xdcI\x95\x08u4D\x05\
-4\x91\xc5)\x0eq\x86\xae\x88\x8e\xbei\xd0@(a\
-\xec\xf7\xee\xa4\xf2\xe3\xd3\x9c\x82\x09mic\xad\xd5j\
-\xbdd\xd3\x85#:\xdf\x1f?~l\xd4\xd1~\xff\xab\
-QI\x01\x8e\xe6TH'\xd1\xe4\xd1\x94\xb7\xa7Ow\
-\x05\xca&\xff\x5c\xedR\xd0@k\x0bP'-\xc8m\
-\x1aJc\xd0\xf2m\xce&38Y\xd34\x92\x92!\
-\xc4d\xa3\x8f\x98HOE\x9f[@\x1a\xa6tT|\
-f\xf4\x1e\xa1Kh\xe7\xa5u\xb3X\xde\xb4p\xf8C\
-[:\xd0\xbbe\xab\x17J\x03\xe9~\xc3f\x9b\x09\x9c\
-\xb4)\x98\x8a@\x06\xb61\x04~N\xb5C\x86j\xba\
-\x1ee\x96*\xd62Tf\x81\xa37\x05\x93\x17\xab\xb1\
-\x82i\x22+\xf3\xa6\x1f\xc3o\xc7Li\xf8\xcc\xbf`\
-\xeb\x1c\xea\xa7\xc2\xc7!R\x10\xda\xba\xc2\x062\xf4\xd5\
-h$\x14\x1b\x89Y\x84\x05NY\x149\xa4cr\x8a\
-A\x02\x94\xbfa\xb2O0\xff\xa2>+Q8u\x82\
-\x0a\xfd\x89\xd0N\xa0\x86 }\x06\x1d\x15\xd4\x05W\x00\
-\x16\x9csN\xe4\x90\x8e\x87S\xb8\x8a\x8c\x95[\x0d\x7f\
-\xfaH\x90\x8e\xa3.\xbf\xecL\xcd\x17=q\xd3\xd01\
-\xe1\xe8\x89\xab\x08\x16\xb4\xc6\x13\x22\x87t\x18\xa7PX\
-z\xden\x1d\xd2\xd17\xcd\xbf\xf4z\x81\x8e\xb5_J\
-\x84\xdeD\xf5\xc9\x1aA\x19Ru\x5c\xe9!\xa3\xa6\x85\
-?/[\x15\x8f\xab\x9c\x85I\xc3\xb9\x0e\x17\xd1\xd17\
-\xa1\xd7\x0b\xca\xbe\xe0L-\x22\xf1\x90\xb8\xdd\xfe\x0f\xa7\
-\xe2\xe4\xcc\x993\xf3\xf8x\x8f\xd3\xe3\x18\x1b\x1b\xe3T\
-\xb2\xb0\x0e\xb9\xc5)%\x05y\xb6N\x1dTX\xa7L\
-MM\xc5\xfe\xbe|\xf9r\x97\xce\xea*;\x84\xefP\
-\xaf\xd7\xdb\xb8B\x7f\xce\xe9q\xd8\xe6<\xbe\xe0*n\
-*s\x10\x1d\xae/\xe9\xe2\xe6\xcd\x9b]\xbf\xe9\xf52\
-11\xf1\xef.\xa54\x18BS\x18+i~A\x1d\
-\x1bu\xf4\x860\xe0C\xea\xb0Cd\x0d_\xe8\x1b]\
-#Av\x8e\x13\xd1\xb1\xa9E\xf7v\x5c\xf5\xe2\x9ad\
-'\xc66\xf4sT\x8c\x0fYl\x09\x9b\xbdW:\xcc\
-\x04\x94\xeb\xe0iTzTX\xea\xc4T/\xb9\xdf,\
-\xa3\xa6\x9edLnKG#\x8b-\x91)\x0fLK\
-\x9bq\x98\x86\xe0\xaa\x1f\x17|\x1eB\xa1\x95\x10K2\
-\xd9H\xe8\x18\x1fl\xb6\x0d\x87\x8dJ\xea<\xe8\xf7x\
-\x0c\xf2\x8a\xd58\x02-\xe5\x17\x82\xcfC\xef\x1c\x22\xa1\
-\x89$\xf5'Y\xe3y\x84\xcd6p\xd8\xa8\xa4\xce\x03\
-\xfa\x93\xdb\x0e;\x927\xed\xd6\xfb\xa0\x1e6\x85#\x0d\
-\xba\x80#\xe7\xf7\x95M\x91\xa2B\x14\x5c\x95\xd2\xb0\x9b\
-\x85\x95\xda\xb5\x9ef\x10+\xb4\x92\xeb\xb0#\xf9\x8b\xdd\
-z\x1fW\x9f\x14\xcd\xeeSw\xea\xec\x90\xd8A`;\
-\x80L5l\xc7<i2\xc7S\x17\x18Wo}i\
-i\xc9\xb8\xb8\xa8Pg\x8e\x0b\xc7p\x9a\xe6#\xef\xa2\
-\x0e\xfc\xe7\x09\x1a\xa9\x9dB\xdb\x82l\xc7\x90\xe1\xa6\xed\
-\x98'3\xc2\xd1Z666R;\x05\xf3\x1b\x9f\x99\
-\xbas\xf4\x85\x96Z_YY\xb1\x1e\xafynm\xb2\
-\x91\xda)\xcc\x89gl+\xab\x09h\xda\x0e\xa0BR\
-;\x85\xdb\xc6\xe4\xc3\xf2\xf22\x97F\xc0\x1c\xef)\xae\
-\xb8\x1c\xd8\xcdB\xb8>\x81\xc46\x89\xe3\xfa\x84=\x93\
-\x11\x1c\xf2\x92\x87\x9d\xd5^\xc1y\x0b\x02-\xe9\x84\xdd\
-\xb4\xf7p\x05s\xed\x80\xe7lI\x16t#T\xec\x09\
-\x0f;\x92\x13\xba-*\xeb7\x1evR\xba\xc0\xb9\x0f\
-\xe1\xc3'\x8d\x81\xc2e\xee\x19\xc2\xd8wS\xda\x92t\
-m~\x886\xc5qv$s\xaa\x1d\xe6Y_\xc4\xc7\
-\x7f=\xecBA\xbec\x83\x01\xba\x17\x82\x11\xd7}\xce\
-\xce\xe3~R\xcfa\x0b\x07i\xa1\x22M\xa3\x1d\xceN\
-J,\x84\xa1b\x16=lH\x16U;\xcc+~\xe6\
-a\xd3\x118\xa5s\xef\xa3\xddn\x7f\xcec\x18\x1dJ\
-Y\x9cBr\x1f\x95r(\xa5\xed\x82j\x84Boz\
-\xd8\x90l\x8a8\xab\x1e6\x1d\x81\x13:\xe7\xc5E\xf5\
-\x8c\xd3\x972p\xa7\xf8\xec*Q\xe4m\xcd\x9c\xd3\x97\
-\xd2\x09a\xd1\x84\x8c\xd3W%\xa0\x9d\xfa\xd1b \xa7\
-\x1b\x13\xb4\x94p\x9f\x97\xeb\xe1$\x93\xa0N\xfe%\x06\
-\x89\xe16\xb0Sh\x18M\x9b\xaak\xca\xd6SO\xa1\
-u\xb7f\xd2\xf3\x91$X\xaf\xd3\x85\xf6o\x05\x1ez\
-1\x81\x13\xbbo8\xf5\x13t\x9e\xb4q\x8e\xcd\xe8A\
-\x12\xb4\xcco\x89A\x82\x0c\xd0\xf6G6\xa3\x07E\x10\
-\x01\xde\x179\x90zFO\x1c?~\xfc\xef\x08\x0f\xf7\
-9\xbd\x83\xc2\xd8\xd8\xd8\x1f9\x1d\x1f29edd\
-\xe4\xe3\xa9\xa9\xa9\x7fpz\x07\x05\xd4\xc5mN\xa7/\
-`\x96\xfb}\xe1\xd1\xb4\x0f\x80|\x84p\xfey\x91\x03\
-\x99Z\x0a1::\xfa\x10\x1f\x7f\xe3\xf4\x86\x1d\xf4'\
-\xf7\xea\xf5\xfa.\xa7\xe7Cf\xa7\x9c>}\xfa}\x0c\
-\x1d\xfb\xf6\xecFQA\x7f\x92[\xe8\xca\xec\x14\xf4+\
-bzz\xfa\x1e\xbe\xb69\xddafvv\xf6\x0f\x9c\
-N_A\xbfB\x1b\x97)\x8cqqwXeS\xe4\
-H\xe6\x96BLLL\xec \xa6vo\x11< d\
-\xbd\xd3\xa8\x93\x8bS\xd0\xc1\xfd\x0f\xf3\x95w\xf0\xf5O\
-\x9cn\x1e\xd4\xa2\xc7\xeb\xe8\xd3$\xaaN\x9fx\x87S\
-H\xc2g8\x05_\xd0\xaf\xbc\xbb\xb4\xb4\xf4\x06\xbe~\
-\x0d\xf2MN_\x85*\x906l\xd3\xe7\xc9\x93'\xc3\
-\xef$\x18\xd9\x89\xf1\xf1q\xf4[_\x0a\xf5\x0e\x1fN\
-7\xe2\xa4g\x17\x09\xda\x9c\xbe\xb3\xb3#\x1e=z\x14\
-\xeeE&\xd9\xd8\xd8\x087A\xd0w\xd7f\x08\x17\xe8\
-O\xee]\xbdz\x95S\xeb?\x18\xa3S\xa5\xd2V\xce\
-\xd7 ;\x82\x89\xc3\xb4PH+\xb0\xa6\xe7:\x06\x05\
-\xed\x03\x96/6\xf0\xd8\xdb&\xcb\xd1\x14E\x06\x1d>\
-}\xbc\x00\xf9\xb5\xb0\x14\xa2V\xab\x15\xca\x116(\x8f\
-\x1e+\xccM\xbd\x0e\x0aIt3\xeb;b\x7fB\xd9\
-U\x10\xfd\xe9\xe0\x22C-\xc7T\x86H\x16\x0d\xc5\xcf\
-\x85\xdc\xfa\x14\xc9\xfc\xfc\xfc\x87\x88\xcf\xffD\x8c]\xc4\
-\x9f\x14\xce\xbe\xae\x1e\xe7\x9e+\xa1\xf8/c?\xb1\xbd\
-\xfd\xc9K\xee\xb6\xb6\xb6b\xbazZ\xea\x83D\xd4\x1f\
-\x11G\x8f\x1e\x0d?\x8f\x1c9\x12~R\xff\xe4\xdb7\
-\xdd\xb9s\xc7vh\x1d\xa1\xf7\x95^\xf5#\x9f\xe2\x14\
-\xd2@\x1d&\xe2\xf2\x8b+++\xaf\xe2\xcfy\xfd8\
-\xbd\xf0@v\xea\xd4\xd1\xaav\x84Z\xd9i;_\x89\
-:\x0a3=\xfd\xa5\x8f\xd2d\x9e\xe8\xbc\x96\x0dwO\
-Q\xb6I\x0cj\xd6M\x07\x0b\x0d:~z\x9e\xfe\x07\
-\x10z\x1e\x8f\x8b\xcd\xa5\x11\x5cPs\xa2\xcc\xa0\xe3\xa7\
-\xcb\xf0u\xe1Q\xd8\x92\xc8\xa2\x18\x06\x10{g\xc4\xfe\
-\x83\x9d\x5c\x81\x8b.\xf4\xea\xc2\xc3bX@\x93\xa7\x07\
-O\xb9B\x17Yvqq\xf9>\x07Y\x0e\xda\xed6\
-\x0d(\xd8w\x98\x14U0\x18\x98\x13\xc3\x08\xae\xb4\xef\
-\x09\x8f\x0a(\xa0\xf8\xbc7\xac\xd4p\x15P8A\xe8\
-]\x10}&\x97Ub_\x10\x06>\xe0t\x8a\x06\xf2\
-\x9c\xfb\x9b'8r\x9f\xd13\x90S\xbe\xc0)\x11\xae\
-\xa5w9\x09\x94:4\xe1\xd3\x91\x93R\xd3\x84T\xfd\
-\xdd\x03z\xd4\xae\xaf\x13\xc5\x9e\xcc\xe8\x1d\xd0\xa3\x08]\
-N\x91K\xf7\xf4\xca\x11\xb9l?==\x9dhI$\
-\x09\xb4\x94\xb3\xb2\xf20\x5c\xb6y\xf0\xe0\x017\x83\x7f\
-/\x08\x82z\xa3\xd1\xc8\xfc>\x99\xc2\x811>]\xce\
-\xb1x\x1d\xbd\x83\xd2\xf8\xd2\xe7A@\xaf\xee0mZ\
-G\x1e\x13\xbf\xab\xa5,\xfcJ(\x05\xb5\xbdr\xb6\x08\
-\xe8/\x96#GaX?<\x13G\x02\xcd\x9f\xee\xb1\
-t\x0aI\xf7T\x8a\xd2:l\xa8\xf9%\x89^P\xda\
-\x17\xfa\xd2\xd1_\xbat\xe9-\xf5o\x8a\xdf\xd7\xae]\
-\x13\x17/^\x14\xc7\x8e\xc5\x1f\xf2z\xf2\xe4I\xb8l\
-/\x97\xec)\xee\xab\x9d\xb4\xfc\xae\xae.\xab\xa8\x9d\xbe\
-\x1c\x10\xc8O\xd3r\xbe\xdeo\xd1\xf9\xaf_\xbf.t\
-\xd0\xf7\xcct\xfd\xd8#z\xde\xd1\xa3\xd9\x1f\x1a\x19\x19\
-yf:&;xI\x86\x11R\x22\xf4\x91\x9d\x9e\x07\
-\xdby\xd1\xe2\x7f\x84\x0e\xbfX\xfb\xbb\xd2\xe0\xf1r\x9a\
-\xd2\x08\xca\xb2 \xfa@\xcf'\x8f\x08\x05\xdc\x8b\x00J\
-\x03BX\xea\x97*$\xa1\xe7N\xc1\xd8\x7f\x98VW\
-_\xe6\x14\xf2\xa0\xe7N\x19&\x96\x97\x97?\xe4t\xf2\
-\xa0\xe7N\xe9Ug=\x080\x08\x088\x9d<\xe8\xb9\
-S&''\x7f\xc9\xe9\x94\x85\xd9\xd9\xd9\x80\xd3)\x0d\
-\xf4\x1c\xbb\xc7\xc6\xb6\xc2J\xcd\xf1_/J\x0f\x0d)\
-\xe1\x9c5r\x90\xef\xb6\xd0AI-\xfa\xef\x10\xd1\xcb\
-\x0d\xfaJ\xcf'\x8f6\xe8\xed\x11\x18.\xff\xf6\xee\xdd\
-\xbb\xa7\xa2\xbf;\x93\xc7~\xf5Cr\x12)7\x97\x13\
-\xb4\x22p\xf6\xecY\x81I\xe2\xc0\xeaf`'\xb6\x81\
-Y\xf3\xa9\xad\xad\xad\xf3p\xd0\x8f!\x9d\xe1\xb4mY\
-\x85 'R\xa5\xcaO\x15\xb9\xecB\xf6\xd1\x8e\xfe'\
-\x90\x87\xa3\xa3\xa3\xf4\xae\x96\xd5\xf1\xf1\xf1?\xc3\xe6\xa9\
-!\xd9\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x8a\x88\
-\xff\x03\x9e\x1d\x95\x12C~\xa7%\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x0b\x03\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00W\x00\x00\x00_\x08\x06\x00\x00\x00\x9d\x9b[\x01\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x098IDATx^\xed\x9c\xcf\x8b\
-\x14G\x14\xc7+?\x0eb~\xac9(\xeeHb\x88\
-\x89\x04\x87x\xd1\xf1\x94\xd1\xbe,\xe4\xa0\xe8e\x83n\
- \xe4\x1co\xfa\x07\xec\xe4\xbc\xe8%\x04O\x81\xf5\x10\
-\x14\x17\x02j\x8e\x82\xbd\x1arY\xbd\x08\xb3\x12A\xd0\
-\x80\xae\xac\x177\xc4\x85\x1c\xc2\xe6}\xc7\xae\xb5\xba\xfa\
-UWW\xff\xda\x9e\xd9\xfa\xc0c\xb7gj\xaa\xbb_\
-\xbfz\xf5\xeaUu\x09\xe1\xf1x<\x1e\x8f\xc7\xe3\xf1\
-\xc4y\xfa\xf4\xe9\xbba\x18~{\xfc\xf8\xf1\x9f\xe9\xf0\
-O\x92U\x925U\xce\x9c9\xd3\xa7r\x07\xd2\xea\xf1\
-h\xf4\xfb\xfd/:\x9dNL\x91ir\xee\xdc\xb95\
-S]\x1e\x8dV\xab\x15\x8a\x0cJU\x85\x14<\xcdV\
-\xe6y\x0d5\xf5@\x18\x14HJ\x1f\x88\xe1\xbb>_\
-\xa3g\x1dr\x07\xa1\xd0\x14\x07\x17q\xf9\xf2\xe5\xb5\xc5\
-\xc5\xc5\x81\xc0\x0dpJ\xa62\xe3\xc6\x8a=\x03\x12\xd6\
-\xfa\xf2\xe5?k:\xd4\xd9%\x14L\x9d\xdf\xd1\xb4\x8a\
-=IkL(VB.D\x7f\x10\x8d\xf2\xbbo\xda\
-\x0al4\xc7\x8e\x99\x8dq\xd7\xae]\xfaq\xa3\xc2\xb2\
-\xc6)\x97\xaco^=^X\xb8c*\x9a\xa0\xdb\xed\
-\x1e\xb4\x95\xd9\xd4\x90\xdf\x0c\x84\xd6\x99q\xd0\xe0!\xe1\
-s\xa9\xa3\xeb\x99k\xf6HB\x11\xef\xa8b\x9d\x1a\x22\
-\x06f\x90\xd13\xd6\xe6y\x0d).\x10Z\xc7f\x91\
-\x90\xab\xc7c\xc6\xa6PU\x02\xbe\x8a\x8d\xa5q\x1d\x9a\
-\x84\xfc\xa9\xad\xc8:\xd1\xa8\xce\x93F\xbf\xdf\xff\x92\x5c\
-\xc2\xb2\xb0[*'=\xa6J\x0f\xf5\xfc[\xa8\xd3\x9a\
-\x13)\xca\x93y\x05Sn!\x12\xd4\xb1\x9d9\xc5\xe6\
-\x84F`\x93&k\x85\x22\x11\x15 \x97\x80\x08\x01 \
-j\xc0\xa8\x0d\xa33\x83\xa2Q\xd7\xa4\xe1t\x9b\x03X\
-+)\xc8h\xadP\x1e\xf2\x076\xa0hC\xee\x17Y\
-\xb2\x1e}\xdf\xe6\xaf`D!\xa5M\x92\x1b`\xad\x15\
-\x8a\xca\xa2T\x1dS\xa6L\xbczPs\xe4\xcf\xc7L\
-\xd732`\x14e\x9ae\x80\xb5r\x19\xb0\xac`\xd4\
-\xa6's\xa4\xc0\xf5\xc0\x05\x99\xaek\xe8\xa1\x1b\xef\x89\
-\x12\xad\xd5\x04\x5c\x85\xc9\x8a\xe9\xbb\x1e\x7fuC\x8cI\
-\xb1h\xceE\xac\xd5\x04\xac\x18\xc3f\xee\x9c#\xa5`\
-\x93b\xd3r\xb5:y\x1f\x80\xc9M\x8c\x84\x82M\x8a\
-uq\x03(\xab\xfe\x16M^\x86fY\x88f\x87G\
-K\xc1\xa4\x94\x80\xf3}.\x8a\x01\xbar\xf3\xd4\x81V\
-\xa2\xd7\x01_\x8fi|\xfe\xea\x1b\x0e\xf9\xbcP\x14\xb0\
-XIQ\xcb\x95p\x16L-+d/\xbe\xc9pS\
-\xe4\xb8\xb9<@\x91j=P.:\xac<p\x9d\x1c\
-Z\x18{\x13ME_\xd8\x81\x9b\xcaKY\x96\x0b\xf0\
-P\xf48;ja\xc3\x01Yh 4\xebp\xb14\
-9\xa4\x85\xe0\xa1p\x83\x0e\xf5;\x88\x8b\xb29\xff;\
-4\xbeW\xf7\xb5\x08\x87\x5c0\xf5\xeei\xe2\xe2\xcb\x11\
-\xd6\xe9\x0f\x8c\xce\x19\x8a\xa6C7\xf9\xb1(`\xb5 \
-\x8fr],\x17\x18\xceQ*\xa5\xcfD\xdc\xbd{7\
-P\x8f1\xa30>\xee\xb6\xca\xe8\xc9\x93'\xb6\x22\x09\
-\x96\x97\x97mEb\x1c8P\xfd\x12\x87\xb7m\x05r\
-\x10\xa8\x07'O\x9e4\x143s\xe8\xd0!LR\xae\
-\x1fC\xd9d\xfd\xb12\xf2{|\x87\xc5!;v\xec\
-\x10.t:\x07\x07u,,,\xd8\x8a\xe6\xa6t\xe5\
-\xd2\xcd\x06\xea\xb1\xbe*&\x0bXes\xf8\xf0\xe1\xc1\
-\xffcc\xef\x8b\xeb\xd7\x7f\x8b=$\xb4\x86\x99\x99\x99\
-\x81\x82VV\xfe\x1e|\xe6\xda:\xb6n}\xc7i\x9e\
-.\x0f\xa5\xbb\x05b\xb7zp\xeb\xd6-S9#\xb8\
-q(\x0b\x82\xff\xf7\xef\xdf\x9f(\xb3w\xef\xdeX9\
-W\x96\x96\x96*\xb5ZP\xbaruK\xbdz\xf5\xaa\
-\xa1dv8\x7f\xfa\xe2\xc5\x0b\xa6dv\x1e<x\x90\
-p5eS\xbar9VW_\xda\x8a\xd4\x0eu\xbc\
-\xfaG\x8b\x5c\xb9\x22\xd4\xa2\x5c\x97\xc5tY(\xc3\xe2\
-\x18wu\x85+\xd7(\xe8\xc6\x8f\xe9\x01\xba\xeb \x82\
-\x03q,\xe2e\xb9\xba\xbc\x08\xdc \x82\xaeq_\xda\
-}5\x06.A\xdd$\x98\xe1o%\xefST\xe2\x16\
-(N\x8d\xad\xb1\x05g\xcf\x9e\xe5\x8a\xd6\x0e\xfc\xff\xa5\
-K\x97b\x9fQH\xd6|\x97\xa0\xc2\xa5\xf6\xf2\xa6\x1c\
-\xcb\x84kUd\xc9\xc3\xe1\x12$t\xc1\xa1`r\x00\
-e\xcf\xf4f\x01>\xd6\x94\xaf\xa0\xeb\xa9\xccj\xdf\xb0\
-\x15(\x02\xac\xe4\xfc\xf9\xf3\xc6\xef\xc9\xba\xc5\x9e={\
-\x06\xc3\xdd\x9d;w\x0e\x86\xb0\xdb\xb6mK\x94\xc3(\
-\xcd\x86\x1c\xa9!\xfeE\x5c\x8cP\x0b\x11\x01\x06\x0a)\
-\xd1\xc5sz\xd0\xed \x08\x9e\x9b\x0a\x14\xa1R\xe5b\
-\xd5b\xbb\xdd\xfeU\x14\x5c\x1c'\x87\xa9\xea\x00EM\
-\xee\xe4\x0d\xcd\xe8\xe1~M\x83\x9c9[\xb9\xc6B\xcd\
-\x11\x8aE\xd3c\x9b\xe5F\xc9\xd0ub\x16B\xa1\xdd\
- \xfc\xafeIh!\x91\xab$\x99\xcf\x97\xc9\x1d\x14\
-jMY(=+f\x82\x9a`\x8f\x9a\xe0My\x8c\
-\xa6~\xf1\xe2\xc5\xc1\xff\xf0\x91\xcf\x9e=K\xe4q\xb3\
-\xe6uUw\x81\xff\xe1\xbf\x01\x92;\xf0\xbbz\xda\x93\
-\xc2\xc2\xd3U\xf9\xd9\x0dC\xb7\xa2:\xa2\x06=\xf4\xaa\
-s*\xbd\x92A\x84\x09\xdd\x82\xae]\xbbf(Y\x1e\
-\xb7o\xdf\x8e\x1d\x93e\xf7\xf8\x92\xe5S\xabr)\xf6\
-\xb5\x15\xa9\x1cr5\x8fle\xca\xa26\x9f\x0b\xf4\xe4\
-4\xe2[\x0e\x0cQ\x11\xb7\xca\x9c\xad\xcc\xe7\xc2/K\
-\x7f*\xa7ud\x5c\x8cX\x18\xc9s\x9dn\xb7\xab\x9f\
-7 \x99M\x14\xac\x80Z\x95\xab\x22cW\x0c22\
-\x04\xfbN\xa0n\xcc\x8fa\xaaH\x7f\x80\xe4&\x02Q\
-\x93rk\x83[(\xb2A\xf2H\x8c\x1a\xfa\xf2\xa6\x8d\
-\x14z\xd0\xb5$j\xeat\x0bGl\x05\x00\x9a4b\
-U\xfcE\xde\x01\xe0X\xc6\xaf\xf0\xb52.\xd6A\x5c\
-\x0cy\xf8\xf0a\xea\xdc\x1d\xb9!\xbc\x1b\xf1\x83\xb1\xc0\
-0\xd1\xef\xf7\xa7\x84f=\x18=\xb9\xac,\xcf\x0b\xb7\
-.\xac5J\x9b\x0das5\xa1\xdd`\xdee\xf8y\
-\xd0\x97\xa0B\xeax_\xb8\x968WOF\xa3\xc9s\
-aS\x9d\xd41\x98\xa8\xc5\xe7\x22,R} B\xae\
-\x13'N\x88S\xa7N\xc5\xe2V.\x97kB_\xb7\
-\xa0\xafm\x90\xb9\x0a\x19\xe61\xb8-.\xcbA\xa5\xf9\
-\x5c\x09\xd6\xbeNLL\xfcHJ5vj\xb2#\xb3\
-QF\x1e\x97\x1e\xf6\xf3\xd9\xd9\xd9\xcf\xda\xed\xf6\x8a\xad\
-\xec\xd0\x10\xf9\xb9Pd\x08\x97\xaa\x12\xcc\xed\xd1C\xf9\
-D\x8c*X#\xd0z\xb5\x07X\xa2\xa3K\x13\xd3k\
-\xad6\x89\xde|\xef\x87a8-6\x13Y\x16:\xcb\
-IMD\x18r\xbbA\xdbo\x22\xd9\x9cP\xd3la\
-\x86\xd8f\x8d\xa6\x97\xad\xa1l\xdbo\xb9\xf3\x8e4\xa4\
-\x90\xa0\xc3l\x86\xc9\x89m\x90\x01\xa5\x9b^?\x8dd\
-\xb0\xe7\x02\xb9\xa0\xe6\xef\xb9\x80\xd79m\xf3^r\xde\
-\xcaV.M\x5c\xdf\xce\xe16\xcd\xcc*\xea\xf5Z\xca\
-\x85\xd1\x86r\xe5C'\xef\x89\x0c\x17[T\xd2V\xe5\
-@\x89iSCi[\x01\x94(}\xbc\xcfLn\xed\
-\x03Q\x14\xcc\x92\x92bS7\xf7)*\xb0\x1a\x9b\x0b\
-\xc0\x0aG\x94\x85\xf2l\xe0\x01\x98\xb6\x03(K:\xaf\
-\xde\x1b\xfeJ\xe4\x05\xdb\xa5t\xf2oE\x95\x10(\x06\
-7\x0d\xeb\x94\x9b\x0dg\x01\xbeU\xb5H\x97\xb71\xa1\
-h\x9cO\xbe\x10X\xa6eS}\xff\x92\x82?\x17\x06\
-\x8c#4\xecbO\x17t'\xed\xbd\x01\x0ckej\
-P]\x92\x04\xd4\xe9\x17\x907\x97p\xff\xfe}\xb1o\
-_2\xfd\x8a\xa5P\x17.\x5c\xc8\xf5>\x84\x0a\xa6\x94\
-\x1e?\xfe+6\xbd/G\x81H]\xdafH\xe8:\
-\x96\xe8:>%=\xac\x1a\x0b\xe9\xa4\xf5\xc2\xb6&\x5c\
-\x06i\xfb\xd5\xa8R\xd5N#*\xb6\xa8\x84\xf4\xf1\xc7\
-\xca\xcaJ\xb6T\x02\x97\x03\x95\x92\xb5)\xe7!\xc7 \
-a 27\xec\xfa\xa6\xa6+i\xd7E\xee\xe1\xb4\xc8\
-B\xcarK\xdb\xf9\x9d\x90\xcb\xf0\xa5_L\x09\x87b\
-\x1b\xb1\x912'\xa3\xcf\x12e\xe1[\xa5?G\xfde\
-Z5\xb7g\xaf\x14\xba\x87\xc4\xda3\xd6\x941s0\
-11\xf1\x8b\xeek\xe0_\xb3.1\x02\xf2-\x1eu\
-\x9a\xfc\xde\xbd{\xeb\xa9@\xd4\x9f\xe1]\xb09R\xfa\
-i*\x17[~D\x9fm\xa7\xcf~\x12)\xbb\xdf\xa9\
-}\x82>U\xb4{\xf7G\xce\xfd\xc0\xfc\xfc\xbc\x08\x82\
- \xf19\xb2l7n\xdc\x18\x1f\x1b\x1b\xfbO\xfd\xdc\
-\xe8'\xe8I\xf4\xa6\xa6\xa6\xa6u\x05\x93\x85\xc1\x1f\x0f\
-\xfe7u\x06\xe8\x08$\xf2\xf7\xf2\xa18\xa4\x09\xa1L\
-4\xb5\xd4%\x9etc\x93\x91\x923/\xac\xe3\xe6\xe9\
-$\xeaC\xc0Z3\xd9a\xe2^\xa7\xa6\xbea\xe7\xe6\
-\xc8\x18\xbb\xedv\xfb\xf7\xc4\x17i\x986\xffA\xd3\xab\
-\x22\xb4\x91Bu^\x89\x96\x9ef\x02e\xe9zJ]\
-\xa6\xda\x8a6\xe5\xec\xa4\xec\xf9\x00)\xb4\x95@\xd5\x03\
-\x08E\xfat\xa1\xd3\xd4brO{\x93\xaf\xddNr\
-\x84\x8c\xe2{R\x0c\xac\xf9\xa60\xf8\xe62$\xca\x0d\
-\xe7\x7f\x81\x98~\xbc\x85.\xb4\xd4\x0b\x94\xd6 s\xac\
-\xd4\xac>\x14\x15B\xe7\x19\xa7\xf3\x1d\x8dr\xc8X\xfd\
-\x07\xdfd\xbdN\x9b\xd0\xb5\x87\xa2(\xd8\x03\xd1\xb5\xf9\
-C\x81X\xae\x19\xad\xb4i<H\xcad\xcd\xd6A\x10\
-\xddPl\xbb\xd5P\x9d\x1b\xdc\xe6\xc1\xa4\xf0G\xa4\xf8\
-Y\x92\xef\xc8\xfa\xdc6<\x18\x1ezB\xbbo2\x9a\
-eR\xec{\xa9\xbfrE\xdd\x965Z\xe8\xb1)\x88\
-v\xce\x93\x8a\xbdB\x8a}\xcb\xf2\x13w\xf0\xb4\xd0;\
-\xd2\xc9\x02[Y\x8f\xc7\xe3\xf1x<#\xc2\xff\x15N\
-\xbd7\x03\xe2t\xc1\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x09\xc9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00V\x00\x00\x00[\x08\x06\x00\x00\x00\xe9\xc8r)\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x07\xfeIDATx^\xed\x9dM\x8b\
-\x14G\x18\xc7\x9f\xbc\x10\x82\x09\xac\x97\x95u\x07\xa2a\
-aA\x96\x9c\x86\xdd\x9b:\x9f\xc0=\x05\x96\x1c\xc4\x83\
-$B\x08\x04\xbf\xc0N>\xc0\xfa\x19\xbc)\xf1\xa4\x86\
-x\xedu\x0f\x0b\x1aOa\xf6 \x184\xb2\xab\xac\x17\
-'f\xcdE\x98<\xff\xd9\xae\xa6\xbb\xe6\xa9\xae\xea\xee\
-\xea\xda\x1e\xed\x1f\x143\xd3S]U\xfd\xaf\xa7\x9ez\
-\x9d]\xa2\x96\x96\x96\x96\x96\x96)\xe3\x13[\x84&p\
-\xf5\xea\xd5\xfe\xbbw\xef~\xeft:+kkk\xcf\
-\xb7\xb7\xb7\x9f\xdb\xeei\xb1p\xf3\xe6\xcd\x11\xbf\xe8\xa1\
-\xf1|l\x8bp\xd4<x\xf0\xc0\x16\xa5\x914^\xd8\
-'O\x9eL\x5c[]]\x9d\x0a\xabm$Q\x14\xf5\
-766$70\x9a\x9f\x9fo\x85ueooo\
->\xb6\xc4R\xa1iV\xdc\x18W\xc0V\xb8\xb7\xb0\xb0\
-`\x8b654FX \xf9\xd3i\xa5Q\xc2V\xb1\
-Xv%\xbf\xd8\xe2|\xd0p\x87\xb5\xce/\x03\xb2\xfb\
-\xd5\x88COL\xa4\xc5\x0cwF=:\x14O\x12\xb5\
-o\xba\xaf\xc5\x91xh\xa5\x87\xc6\xd3(\x1f+\xb1\xbc\
-\xbcl\x8b\xd2H\x1a/\xec\xb4\xd2xa\xb9\xb7\x9f\xb8\
-\x86\xd5\xae\xc9\x98-\xcep\x07\xd6'\xc3\xa8\x80G\x0f\
-\xb7\x06\x83\xc1L\xce\xed-\x12\xec[\xfbd\x9f\xc6\xee\
-GQ\xf4\xad1\x91\x96,<\x12\xe8\x93}\x1c;\x0e\
-\x185`\xc1FN\xa9%\xc1\xc5R\xf5\xd0\x8akA\
-\xf2\xa9,\xf4\x08\xbb\x08,\xdc8\xe0\xbd\xb4\x0a\xd6\xb4\
-\xd5\xad\xc6\xc0\xa2\xf5H\x13\x8b{\xff\x91\x09I\x5c\xee\
-\xd0.\x99\xd2\xff`a\xcb\x8cH\xb3\xd4\x83\x83\x7f\x8d\
-\xc2\xe2;\xd2\x84\xe5{\xae\x1b3\xf8\x80\xd1\xad\xcf(\
-\xaa\x02\x16MYa\x9f\xe6\xa4\x1f\x94FN\x10\xb83\
-\xa2n\xb7k\x8bF\x17.\x5c\xc8|\xde\xdd\xdd=e\
-\x88\x9a\xc0c\xdf\xef\xd8O\x0fPqp'h\x19\xa8\
- \xf8o\x9e\x8c|o\xbb?\x08\x5c\x98[\xe8\x91\x0d\
-\x0b%\x08\x11\xb9/\xed%\xf7!\xbd\x9d\x9d\x1d\x9b\xc1\
-B\x88\x91~\x9f\x94\xf0p8<\xc6BF\x96\xb2&\
-\x01B\xf3=_Ki\xd5\x0a\x06\xe5\x5c\xd3\xfbd)\
-`*Dd\x178\x89o\xf3\xafi\xd2\xf7\xe9\xc2B\
-P\xb6\xca(\x1d\xa7H\xe0\xf4\x0e\xb8\xf2\x16)\x04U\
-\x0aJ\x87\x0b\xd8}\x0eK4I\x12\x0f\xc2\xba\x92\xbe\
-/-,7\xf7>\xd2I\x7f_6 -\xaa\x0b\xae\
-\xb9\xae\xcb.*\x1eN\xf9.K\xdc\xb1\xc8\x5ch%\
-r\xf2]Ua\xb9\xd9\xf7]\xca\x89|PVG\xf7\
-\xd0'\xdf@T\x93P(\x14:\x028\x7f\x09\xf8A\
-|\xef t\x12\xca\xba\x02[@\xbay\xa3\x0d\xf8u\
-\xf8W\x93\xd0|\xff-\xf2\x89>\xac\xa1XP\xcc\x82\
-\x8a\x80\xf8.\x02\xbbv^\x88cK\x8bbAM\x15\
-/\x01c\x90\x9e\x19\x81+f\x9f| 5+\x14\x14\
-\x99\x97\xc5t\xc2%\x1d\xca\x8cc\xf5\xa0ZSYP\
-\x19R\xba\xf1\xf5jp\xe12;\xa6(l\x15Q\x15\
-(\x5c\x9eos\xf1\xb3\xa6{\xd5\xfd.VoC\x12\
-7nu\xe5\xe1D\xd1\xb1d\x12-\xda\xfc\xf3@\x05\
-\xe5u\x88yy\x19\x8ew\x8e\x03,\xd9\xd5G\xbb\xa0\
-\xb7\x0c\x18\x04O4~\xa6\xb2\xe8\xabME:\x95\x22\
-\x98\xc4\xc5u\x13&k\xcf[\xb8\xa9\x82\x9e\x1f\xe7\xf3\
-T\xd7\xab\x08\x197P\xc5_\xe5\x81\xca2\x89+Y\
-\xad\xc9G\xd7%*\x10\xd6%F\x93r\xb9\x93I\xac\
-H\xcfZ\x14\x88+\x8d\x18t\x9fn\x1a\x09\xe4Y\xb7\
-\x0f\xf4|\xab\x1e%5>`\x1d }\xa9\x89\xa7-\
-Q\x12\xdf\xa5\xa3\xf3\x81\xae\x87\xa8\x98#\xc1,Ba\
-\xea\x94 \xba\xe9\xbb:[R\x1a!\xef\xd2\x04\x17\x16\
-H\xfe\xd64\xb1\x08Y\xaet\xbe\xde,\xb6\xae\x11\x81\
-\x84i`.\x85P\xe8;\x166a\x9d\x17\xbaww\
-w\xe9\xe1\xc3?l\xd1\xbcp\xfe\xfcyL\xa3m\xd1\
-0+\xb4E\xf1\x86\xfe\xec\xcb\x963e\xb9\xc2r\xad\
-\xec\xa8\xf78\xea\xf3\xe8\xd1\xa3\xbc\xe8^YYY\xb1\
-E\xa1+W~\xb0E\xf1\xc6\x9d;w\xf4K;T\
-\x16}\x9d\xa0\xea\x1aA\x11L\xc3\xaftYB!\xb9\
-\x01vW\xeb\xa2h.\xf0\xb4\xed+\xd2\x1e\xa8\xaeI\
-\x82D\xde\x22K\xa8\x91\x00\xd0\xcb\xe1\xe5\x0c\x03\x0e\x9f\
-\x91V[>\x167\x5c\xc8\xeb\xc4B\xa1\xef\xab!\xf0\
-\xb0\xefWQ\xac\x22p\xc2\x9f\xeb\xfb[\xa1\x868\xa6\
-\x09CH7\xa0\x0f\xfdp\x10\xcf\xa4Ua\xe2\x13}\
-\x99\x0cB\xb9\x04\xc9\xcf\xd6\xb9&\x90FZ\x93\xf0~\
-\xba\x91\x1f\xe6.i\x99\x84\xe8\xc8\xa4\xc9\x82\xcf\xa5K\
-\x13\x92\x1b\x8a;s\xbfpG6\xc7\xd6\xf3\x1f\x05n\
-\x92\x92\xd5\xd4\xed\xe3%\x17\xb4|x\x0a\xb2\x1e\xe2m\
-\xe0\xa0.A\x12\xb6n\x84V\x12Izx\x853\xfd\
-\x8b\x02X\x90\xda1\xd5\xf3B\x805\xe1\xbb:\xf2\x95\
-*\x92\x0d\xaa'i\x91\xc7G\xb6\x08:\xc3\xe1\xf0\xcb\
-\x8b\x17/\xbe\xb9}\xfbvr\x8d\x1ft<\xe5-\xc3\
-\x8b\x17/\xe8\xf1\xe3\xc7\xe3Y\x1d\xd2\xd8\xda\xda\xe2\xe9\
-\xe3C\xdbm\x09\xc8{mm\x8d:\x9d\xce8\xcc\xcd\
-\xcd\xd1\xe2\xe2\x22\x9d<y\xd2v\xeb\x04\x9b\x9b\x9b\xd4\
-\xeb\xf52\xd7\xd8\x906\xf9Y\xb3\x17\x1d(,,\x80\
-K\xe0\x87YO_\xc3\xdc\xf9\xec\xd9\xb3\xe3\xf7\xea\xc7\
-\xc6\xea\x17/Jt\xe9\x170!\x80\xf8\x0a\x88/]\
-\x07\xa8P\xbd\x8c\xfc\xb9\xc3\xf1\xc2\x15<>\x19\x226\
-\xd5\xf7%\x1c\xd9\xf1{\xb6R\x97\x1f\x13{\x09.\xc7\
-\x80|\x86\xe5\xc3\x83\xd0GC]V;\x1f\x9f\xff\x92\
-\x8e.\x959\xb2T&\xc4G\xf7KS\xca\xc7\xa6\x89\
-\xf7\xc2lq\x92\xf7\xf0q\xf8\x8c\xbfM\x90\xeepN\
-\x9c8A\xc7\x8f\x1f/\xd5\xe9\x00t\x82\xaf_\xbf\xa6\
-\xfd\xfd}z\xf9\xf2\xe5\xd8\xaf#\xc0\xdf\xa3|z\xe7\
-\x9aW\xe6\xb2\x1d\x96W\xb8\x10\x99E\x1a:\xac\xed\xf1\
-P\x08!\xc4\xec\xac(X\x06D\xb9P>i\x1f\xad\
-\xaa\xb5z\x81\x0b1\xcb/\x99E\x9aP[8>\x10\
-\xb6\xd3\x07\xe6\xa7u\xc7yk\xc6\x04\x8f\xfb^\xf1\xcb\
-\x8f\xe9kw\xef\xfef\x88\xdd<\xee\xdd\xbb\x97\xf9\xcc\
--\xb0\xfa\x92 y\x106\x06\xee \xd9\xaa\x98\xa6\xbf\
-\xeev\xff\xfe\xfd\xcc\xe7s\xe7\xce\xf9=\x03\xeb\x81>\
-\xc5\xcd)\xc4\xe2\x8c\x0f\xe0\xb2\x84a\x9c\x17|Y,\
-Hj\xba\xec\xf464\xc3\xe1?\x99\xd1\x81>\x13\xab\
-\x82Oa3N\xff\xed\xdb\x03S\xbc\xc6b\xdb\xd2.\
-\xc2\xa7\xb6\x08e\x80\x15<{\xf67\x9d9s\xc6\x16\
-u\x025\x1e\x05\x18\x93*06\x05\x18\xf3*0\xf6\
-\x05e\xc7\xbfX\xfcIS\xe5\xef~\xe9\xd4\x22,\x80\
-(\x92\xb0\xb0d\x1c~\xc0j\x16:\x0e5x\xb7M\
-2\x5cAsV\x93\x10\xee\x88\xc6\xbfp\xc4\x01\x10\x09\
-UYuP\x9b\xb0\xaa\xd0\xb0\xc0\x1b7n`E\xac\
-\xd0r`YPA\xaa\x92\xd2K\x9b\x80\x87Rc\xb1\
-q\xd0\xe3\xd8\xb1/\xa4\xdb\x9fI\x17\x9b@\xd2\xbb\xa2\
-\xb7\x0d\xbdpR4\xe8\xeb\x0d\x1b\x1b\x1b\xd7\xc9\x13\xb5\
-Y\xac\xaf\xa6]'B\x0b\x8a\x84h\xa5\xa8M\xd8*\
-(?\xa9\xde\x9bHW\x9e\x0f?\xcdyF\xb68\xae\
-T^\xdd\xd2\x18\xd9\x22(\xa1\xb0\x9d\x82\x83oU\xb6\
-RL\xa8\xed\x1e\xf8y\x9cHt\xf1\xed(\x17W\x8c\
-o=\xbc\x91\xeb\xcfB\x9c\x070\x81\xbc\xf3|~\xd5\
-\x1fk\xd4\x8dqG!\xe4!6\x13y\x87\xec\xbc\x1c\
-t\xab\x8b\xbc\x1d\x05e\xb1\x108\xd4\xb2bz\xcd\xd5\
-f\xb1\xf1\xba\xac7\xbc\xfb\x14X\xc5\xb5k\xd7r\xe3\
-`\xea\xa8|\xad\x9a\xed\xa8\xceJ\xbd\xaa]\x05\x09i\
-F\xa6\xd0w\x0e\x5c\xfc+\xfb\xe1W\x97/_^\x98\
-\x99\x99yc\x8b{d\x0c\x87\xc3\xcf\xb8\xa0\xeb\xf3\xda\
-op\xcb\x045\x16\xd6\x83\xed>\xd7\x80\xb4p$\x93\
-\xcb<\x15\xff\x1a&\x81\x0b}\x9a\x0b\x7f\x89\xdf^\xe7\
-\xf0\x94\x1c\x1e6D\x88\xddR4\x18\x0c\xbe\xa1\xf7\x81\
-\xd5\xfc?\x0f]W@~=\x0a\x8cw\x1f[\x14v\
-\x1b\xa7\xd9'\xf6\xf8m\x8f\xfdb\x8f\xfd\xe2)\x5cw\
-\x19\xf0\xa7\x17\x5c\x80\xda\xf9\x05\xddnwsvv\xf6\
-\xa7\xa5\xa5\xa5?\xf3\xd2hiiiiiiii\
-\x99J\xfe\x07\x10\xba\xe4r.\xc1\x9e\x0c\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x05\x1c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00K\x00\x00\x00W\x08\x06\x00\x00\x00LZ\xb8\x0a\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x03QIDATx^\xed\x9b\xbfk\
-\x13a\x18\xc7\x1fE\xa5*\x9a)\xb5t\x10!.\x92\
-Q\xe2\x16\xd2A\x5co\xf0\x1fpq\x14\xe4\x14$S\
-\xdf\xae\xc2ept\x90,\x0e\x99\xa4\xab\x83\x1c\xed\xd8\
-:f\x10\xec$\x84`\x9dT\x04\x91\x12\x9f\x93$\xd4\
-\xcb%\xcf\xf3\x5c\xde\xbb{\xafy>\xf0\xe5m\xc2\xf3\
-\xbe\xf7\xe4\xd3\x0b\xbd\x1f=\x00EQ\x14EQ\x14E\
-QV\x00\xcf\xf3\x0c\x0e\xa3E\x19\xd7\xcc\xc5\xf7\xfd\xad\
-\xf8\x1cN\x1a\x8d\xc6(i\xbd\x09A\x10\x98\xa4y\xa7\
-\xb3\xb9\xb99\x1a\xd7e\x0bG\xd4$\xf8\xc1L\xf2*\
-\xff\x08\x93\xe6p\x82\x1f\xf6\xd6\xecr<Q\xa7\xd6\xc8\
-V\xd8\xf8\xc3\x93\x8d\xc42\x0fj\xde\xa2<\x9a]\x0e\
- \x12\xc0\x98;MT?\xde\xc33\x81l !\xf3\
-\xa0\xe6-Jwv9\xb9\xacq\xc2\xa4\xb5\xe2\x9c\xa7\
-\x0a\x1cf\x8b*\x10\xd0\xa2\x0a\x22\xceQ\x05\x09,\xda\
-S\xca\x0c\xe9\xa2\xcc{V\xee\xa8,\x01*K\x80\xca\
-\x12\xa0\xb2\x04\xa8,\x01*K@\x1aY;TA\xd9\
-\xc0\xa3~\xaad)\x0c\xd0\xa7\x10\xa5Ht\x05#\x0c\
-\xc3g\x901\x06\x18\xcd\xb8\x1c\x14\xf5\xa7\xdf\xefoA\
-N\x18`4\xe5bP\xd4\x0f\xdc\xa3\x1e@\xce\x18`\
-4\xe7RP\xd4W\x14u\x17\x0a\xc2\x00\xa3I\x17\x82\
-\xa2>\xa3\xa8\xdbP0\x06\x18\xcd\x16\x19\x14\xf5\x11E\
-\xdd\x00G0\xc0h\xba\x88\xa0\xa8\xf7(\xea\x1a8\x86\
-\x01F\xf3y\x06E\xbdEQ\x97`I\xc8\x0b^)\
-\x19\x9d~\xe1\xfb\xfe\xbc:\xeb\xec\xef\xef\xc3\xc1\xc1\xc1\
-\xf45\x8a\xeat\xbb\xdd\xe7\xf5z\xfd\xbf\x9e\x9c!~\
-\x1d<O\xf0\x17\x13\xdf\xb3\xac\x91\xe6tgeQY\
-\x02.P\x056\xe8\xf5z\xb0\xb1\xb1\x01\xc3\xe1p:\
-N\xb0\xf9:\xfa\xf9\xe8\xe8\x08JE\xca{wY\xc5\
-\x1a\xfa5\x14\xa0\xb2\x04\xa8,\x01*K\x80\xca\x12\xa0\
-\xb2\x04\xa8,\x01*K\x80\xca\x12\xa0\xb2\x04\xa8,\x01\
-*K\x80\xca\x12\xa0\xb2\x04\xa8,\x01*K@.W\
-J\xc30\xa4J\xac\xb0\xbe\xbe\x0e\xedv\x1bvww\
-\xa9\xd2T\xe4\x22\xab\xd5jQ%\xd6\xa8\xd5jTI\
-j\xf4k(\xc0\xba,\xdf\xf7_\x0c\x06\x03\xaa,7\
-\x88\xa7\xd2DX\xbd#\x8d\xa2\x1ew:\x9d\xd7\xf1\xf7\
-=\xcf\x83<\x04F\xff\xee\x18\xdd\x8d\x8eo\x0b\x85\xed\
-\xe0\xfb&yV\x01\x04A\xf0\x10\x87\x13\xa0\xef\xb6\x14\
-\x12\x9b{\xd8R\xa0\xa8\xfb8\xfc\x06F\xd3E\xa6p\
-a(\xea\x1e\x0e?\x81\xd1\xac\x0b)L\x18\x8a\xba\x83\
-\xc37`4\xe9Rr\x17\x86\xa2n\xe2\xf0\x05\x18\xcd\
-\xb9\x98\xdc\x84\xa1\xa8*\x0e\x9f\x80\xd1\x94\xcb\xc9\x5c\x18\
-\x8a\xba\x8e\xc3!0\x9a)C2\x13\x86\xc7Qk8\
-|\x00F\x13e\x8aua(*:\x8f|\x07\x8c\x8d\
-\x971\xd6\x84\xa1\xa8\xe8H\xff\x0d06Z\xe6\xe0\x19\
-\x80\x01\x0b\xbc\x04\xc6\xc6\xceH\xd2\x13\x86\xe1\x15\xa07\
-p\x962\x17\xf2\xaaC\xb5Z]\xa3jV\x05R\x16\
-\xe4t\x81\xb0\x0cpd]\xa4\x0aV\x05\x8e\xac\xcbT\
-\xc1\xaa\xc0\x91\xe5\xdc\xc3AEA\xca:>>\xaeS\
-5\xab\x02)\x0b\xff\x1a~\xc7\x83\xb5\x13\xaaN\x19\x83\
-'\xcfOQX\xf4\x18\x03u\x8cR\xeax\x9e\x17\xc2\
-\x02\xd87,P\xd8\x93\xbd\xbd\xbdWT]\x19\x89n\
-p4\x9bM\xd8\xde\xde\xbeZ\xa9T~Q\xf5\x8a\xa2\
-(\x8a\xa2(\x0c\xfe\x02\xc4\xd9\xc0.\xb5\xb76'\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0e8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00_\x00\x00\x00[\x08\x06\x00\x00\x00\x15\xddY\xe3\
-\x00\x00\x01qiCCPicc\x00\x00(\x91u\
-\x91\xbdK\xc3@\x18\xc6\x9f\xb6\x8aR+\x1d\x14\x11q\
-\xc8PE\xb0\x85\xa2 \x8eR\xc1.\xd5\xa1\xad`\xd5\
-%\xb9&m!I\xc3%E\x8a\xab\xe0\xe2Pp\x10\
-]\xfc\x1a\xfc\x0ft\x15\x5c\x15\x04A\x11D\x9c\xfc\x03\
-\xfcZ\xa4\xc4\xf7\x9aB\x8b\xb4w\x5c\xde\x1fO\xeey\
-\xb9{\x0e\xf0\xa7tf\xd8=q\xc00\x1d\x9eN&\
-\xa4\xb5\xdc\xba\xd4\xf7\x8e Fh\xc60-3\xdbZ\
-\xce,e\xd1u\xfc<\xc2'\xeaCL\xf4\xea\xbe\xaf\
-\xe3\x18\xc8\xab6\x03|\xfd\xc4s\xcc\xe2\x0e\xf1\x02q\
-j\xcb\xb1\x04\xef\x11\x0f\xb3\xa2\x9c'>!\x8er:\
- \xf1\xad\xd0\x15\x8f\xdf\x04\x17<\xfe\x12\xcc\xb3\xe9E\
-\xc0/zJ\x856V\xda\x98\x15\xb9A<E\x1c1\
-\xf4\x0ak\x9eG\xdc$\xa4\x9a\xab\x19\xaac\xb4\xc6a\
-#\x8d$\x12\x90\xa0\xa0\x82\x12t8\x94K\x09&e\
-\xd6\xd9\x17o\xf8VP&\x0f\xa3\xaf\x85*89\x0a\
-(\x927Jj\x85\xba\xaaT5\xd2U\x9a:\xaa\x22\
-\xf7\xffy\xda\xda\xec\x8c\xd7=\x94\x00z_]\xf7s\
-\x02\xe8\xdb\x07\xea5\xd7\xfd=u\xdd\xfa\x19\x10x\x01\
-\xae\xcd\x96\xbfL9\xcd\x7f\x93^ki\x91c \xbc\
-\x03\x5c\xde\xb44\xe5\x00\xb8\xda\x05F\x9f-\x99\xcb\x0d\
-)@\xcb\xafi\xc0\xc7\x050\x98\x03\x86\xee\x81\xe0\x86\
-\x97U\xf3?\xce\x9f\x80\xec6=\xd1\x1dpx\x04L\
-\xd2\xfe\xf0\xe6\x1f\x5c\xefh5`GI\xb2\x00\x00\x00\
-\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd\
-~\xfc\x00\x00\x0cmIDATx^\xed\x9dMl\
-\x1cI\x15\xc7k\x11\x08\x94ew#$\xa2d\x02\xeb\
-@P\x84\xb0\xc8\xc5v\x0eH\x8eG\x5c \x12\x92s\
-\x00\x14\xb2B2\x12\x82\xcdJ\x1c\xe2\xc9uqs\xe2\
-\x14K \xed!\x87\x08#\xb1k\x87\x9cBV\x5c\x19\
-\xc5\x17\x14\xaf\x8f\xe3H\x84\x08/R\x9c\xc8\xd1n2\
-\xcb\xc6\x8b\xc4\xc1\xbc\x7f\xbb\xab\xfd\xfau}\xf5L\xcf\
-L\x1b\xfa'\x95\xe6\xa3\xab\xaa\xab^U\xbf\xf7\xeaU\
-y\xacTMMMMMMMMM\xcd@x\xc1\
-\x97\xa1\xea\xb4\xdb\xed&\xbdD\x94\x9e\x9c:u\xea\xc7\
-\x8dF\xe3\xdf\xee\x125}CBn\xd2K\x9b\xd2\xae\
-N\xb3\xb3\xb3\xdb4\x18?p\x95\xab\xe9\x83\xa9\xa9\xa9\
-/\xd2\xcbM\xc5\x84.\xd3\xca\xcaJ\xd3ZAMo\
-\xd0\xcc\xc6\xac\xdeVL\xd04\x18\xbb\xf4\x14d\x84O\
-\x9f\xdb\xf6Z\xfe\xcf\xe8t:\xdf\x9c\x9f\x9f\x87ZH\
-\x05\x85W\x12\x5c\x87\xbe\x8f\xba\xdd\xeeg}u\xd0l\
->\xa1\x98\x80Q\xdf\xc6\xc6\xc6\xee\xd6\xd6V\xfcz\xf5\
-\xea\xd5]q\xbdi\xaf-\x0b\xb5k\x9c\xda\x13\xd1\xdb\
-\x0e\xa5Mj\xd7\x12}7G\xed>\xe2)Z}\xa8\
-3m\xe5P\x13\x18\x14{\xe9=H\x98sj\x7ff\
-\xef>\x7f\xfe\xf1\xae$\xa9G?\x11mW} \x19\
-\xa0\xb6\xb2\xb4\x0b\xf7!\x1b\x12\xd9\xcaW\x9e\xc40Z\
-\x05\xaf\x13\x09\xa2m\xa9\x22\x86\x04\xbb\xc4\xf2\xe6\x04\x0f\
-\xf8\xec\xa7\xfbv<\xf5\x8d+eo\x8fN\x18\x00z\
-\x02.Z+\xea\x83O\xf92\xf4\x0b\xa9\x85\x88\x7f&\
-\xc1)\x12\x12:\x9f\xc9\xb7\xb8\xb88\x03\xf5\xa4\xec4\
-\xf5\x9b\x07\x0f\x1e8\xb2\xa5\xfc\xd1uqmm-\xe3\
-\x15\x91\x90\xe3\xb6!\xe1\xbd\x86\xda\xaf\xae_\xbf\xfev\
-\xae\x82\x03@:\xbb0\x83\xa0\x9b9\xa4\xc7\xa5\xfai\
-\xdb*\xa2\x01\xcbx8&\xb5\x03\xe3\xcb\xea\xfa\x86\xad\
-\xae\x84\x0e\xcb\x9b\xab\x8b\xab\xb0$\x1d8\x22\xe5Q\x15\
-\xc2S\xf9\xc0V\x11\x0d\x14\x5c\xcc\xd4\xd3I\xf4q\x5c\
-\x07\x06U\x08k\xcbV\x0f#\xcdoBN\x0cgM\
-\x15%\x9d]6\xe1\xf3\xd9J\xe9\xaf\xae\xca\x12WS\
-\x0a%\x97h`\xfed\xadd\x1f\xa7\xf01\xb0*[\
-o\xe9\x14\xd2\xf9\xa4\xff&H/\xff:Y\xd2\x97\xc2\
-\xc3\x87\x0f\xd3\xf7$\xb4\xbf;\xb2\xaa[\xb7nA\xf5\
-l\xb8\xf2\x00\x1a\xd0u_\x1e\xce\xce\xce\xf3\xdcw\x8f\
-\x1f?6\xe4\x1c\x11\xa4s#\x95\x9d\x09\x98\xd5Q\xe2\
-5\x18I|\xe7TM\xc0'\xe7\x18t\xfe\x82\xad.\
-F\xa4<3\x9f\xea\xf9\x9e\xb5\xf4><\x7fn\xe6s\
-5\x96\xf4#\x07\xd6\x01$\x979z\xbbDi\x93\xd7\
-IO\xfaM\xea\xef\xe7L\xe5\x0a\xc1\x85hI\xc6x\
-\x0a5,\xe3\xcea\x00\xe0\x0eB\xe8PC\xb2\x1e\xba\
-\xf6\x9a\xa9\x1e\x0e\xcdj\xaf\x8bHB\xf9\x82\xbd\x86\x94\
-L\x19\xb4\x0d\xedB\xfb\x84*\x8cL\x85\xe9\x1e\xaf\xca\
-\x95\xb5\xa1\xce\xfebM4\x03\x9a\xca\xd3YJ\xdbI\
-\xcc\xc5V\xbe\x1dP\x07\xf4\xec\x19S\x1d\x1c\xaa\xefe\
-\xe5\xa9\xc7^:\x83\xaf\x0e\xa4%[ajG\xe4)\
-\x1b'\x0c$\xad\xe0?c\xab\xc7G[%\x15\xc9\x99\
-+F\xde\xe9W+O0\x0c\x89f\xd3K\xf6\xe2{\
-\xf8\x16GI\x9bB\xf0\x09\xaeCu\x1d\xb2\x17\xdfw\
-&\x90 \x0f\xcb\x93\x83\xef\xe7\x1c\xf5\x98\x91\xabS\xa9\
-\xb3\xe1\x11\xf0\x01\xa0\xf7'lu\x91\xd02\xae\xa2)\
-Q}\xc6\xa7\x87C\x9d\xfc\x8er\xd4\x91t<\x04\x97\
-\xe0a\x81\xad\xeb\x04\xba\xc7\x09\x9e_\xbb\xbc\x1a\xacA\
-\xf8\x00\x90\x5c\x96lu\xb9h+\xd6)\x13\xc2\xbf\x9e\
-s\xd4\x85\xc1t\xba\x8a4Cf\x1c\xc5cH\xf8?\
-U\x8e:J\x12\xfe\x9c\xbdX\x0c\xae;\xe5\x22l\xda\
-\xa6\xa9\x12\x9f\xab\xe9\x9d\x89'O\x9e\xe4\x1f\x9b\x96l\
-1\xf4\xe4\xdct]'\xb7\xd3\xea91\xbe\xe4\xba8\
-==\xed\xba\x1c\xca\x92\xebb\xa2\x11\xfa\xc6)|\xba\
-I*,\xee\x8fsD\x9c\xa5i\xcc\x14\x08\xcd\xfc\x10\
-\xe1\x7f\xd9u10\xee\xd3/M\xfdfmm\xcd\x98\
-A\xb4\xa3m\xca\xe3\x14~\xab\xd5J\x85\x8f\x00\xd3\xe2\
-\xe2b\xe6:>\xd3\xc2'\xfdL\x835\xa6\xfa\x80\x06\
-\xd8\x17\x8f\x01\xce\x99\x8fv\x0e\x1aR5\x99~\x9e?\
-\x7f^=z\xf4(\xfd|\xe3\xc6\x8d\x8c\x5c\x5c1+\
-\x1f\x91b\xfa\x10\x06V'\xfe=RH\x5c\xde\xe3\x1b\
-o;\x8a\xc6\x90.\xddP}\xea\xfc\xc41p\xb5\xc3\
-\x89\xdc\xb8\xd1\xc9&\x172\xc8'lu\x85\x10)w\
-c\xe3\x944\xca\x89\xf0\x02ru\x90\xea9\xe6*O\
-\x03\xfc\x91,\xc3S\xa0\xab9\xa7\xf2e\x82\xcb\x1b\xe2\
->\xb6\xf4\x80&\x8bu\xb5\xed3\xb8\x9a\x88\xd2\xaf|\
-\x99lv\x81\xd3\x10\xb1r\xc4\xcf94\x80\x13\xb2\x8c\
- \xb3\x16\x90\xfb\x02\x81j\xa7\xa9\xdf\xd0d\x88S\x11\
-\x02\xe2>8\xbe\x12Q\xdf\xc6I5\xbf\xeb\xcb\x1c\x84\
-/\xcc\x102kd\x9c\x1c\xe1`1\xf3\x16\x8a\x96\xe7\
-\x9f\x93\xe4cS%y\xb10\xe2Oc\x88\xda2\xc4\
-\xfay\xbaM}\xf8\x8a\xa3x\xef`\xc3[9\x06\x80\
-f\x9es\x95*\x1bnX+8\xc3\xc1r\xf5\x08\xe4\
-w\xae\xf2r\xe1\x08\xf8\xe0\x87\x08\xdfc\xb7\x06\x0e\x9e\
-m\xe3\xcd}Ki)|\xac\x06\xc5\xecu\xea\x0d\x93\
-\xf0\x0d\x06\xd0E[\xe7\xd3\xd1L\xc5\xca\xfa\x84\x8fH\
-\xe6\xa8\x85\x7f[Yn\xee[JK\xe1\xeb\x90\x85P\
-=.\xbd\x9f\xe6\xd3\xc2\x0b\xdd\xf8\x90AB\xbd\xadY\
-d\xe6S\x1ds*{\xaf\xa0{\x97I\xa4\xec7\xdf\
-\xb4\x96Rv\xe1\x8b\xd9{\xcdT\x96\xf24xY\x94\
-\xd1\xf0\xefMe\x13\xda:\x0f\x04\xae1x`V\x92\
-\xc9U\x8a\xf0C\xbd\x9d\x0c\x9e\x9d\xa21j\xe0\x9c\xed\
-\xa2\xcd\x1by\xfd\xf5\x9f\xf3\x8f?\xa2{|^\xe6!\
-o*\xf3D\x9c;w.}\xcf\xbd(*\xfb5%\
-H\xce\xe8\xcc\xe8\xcf\xb4\x80L\xaf\xf1\xb2>\xa8\xfdM\
-\xdb\xb5\x22\xf5\x80\x9e\x84?==\xed\xdc\xa6\xa3\x06\xbe\
-E\x9d5\xaeV\xc5\xb6\xa1z\xe5\x95\x97\xe3\xf7\x87\x0e\
-\xbd\xc8]\xbe\x97(_\xee\xac\x0c-\xd93\xc2\x1f\x1b\
-{5}\x7f\xe1\xc2\x85\xf4=\x95\xdd\x1f\x95\x84\xd5\xd5\
-\xd5\x88\x7f\x96.n \x11\xa51\xdb\xc5\xe3\xc7\x8f\x7f\
-h\xbbV6\xe9\xa3\x06Ub\xf08:\xa4\x16r\xf1\
-p\xa9_\xf9\x11\x10\xa1\xbb\xdf\x93e)\x7fjk\xb8\
-\xda0\x94\xfd3/G\xedh\xb2k\x19u\x05x\x04\
-\xb2\xb1w*\xc2\x14P\x8cx\x1d\xc8'U(\xb5\xcf\
-y\x00\xa0L2B\x94\xb1}\xa5\xac\xc673h\xf2\
-\xfc\x8d\xd0\xbf\x91(\x9bzY\xa6\xd3\x10\xac\xee\x1d\xba\
-\x9e\xee\x9f&\xb1\x95\xf4\xba\xbc\xa7\xf4\x96dh\xdb\xb4\
-\xbeA\x7f\xe5V(\xdd\xe7\x0fjHdn\x0cL\xcb\
-n\x12fd+g\x12\xa0\x5c4%\xeb\x8a\x5cY\xb9\
-\x81\x01\xf8\xc0\x91 \xbe\x8b\x02I\xa44\xfd^\xcez\
- 7\xf2\xe9\xf3\x1b\xfa\x86\xa6\xedB\xddn\xc3\xf7\x0b\
-j\x18\xc8Y\xae\x85a\x0a:%\x1d\xd08\x05\x01\xc4\
-\xc9\x01~V2\xfd\xcetb\x8d\xdf\x9b\x06\xe27(\
- \x85'w\xe3\x80\x1cp\xaa\xe7-\x94%a\xe66\
-\x7f\xb4{\x0b\xe45\x1a4\xef\x01\x80R\x90\xfa\x8e\x0b\
-\xd2t2\x81\xcd`\xde\xd8\x9c \x80\x14\x06f4\x17\
-\xa2\xed\x00\x16\x04\xab\xf3\xd0\x00\xddO\xee\x97\xee\xb5\xda\
-\xee\x87\x81\x14m\xfd\x0b\xf5'\xb7\xed\xc9m\x94|\xca\
-1!\xba\xddn\xffGEB\xa0\xc6e6\x90\xe5v\
-\x9a%\xfe\x11\xf1\xcf\xf2\xec&\xc7p\x5c/\xa8\x9c\xc1\
-\xf0;\x07L#\xf2C\xe8\x99\x0d\x7f\x08\x97?5\x06\
-}\x8f\xd7\xe1`8D\x95S\x05\x9e\x00\x94S\x88\xb6\
-\xf2\xfc\xb17a\xb1;F5\xc5\xb1\x0d\x9aJ\x04/\
-\xdb*\xf3S\xbb\xac\xe7LK\x87:9.\xf5\xbeI\
-\x9f\xda\x06\x00\x8d7\xe5\xe7\xc8S\x00H&C+\x91\
-6\xc37\xc8\xc0\xa4*]\xf7\x94yh2\x0e\xcd\xcd\
-\x8c\xa1Nf\x02l6\x9dj\xea\x98\xc9\xcd4\xc1C\
-\xce>\xd5\xa1\xe16\xc3\xd6&\x89\xc9Q\xb0M\x10n\
-[\x94JU\xd2\xb7s\x02\x1a$$\x8cL\x80\xcd\xa5\
-\x12d\xe7B\x05\x090\xf3B\x9e\x14\x0e\xea/r\x0f\
-i\xe4]\x93C\xda#_<\xc8\xc6\xa7}\x19< \
-\xcc\x90n\x93\xf1Mc\x09\x96\xf3\x13\x13\x13\xea\xe2\xc5\
-\x8bq|\x87\x96\xe2\xd6\xbc\x1a}zxjj2\xad\
-\xfb\xde\xbd{j{{o\xab\x97\xef(\x1d=z4\
-~=r\xe4\x88:|\xf8\xb0\xbar\xe5\x8az\xf6\xec\
-YZ\x07\xc2\x17.PF3\x9f\xfc\xf5\x8c\x8d\xe5\xe5\
-\xe5\xccg\x84E\x5c}\xb7\xd1\x97\xf0\xcf\x9c9\x93\x8b\
-\xf1`\x17\xff\xd81\xf36\xec\xcc\xcc\x8c\xba\x7f\xffo\
-4\x00\xaf\xc5\x03\xc1\xcb@P\x10*\x04\x8a\xf8\xcf\x9d\
-;w\xe2A\xb2\x1d\xcd(\x02bH\x10\x10\xce\x18a\
-\xd0qo=H\xba\xadx\xa5\xd9\xae._\xbe\x1c\xb7\
-\xd3\x85l\x938\xbb4\x1cH8\x87\xa4A\xb4-\x9c\
-$x\xcc\xf5\x12\xdd\xe5i\x0c2\xe9\xf8\x0c\xd4\x08\xda\
-\x13b\x98\xa5\xbeG\xa2E \xd4\xef\xf01\x04\x97\xac\
-\x0d\xd7\x7f/\x8b2\xd2S\xaaBB\xdb\xe7\x93\x03\xaf\
-6\xa4\xf3\xd0\xab\xbe/\x05\x93'c:P\xebr\xe5\
-zM\xe88O\xbe\xfcE\x12\x06\x02\x83 \x8d\xae\xbc\
-\x0f\xe5s\xfe\xc9\xa9\x8b\xbet> \xbd\x9f\xfb\xee\xd2\
-\xa5K\xea\x9dw\xdeV\xb7o\xbf\x1b\x1b\xa7\x22\xc6\x08\
-\xba\x19:Z\xebg\xc0\x8d\xb36\xac\x00z\x9b\xa3\x0d\
-1\xd0\xb6\x03\xe0U\x1f\xdf\x0b\xb5#\xc8\x83=\x02\xb4\
-\x07\xaf\xd8\xecy\xf3\xcd_\xca\xcd\xa0\x9d\xc6\xde\xe1\xdf\
-\x9e\xe8\xfb'_\xa81?\x9b\x9c\x9c\xbc&w\xa8\xd0\
-\xe8\x90N\xc2\xc8\x9d={\xd6h\x04\xcb\x06\x9eO\xb7\
-\xfbQj\xdc\xd7\xd7\xd7\xe3\x81\xa1\x19\xee=\xefc\xea\
-\x0f\x09\xfe'Tn\xc9\x5cbH\x145\x98xt\xf1\
-HC=\x85,\xb4\x06\x0d\xda\x00\xd5\xe8\x0b\x87\x88\x94\
-\xd9\xb0\x19\x19$\xc8N\xa8\xce-\xb2\xf0\x19\x05p\x0a\
-\x02&\xd3\x7f(}]\xcaad\x90\x17\xf3\xdc7\x00\
-\xbe\xa0XUpET\x93\xf4[\x83\x08\x0a\xd3\xb7\xc1\
-\xd5\xb4Z\xad\x171\xab\xe51r\x1fR\x0f\xebU+\
-t\xb16\x98\xdcX\xeak>\xb4\x91n$'\x0a\xa4\
-\x01\x87\xe1\xee\xd1\xc6|\x88\xbd\x85\x22N\xc4\xd0\xa0G\
-\x16\x92\xf2\xcd\x9c\x03\x9bh0\x7f\xa1\xaaJ\xb7\xdb}\
-!\xd9\xb7\xfdD\x05t\xe6 %\x12\xfc\x06\xfa\xa7\xaa\
-\x0e5\xf4\xab\xcaq\xac\xf0 \xa6N\xa7\xe3;\xbe^\
-\x88a\x8c\x22\xb6\xe3\xbe\xef\xcb\x04\x1a\xec\xc4\x17_X\
-5\xc4I0\x1e\xc8B>i\x03\xf8\xdfCq\xff\x9d\
-\xe7\xf3\xf9\xf5\x82\x1drE\xdfh6\x9b\xbf\xf7e,\
-Bi\x06\xd7\x01\x8ea\xcc(\xf6\x97\x8dz\xd5\x08\xb8\
-\xf1\xc3\x094_\xe8\xb7\x0c`\xe4\xdf\x7f\xff\x9f\x99(\
-*@$\xd5`Hq\xf8\xeb\x87$x\xef\x0fnT\
-\x95\xcc\x11\x8c\xaa\xfa\xfa\x86?\xb4\xf8\x1dy6\xae\xbf\
-B?0d:\x16\xb2\x17;l\x0c\x8b\xab\x81\xd2\xd3\
-A\xd92\x08\xf8\xbb\xa6\xa1\x02U\x14\x12\x8b*\x93\x91\
-\x09?d\xa1\xf4\xbf\xce\xc8\x84_5\xb0\xca\x1e6\xc3\
-\xf0v\xfaBo\x80\xeb\x10\x84\x86o\xa2\x9bb\xfcz\
-C\x1c\xe7\xffC<(\xfdw\x02\x1c\x1c-o\xb5Z\
-\xed|\xeer\x18\x99\xf0\x11\xbf\xdf\xd3\xb3\xef\xa5qu\
-\xf8\xe7\xf0\xbf\xa5J*\xe8\x93g\xc0\x1a\x01\xe5\xf9Z\
-\x81o\xa6#\x9d>}:vse\xcc~ee%\
-R}\xfe\x9eD\x15h\xaa\x80\x15d\x15S\x99?\xe6\
-7*\xda*\xa0\xa3UL\xb3}\xfchE\x15h\xaa\
-\x80NV9\xad\xec\xfd\x82y\xe9\x0cC\xe7G\xbe\x0c\
-\xfcP\x93F\xebc O\xa3\xb9\x8c(\xdf\x1f\x00\xf2\
-t\x9b\xde'X]]\x0d\xf6\xeb\x97\x97\x97\x9b\xca\xf3\
-\x03HU\xc4\xfact\xd8\xd5\xaa\xca*7\xe0h\xcb\
-\x92\xa9sU'R\xe6\xc7\xd8'\x8f\x91`:\x8d\x96\
-\xa4Mc\xef\xfad\xd0\x8b,\xe3\x99\x16\xb8vUD\
-\x9f\xd740f\xfa\xb2\xea8UN\x91#\xdf\x83d\
-\xcb\xf2\xaf?D*\x9dAo\xa68\x1b\xad\x0d-\x0e\
-M\xe9\xb8>\x081\xacE\x90\x9b\xf4@\x1b\xe0\xbbw\
-\xef\x86\x1a\xdf\xd2eUz\x85\x82\x9ef\x0c\x06E\x9e\
->0!\x8ff\xdb~Y\x90\x9fz\xe8c\xb5<h\
-Y\x95K\xc1\x13`\x95M#=\x89\x5c\x22\xf81\x8c\
-\x05%~\x87\xb8b\x09m[P\x8e\x9f\xf3=\xf0\xcc\
-\xee\xfdO\x13t\xb2\x0a\x03\xf1/J\xd7\xc8\xfe\x94z\
-:\xc1G%\xf4\x18~\xef\xfe\xc9\x93'\xdf\x22#8\
-\x91\xfc\xa6\xce$\xbd\x1e\xd3:\x1c\xc6\xb0W]\xad\xed\
-\x87>v\x0e\xf4\xea\x99\x0c\xfc:\xfe\x99\xe5\xd3\xa7O\
-\xff1>>^\xffC\xcb\x9a\x9a\x9a\x9a\x9a\x9a\x9a\x9a\
-R\xf9/q\xaa\xb1\xb9Y\xc7\x8f\x14\x00\x00\x00\x00I\
-END\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x07o\xb9\xc3\
-\x00p\
-\x00i\x00e\x00c\x00e\x00s\
-\x00\x05\
-\x00g G\
-\x00b\
-\x00K\x00i\x00n\x00g\
-\x00\x07\
-\x07$\xfd4\
-\x00b\
-\x00K\x00n\x00i\x00g\x00h\x00t\
-\x00\x05\
-\x00|\x96[\
-\x00w\
-\x00R\x00o\x00o\x00k\
-\x00\x05\
-\x00gh\xde\
-\x00b\
-\x00P\x00a\x00w\x00n\
-\x00\x07\
-\x06\x90\x9f\xa0\
-\x00b\
-\x00B\x00i\x00s\x00h\x00o\x00p\
-\x00\x05\
-\x00|h\xde\
-\x00w\
-\x00P\x00a\x00w\x00n\
-\x00\x07\
-\x0c$\xfd\x14\
-\x00w\
-\x00K\x00n\x00i\x00g\x00h\x00t\
-\x00\x06\
-\x06x\xbb\xbe\
-\x00b\
-\x00Q\x00u\x00e\x00e\x00n\
-\x00\x07\
-\x0b\x90\x9f\x80\
-\x00w\
-\x00B\x00i\x00s\x00h\x00o\x00p\
-\x00\x05\
-\x00| G\
-\x00w\
-\x00K\x00i\x00n\x00g\
-\x00\x05\
-\x00g\x96[\
-\x00b\
-\x00R\x00o\x00o\x00k\
-\x00\x06\
-\x07\xc8\xbb\xbe\
-\x00w\
-\x00Q\x00u\x00e\x00e\x00n\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x84\x01\xe6\x14,\
-\x00\x00\x00F\x00\x00\x00\x00\x00\x01\x00\x00\x18\x1f\
-\x00\x00\x01\x84\x01\xea,\xdc\
-\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x00\x00Z\xfe\
-\x00\x00\x01\x84\x01\xf0\x1d\xce\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00Q1\
-\x00\x00\x01\x84\x01\xf3>:\
-\x00\x00\x00j\x00\x00\x00\x00\x00\x01\x00\x00%\xf2\
-\x00\x00\x01\x84\x01\xfb\xbb\x99\
-\x00\x00\x006\x00\x00\x00\x00\x00\x01\x00\x00\x11\xf1\
-\x00\x00\x01\x84\x02\x02\xa9D\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x009\xdf\
-\x00\x00\x01\x84\x01\xed\xbf\x8b\
-\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x1dG\
-\x00\x00\x01\x84\x01\xe49\xdc\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x0aH\
-\x00\x00\x01\x84\x01\xe8\x5c\xc5\
-\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00`\x1e\
-\x00\x00\x01\x84\x02\x01\xc0z\
-\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x00F*\
-\x00\x00\x01\x84\x01\xf1\x92\x9d\
-\x00\x00\x00z\x00\x00\x00\x00\x00\x01\x00\x00,\x80\
-\x00\x00\x01\x84\x01\xfa\x18\x99\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,171 @@
+"""Standard algebraic notation (SAN) encoding and decoding.
+
+Both directions look only at the squares involved in the move. The
+pieces that could also reach the target square are found in its
+controlledBy list, so disambiguation doesn't need a move generation.
+Moves must be encoded before they are played on the board, as the
+board is what tells which piece moved and what it captured."""
+from moves import (FILES, CASTLE, EN_PASSANT, PROMOTION, PROMOTION_PIECES,
+                   encodeMove, indexToCoord, moveFrom, moveTo,
+                   promotionPiece, squareIndex)
+
+PIECE_LETTERS = {
+    "King": "K",
+    "Queen": "Q",
+    "Rook": "R",
+    "Bishop": "B",
+    "Knight": "N",
+    "Pawn": "",
+}
+LETTER_PIECES = {"K": "King", "Q": "Queen", "R": "Rook", "B": "Bishop",
+                 "N": "Knight"}
+
+
+class SanError(ValueError):
+    """Raised when a SAN string doesn't name a legal move"""
+
+
+def checkSuffix(checked):
+    """Returns the suffix for a check dict as returned by
+    Position.check()"""
+    if checked["mate"]:
+        return "#"
+    if checked["check"]:
+        return "+"
+    return ""
+
+
+def disambiguate(piece, toSq):
+    """Returns the file, rank or square needed to tell piece apart from
+    other pieces of the same type that can move to toSq"""
+    fromName = piece.square.name
+    sameFile = sameRank = False
+    ambiguous = False
+    for other in toSq.getControllingPieces():
+        if (other is piece or other.pieceName != piece.pieceName
+                or other.isWhite is not piece.isWhite
+                or not other.canMoveTo(toSq)):
+            continue
+        ambiguous = True
+        otherName = other.square.name
+        if otherName[0] == fromName[0]:
+            sameFile = True
+        if otherName[1] == fromName[1]:
+            sameRank = True
+
+    if not ambiguous:
+        return ""
+    if not sameFile:
+        return fromName[0]
+    if not sameRank:
+        return fromName[1]
+    return fromName
+
+
+def sanFromSquares(fromSq, toSq, promotingTo=None):
+    """Returns the SAN of moving the piece on fromSq to toSq, without
+    the check suffix. promotingTo is the name of the piece a pawn
+    promotes to, with or without its color prefix."""
+    piece = fromSq.getPiece()
+    pieceName = piece.pieceName
+    fromCoord, toCoord = fromSq.getCoord(), toSq.getCoord()
+
+    if pieceName == "King" and abs(toCoord[0] - fromCoord[0]) == 2:
+        return "O-O" if toCoord[0] == 6 else "O-O-O"
+
+    if pieceName == "Pawn":
+        if fromCoord[0] != toCoord[0]:  # Pawns only change file on captures
+            san = fromSq.name[0] + "x" + toSq.name
+        else:
+            san = toSq.name
+        if promotingTo is not None:
+            san += "=" + PIECE_LETTERS[promotingTo.lstrip("wb")]
+        return san
+
+    san = PIECE_LETTERS[pieceName] + disambiguate(piece, toSq)
+    if toSq.hasPiece():
+        san += "x"
+    return san + toSq.name
+
+
+def moveToSan(position, move, checked=None):
+    """Returns the SAN of an encoded move on a Position. checked is the
+    check dict after the move, if the suffix should be added."""
+    fromCoord = indexToCoord(moveFrom(move))
+    toCoord = indexToCoord(moveTo(move))
+    san = sanFromSquares(
+        position.squares[fromCoord[0]][fromCoord[1]],
+        position.squares[toCoord[0]][toCoord[1]],
+        promotionPiece(move))
+    if checked is not None:
+        san += checkSuffix(checked)
+    return san
+
+
+def sanToMove(position, san):
+    """Decodes a SAN string into an encoded move for the side to move on
+    a Position"""
+    squares = position.squares
+    isWhite = position.whiteTurn
+    text = san.rstrip("+#!?")
+
+    if text in ("O-O", "0-0", "O-O-O", "0-0-0"):
+        king = position.wKing if isWhite else position.bKing
+        kingCoord = king.square.getCoord()
+        toFile = 6 if len(text) == 3 else 2
+        toSq = squares[toFile][kingCoord[1]]
+        if toSq not in king.castleMoves:
+            raise SanError(f"Illegal move {san}")
+        return encodeMove(squareIndex(kingCoord), squareIndex(toSq.getCoord()),
+                          CASTLE)
+
+    promotion = None
+    if text[-1] in "QRBN" and len(text) > 2:
+        promotion = LETTER_PIECES[text[-1]]
+        text = text[:-2] if text[-2] == "=" else text[:-1]
+
+    try:
+        toCoord = FILES.index(text[-2]), int(text[-1]) - 1
+        toSq = squares[toCoord[0]][toCoord[1]]
+    except (ValueError, IndexError):
+        raise SanError(f"Invalid move {san}") from None
+    toIndex = squareIndex(toCoord)
+
+    if text[0] in LETTER_PIECES:
+        pieceName = LETTER_PIECES[text[0]]
+        hint = text[1:-2].replace("x", "")
+        # The hint is a file, a rank or a square, so it is always part
+        # of the name of the square the piece moves from
+        movers = [piece for piece in toSq.getControllingPieces()
+                  if piece.pieceName == pieceName and piece.isWhite is isWhite
+                  and hint in piece.square.name and piece.canMoveTo(toSq)]
+        if not movers:
+            raise SanError(f"Illegal move {san}")
+        if len(movers) > 1:
+            raise SanError(f"Ambiguous move {san}")
+        return encodeMove(squareIndex(movers[0].square.getCoord()), toIndex)
+
+    # Pawn moves
+    direction = 1 if isWhite else -1
+    if "x" in text:
+        if text[0] not in FILES:
+            raise SanError(f"Invalid move {san}")
+        fromSq = squares[FILES.index(text[0])][toCoord[1] - direction]
+        flag = EN_PASSANT if not toSq.hasPiece() else 0
+    elif 0 < toCoord[1] - direction < 7:
+        fromSq = squares[toCoord[0]][toCoord[1] - direction]
+        if not fromSq.hasPiece() and 0 < toCoord[1] - 2*direction < 7:
+            fromSq = squares[toCoord[0]][toCoord[1] - 2*direction]
+        flag = 0
+    else:
+        raise SanError(f"Illegal move {san}")
+
+    pawn = fromSq.getPiece()
+    if (pawn is None or pawn.pieceName != "Pawn" or pawn.isWhite is not isWhite
+            or toSq not in pawn.getMoves()):
+        raise SanError(f"Illegal move {san}")
+    if promotion is not None:
+        flag = PROMOTION + PROMOTION_PIECES.index(promotion)
+    elif toCoord[1] in (0, 7):
+        raise SanError(f"Missing promotion piece in {san}")
+    return encodeMove(squareIndex(fromSq.getCoord()), toIndex, flag)
@@ -0,0 +1,172 @@
+"""Alpha-beta search on top of the rules engine, without the GUI.
+
+The rules classes can't take a move back, so every node of the tree is
+a Position built from the snapshot of its parent with one move played
+on it. What a node needs (its legal moves, whether the side to move is
+in check and its evaluation) is kept by snapshot, so the deeper
+iterations of iterative deepening and transpositions don't rebuild it.
+
+Scores are in centipawns from the point of view of the side to move.
+A forced mate scores MATE_SCORE minus the plies to the mate. The search
+doesn't know the fifty move rule or repetitions, as snapshots don't
+keep them."""
+import threading
+import time
+from analysis import MOBILITY_VALUE, PIECE_VALUES
+from moves import indexToCoord, moveTo, promotionPiece
+from position import Position
+
+MATE_SCORE = 100000
+INFINITY = MATE_SCORE + 1
+MAX_DEPTH = 64
+# Nodes kept before the cache is cleared, around 1 KB each
+MAX_CACHED_NODES = 200000
+
+
+class SearchStopped(Exception):
+    """Unwinds the search when it is stopped"""
+
+
+def evaluate(position):
+    """Material and mobility balance of a Position in centipawns,
+    positive when white is better"""
+    evaluation = 0
+    for piece in position.pieces:
+        if piece.captured:
+            continue
+        value = PIECE_VALUES[piece.pieceName] + MOBILITY_VALUE * len(piece.moves)
+        evaluation += value if piece.isWhite else -value
+    return evaluation
+
+
+def isMateScore(score):
+    return abs(score) > MATE_SCORE - MAX_DEPTH - 1
+
+
+class Search:
+    """Searches the best move of the position of a snapshot.
+
+    run() deepens the search one ply at a time until maxDepth, the
+    deadline or maxNodes is reached, or stopEvent is set. stopEvent is
+    polled at every node, so another thread can stop the search at any
+    time. onIteration(depth, score, nodes, pv) is called after every
+    completed depth."""
+
+    def __init__(self, snapshot, stopEvent=None, onIteration=None):
+        self.snapshot = snapshot
+        self.stopEvent = stopEvent if stopEvent is not None else threading.Event()
+        self.onIteration = onIteration
+        self.deadline = None
+        self.maxNodes = None
+        self.nodes = 0
+        # {snapshot: (moves ordered by capture, in check, evaluation)}
+        self.nodeInfo = {}
+        # {(snapshot, move): snapshot after the move}
+        self.children = {}
+        # {snapshot: best move found by the previous iterations}
+        self.bestMoves = {}
+
+    def run(self, maxDepth=MAX_DEPTH, moveTime=None, maxNodes=None):
+        """Returns (best move, score, pv) of the deepest completed
+        iteration. The best move is None when there are no legal
+        moves. moveTime is in seconds."""
+        self.nodes = 0
+        self.maxNodes = maxNodes
+        self.deadline = None if moveTime is None else time.monotonic() + moveTime
+        moves, inCheck, evaluation = self.expand(self.snapshot)
+        if not moves:
+            return None, -MATE_SCORE if inCheck else 0, []
+        bestMove, bestScore, bestPv = moves[0], evaluation, [moves[0]]
+        for depth in range(1, maxDepth + 1):
+            try:
+                score, pv = self.negamax(self.snapshot, depth, -INFINITY,
+                                         INFINITY, 0)
+            except SearchStopped:
+                break
+            bestMove, bestScore, bestPv = pv[0], score, pv
+            if self.onIteration is not None:
+                self.onIteration(depth, score, self.nodes, pv)
+            if isMateScore(score):
+                break  # Deeper searches find the same mate
+        return bestMove, bestScore, bestPv
+
+    def checkStop(self):
+        if (self.stopEvent.is_set()
+                or (self.deadline is not None and time.monotonic() > self.deadline)
+                or (self.maxNodes is not None and self.nodes >= self.maxNodes)):
+            raise SearchStopped
+
+    def negamax(self, snapshot, depth, alpha, beta, ply):
+        """Returns (score, pv) of a node"""
+        self.checkStop()
+        self.nodes += 1
+        moves, inCheck, evaluation = self.expand(snapshot)
+        if not moves:
+            return (-MATE_SCORE + ply if inCheck else 0), []
+        if depth == 0:
+            return evaluation, []
+
+        bestScore, bestPv = -INFINITY, []
+        for move in self.orderMoves(snapshot, moves):
+            score, pv = self.negamax(self.child(snapshot, move), depth - 1,
+                                     -beta, -alpha, ply + 1)
+            score = -score
+            if score > bestScore:
+                bestScore, bestPv = score, [move] + pv
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+        self.bestMoves[snapshot] = bestPv[0]
+        return bestScore, bestPv
+
+    def orderMoves(self, snapshot, moves):
+        """The best move of the previous iteration first, the others are
+        already ordered by capture"""
+        best = self.bestMoves.get(snapshot)
+        if best is None:
+            return moves
+        return [best] + [move for move in moves if move != best]
+
+    def expand(self, snapshot):
+        """Returns the node info of a snapshot"""
+        info = self.nodeInfo.get(snapshot)
+        if info is None:
+            info = self.addNode(snapshot, Position(snapshot))
+        return info
+
+    def child(self, snapshot, move):
+        """Returns the snapshot after move, building its node"""
+        child = self.children.get((snapshot, move))
+        if child is None:
+            position = Position(snapshot)
+            position.playMove(move)
+            child = position.snapshot()
+            self.children[(snapshot, move)] = child
+            if child not in self.nodeInfo:
+                self.addNode(child, position)
+        return child
+
+    def addNode(self, snapshot, position):
+        if len(self.nodeInfo) >= MAX_CACHED_NODES:
+            self.nodeInfo.clear()
+            self.children.clear()
+            self.bestMoves.clear()
+
+        def captureValue(move):
+            coord = indexToCoord(moveTo(move))
+            target = position.squares[coord[0]][coord[1]].getPiece()
+            value = PIECE_VALUES[target.pieceName] if target is not None else 0
+            promotion = promotionPiece(move)
+            if promotion is not None:
+                value += PIECE_VALUES[promotion]
+            return value
+
+        # Ties keep the order of the codes, the order the pieces give
+        # their moves in isn't the same every run
+        moves = sorted(position.getLegalMoves(),
+                       key=lambda move: (-captureValue(move), move))
+        evaluation = evaluate(position)
+        info = (moves, position.lastCheck["check"],
+                evaluation if position.whiteTurn else -evaluation)
+        self.nodeInfo[snapshot] = info
+        return info
@@ -0,0 +1,164 @@
+"""Compact snapshots of a position.
+
+A snapshot is 34 bytes:
+
+    bytes 0-31  pieces, one nibble per square (a1 is the low nibble of
+                byte 0, h8 the high nibble of byte 31)
+    byte 32     bit 0 set if white is to move, bits 1-4 castling rights
+                (white kingside, white queenside, black kingside, black
+                queenside)
+    byte 33     index of the en passant square, or 0xFF if there is none
+
+Piece nibbles are 1-6 for white pawn, knight, bishop, rook, queen and
+king, and the same plus 8 for black pieces.
+
+Snapshots can also be read from and written to FEN strings."""
+from collections import namedtuple
+from moves import indexToSquareName, squareNameToIndex
+
+PIECE_NAMES = ("Pawn", "Knight", "Bishop", "Rook", "Queen", "King")
+BLACK = 8
+NO_EN_PASSANT = 0xFF
+SNAPSHOT_SIZE = 34
+
+WHITE_TO_MOVE = 1
+CASTLING_BITS = (("K", 2), ("Q", 4), ("k", 8), ("q", 16))
+
+FEN_LETTERS = {"Pawn": "P", "Knight": "N", "Bishop": "B", "Rook": "R",
+               "Queen": "Q", "King": "K"}
+LETTER_NAMES = {letter: name for name, letter in FEN_LETTERS.items()}
+
+Snapshot = namedtuple("Snapshot", "placement whiteTurn castling epSquare")
+Snapshot.__doc__ = """Decoded snapshot. placement maps square indexes to
+piece names with their color prefix (eg. {0: "wRook", ...}), castling is
+a FEN castling string (eg. "KQkq") and epSquare is a square index or
+None."""
+
+
+def pieceCode(pieceName, isWhite):
+    return PIECE_NAMES.index(pieceName) + 1 + (0 if isWhite else BLACK)
+
+
+def encodeSnapshot(placement, whiteTurn=True, castling="", epSquare=None):
+    """Packs a position into a snapshot. placement maps square indexes
+    to piece names with their color prefix."""
+    nibbles = [0] * 64
+    for index, piece in placement.items():
+        nibbles[index] = pieceCode(piece[1:], piece[0] == "w")
+
+    flags = WHITE_TO_MOVE if whiteTurn else 0
+    for right, bit in CASTLING_BITS:
+        if right in castling:
+            flags |= bit
+
+    data = bytearray(nibbles[i] | (nibbles[i + 1] << 4) for i in range(0, 64, 2))
+    data.append(flags)
+    data.append(NO_EN_PASSANT if epSquare is None else epSquare)
+    return bytes(data)
+
+
+def decodeSnapshot(data):
+    """Unpacks a snapshot into a Snapshot tuple"""
+    placement = {}
+    for i in range(32):
+        byte = data[i]
+        for index, code in ((2*i, byte & 0xF), (2*i + 1, byte >> 4)):
+            if code:
+                color = "b" if code & BLACK else "w"
+                placement[index] = color + PIECE_NAMES[(code & 7) - 1]
+
+    flags = data[32]
+    castling = "".join(right for right, bit in CASTLING_BITS if flags & bit)
+    epSquare = None if data[33] == NO_EN_PASSANT else data[33]
+    return Snapshot(placement, bool(flags & WHITE_TO_MOVE), castling, epSquare)
+
+
+def startingPlacement():
+    placement = {}
+    backRank = ("Rook", "Knight", "Bishop", "Queen", "King", "Bishop",
+                "Knight", "Rook")
+    for file, piece in enumerate(backRank):
+        placement[file] = "w" + piece
+        placement[8 + file] = "wPawn"
+        placement[48 + file] = "bPawn"
+        placement[56 + file] = "b" + piece
+    return placement
+
+
+STARTING_SNAPSHOT = encodeSnapshot(startingPlacement(), True, "KQkq")
+
+
+class FenError(ValueError):
+    """Raised for a FEN string that can't be read"""
+
+
+def snapshotFromFen(fen):
+    """Packs the position of a FEN string into a snapshot. The move
+    counters are ignored, and the fields after the placement can be
+    left out (white to move, no castling, no en passant)."""
+    fields = fen.split()
+    if not fields:
+        raise FenError("Empty FEN")
+    ranks = fields[0].split("/")
+    if len(ranks) != 8:
+        raise FenError(f"FEN placement needs 8 ranks: {fen!r}")
+
+    placement = {}
+    for row, rankText in enumerate(ranks):
+        rank = 7 - row
+        file = 0
+        for char in rankText:
+            if char.isdigit():
+                file += int(char)
+            elif char.upper() in LETTER_NAMES:
+                if file > 7:
+                    raise FenError(
+                        f"Rank {rank + 1} has more than 8 squares: {fen!r}")
+                color = "w" if char.isupper() else "b"
+                placement[file + 8*rank] = color + LETTER_NAMES[char.upper()]
+                file += 1
+            else:
+                raise FenError(f"Unknown piece {char!r} in FEN {fen!r}")
+        if file != 8:
+            raise FenError(f"Rank {rank + 1} doesn't have 8 squares: {fen!r}")
+
+    turn = fields[1] if len(fields) > 1 else "w"
+    if turn not in ("w", "b"):
+        raise FenError(f"Unknown side to move {turn!r} in FEN {fen!r}")
+    castling = fields[2] if len(fields) > 2 else "-"
+    if castling != "-" and not set(castling) <= set("KQkq"):
+        raise FenError(f"Unknown castling rights {castling!r} in FEN {fen!r}")
+    ep = fields[3] if len(fields) > 3 else "-"
+    # An en passant square can only be on the third or sixth rank
+    if ep != "-" and (len(ep) != 2 or ep[0] not in "abcdefgh"
+                      or ep[1] not in "36"):
+        raise FenError(f"Unknown en passant square {ep!r} in FEN {fen!r}")
+    epSquare = None if ep == "-" else squareNameToIndex(ep)
+
+    return encodeSnapshot(placement, turn == "w", castling.strip("-"), epSquare)
+
+
+def snapshotToFen(data, halfmoves=0, fullmoves=1):
+    """Returns the FEN string of a snapshot"""
+    snapshot = decodeSnapshot(data)
+    ranks = []
+    for rank in range(7, -1, -1):
+        text = ""
+        empty = 0
+        for file in range(8):
+            piece = snapshot.placement.get(file + 8*rank)
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                text += str(empty)
+                empty = 0
+            letter = FEN_LETTERS[piece[1:]]
+            text += letter if piece[0] == "w" else letter.lower()
+        if empty:
+            text += str(empty)
+        ranks.append(text)
+
+    ep = "-" if snapshot.epSquare is None else indexToSquareName(snapshot.epSquare)
+    return " ".join(("/".join(ranks), "w" if snapshot.whiteTurn else "b",
+                     snapshot.castling or "-", ep, str(halfmoves), str(fullmoves)))
@@ -1,9 +1,5 @@
 """Class that determines whether some of chess' special moves are legal"""
 from squares import Squares
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QSizePolicy
-from PySide6.QtCore import QSize
-from PySide6.QtGui import QIcon
-import resources
 
 class Castle:
 
@@ -41,50 +37,46 @@ class Castle:
 
     @classmethod
     def canCastle(cls, king):
+        """Returns the squares the king can castle to. The squares
+        between the king and the rook must be empty, and the king can't
+        castle out of, through or into check."""
         moves = []
+        if king.isChecked():
+            return moves
 
         squares = Squares.getSquares()
+        kingCoord = king.square.getCoord()
+        rank = kingCoord[1]
         if king.isWhite:
-            kingCoord = king.square.getCoord()
-            # Check if king can castle queenside
-            if not cls.wRook0.moved:  # If rook hasn't moved
-                for i in range(1, 4):
-                    sq = squares[kingCoord[0]-i][kingCoord[1]]
-                    if sq.hasPiece() or (not king.canMoveTo(sq)):
-                        break
-                else:
-                    moves.append(squares[2][0])  # square on 'c1'
-
-            # Check if king can castle kingside
-            if not cls.wRook1.moved:  # If rook hasn't moved
-                for i in range(1, 3):
-                    sq = squares[kingCoord[0]+i][kingCoord[1]]
-                    if sq.hasPiece() or (not king.canMoveTo(sq)):
-                        break
-                else:
-                    moves.append(squares[6][0])  # square on 'g1'
+            queensideRook, kingsideRook = cls.wRook0, cls.wRook1
         else:
-            kingCoord = king.square.getCoord()
-            # Check if king can castle queenside
-            if not cls.bRook0.moved:  # If rook hasn't moved
-                for i in range(1, 4):
-                    sq = squares[kingCoord[0]-i][kingCoord[1]]
-                    if sq.hasPiece() or (not king.canMoveTo(sq)):
-                        break
-                else:
-                    moves.append(squares[2][7])  # square on 'c8'
-
-            # Check if king can castle kingside
-            if not cls.bRook1.moved:  # If rook hasn't moved
-                for i in range(1, 3):
-                    sq = squares[kingCoord[0]+i][kingCoord[1]]
-                    if sq.hasPiece() or (not king.canMoveTo(sq)):
-                        break
-                else:
-                    moves.append(squares[6][7])  # square on 'g8'
+            queensideRook, kingsideRook = cls.bRook0, cls.bRook1
+
+        # Check if king can castle queenside
+        if cls.rookCanCastle(queensideRook):  # If rook hasn't moved
+            for i in range(1, 4):
+                sq = squares[kingCoord[0]-i][rank]
+                if sq.hasPiece() or (
+                        i < 3 and sq.isControlledByOppositeColor(king)):
+                    break
+            else:
+                moves.append(squares[2][rank])  # square on 'c1' or 'c8'
+
+        # Check if king can castle kingside
+        if cls.rookCanCastle(kingsideRook):  # If rook hasn't moved
+            for i in range(1, 3):
+                sq = squares[kingCoord[0]+i][rank]
+                if sq.hasPiece() or sq.isControlledByOppositeColor(king):
+                    break
+            else:
+                moves.append(squares[6][rank])  # square on 'g1' or 'g8'
 
         return moves
 
+    @staticmethod
+    def rookCanCastle(rook):
+        return rook is not None and not (rook.moved or rook.captured)
+
 
 class EnPassant:
 
@@ -98,6 +90,8 @@ class EnPassant:
         squares = Squares.getSquares()
         coord = square.getCoord()
         cls.take = square
+        # Only the last double step can be taken
+        cls.canTakeEnPassant = []
         if isWhite:
             cls.resetOnWhiteTurn = False
         else:
@@ -131,52 +125,40 @@ class EnPassant:
             cls.canTakeEnPassant = []
             cls.move = None
 
-
-class Promotion():
-
     @classmethod
-    def getPromotionDialog(cls, isWhite, promoteToFunc):
-        dialog = QWidget()
-        layout = QHBoxLayout()
-
-        queenButton = QPushButton()
-        rookButton = QPushButton()
-        knightButton = QPushButton()
-        bishopButton = QPushButton()
-
-        queenButton.clicked.connect(lambda: promoteToFunc("Queen"))
-        rookButton.clicked.connect(lambda: promoteToFunc("Rook"))
-        knightButton.clicked.connect(lambda: promoteToFunc("Knight"))
-        bishopButton.clicked.connect(lambda: promoteToFunc("Bishop"))
-
-        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        queenButton.setSizePolicy(sizePolicy)
-        rookButton.setSizePolicy(sizePolicy)
-        knightButton.setSizePolicy(sizePolicy)
-        bishopButton.setSizePolicy(sizePolicy)
-
-        layout.addWidget(queenButton)
-        layout.addWidget(rookButton)
-        layout.addWidget(knightButton)
-        layout.addWidget(bishopButton)
-
-        dialog.setLayout(layout)
-
-        iconSize = QSize(100, 100)
-        queenButton.setIconSize(iconSize)
-        rookButton.setIconSize(iconSize)
-        knightButton.setIconSize(iconSize)
-        bishopButton.setIconSize(iconSize)
-
-        if isWhite:
-            queenButton.setIcon(QIcon(":pieces\\wQueen"))
-            rookButton.setIcon(QIcon(":pieces\\wRook"))
-            knightButton.setIcon(QIcon(":pieces\\wKnight"))
-            bishopButton.setIcon(QIcon(":pieces\\wBishop"))
-        else:
-            queenButton.setIcon(QIcon(":pieces\\bQueen"))
-            rookButton.setIcon(QIcon(":pieces\\bRook"))
-            knightButton.setIcon(QIcon(":pieces\\bKnight"))
-            bishopButton.setIcon(QIcon(":pieces\\bBishop"))
+    def moveFor(cls, pawn):
+        """Returns the square pawn can take en passant on, or None.
+        Pins and checks are left to Piece.getMoves(), except for the
+        pin along the rank both pawns leave at once."""
+        if pawn.square not in cls.canTakeEnPassant:
+            return None
+        taken = cls.take.getPiece()
+        if taken is None or taken.isWhite is pawn.isWhite:
+            return None
+        if cls.exposesKing(pawn):
+            return None
+        return cls.move
 
-        return dialog
\ No newline at end of file
+    @classmethod
+    def exposesKing(cls, pawn):
+        """Whether taking would leave the pawn's king on the same rank
+        as an enemy rook or queen with nothing left between them"""
+        squares = Squares.getSquares()
+        file, rank = pawn.square.getCoord()
+        ends = []
+        for step in (-1, 1):
+            i = file + step
+            while 0 <= i <= 7:
+                sq = squares[i][rank]
+                if sq.hasPiece() and sq is not cls.take:
+                    ends.append(sq.getPiece())
+                    break
+                i += step
+        if len(ends) != 2:
+            return False
+        for king, other in (ends, ends[::-1]):
+            if (king.pieceName == "King" and king.isWhite is pawn.isWhite
+                    and other.isWhite is not pawn.isWhite
+                    and other.pieceName in ("Rook", "Queen")):
+                return True
+        return False
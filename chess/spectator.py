@@ -0,0 +1,412 @@
+"""Delta stream of a game for spectator boards.
+
+Instead of the whole board, every move is sent as a delta: the pieces
+moved, captured and added by a promotion, and the squares whose
+controlling pieces changed, and the pins that changed. A
+spectator that joins late gets the latest keyframe (the whole board)
+and the deltas played since, like the snapshots of timeline.py.
+
+Pieces are identified by their index in Position.pieces, which only
+grows (promotions are appended). Frames (all integers little endian):
+
+    frame       length:u16 type:u8 body        length counts type and body
+    KEYFRAME    ply:u16 snapshot:34 checkFlags:u8
+                pieceCount:u8 (id:u8 code:u8 square:u8)...
+                controlCount:u8 (square:u8 n:u8 ids:u8...)...
+                pinCount:u8 (pinned:u8 pinner:u8)...
+    DELTA       ply:u16 move:u16 checkFlags:u8
+                movedCount:u8 (id:u8 square:u8)...
+                capturedCount:u8 id:u8...
+                addedCount:u8 (id:u8 code:u8 square:u8)...
+                controlCount:u8 (square:u8 n:u8 ids:u8...)...
+                pinCount:u8 (pinned:u8 pinner:u8)...
+
+Piece codes are the ones of snapshot.py, squares are indexed like move
+codes (a1 = 0), and a pin whose pinner is NO_PIECE was removed. A
+keyframe lists only the squares controlled by a piece and the pins
+in place.
+
+    python spectator.py serve (--pgn FILE | --record FILE) [--game N]
+        [--port N | --unix PATH] [--delay SECONDS]
+    python spectator.py watch [--port N | --unix PATH]"""
+import argparse
+import asyncio
+import struct
+import sys
+from moves import squareIndex
+from snapshot import PIECE_NAMES, SNAPSHOT_SIZE, pieceCode
+
+KEYFRAME = 1
+DELTA = 2
+
+NO_PIECE = 0xFF
+CHECK = 1
+MATE = 2
+# Plies between keyframes, late joiners replay at most this many deltas
+KEYFRAME_INTERVAL = 16
+# Bytes waiting to be sent to a subscriber before it stops getting
+# deltas. It gets a keyframe once it has caught up.
+MAX_BUFFER = 64 * 1024
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+
+FRAME_HEADER = struct.Struct("<HB")
+KEYFRAME_HEADER = struct.Struct(f"<H{SNAPSHOT_SIZE}sB")
+DELTA_HEADER = struct.Struct("<HHB")
+
+
+class DeltaEncoder:
+    """Encodes the frames of a Position. keyframe() and delta() are
+    called on the thread that plays the moves."""
+
+    def __init__(self, position):
+        self.position = position
+        self.ply = 0
+        # {piece: id}
+        self.ids = {}
+        # Published state: square of every piece id (NO_PIECE once
+        # captured), ids controlling each square, {pinned id: pinner id}
+        self.squares = []
+        self.control = [()] * 64
+        self.pins = {}
+
+    def readState(self):
+        """Returns the (squares, control, pins) of the position"""
+        position = self.position
+        position.activate()
+        ids = self.ids
+        for piece in position.pieces[len(ids):]:
+            ids[piece] = len(ids)
+
+        squares = [NO_PIECE if piece.captured else squareIndex(piece.square.getCoord())
+                   for piece in position.pieces]
+        control = [()] * 64
+        for file in position.squares:
+            for sq in file:
+                controlledBy = sq.getControllingPieces()
+                if controlledBy:
+                    control[squareIndex(sq.getCoord())] = tuple(
+                        sorted(ids[piece] for piece in controlledBy))
+        pins = {ids[piece.pinning]: ids[piece] for piece in position.pieces
+                if not piece.captured and piece.pinning is not None}
+        return squares, control, pins
+
+    def checkFlags(self):
+        lastCheck = self.position.lastCheck
+        return (CHECK if lastCheck["check"] else 0) | (MATE if lastCheck["mate"] else 0)
+
+    def keyframe(self):
+        """Returns the keyframe of the position and makes it the state
+        the next delta is taken from"""
+        self.squares, self.control, self.pins = self.readState()
+        pieces = self.position.pieces
+        body = bytearray(KEYFRAME_HEADER.pack(
+            self.ply, self.position.snapshot(), self.checkFlags()))
+
+        live = [(i, square) for i, square in enumerate(self.squares)
+                if square != NO_PIECE]
+        body.append(len(live))
+        for i, square in live:
+            body += bytes((i, pieceCode(pieces[i].pieceName, pieces[i].isWhite),
+                           square))
+        encodeControl(body, [(index, ids) for index, ids in enumerate(self.control)
+                             if ids])
+        encodePins(body, self.pins.items())
+        return frame(KEYFRAME, body)
+
+    def delta(self, move):
+        """Returns the delta of the move just played"""
+        squares, control, pins = self.readState()
+        pieces = self.position.pieces
+        self.ply += 1
+        body = bytearray(DELTA_HEADER.pack(self.ply, move, self.checkFlags()))
+
+        previous = self.squares
+        moved = [(i, squares[i]) for i in range(len(previous))
+                 if squares[i] != previous[i] and squares[i] != NO_PIECE]
+        captured = [i for i in range(len(previous))
+                    if squares[i] == NO_PIECE and previous[i] != NO_PIECE]
+        added = [(i, pieceCode(pieces[i].pieceName, pieces[i].isWhite), squares[i])
+                 for i in range(len(previous), len(squares))
+                 if squares[i] != NO_PIECE]
+        body.append(len(moved))
+        for i, square in moved:
+            body += bytes((i, square))
+        body.append(len(captured))
+        body += bytes(captured)
+        body.append(len(added))
+        for piece in added:
+            body += bytes(piece)
+
+        encodeControl(body, [(index, ids) for index, ids in enumerate(control)
+                             if ids != self.control[index]])
+        changedPins = [(pinned, pinner) for pinned, pinner in pins.items()
+                       if self.pins.get(pinned) != pinner]
+        changedPins += [(pinned, NO_PIECE) for pinned in self.pins
+                        if pinned not in pins]
+        encodePins(body, changedPins)
+
+        self.squares, self.control, self.pins = squares, control, pins
+        return frame(DELTA, body)
+
+
+def frame(frameType, body):
+    return FRAME_HEADER.pack(len(body) + 1, frameType) + body
+
+
+def encodeControl(body, squares):
+    body.append(len(squares))
+    for index, ids in squares:
+        body += bytes((index, len(ids)))
+        body += bytes(ids)
+
+
+def encodePins(body, pins):
+    pins = list(pins)
+    body.append(len(pins))
+    for pinned, pinner in pins:
+        body += bytes((pinned, pinner))
+
+
+class SpectatorBoard:
+    """Board of a spectator, kept up to date by applying frames"""
+
+    def __init__(self):
+        self.ply = None
+        self.move = None
+        self.check = self.mate = False
+        # {id: [piece code, square]} of the pieces on the board
+        self.pieces = {}
+        self.control = [()] * 64
+        self.pins = {}
+
+    def apply(self, frameType, body):
+        """Applies a frame without its length. Returns False for a delta
+        that doesn't follow the current ply, which needs a keyframe
+        first."""
+        if frameType == KEYFRAME:
+            self.ply, _, flags = KEYFRAME_HEADER.unpack_from(body)
+            offset = KEYFRAME_HEADER.size
+            self.pieces = {}
+            for _ in range(body[offset]):
+                pieceId, code, square = body[offset + 1:offset + 4]
+                self.pieces[pieceId] = [code, square]
+                offset += 3
+            offset += 1
+            self.control = [()] * 64
+            self.pins = {}
+        elif frameType == DELTA:
+            ply, self.move, flags = DELTA_HEADER.unpack_from(body)
+            if self.ply is None or ply != self.ply + 1:
+                return False
+            self.ply = ply
+            offset = DELTA_HEADER.size
+            for _ in range(body[offset]):
+                self.pieces[body[offset + 1]][1] = body[offset + 2]
+                offset += 2
+            offset += 1
+            count = body[offset]
+            for pieceId in body[offset + 1:offset + 1 + count]:
+                del self.pieces[pieceId]
+            offset += 1 + count
+            for _ in range(body[offset]):
+                pieceId, code, square = body[offset + 1:offset + 4]
+                self.pieces[pieceId] = [code, square]
+                offset += 3
+            offset += 1
+        else:
+            raise ValueError(f"Unknown frame type {frameType}")
+
+        self.check, self.mate = bool(flags & CHECK), bool(flags & MATE)
+        for _ in range(body[offset]):
+            index, count = body[offset + 1], body[offset + 2]
+            self.control[index] = tuple(body[offset + 3:offset + 3 + count])
+            offset += 2 + count
+        offset += 1
+        for _ in range(body[offset]):
+            pinned, pinner = body[offset + 1], body[offset + 2]
+            if pinner == NO_PIECE:
+                self.pins.pop(pinned, None)
+            else:
+                self.pins[pinned] = pinner
+            offset += 2
+        return True
+
+    def placement(self):
+        """Returns {square index: piece name with its color}, like
+        snapshot.decodeSnapshot()"""
+        placement = {}
+        for code, square in self.pieces.values():
+            color = "b" if code & 8 else "w"
+            placement[square] = color + PIECE_NAMES[(code & 7) - 1]
+        return placement
+
+
+async def readFrames(reader):
+    """Yields (type, body) of the frames of a stream until it ends"""
+    while True:
+        try:
+            header = await reader.readexactly(FRAME_HEADER.size)
+        except asyncio.IncompleteReadError:
+            return
+        length, frameType = FRAME_HEADER.unpack(header)
+        yield frameType, await reader.readexactly(length - 1)
+
+
+class SpectatorHub:
+    """Fans the frames of a game out to subscribers. A subscriber is an
+    asyncio StreamWriter, from a socket or a pipe. Methods are called
+    on the event loop."""
+
+    def __init__(self, maxBuffer=MAX_BUFFER):
+        self.maxBuffer = maxBuffer
+        self.keyframe = None
+        # Deltas since the keyframe
+        self.deltas = []
+        self.subscribers = set()
+        # Subscribers that fell behind and wait for a keyframe
+        self.lagging = set()
+
+    def setKeyframe(self, keyframe):
+        """Stores the keyframe late joiners start from, without sending
+        it"""
+        self.keyframe = keyframe
+        self.deltas = []
+
+    def publish(self, delta):
+        self.deltas.append(delta)
+        for writer in list(self.subscribers):
+            if writer.is_closing():
+                self.unsubscribe(writer)
+            elif writer in self.lagging:
+                if writer.transport.get_write_buffer_size() <= self.maxBuffer // 2:
+                    self.lagging.discard(writer)
+                    self.sendHistory(writer)
+            elif writer.transport.get_write_buffer_size() > self.maxBuffer:
+                self.lagging.add(writer)
+            else:
+                writer.write(delta)
+
+    def sendHistory(self, writer):
+        if self.keyframe is not None:
+            writer.write(self.keyframe + b"".join(self.deltas))
+
+    def subscribe(self, writer):
+        self.sendHistory(writer)
+        self.subscribers.add(writer)
+
+    def unsubscribe(self, writer):
+        self.subscribers.discard(writer)
+        self.lagging.discard(writer)
+
+    async def handleConnection(self, reader, writer):
+        self.subscribe(writer)
+        try:
+            # Spectators don't send anything, wait for them to leave
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            self.unsubscribe(writer)
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unixPath=None):
+        """Returns the asyncio server accepting spectators"""
+        if unixPath is not None:
+            return await asyncio.start_unix_server(self.handleConnection, unixPath)
+        return await asyncio.start_server(self.handleConnection, host, port)
+
+
+class SpectatorPublisher:
+    """Publishes the moves played on a Position to a SpectatorHub.
+    Called on the hub's event loop."""
+
+    def __init__(self, position, hub, keyframeInterval=KEYFRAME_INTERVAL):
+        self.encoder = DeltaEncoder(position)
+        self.hub = hub
+        self.keyframeInterval = keyframeInterval
+        hub.setKeyframe(self.encoder.keyframe())
+
+    def moved(self, move):
+        """Publishes the move just played on the position"""
+        self.hub.publish(self.encoder.delta(move))
+        if self.encoder.ply % self.keyframeInterval == 0:
+            self.hub.setKeyframe(self.encoder.keyframe())
+
+
+def readGame(args):
+    """Returns (snapshot the game starts from, moves)"""
+    from game_record import (GameRecordReader, pgnGameToMoves, readPgnGames,
+                             startSnapshot)
+    if args.record:
+        with GameRecordReader(args.record) as reader:
+            game = reader.getGame(args.game)
+            return startSnapshot(game.tags.get("FEN")), list(game.moves)
+    with open(args.pgn) as file:
+        for i, (tags, sanMoves, _) in enumerate(readPgnGames(file)):
+            if i == args.game:
+                fen = tags.get("FEN")
+                return startSnapshot(fen), list(pgnGameToMoves(sanMoves, fen))
+    raise ValueError(f"{args.pgn} has no game {args.game}")
+
+
+async def serveGame(args):
+    from position import Position
+    snapshot, moves = readGame(args)
+    hub = SpectatorHub()
+    server = await hub.serve(port=args.port, unixPath=args.unix)
+    print(f"Serving {len(moves)} plies on "
+          f"{args.unix or f'{DEFAULT_HOST}:{args.port}'}")
+    position = Position(snapshot)
+    publisher = SpectatorPublisher(position, hub)
+    for move in moves:
+        await asyncio.sleep(args.delay)
+        position.playMove(move)
+        publisher.moved(move)
+    # Late joiners can still watch the end of the game
+    await server.serve_forever()
+
+
+async def watch(args):
+    from moves import moveToUci
+    if args.unix is not None:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(DEFAULT_HOST, args.port)
+    board = SpectatorBoard()
+    async for frameType, body in readFrames(reader):
+        board.apply(frameType, body)
+        if frameType == KEYFRAME:
+            print(f"ply {board.ply}: keyframe, {len(body) + FRAME_HEADER.size} bytes")
+        else:
+            print(f"ply {board.ply}: {moveToUci(board.move)}, "
+                  f"{len(body) + FRAME_HEADER.size} bytes"
+                  + (", mate" if board.mate else ", check" if board.check else ""))
+    writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a game to spectators")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="replay a game to spectators")
+    source = serve.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pgn")
+    source.add_argument("--record", help="game record archive")
+    serve.add_argument("--game", type=int, default=0)
+    serve.add_argument("--delay", type=float, default=0.5,
+                       help="seconds between moves")
+    watchParser = commands.add_parser("watch", help="print a streamed game")
+    for command in (serve, watchParser):
+        command.add_argument("--port", type=int, default=DEFAULT_PORT)
+        command.add_argument("--unix", help="unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serveGame(args) if args.command == "serve" else watch(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
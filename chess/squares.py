@@ -8,4 +8,73 @@ class Squares:
 
     @classmethod
     def getSquares(cls):
-        return cls.squares
\ No newline at end of file
+        return cls.squares
+
+
+class Square:
+    """A detailed representation of a square that will hold
+    info about the square's state"""
+
+    def __init__(self, coord, name):
+        self.name = name
+        self.piece = None
+        self.trackedBy = []
+        self.controlledBy = []
+        self.pinned = False
+        self.coord = coord
+
+    def setPiece(self, piece, init=False):
+        """Sets a piece to this square. If there was already a piece,
+        and the piece param is not None, the piece on this square is 
+        captured and their getCaptured() method is called."""
+        if (self.piece is not None) and (piece is not None):
+            self.piece.getCaptured()
+
+        self.piece = piece
+        # Don't update squares when initializing the pieces on their
+        # initial positions
+        if (not init) and (piece is not None):
+            self.piece.updateSquares()
+
+    def addTrackingPiece(self, piece):
+        self.trackedBy.append(piece)
+
+    def removeTrackingPiece(self, piece):
+        indexToRemove = self.trackedBy.index(piece)
+        del self.trackedBy[indexToRemove]
+
+    def getTrackingPieces(self):
+        return self.trackedBy
+
+    def addControllingPiece(self, piece):
+        self.controlledBy.append(piece)
+    
+    def getControllingPieces(self):
+        return self.controlledBy
+    
+    def removeControllingPiece(self, piece):
+        indexToRemove = self.controlledBy.index(piece)
+        del self.controlledBy[indexToRemove]
+
+    def isControlledByOppositeColor(self, piece):
+        for controllingPiece in self.controlledBy:
+            if controllingPiece.isOppositeColorAs(piece):
+                return True
+        return False
+
+    def getCoord(self):
+        return self.coord
+
+    def hasPiece(self):
+        if self.piece is not None:
+            return True
+        return False
+
+    def getPiece(self):
+        return self.piece
+
+    def __str__(self):
+        return self.name
+    
+    def __repr__(self):
+        return self.name
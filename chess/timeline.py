@@ -0,0 +1,70 @@
+"""Seeking through the plies of a game.
+
+A GameTimeline keeps the moves of a game and a snapshot of the position
+every `interval` plies. Seeking to a ply starts from the closest
+snapshot before it, so it never replays more than interval - 1 moves."""
+from moves import MoveBuffer
+from position import Position
+from snapshot import STARTING_SNAPSHOT
+
+SNAPSHOT_INTERVAL = 16
+
+
+class GameTimeline:
+
+    def __init__(self, interval=SNAPSHOT_INTERVAL, startSnapshot=STARTING_SNAPSHOT):
+        self.interval = interval
+        self.moves = MoveBuffer()
+        # snapshots[i] is the position at ply i*interval
+        self.snapshots = [startSnapshot]
+
+        # Position used to replay moves from a snapshot and the ply it
+        # is at, so seeking forward can continue from it.
+        self.replayPosition = None
+        self.replayPly = None
+
+    @classmethod
+    def fromMoves(cls, moves, interval=SNAPSHOT_INTERVAL,
+                  startSnapshot=STARTING_SNAPSHOT):
+        """Builds a timeline by replaying encoded moves"""
+        timeline = cls(interval, startSnapshot)
+        position = Position(startSnapshot)
+        for move in moves:
+            position.playMove(move)
+            timeline.record(position)
+        timeline.replayPosition = position
+        timeline.replayPly = len(timeline.moves)
+        return timeline
+
+    def record(self, position):
+        """Adds the last move played on position to the timeline"""
+        self.moves.append(position.history[-1])
+        if len(self.moves) % self.interval == 0:
+            self.snapshots.append(position.snapshot())
+
+    def __len__(self):
+        """Number of plies in the timeline"""
+        return len(self.moves)
+
+    def positionAt(self, ply):
+        """Returns a Position after ply moves. The Position is reused by
+        the next seek, so it is only valid until then."""
+        if not 0 <= ply <= len(self.moves):
+            raise IndexError("ply out of range")
+
+        base = ply - ply % self.interval
+        if (self.replayPosition is None or self.replayPly > ply
+                or self.replayPly < base):
+            self.replayPosition = Position(self.snapshots[base // self.interval])
+            self.replayPly = base
+
+        for move in self.moves[self.replayPly:ply]:
+            self.replayPosition.playMove(move)
+        self.replayPly = ply
+        return self.replayPosition
+
+    def snapshotAt(self, ply):
+        """Returns the snapshot of the position after ply moves"""
+        if ply % self.interval == 0 and ply // self.interval < len(self.snapshots):
+            return self.snapshots[ply // self.interval]
+        return self.positionAt(ply).snapshot()
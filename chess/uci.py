@@ -0,0 +1,230 @@
+"""UCI front end of the rules engine, for the GUIs and tournament tools
+that speak the Universal Chess Interface.
+
+    python -m chess.uci     (from the root of the repository)
+    python chess/uci.py
+
+Commands are read on the main thread and searches (see search.py) run
+on a worker thread, so isready, stop and quit are answered while the
+engine thinks. Supported commands: uci, isready, ucinewgame, position,
+go (depth, nodes, movetime, wtime, btime, winc, binc, movestogo,
+infinite), stop and quit. Other commands are ignored, as UCI asks."""
+import os
+import sys
+import threading
+import time
+
+# The modules of chess/ import each other by name
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analysis_server import validateSnapshot
+from moves import moveToUci
+from position import Position
+from search import MATE_SCORE, MAX_DEPTH, Search, isMateScore
+from snapshot import STARTING_SNAPSHOT, FenError, decodeSnapshot, snapshotFromFen
+
+ENGINE_NAME = "chess"
+ENGINE_AUTHOR = "chess contributors"
+# Moves a clock is shared between when the GUI doesn't give movestogo
+DEFAULT_MOVES_TO_GO = 30
+# Time kept on the clock for the GUI to receive the move, in seconds
+MOVE_OVERHEAD = 0.05
+GO_INT_PARAMETERS = ("depth", "nodes", "movetime", "wtime", "btime", "winc",
+                     "binc", "movestogo")
+
+
+class UciError(ValueError):
+    """Raised for a command that can't be carried out"""
+
+
+def uciToMove(position, uci):
+    """Returns the legal move of a Position written in long algebraic
+    notation (eg. e7e8q)"""
+    for move in position.getLegalMoves():
+        if moveToUci(move) == uci:
+            return move
+    raise UciError(f"illegal move {uci}")
+
+
+def parsePosition(tokens):
+    """Returns the snapshot of "position [startpos | fen FEN] [moves
+    MOVES]" without the command name"""
+    if "moves" in tokens:
+        split = tokens.index("moves")
+        tokens, moves = tokens[:split], tokens[split + 1:]
+    else:
+        moves = []
+    if tokens[:1] == ["startpos"]:
+        snapshot = STARTING_SNAPSHOT
+    elif tokens[:1] == ["fen"]:
+        try:
+            snapshot = snapshotFromFen(" ".join(tokens[1:]))
+            # The search can't play a position without both kings
+            validateSnapshot(snapshot)
+        except FenError as error:
+            raise UciError(f"invalid FEN: {error}")
+    else:
+        raise UciError("position needs startpos or fen")
+    if not moves:
+        return snapshot
+
+    position = Position(snapshot)
+    for uci in moves:
+        position.playMove(uciToMove(position, uci))
+    return position.snapshot()
+
+
+def parseGo(tokens):
+    """Returns the parameters of "go" without the command name, eg.
+    {"depth": 4, "infinite": True}"""
+    params = {}
+    tokens = iter(tokens)
+    for token in tokens:
+        if token in GO_INT_PARAMETERS:
+            try:
+                params[token] = int(next(tokens))
+            except (StopIteration, ValueError):
+                raise UciError(f"{token} needs a number")
+        elif token in ("infinite", "ponder"):
+            params["infinite"] = True
+    return params
+
+
+def moveTime(params, whiteTurn):
+    """Seconds to spend on a move, None to search without a time limit"""
+    if "movetime" in params:
+        return params["movetime"] / 1000
+    timeLeft = params.get("wtime" if whiteTurn else "btime")
+    if timeLeft is None:
+        return None
+    increment = params.get("winc" if whiteTurn else "binc", 0)
+    movesToGo = params.get("movestogo", DEFAULT_MOVES_TO_GO)
+    budget = timeLeft / movesToGo + increment * 3 / 4
+    return max(0, min(budget, timeLeft / 2) / 1000 - MOVE_OVERHEAD)
+
+
+def formatScore(score):
+    if not isMateScore(score):
+        return f"cp {score}"
+    plies = MATE_SCORE - abs(score)
+    moves = (plies + 1) // 2
+    return f"mate {moves if score > 0 else -moves}"
+
+
+class UciEngine:
+    """Carries out UCI commands and writes the answers to output"""
+
+    def __init__(self, output=None):
+        self.output = output if output is not None else sys.stdout
+        self.outputLock = threading.Lock()
+        self.snapshot = STARTING_SNAPSHOT
+        self.searchThread = None
+        self.stopEvent = threading.Event()
+        self.commands = {
+            "uci": self.uci,
+            "isready": self.isReady,
+            "ucinewgame": self.newGame,
+            "position": self.position,
+            "go": self.go,
+            "stop": self.stop,
+        }
+
+    def send(self, line):
+        with self.outputLock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def handle(self, line):
+        """Carries out a command line. Returns False on quit."""
+        tokens = line.split()
+        if not tokens:
+            return True
+        if tokens[0] == "quit":
+            self.stop()
+            return False
+        command = self.commands.get(tokens[0])
+        if command is not None:
+            try:
+                command(tokens[1:])
+            except UciError as error:
+                self.send(f"info string {error}")
+        return True
+
+    def uci(self, tokens):
+        self.send(f"id name {ENGINE_NAME}")
+        self.send(f"id author {ENGINE_AUTHOR}")
+        self.send("uciok")
+
+    def isReady(self, tokens):
+        self.send("readyok")
+
+    def newGame(self, tokens):
+        self.stop()
+        self.snapshot = STARTING_SNAPSHOT
+
+    def position(self, tokens):
+        # The rules state is global, it can't be used while a search runs
+        self.stop()
+        try:
+            self.snapshot = parsePosition(tokens)
+        except UciError:
+            # Don't search the position of an earlier command
+            self.snapshot = STARTING_SNAPSHOT
+            raise
+
+    def go(self, tokens):
+        params = parseGo(tokens)
+        self.stop()
+        self.stopEvent = threading.Event()
+        self.searchThread = threading.Thread(
+            target=self.search, args=(self.snapshot, params, self.stopEvent),
+            name="uci-search", daemon=True)
+        self.searchThread.start()
+
+    def stop(self, tokens=()):
+        """Stops the search, which sends its best move"""
+        if self.searchThread is not None:
+            self.stopEvent.set()
+            self.searchThread.join()
+            self.searchThread = None
+
+    def search(self, snapshot, params, stopEvent):
+        """Runs on the search thread. A bestmove is always sent, as the
+        GUI waits for it."""
+        start = time.monotonic()
+
+        def onIteration(depth, score, nodes, pv):
+            elapsed = time.monotonic() - start
+            self.send(
+                f"info depth {depth} score {formatScore(score)} nodes {nodes} "
+                f"nps {int(nodes / max(elapsed, 1e-3))} time {int(elapsed * 1000)} "
+                f"pv {' '.join(moveToUci(move) for move in pv)}")
+
+        bestMove = None
+        try:
+            whiteTurn = decodeSnapshot(snapshot)[1]
+            search = Search(snapshot, stopEvent, onIteration)
+            bestMove, _, _ = search.run(
+                maxDepth=params.get("depth", MAX_DEPTH),
+                moveTime=moveTime(params, whiteTurn), maxNodes=params.get("nodes"))
+            # In infinite mode the best move waits for stop
+            if params.get("infinite"):
+                stopEvent.wait()
+        except Exception as error:
+            self.send(f"info string search failed: {error!r}")
+        finally:
+            self.send("bestmove " + (moveToUci(bestMove) if bestMove is not None
+                                     else "0000"))
+
+
+def main(input=None, output=None):
+    engine = UciEngine(output)
+    for line in input if input is not None else sys.stdin:
+        if not engine.handle(line):
+            break
+    engine.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
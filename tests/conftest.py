@@ -0,0 +1,28 @@
+"""The modules of chess/ import each other by name, so the tests do too"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "chess"))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The QApplication of the Qt tests, without a display"""
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def logDir(tmp_path, monkeypatch):
+    """Logs go to the test's directory instead of logs/"""
+    import logger
+    monkeypatch.setattr(logger, "LOG_PATH", str(tmp_path / "logs.txt"))
+    monkeypatch.setattr(logger, "BOARD_JOURNAL_PATH",
+                        str(tmp_path / "board_journal.bin"))
+    yield tmp_path
+    logger.closeLog()
@@ -0,0 +1,145 @@
+import asyncio
+import gc
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import analysis_server
+import logger
+
+from analysis_server import (AnalysisClient, AnalysisServer, AnalysisService,
+                             validateSnapshot)
+from snapshot import FenError, STARTING_SNAPSHOT, snapshotFromFen
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def withServer(test):
+    """Runs test(server, client) against a server on a free port"""
+    async def run():
+        server = AnalysisServer(AnalysisService(workers=1), port=0)
+        await server.start()
+        client = AnalysisClient(port=server.port)
+        try:
+            return await test(server, client)
+        finally:
+            await client.close()
+            await server.close()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("fen", [
+    "4k3/8/8/8/8/8/8/P3K3 w - - 0 1",
+    "p3k3/8/8/8/8/8/8/4K3 b - - 0 1",
+    "4k3/8/8/8/8/8/8/4K2p w - - 0 1",
+    "4k3/8/8/8/4P3/8/8/4K3 w - e3 0 1",
+    "4k3/8/8/8/8/8/8/4K3 b - e3 0 1",
+])
+def test_invalid_positions_are_rejected(fen):
+    with pytest.raises(FenError):
+        validateSnapshot(snapshotFromFen(fen))
+
+
+def test_en_passant_square_behind_the_pawn_is_accepted():
+    validateSnapshot(snapshotFromFen("4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1"))
+    validateSnapshot(snapshotFromFen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1"))
+
+
+def test_analyze_and_bad_requests():
+    async def test(server, client):
+        status, data = await client.analyze(START_FEN)
+        assert status == 200
+        assert data["fen"] == START_FEN
+        assert sum(map(len, data["moves"].values())) == 20
+
+        status, data = await client.analyze("P3k3/8/8/8/8/8/8/4K3 w - - 0 1")
+        assert status == 400
+        status, _ = await client.request("GET", "/analyze")
+        assert status == 405
+    withServer(test)
+
+
+def test_truncated_body_gets_400():
+    async def test(server, client):
+        reader, writer = await asyncio.open_connection(port=server.port)
+        writer.write(b"POST /analyze HTTP/1.1\r\nContent-Length: 100\r\n\r\n{}")
+        writer.write_eof()
+        response = await reader.read()
+        writer.close()
+        assert response.startswith(b"HTTP/1.1 400 ")
+        assert b"Connection: close" in response
+    withServer(test)
+
+
+def test_failed_batch_fails_its_requests(monkeypatch, logDir):
+    async def test(server, client):
+        loop = asyncio.get_running_loop()
+
+        async def fail(executor, function, *args):
+            raise OSError("pool unavailable")
+        monkeypatch.setattr(loop, "run_in_executor", fail)
+        status, data = await asyncio.wait_for(client.analyze(START_FEN), 10)
+        assert status == 500
+        assert "pool unavailable" in data["error"]
+        assert server.service.pending == {}
+        assert STARTING_SNAPSHOT not in server.service.cache
+    withServer(test)
+    logger.closeLog()
+    assert "batch of 1 positions failed" in (logDir / "logs.txt").read_text()
+
+
+class FakeExecutor:
+    def __init__(self, *args, **kwargs):
+        self.shutDown = False
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutDown = True
+
+
+def test_broken_pool_is_replaced_once(monkeypatch, logDir):
+    monkeypatch.setattr(analysis_server, "ProcessPoolExecutor", FakeExecutor)
+
+    async def test():
+        loop = asyncio.get_running_loop()
+
+        async def fail(executor, function, *args):
+            await asyncio.sleep(0)
+            raise BrokenProcessPool("worker died")
+        monkeypatch.setattr(loop, "run_in_executor", fail)
+        service = AnalysisService(workers=1)
+        broken = service.executor = FakeExecutor()
+        snapshots = [snapshotFromFen(fen) for fen in
+                     (START_FEN, "4k3/8/8/8/8/8/8/4K3 w - - 0 1")]
+        for snapshot in snapshots:
+            service.pending[snapshot] = loop.create_future()
+        # Both batches ran on the old pool
+        await asyncio.gather(*(service.runBatch([snapshot])
+                               for snapshot in snapshots))
+        assert broken.shutDown
+        assert service.executor is not broken
+        assert not service.executor.shutDown
+        assert service.stats["batches"] == 2
+    asyncio.run(test())
+
+
+def test_failed_batch_without_waiters_is_quiet(monkeypatch, logDir):
+    async def test():
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+        async def fail(executor, function, *args):
+            raise OSError("pool unavailable")
+        monkeypatch.setattr(loop, "run_in_executor", fail)
+        service = AnalysisService(workers=1)
+        cancelled = snapshotFromFen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+        # Nobody waits for the first job any more, the second was
+        # cancelled when the service closed
+        service.pending[STARTING_SNAPSHOT] = loop.create_future()
+        service.pending[cancelled] = loop.create_future()
+        service.pending[cancelled].cancel()
+        await service.runBatch([STARTING_SNAPSHOT, cancelled])
+        assert service.pending == {}
+        gc.collect()
+        assert errors == []
+    asyncio.run(test())
@@ -0,0 +1,72 @@
+import os
+import signal
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+import analysis_worker
+from analysis_worker import AnalysisWorker
+from snapshot import STARTING_SNAPSHOT
+
+
+@pytest.fixture(autouse=True)
+def stopPool():
+    yield
+    analysis_worker.shutdown()
+
+
+def waitFor(app, results, count, timeout=60):
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return results
+
+
+def killWorkers():
+    executor = analysis_worker.getExecutor()
+    for pid in list(executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    # Wait for the pool to notice
+    deadline = time.monotonic() + 10
+    while not executor._broken and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_only_the_latest_job_is_delivered(app):
+    worker = AnalysisWorker()
+    results = []
+    worker.analysisReady.connect(results.append)
+    worker.submit(STARTING_SNAPSHOT)
+    worker.submit(STARTING_SNAPSHOT)
+    waitFor(app, results, 1)
+    waitFor(app, results, 2, timeout=1)
+    assert len(results) == 1
+
+
+def test_submit_after_the_worker_died(app):
+    worker = AnalysisWorker()
+    results = []
+    worker.analysisReady.connect(results.append)
+    worker.submit(STARTING_SNAPSHOT)
+    waitFor(app, results, 1)
+
+    killWorkers()
+    worker.submit(STARTING_SNAPSHOT)
+    assert len(waitFor(app, results, 2)) == 2
+
+
+def test_job_running_when_the_worker_died_is_sent_again(app):
+    worker = AnalysisWorker()
+    results = []
+    worker.analysisReady.connect(results.append)
+    worker.submit(STARTING_SNAPSHOT)
+    waitFor(app, results, 1)
+
+    executor = analysis_worker.getExecutor()
+    for pid in list(executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    worker.submit(STARTING_SNAPSHOT)
+    assert len(waitFor(app, results, 2)) == 2
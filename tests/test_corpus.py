@@ -0,0 +1,27 @@
+from corpus import corpusStats, generateCorpus
+from game_record import GameRecordReader, convertPgn, exportPgn
+
+
+def test_corpus_round_trips_through_pgn(tmp_path):
+    # Game 13 of seed 1 used to play a stale en passant capture
+    corpus = tmp_path / "corpus.cgr"
+    generateCorpus(corpus, games=16, seed=1)
+    exportPgn(corpus, tmp_path / "corpus.pgn")
+    assert convertPgn(tmp_path / "corpus.pgn", tmp_path / "converted.cgr") == 16
+
+    with GameRecordReader(corpus) as games, \
+            GameRecordReader(tmp_path / "converted.cgr") as converted:
+        for game, other in zip(games, converted):
+            assert other.moves == game.moves
+            assert other.result == game.result
+
+
+def test_games_only_depend_on_the_seed_and_their_index(tmp_path):
+    generateCorpus(tmp_path / "whole.cgr", games=3, seed=7, maxPlies=40)
+    generateCorpus(tmp_path / "parts.cgr", games=1, seed=7, maxPlies=40)
+    generateCorpus(tmp_path / "parts.cgr", games=2, seed=7, maxPlies=40,
+                   append=True)
+
+    assert ((tmp_path / "whole.cgr").read_bytes()
+            == (tmp_path / "parts.cgr").read_bytes())
+    assert corpusStats(tmp_path / "whole.cgr")["games"] == 3
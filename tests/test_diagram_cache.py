@@ -0,0 +1,66 @@
+import os
+import time
+
+import pytest
+
+import diagram_cache
+from diagram_cache import DiagramCache
+
+
+def age(path, seconds):
+    """Sets the modification time of path to seconds ago"""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_put_replaces_atomically(tmp_path, monkeypatch):
+    cache = DiagramCache(str(tmp_path))
+    path = cache.put("ab01", b"old")
+
+    def fail(source, destination):
+        raise OSError("disk full")
+    monkeypatch.setattr(diagram_cache.os, "replace", fail)
+    with pytest.raises(OSError):
+        cache.put("ab01", b"new")
+    # The old file is intact and the temporary file is gone
+    with open(path, "rb") as file:
+        assert file.read() == b"old"
+    assert os.listdir(os.path.dirname(path)) == ["ab01.png"]
+
+
+def test_overwriting_keeps_the_size_right(tmp_path):
+    cache = DiagramCache(str(tmp_path))
+    cache.put("ab01", b"x" * 100)
+    cache.put("ab01", b"x" * 40)
+    assert cache.totalBytes == 40
+    assert DiagramCache(str(tmp_path)).totalBytes == 40
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    cache = DiagramCache(str(tmp_path), maxBytes=300)
+    paths = [cache.put(key, b"x" * 100) for key in ("aa01", "bb02", "cc03")]
+    for seconds, path in zip((30, 20, 10), paths):
+        age(path, seconds)
+    # A hit makes the oldest diagram the most recently used
+    assert cache.get("aa01") == paths[0]
+
+    cache.put("dd04", b"x" * 100)
+    assert cache.get("bb02") is None
+    assert cache.get("cc03") is None
+    assert cache.get("aa01") == paths[0]
+    assert cache.get("dd04") is not None
+    assert cache.totalBytes == 200
+
+
+def test_stale_temporary_files_are_removed(tmp_path):
+    cache = DiagramCache(str(tmp_path), maxBytes=100)
+    os.makedirs(tmp_path / "ee")
+    stale = tmp_path / "ee" / "dead.tmp"
+    fresh = tmp_path / "ee" / "busy.tmp"
+    stale.write_bytes(b"partial")
+    fresh.write_bytes(b"partial")
+    age(stale, diagram_cache.STALE_TEMP_SECONDS + 60)
+
+    cache.put("ff01", b"x" * 200)
+    assert not stale.exists()
+    assert fresh.exists()
@@ -0,0 +1,67 @@
+from events import (PIECE_EVENTS, Check, ControlChanged, EventSource,
+                    MovePlayed, PieceMoved, PiecePromoted, PieceRemoved,
+                    PinAdded, PinRemoved)
+from position import Position
+from san import sanToMove
+from snapshot import snapshotFromFen
+
+
+def play(position, *sans):
+    for san in sans:
+        position.playMove(sanToMove(position, san))
+
+
+def test_subscribers_get_the_types_they_take():
+    source = EventSource()
+    pieces, everything = [], []
+    source.subscribe(pieces.append, PIECE_EVENTS)
+    source.subscribe(everything.append)
+    assert source.wants(PieceMoved) and source.wants(Check)
+    source.emit(PieceMoved("wKnight0", "g1", "f3"))
+    source.emit(MovePlayed(1, 1))
+    assert pieces == [PieceMoved("wKnight0", "g1", "f3")]
+    assert len(everything) == 2
+
+    source.unsubscribe(everything.append)
+    assert not source.wants(Check)
+
+
+def test_capture_castling_and_promotion():
+    position = Position(snapshotFromFen("r3k3/1P6/8/3pP3/8/8/8/R3K2R w KQq d6 0 1"))
+    events = []
+    position.events.subscribe(events.append, PIECE_EVENTS + (MovePlayed,))
+    play(position, "exd6", "Kd7", "bxa8=Q", "Kxd6", "O-O")
+    assert events == [
+        PieceRemoved("bPawn0", "d5"),
+        PieceMoved("wPawn0", "e5", "d6"),
+        MovePlayed(position.history[0], 1),
+        PieceMoved("bKing0", "e8", "d7"),
+        MovePlayed(position.history[1], 2),
+        PieceRemoved("bRook0", "a8"),
+        PieceMoved("wPawn1", "b7", "a8"),
+        PiecePromoted("wQueen0", "wPawn1", "a8"),
+        MovePlayed(position.history[2], 3),
+        PieceRemoved("wPawn0", "d6"),
+        PieceMoved("bKing0", "d7", "d6"),
+        MovePlayed(position.history[3], 4),
+        PieceMoved("wKing0", "e1", "g1"),
+        PieceMoved("wRook1", "h1", "f1"),
+        MovePlayed(position.history[4], 5),
+    ]
+
+
+def test_pins_checks_and_control():
+    position = Position(snapshotFromFen("r6k/8/8/8/8/8/4N3/4K3 b - - 0 1"))
+    events = []
+    position.events.subscribe(events.append)
+    play(position, "Re8")
+    assert PinAdded("wKnight0", "bRook0") in events
+    assert ControlChanged("e5", ("bRook0",)) in events
+    assert type(events[-1]) is MovePlayed
+    del events[:]
+    play(position, "Kf2")
+    assert PinRemoved("wKnight0", "bRook0") in events
+    del events[:]
+    play(position, "Rf8+")
+    assert events[-2:] == [Check("wKing0", "f2", False),
+                           MovePlayed(position.history[-1], 3)]
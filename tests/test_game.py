@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+
+@pytest.fixture
+def game(app):
+    from main import MainWindow
+    import analysis_worker
+    window = MainWindow()
+    window.show()
+    window.startNewGame()
+    # Shortcuts only trigger in the active window
+    window.activateWindow()
+    QTest.qWaitForWindowActive(window)
+    yield window.currentGame
+    analysis_worker.shutdown()
+    window.close()
+
+
+def click(game, *squares):
+    scene = game.board.scene()
+    for square in squares:
+        scene.applyClickResult(game.squareClicked(square))
+
+
+def shownPieces(game):
+    return {name: sq.getPiece() is not None
+            for name, sq in game.board.scene().squares.items()}
+
+
+def test_earlier_plies_are_shown_and_left(game):
+    scene = game.board.scene()
+    click(game, "e2", "e4", "e7", "e5")
+    live = shownPieces(game)
+
+    game.showPly(1)
+    assert scene.reviewing
+    assert shownPieces(game)["e4"] and not shownPieces(game)["e5"]
+
+    game.showPly(2)
+    assert not scene.reviewing
+    assert shownPieces(game) == live
+
+
+def test_arrow_keys_and_move_list_pick_the_ply(game):
+    click(game, "e2", "e4", "e7", "e5", "g1", "f3")
+    QTest.keyClick(game.board, Qt.Key_Left)
+    assert game.shownPly == 2
+    QTest.keyClick(game.board, Qt.Key_Home)
+    assert game.shownPly == 0
+    QTest.keyClick(game.board, Qt.Key_End)
+    assert game.shownPly == 3
+
+    moveList = game.gameInfo.moveList
+    moveList.moveList.clicked.emit(moveList.model.index(0))
+    assert game.shownPly == 2
+
+
+def test_promotion_after_a_seek_gets_a_new_name():
+    from position import Position
+    from snapshot import snapshotFromFen
+    from timeline import GameTimeline
+
+    snapshot = snapshotFromFen("4k3/PP6/8/8/8/8/8/4K3 w - - 0 1")
+    live = Position(snapshot)
+    timeline = GameTimeline(startSnapshot=snapshot)
+    for fromSq, toSq, promotingTo in (("a7", "a8", "Queen"), ("e8", "f7", None)):
+        live.makeMove(live.getSquare(fromSq), live.getSquare(toSq), promotingTo)
+        timeline.record(live)
+    # Rebuilds the start, which has no queen
+    timeline.positionAt(0)
+
+    live.makeMove(live.getSquare("b7"), live.getSquare("b8"), "Queen")
+    names = [piece.name for piece in live.pieces]
+    assert len(names) == len(set(names))
+
+
+def test_move_list_columns(app):
+    from game import MoveListModel
+
+    model = MoveListModel()
+    model.addMove("e5", isWhite=False)
+    model.addMove("Nf3")
+    model.addMove("Nc6", isWhite=False)
+    assert model.rowCount() == 2
+    assert model.data(model.index(0)) == "  1. ...      e5"
+    assert model.data(model.index(1)) == "  2. Nf3      Nc6"
+    assert [model.plyAfterRow(row) for row in range(2)] == [1, 3]
+
+
+def test_control_checkbox_toggles_the_tint(game):
+    overlay = game.board.scene().overlay
+    assert not overlay.controlShown
+    game.gameInfo.showControl.setChecked(True)
+    assert overlay.controlShown
+    game.gameInfo.showControl.setChecked(False)
+    assert not overlay.controlShown
@@ -0,0 +1,133 @@
+import pytest
+
+from game_record import (GameRecordError, GameRecordReader, GameRecordWriter,
+                         convertPgn, exportPgn, pgnGameToMoves)
+from moves import encodeMove, squareNameToIndex
+
+OPERA_GAME = """[Event "Paris"]
+[White "Morphy"]
+[Black "Duke Karl / Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 4. dxe5 Bxf3 5. Qxf3 dxe5 6. Bc4 Nf6 7. Qb3 Qe7
+8. Nc3 c6 9. Bg5 b5 10. Nxb5 cxb5 11. Bxb5+ Nbd7 12. O-O-O Rd8 13. Rxd7 Rxd7
+14. Rd1 Qe6 15. Bxd7+ Nxd7 16. Qb8+ Nxb8 17. Rd8# 1-0
+"""
+
+SET_UP_GAME = """[Event "Endgame"]
+[SetUp "1"]
+[FEN "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"]
+[Result "*"]
+
+1. e4 Kd7 2. e5 Ke6 *
+"""
+
+ILLEGAL_GAME = """[Event "Illegal"]
+[Result "*"]
+
+1. e4 e5 2. Ke3 *
+"""
+
+
+def move(fromName, toName):
+    return encodeMove(squareNameToIndex(fromName), squareNameToIndex(toName))
+
+
+def test_games_are_read_back_at_random(tmp_path):
+    path = tmp_path / "games.cgr"
+    games = [([move("e2", "e4"), move("e7", "e5")], "1-0", {"Event": "One"}),
+             ([], "*", None),
+             ([move("d2", "d4")] * 1000, "1/2-1/2", {"Event": "Three", "Round": "2"})]
+    with GameRecordWriter(path) as writer:
+        for moves, result, tags in games:
+            writer.addGame(moves, result, tags)
+
+    with GameRecordReader(path) as reader:
+        assert len(reader) == 3
+        assert reader.getMove(2, 999) == move("d2", "d4")
+        assert reader.getPlyCount(2) == 1000
+        game = reader[0]
+        assert list(game.moves) == games[0][0]
+        assert (game.result, game.tags) == ("1-0", {"Event": "One"})
+        assert reader[1].tags == {}
+
+
+def test_append_adds_games_after_the_others(tmp_path):
+    path = tmp_path / "games.cgr"
+    with GameRecordWriter(path) as writer:
+        writer.addGame([move("e2", "e4")])
+    with GameRecordWriter(path, append=True) as writer:
+        writer.addGame([move("d2", "d4")], "0-1")
+    with GameRecordReader(path) as reader:
+        assert [list(game.moves) for game in reader] == [
+            [move("e2", "e4")], [move("d2", "d4")]]
+
+
+def test_tags_that_do_not_fit_are_rejected_before_writing(tmp_path):
+    path = tmp_path / "games.cgr"
+    with GameRecordWriter(path) as writer:
+        for tags in ({"Event": "a\nb"}, {"Ev\tent": "a"},
+                     {"Annotator": "x" * 0x10000}):
+            with pytest.raises(ValueError):
+                writer.addGame([], "*", tags)
+        writer.addGame([], "*", {"Event": "fine"})
+    with GameRecordReader(path) as reader:
+        assert len(reader) == 1
+
+
+def test_not_an_archive(tmp_path):
+    path = tmp_path / "games.cgr"
+    path.write_bytes(b"not an archive at all, not even close")
+    with pytest.raises(GameRecordError):
+        GameRecordReader(path)
+
+
+def test_pgn_round_trip(tmp_path):
+    pgn = tmp_path / "games.pgn"
+    pgn.write_text(OPERA_GAME + "\n" + SET_UP_GAME)
+    assert convertPgn(pgn, tmp_path / "games.cgr") == 2
+    exportPgn(tmp_path / "games.cgr", tmp_path / "exported.pgn")
+    assert convertPgn(tmp_path / "exported.pgn", tmp_path / "again.cgr") == 2
+
+    with GameRecordReader(tmp_path / "games.cgr") as games, \
+            GameRecordReader(tmp_path / "again.cgr") as again:
+        for game, other in zip(games, again):
+            assert other.moves == game.moves
+            assert other.result == game.result
+        assert len(games[0]) == 33
+        assert games[1].tags["FEN"] == "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        assert list(games[1].moves)[0] == move("e2", "e4")
+
+
+def test_bad_games_are_skipped_and_counted(tmp_path):
+    pgn = tmp_path / "games.pgn"
+    pgn.write_text(ILLEGAL_GAME + "\n" + OPERA_GAME)
+    skipped = []
+    assert convertPgn(pgn, tmp_path / "games.cgr", skipped=skipped) == 1
+    assert [index for index, _ in skipped] == [0]
+    with GameRecordReader(tmp_path / "games.cgr") as reader:
+        assert len(reader) == 1 and reader[0].tags["White"] == "Morphy"
+
+
+def test_set_up_game_replays_from_its_fen():
+    moves = pgnGameToMoves(["e4", "Kd7"], "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1")
+    assert list(moves) == [move("e2", "e4"), move("e8", "d7")]
+
+
+def test_tags_with_other_line_breaks_round_trip(tmp_path):
+    tags = {"Event": "a\rb", "Site": "x\x0by\x0cz", "Annotator": "\x1c\x1d\x1e",
+            "Round": "\x85\u2028\u2029", "Date": ""}
+    path = tmp_path / "games.cgr"
+    with GameRecordWriter(path) as writer:
+        writer.addGame([], "*", tags)
+    with GameRecordReader(path) as reader:
+        assert reader[0].tags == tags
+
+
+def test_black_to_move_is_numbered_with_dots(tmp_path):
+    pgn = tmp_path / "games.pgn"
+    pgn.write_text('[FEN "4k3/8/8/8/8/8/4P3/4K3 b - - 0 12"]\n[Result "*"]\n\n'
+                   "12... Kd7 13. e4 Ke6 *\n")
+    assert convertPgn(pgn, tmp_path / "games.cgr") == 1
+    exportPgn(tmp_path / "games.cgr", tmp_path / "exported.pgn")
+    assert "12... Kd7 13. e4 Ke6 *" in (tmp_path / "exported.pgn").read_text()
@@ -0,0 +1,47 @@
+import pytest
+
+import logger
+from board_journal import JournalReader
+from moves import squareIndex
+from position import Position
+from snapshot import snapshotFromFen
+
+
+@pytest.fixture
+def journalPath(logDir):
+    level = logger.LEVEL
+    logger.setLevel(logger.DEBUG)
+    yield logDir / "board_journal.bin"
+    logger.closeLog()
+    logger.setLevel(level)
+
+
+def boardOf(position):
+    board = [None] * 64
+    for file in position.squares:
+        for sq in file:
+            board[squareIndex(sq.getCoord())] = (
+                tuple(piece.name for piece in sq.getControllingPieces()),
+                tuple(piece.name for piece in sq.getTrackingPieces()))
+    return board
+
+
+def test_only_the_live_game_is_journaled(journalPath):
+    live = Position()
+    live.startJournal()
+    boards = [boardOf(live)]
+    for fromSq, toSq in (("e2", "e4"), ("e7", "e5"), ("g1", "f3")):
+        live.makeMove(live.getSquare(fromSq), live.getSquare(toSq))
+        boards.append(boardOf(live))
+        # Positions built for seeks or analysis in between
+        scratch = Position(snapshotFromFen(
+            "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"))
+        scratch.makeMove(scratch.getSquare("e2"), scratch.getSquare("e4"))
+        live.activate()
+    logger.closeLog()
+
+    reader = JournalReader(journalPath)
+    assert len(reader.games) == 1
+    assert reader.plyCount() == len(boards)
+    for ply, board in enumerate(boards):
+        assert reader.boardAt(ply) == board
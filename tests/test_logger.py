@@ -0,0 +1,24 @@
+import logger
+
+
+class Loud:
+    def __str__(self):
+        raise AssertionError("formatted a message that isn't logged")
+
+
+def test_only_enabled_levels_are_written(logDir):
+    level = logger.LEVEL
+    try:
+        logger.setLevel("warning")
+        assert not logger.DEBUG_ENABLED
+        logger.debug("hidden %s", Loud())
+        logger.info("hidden %s", Loud())
+        logger.warning("shown %d", 1)
+        logger.setLevel(logger.DEBUG)
+        assert logger.DEBUG_ENABLED
+        logger.debug("shown %d", 2)
+        logger.error("shown %d", 3)
+    finally:
+        logger.setLevel(level)
+    logger.closeLog()
+    assert (logDir / "logs.txt").read_text() == "shown 1\nshown 2\nshown 3\n"
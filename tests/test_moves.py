@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from moves import (CASTLE, EN_PASSANT, NORMAL, PROMOTION, PROMOTION_PIECES,
+                   MoveBuffer, decodeMove, encodeMove, indexToSquareName,
+                   isCastle, isEnPassant, moveFlag, moveFrom, moveTo,
+                   moveToUci, promotionPiece, squareNameToIndex)
+from position import Position
+
+FLAGS = (NORMAL, CASTLE, EN_PASSANT) + tuple(
+    PROMOTION + i for i in range(len(PROMOTION_PIECES)))
+
+
+def test_moves_fit_16_bits_and_decode():
+    for fromIndex in range(64):
+        for toIndex in range(64):
+            for flag in FLAGS:
+                move = encodeMove(fromIndex, toIndex, flag)
+                assert 0 <= move < 2**16
+                assert (moveFrom(move), moveTo(move), moveFlag(move)) == (
+                    fromIndex, toIndex, flag)
+                assert isCastle(move) is (flag == CASTLE)
+                assert isEnPassant(move) is (flag == EN_PASSANT)
+
+
+def test_square_names():
+    assert [indexToSquareName(i) for i in (0, 7, 8, 63)] == ["a1", "h1", "a2", "h8"]
+    for index in range(64):
+        assert squareNameToIndex(indexToSquareName(index)) == index
+
+
+@pytest.mark.parametrize("piece, uci", [
+    ("Knight", "e7e8n"), ("Bishop", "e7e8b"), ("Rook", "e7e8r"),
+    ("Queen", "e7e8q")])
+def test_promotions(piece, uci):
+    move = encodeMove(squareNameToIndex("e7"), squareNameToIndex("e8"),
+                      PROMOTION + PROMOTION_PIECES.index(piece))
+    assert promotionPiece(move) == piece
+    assert decodeMove(move) == ("e7", "e8", piece)
+    assert moveToUci(move) == uci
+
+
+def test_move_buffer_is_a_list_of_codes():
+    codes = [encodeMove(12, 28), encodeMove(4, 6, CASTLE), 0xFFFF]
+    buffer = MoveBuffer(codes)
+    assert list(buffer) == codes
+    assert len(buffer) == 3 and buffer[1] == codes[1]
+    assert isinstance(buffer[1:], MoveBuffer) and list(buffer[1:]) == codes[1:]
+    assert codes[2] in buffer
+    assert buffer.pop() == codes[2]
+    buffer.extend(codes[2:])
+    assert buffer == MoveBuffer(codes)
+
+
+def test_move_buffer_bytes_are_little_endian():
+    buffer = MoveBuffer([0x0102, 0xFFFF])
+    assert buffer.tobytes() == b"\x02\x01\xff\xff"
+    assert MoveBuffer.frombytes(buffer.tobytes()) == buffer
+    assert pickle.loads(pickle.dumps(buffer)) == buffer
+
+
+def test_starting_position_moves():
+    moves = sorted(moveToUci(move) for move in Position().getLegalMoves())
+    assert len(moves) == 20
+    assert moves[:4] == ["a2a3", "a2a4", "b1a3", "b1c3"]
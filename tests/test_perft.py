@@ -0,0 +1,43 @@
+"""Counts of the leaf nodes of the move tree of well known positions
+(https://www.chessprogramming.org/Perft_Results)"""
+import pytest
+
+from position import Position
+from snapshot import STARTING_SNAPSHOT, snapshotFromFen
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+POSITION_3 = "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"
+POSITION_4 = "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"
+POSITION_5 = "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8"
+POSITION_6 = ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 "
+              "w - - 0 10")
+
+
+def perft(snapshot, depth):
+    moves = Position(snapshot).getLegalMoves()
+    if depth == 1:
+        return len(moves)
+    count = 0
+    for move in moves:
+        position = Position(snapshot)
+        position.playMove(move)
+        count += perft(position.snapshot(), depth - 1)
+    return count
+
+
+@pytest.mark.parametrize("fen, depth, nodes", [
+    (None, 1, 20),
+    (None, 2, 400),
+    (None, 3, 8902),
+    (KIWIPETE, 1, 48),
+    (KIWIPETE, 2, 2039),
+    (POSITION_3, 2, 191),
+    (POSITION_3, 3, 2812),
+    (POSITION_4, 2, 264),
+    (POSITION_4, 3, 9467),
+    (POSITION_5, 2, 1486),
+    (POSITION_6, 2, 2079),
+])
+def test_perft(fen, depth, nodes):
+    snapshot = STARTING_SNAPSHOT if fen is None else snapshotFromFen(fen)
+    assert perft(snapshot, depth) == nodes
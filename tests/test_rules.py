@@ -0,0 +1,51 @@
+from moves import moveToUci
+from position import Position
+from snapshot import snapshotFromFen
+
+
+def legalMoves(position):
+    return {moveToUci(move): move for move in position.getLegalMoves()}
+
+
+def play(position, *ucis):
+    for uci in ucis:
+        position.playMove(legalMoves(position)[uci])
+
+
+def test_en_passant_only_right_after_the_double_step():
+    position = Position(snapshotFromFen("4k3/8/8/8/2p5/8/3P4/4K3 w - - 0 1"))
+    play(position, "d2d4")
+    assert "c4d3" in legalMoves(position)
+    play(position, "e8e7", "e1f1")
+    assert "c4d3" not in legalMoves(position)
+    assert "c4c3" in legalMoves(position)
+
+
+def test_en_passant_can_not_expose_the_king_along_the_rank():
+    position = Position(snapshotFromFen("8/8/3p4/KPp4r/5p1k/8/4P1P1/8 w - c6 0 2"))
+    assert "b5c6" not in legalMoves(position)
+
+
+def test_en_passant_takes_a_checking_pawn():
+    position = Position(snapshotFromFen("8/8/8/2k5/3Pp3/8/8/4K3 b - d3 0 1"))
+    assert "e4d3" in legalMoves(position)
+
+
+def test_pinned_piece_can_not_answer_a_check():
+    position = Position(snapshotFromFen("4r1k1/8/8/8/1b6/8/3B4/4K3 w - - 0 1"))
+    assert not [uci for uci in legalMoves(position) if uci.startswith("d2")]
+
+
+def test_king_leaving_a_double_check_unchecks_it():
+    position = Position(snapshotFromFen("2nk4/3P3p/8/8/8/8/8/3RK3 w - - 0 1"))
+    play(position, "d7c8r")
+    assert position.lastCheck["check"]
+    assert set(legalMoves(position)) <= {"d8c8", "d8e7"}
+    play(position, "d8c8", "e1e2")
+    assert {"h7h6", "h7h5"} <= set(legalMoves(position))
+
+
+def test_promotion_taking_the_checking_piece_unchecks_the_king():
+    position = Position(snapshotFromFen("5n1k/4P3/6K1/8/8/8/8/8 w - - 0 1"))
+    play(position, "e7f8b", "h8g8")
+    assert "f8e7" in legalMoves(position)
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from moves import moveToUci
+from position import Position
+from san import SanError, checkSuffix, moveToSan, sanToMove
+from snapshot import snapshotFromFen
+
+
+def sanOf(fen, uci):
+    position = Position(snapshotFromFen(fen))
+    for move in position.getLegalMoves():
+        if moveToUci(move) == uci:
+            return moveToSan(position, move)
+    raise AssertionError(f"{uci} isn't legal")
+
+
+@pytest.mark.parametrize("fen, uci, san", [
+    # Knights on the same rank, on the same file, and three queens
+    ("4k3/8/8/8/8/8/8/1N2KN2 w - - 0 1", "b1d2", "Nbd2"),
+    ("4k3/8/8/8/8/8/8/1N2KN2 w - - 0 1", "f1d2", "Nfd2"),
+    ("4k3/8/8/1N6/8/1N6/8/4K3 w - - 0 1", "b3d4", "N3d4"),
+    ("k7/8/8/8/4Q2Q/8/8/K6Q w - - 0 1", "h4e1", "Qh4e1"),
+    # A pinned knight doesn't need to be told apart
+    ("k3r3/8/8/8/8/8/N3N3/4K3 w - - 0 1", "a2c3", "Nc3"),
+    ("r3k3/1P6/8/8/8/8/8/4K2R w Kq - 0 1", "b7a8q", "bxa8=Q"),
+    ("r3k3/1P6/8/8/8/8/8/4K2R w Kq - 0 1", "e1g1", "O-O"),
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6", "exd6"),
+])
+def test_encoding(fen, uci, san):
+    assert sanOf(fen, uci) == san
+
+
+def test_decoding_accepts_suffixes_and_castling_zeros():
+    position = Position(snapshotFromFen("r3k3/1P6/8/8/8/8/8/4K2R w Kq - 0 1"))
+    assert moveToUci(sanToMove(position, "0-0")) == "e1g1"
+    assert moveToUci(sanToMove(position, "bxa8=Q+")) == "b7a8q"
+    assert moveToUci(sanToMove(position, "bxa8N")) == "b7a8n"
+
+
+@pytest.mark.parametrize("san", ["Nd2", "Ke3x", "O-O-O", "z9", "Qd1"])
+def test_illegal_moves_raise(san):
+    position = Position(snapshotFromFen("4k3/8/8/8/8/8/8/1N2KN2 w - - 0 1"))
+    with pytest.raises(SanError):
+        sanToMove(position, san)
+
+
+def test_random_games_round_trip():
+    # Every legal move of the positions of random games
+    rng = random.Random(3)
+    for _ in range(4):
+        position = Position()
+        for _ in range(120):
+            moves = sorted(position.getLegalMoves())
+            if not moves:
+                break
+            for move in moves:
+                assert sanToMove(position, moveToSan(position, move)) == move
+            position.playMove(rng.choice(moves))
+
+
+def test_check_suffix():
+    position = Position(snapshotFromFen(
+        "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"))
+    move = sanToMove(position, "Qh4")
+    san = moveToSan(position, move)
+    position.playMove(move)
+    assert san + checkSuffix(position.lastCheck) == "Qh4#"
@@ -0,0 +1,25 @@
+import pytest
+
+from snapshot import (FenError, STARTING_SNAPSHOT, decodeSnapshot,
+                      snapshotFromFen, snapshotToFen)
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def test_fen_round_trip():
+    assert snapshotFromFen(START_FEN) == STARTING_SNAPSHOT
+    fen = "4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1"
+    assert snapshotToFen(snapshotFromFen(fen)) == fen
+
+
+@pytest.mark.parametrize("ep", ["a9", "h0", "e4", "e1", "i3", "e", "e33", "E3"])
+def test_en_passant_square_off_the_third_and_sixth_rank_is_rejected(ep):
+    with pytest.raises(ValueError):
+        snapshotFromFen(f"4k3/8/8/8/4P3/8/8/4K3 b - {ep} 0 1")
+
+
+def test_en_passant_square_is_stored():
+    snapshot = decodeSnapshot(snapshotFromFen("4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1"))
+    assert snapshot.epSquare == 20
+    with pytest.raises(FenError):
+        snapshotFromFen("4k3/8/8/8/4P3/8/8/4K3 b - a9 0 1")
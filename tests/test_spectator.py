@@ -0,0 +1,62 @@
+import random
+
+from position import Position
+from snapshot import decodeSnapshot, snapshotFromFen
+from spectator import (DELTA, FRAME_HEADER, KEYFRAME, DeltaEncoder,
+                       SpectatorBoard)
+
+
+def splitFrame(data):
+    """Returns (type, body) of a frame"""
+    length, frameType = FRAME_HEADER.unpack_from(data)
+    assert len(data) == FRAME_HEADER.size + length - 1
+    return frameType, data[FRAME_HEADER.size:]
+
+
+def test_boards_follow_the_game():
+    # Both sides can promote and castle, and en passant is available
+    position = Position(snapshotFromFen(
+        "r3k2r/1P4pp/8/3pP3/8/8/1p4PP/R3K2R w KQkq d6 0 1"))
+    encoder = DeltaEncoder(position)
+    keyframe = encoder.keyframe()
+    board = SpectatorBoard()
+    board.apply(*splitFrame(keyframe))
+    assert board.ply == 0
+
+    rng = random.Random(4)
+    late = None
+    for ply in range(1, 61):
+        moves = sorted(position.getLegalMoves())
+        if not moves:
+            break
+        position.playMove(rng.choice(moves))
+        delta = encoder.delta(position.history[-1])
+        assert splitFrame(delta)[0] == DELTA
+        assert board.apply(*splitFrame(delta))
+        if late is not None:
+            assert late.apply(*splitFrame(delta))
+        if ply == 10:
+            # A spectator joining now starts from a new keyframe
+            late = SpectatorBoard()
+            keyframe = encoder.keyframe()
+            assert splitFrame(keyframe)[0] == KEYFRAME
+            late.apply(*splitFrame(keyframe))
+
+        placement = decodeSnapshot(position.snapshot()).placement
+        assert board.ply == ply and board.move == position.history[-1]
+        assert board.placement() == placement
+        assert board.check == position.lastCheck["check"]
+        assert board.mate == position.lastCheck["mate"]
+        if late is not None:
+            assert late.placement() == placement
+            assert late.control == board.control
+            assert late.pins == board.pins
+
+
+def test_delta_out_of_order_needs_a_keyframe():
+    position = Position()
+    encoder = DeltaEncoder(position)
+    encoder.keyframe()
+    position.playMove(sorted(position.getLegalMoves())[0])
+    delta = encoder.delta(position.history[-1])
+    assert not SpectatorBoard().apply(*splitFrame(delta))
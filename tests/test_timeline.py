@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from position import Position
+from snapshot import snapshotFromFen
+from timeline import GameTimeline
+
+
+def randomGame(plies, seed=5, snapshot=None):
+    """Returns the moves and the snapshot after every ply"""
+    rng = random.Random(seed)
+    position = Position() if snapshot is None else Position(snapshot)
+    snapshots = [position.snapshot()]
+    for _ in range(plies):
+        moves = sorted(position.getLegalMoves())
+        if not moves:
+            break
+        position.playMove(rng.choice(moves))
+        snapshots.append(position.snapshot())
+    return position.history, snapshots
+
+
+def test_seeks_in_any_order_match_the_game():
+    moves, snapshots = randomGame(70)
+    timeline = GameTimeline.fromMoves(moves, interval=8)
+    assert len(timeline) == len(moves)
+    assert len(timeline.snapshots) == len(moves) // 8 + 1
+
+    plies = list(range(len(moves) + 1))
+    random.Random(1).shuffle(plies)
+    for ply in plies + sorted(plies) + sorted(plies, reverse=True):
+        assert timeline.snapshotAt(ply) == snapshots[ply]
+        assert timeline.positionAt(ply).snapshot() == snapshots[ply]
+
+
+def test_recording_a_live_game():
+    start = snapshotFromFen("4k3/PP6/8/8/8/8/8/4K3 w - - 0 1")
+    moves, snapshots = randomGame(20, seed=2, snapshot=start)
+    live = Position(start)
+    timeline = GameTimeline(interval=4, startSnapshot=start)
+    for move in moves:
+        live.playMove(move)
+        timeline.record(live)
+    assert [timeline.snapshotAt(ply) for ply in range(len(moves) + 1)] == snapshots
+
+
+def test_plies_out_of_range():
+    timeline = GameTimeline.fromMoves(randomGame(5)[0])
+    for ply in (-1, 6):
+        with pytest.raises(IndexError):
+            timeline.positionAt(ply)
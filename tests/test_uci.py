@@ -0,0 +1,115 @@
+import io
+
+import pytest
+
+from moves import moveToUci
+from position import Position
+from search import MATE_SCORE
+from snapshot import STARTING_SNAPSHOT, snapshotFromFen, snapshotToFen
+from uci import (UciEngine, UciError, formatScore, moveTime, parseGo,
+                 parsePosition)
+
+
+def test_position_commands():
+    assert parsePosition(["startpos"]) == STARTING_SNAPSHOT
+    snapshot = parsePosition("startpos moves e2e4 e7e5 g1f3".split())
+    assert snapshotToFen(snapshot).split()[:4] == [
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R", "b", "KQkq", "-"]
+
+    fen = "4k3/1P6/8/8/8/8/8/4K3 w - - 0 1"
+    snapshot = parsePosition(f"fen {fen} moves b7b8n".split())
+    assert snapshotToFen(snapshot).split()[0] == "1N2k3/8/8/8/8/8/8/4K3"
+
+
+@pytest.mark.parametrize("tokens", [
+    ["startpos", "moves", "e2e5"], ["fen", "8/8/8"], ["moves"]])
+def test_bad_positions_raise(tokens):
+    with pytest.raises(UciError):
+        parsePosition(tokens)
+
+
+def test_go_parameters_and_time():
+    params = parseGo("wtime 60000 btime 30000 winc 1000 movestogo 20 infinite".split())
+    assert params == {"wtime": 60000, "btime": 30000, "winc": 1000,
+                      "movestogo": 20, "infinite": True}
+    assert moveTime(params, True) == pytest.approx(60 / 20 + 0.75 - 0.05)
+    assert moveTime(params, False) == pytest.approx(30 / 20 - 0.05)
+    assert moveTime({"movetime": 250}, True) == 0.25
+    assert moveTime({}, True) is None
+    with pytest.raises(UciError):
+        parseGo(["depth", "x"])
+
+
+def test_scores():
+    assert formatScore(-35) == "cp -35"
+    assert formatScore(MATE_SCORE - 1) == "mate 1"
+    assert formatScore(-(MATE_SCORE - 4)) == "mate -2"
+
+
+def test_engine_session():
+    output = io.StringIO()
+    engine = UciEngine(output)
+    for line in ("uci", "isready", "position startpos moves e2e4", "bogus",
+                 "position startpos moves e2e5", "go depth 2"):
+        assert engine.handle(line)
+    # The search ends at depth 2 without a stop
+    engine.searchThread.join()
+    assert not engine.handle("quit")
+    lines = output.getvalue().splitlines()
+    assert lines[:4] == ["id name chess", "id author chess contributors",
+                         "uciok", "readyok"]
+    assert lines[4] == "info string illegal move e2e5"
+    assert lines[-2].startswith("info depth 2 ")
+
+    # The illegal move reset the engine to the starting position
+    position = Position()
+    legal = {moveToUci(move) for move in position.getLegalMoves()}
+    assert lines[-1].split()[0] == "bestmove"
+    assert lines[-1].split()[1] in legal
+
+
+def test_mated_side_has_no_move():
+    output = io.StringIO()
+    engine = UciEngine(output)
+    engine.handle("position fen R5k1/5ppp/8/8/8/8/8/6K1 b - - 1 1")
+    engine.handle("go depth 1")
+    engine.searchThread.join()
+    assert output.getvalue().splitlines()[-1] == "bestmove 0000"
+
+
+def test_positions_without_kings_are_refused():
+    output = io.StringIO()
+    engine = UciEngine(output)
+    engine.handle("position startpos moves e2e4")
+    engine.handle("position fen 8/8/8/8/8/8/8/8 w - - 0 1")
+    assert output.getvalue().startswith("info string invalid FEN")
+    assert engine.snapshot == STARTING_SNAPSHOT
+    engine.handle("go depth 1")
+    engine.searchThread.join()
+    bestMove = output.getvalue().splitlines()[-1].split()[1]
+    assert bestMove in {moveToUci(move) for move in Position().getLegalMoves()}
+
+
+def test_an_illegal_move_resets_the_position():
+    engine = UciEngine(io.StringIO())
+    engine.handle("position startpos moves e2e4")
+    engine.handle("position startpos moves e2e4 e2e4")
+    assert engine.snapshot == STARTING_SNAPSHOT
+
+
+def test_a_failed_search_still_sends_bestmove(monkeypatch):
+    import uci
+
+    class FailingSearch:
+        def __init__(self, *args):
+            pass
+
+        def run(self, **limits):
+            raise AttributeError("no king")
+    monkeypatch.setattr(uci, "Search", FailingSearch)
+    output = io.StringIO()
+    engine = UciEngine(output)
+    engine.handle("go depth 1")
+    engine.searchThread.join()
+    assert output.getvalue().splitlines() == [
+        "info string search failed: AttributeError('no king')", "bestmove 0000"]